@@ -106,6 +106,9 @@ def yaml_to_env(yaml_data):
         set_env(const.SIGENERGY2MQTT_MODBUS_TIMEOUT, m.get("timeout"))
         set_env(const.SIGENERGY2MQTT_MODBUS_RETRIES, m.get("retries"))
         set_env(const.SIGENERGY2MQTT_MODBUS_DISABLE_CHUNKING, m.get("disable-chunking"))
+        set_env(const.SIGENERGY2MQTT_MODBUS_MAX_BRIDGED_GAP, m.get("max-bridged-gap"))
+        set_env(const.SIGENERGY2MQTT_MODBUS_PIPELINE_DEPTH, m.get("pipeline-depth"))
+        set_env(const.SIGENERGY2MQTT_MODBUS_CAPTURE_FILE, m.get("capture-file"))
         set_env(const.SIGENERGY2MQTT_MODBUS_LOG_LEVEL, m.get("log-level"))
         set_env(const.SIGENERGY2MQTT_MODBUS_READ_ONLY, m.get("read-only"))
         set_env(const.SIGENERGY2MQTT_MODBUS_READ_WRITE, m.get("read-write"))
@@ -14,6 +14,7 @@ import sys
 from sigenergy2mqtt.config import ConfigurationError, active_config, auto_discovery, initialize, initialize_async
 from sigenergy2mqtt.main import async_main, validate_connections
 from sigenergy2mqtt.metrics.metrics import Metrics
+from sigenergy2mqtt.modbus.capture import ModbusCapture
 
 logger = logging.getLogger(__name__)
 
@@ -128,6 +129,7 @@ def main():
         logger.info("Keyboard interrupt received during runtime shutdown")
     finally:
         Metrics.shutdown(timeout=2.0)
+        ModbusCapture.close_all()
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ from .output_field import OutputField
 from .protocol import Protocol, ProtocolApplies
 from .register_access import RegisterAccess
 from .scan_interval_default import ScanIntervalDefault
+from .scheduler import ScanScheduler
 from .state_class import StateClass
 from .status_field import StatusField
 from .tariff import Tariff
@@ -49,6 +50,7 @@ __all__ = [
     "ProtocolApplies",
     "RegisterAccess",
     "ScanIntervalDefault",
+    "ScanScheduler",
     "ServiceHealthRegistry",
     "StateClass",
     "StatusField",
@@ -0,0 +1,107 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import weakref
+from typing import ClassVar
+
+
+class ScanScheduler:
+    """Single timer that wakes the scan groups of one event loop when they are due.
+
+    Every device thread runs its own event loop, so there is one scheduler per
+    thread. Idle scan groups wait on a plain future pushed onto a min-heap of
+    ``(due, sequence, waiter)`` entries keyed on the loop's monotonic clock.
+    Only the head of the heap holds a loop timer, and it is re-armed whenever
+    the head changes, so waiting groups cost no tasks and cause no event loop
+    wake-ups until one of them is actually due.
+
+    Waiters are cancelled to interrupt a wait (shutdown), or resolved early
+    with :meth:`wake` (``force_publish``). Entries for waiters that are already
+    done are discarded lazily when they reach the head of the heap.
+    """
+
+    _schedulers: ClassVar[weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, "ScanScheduler"]] = weakref.WeakKeyDictionary()
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._heap: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    def __len__(self) -> int:
+        return sum(1 for _, _, waiter in self._heap if not waiter.done())
+
+    @classmethod
+    def get(cls) -> "ScanScheduler":
+        """Return the scheduler for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        with cls._lock:
+            scheduler = cls._schedulers.get(loop)
+            if scheduler is None:
+                scheduler = cls._schedulers[loop] = cls(loop)
+            return scheduler
+
+    @property
+    def armed_at(self) -> float | None:
+        """Return the loop time at which the timer will next fire, or ``None`` when idle."""
+        return None if self._timer is None else self._timer.when()
+
+    def schedule(self, delay: float | None) -> asyncio.Future[None]:
+        """Return a future that is resolved once ``delay`` seconds have elapsed.
+
+        Args:
+            delay: Seconds to wait, or ``None`` to wait until the future is
+                   woken or cancelled.
+        """
+        waiter: asyncio.Future[None] = self._loop.create_future()
+        if delay is not None:
+            heapq.heappush(self._heap, (self._loop.time() + max(0.0, delay), next(self._sequence), waiter))
+            self._arm()
+        return waiter
+
+    @staticmethod
+    def wake(waiter: asyncio.Future[None]) -> None:
+        """Resolve a waiter immediately. Safe to call from any thread."""
+
+        def _wake() -> None:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        loop = waiter.get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            _wake()
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(_wake)
+
+    def _arm(self) -> None:
+        heap = self._heap
+        while heap and heap[0][2].done():
+            heapq.heappop(heap)
+        if not heap:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            return
+        due = heap[0][0]
+        if self._timer is not None:
+            if self._timer.when() <= due:
+                return
+            self._timer.cancel()
+        self._timer = self._loop.call_at(due, self._fire)
+
+    def _fire(self) -> None:
+        # The loop may run a timer up to one clock resolution early, so release everything due by the armed time
+        limit = max(self._loop.time(), self._timer.when() if self._timer is not None else 0.0)
+        self._timer = None
+        heap = self._heap
+        while heap and heap[0][0] <= limit:
+            _, _, waiter = heapq.heappop(heap)
+            if not waiter.done():
+                waiter.set_result(None)
+        self._arm()
@@ -5,6 +5,7 @@ import ipaddress
 import logging
 import signal
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import cast
 
@@ -52,6 +53,10 @@ REG_PSS_SERIAL_NUMBER = 32515
 REG_PLANT_RUNNING_STATE = 30051
 REG_SERIAL_NUMBER_COUNT = 10
 
+# Exception codes a gateway returns on behalf of a device ID that is not there:
+# GATEWAY PATH UNAVAILABLE and GATEWAY TARGET DEVICE FAILED TO RESPOND.
+GATEWAY_EXCEPTION_CODES = frozenset({0x0A, 0x0B})
+
 # ---------------------------------------------------------------------------
 # Module-level inverter serial number registry
 #
@@ -194,6 +199,28 @@ async def probe_register(modbus: AsyncModbusTcpClient, address: int, count: int
     return False
 
 
+async def device_id_responds(modbus: AsyncModbusTcpClient, device_id: int, max_reconnect_attempts: int = 3) -> bool:
+    """Read a single register, returning True if any device answers at device_id.
+
+    Used as a short first pass to rule out absent device IDs before they are
+    identified: a device that is present answers, even if only with an ILLEGAL
+    DATA ADDRESS exception, whereas an absent one times out or is reported as
+    unreachable by the gateway.
+    """
+    _check_interrupted()
+    host = modbus.comm_params.host
+    port = modbus.comm_params.port
+    try:
+        result = await modbus.read_input_registers(address=REG_INVERTER_RUNNING_STATE, count=1, device_id=device_id)
+        return result is not None and not (result.isError() and getattr(result, "exception_code", None) in GATEWAY_EXCEPTION_CODES)
+    except ModbusException as exc:
+        logger.debug(f" -> No response from modbus://{host}:{port} device_id={device_id}: {exc}")
+        await _reconnect(modbus, max_attempts=max_reconnect_attempts)
+    except RuntimeError as exc:
+        logger.debug(f" -> Probe unexpected error modbus://{host}:{port} device_id={device_id}: {exc}")
+    return False
+
+
 async def get_serial_number(modbus: AsyncModbusTcpClient, sn_address: int, device_id: int = 1) -> str | None:
     """Read and decode the serial number string from a device."""
     host = modbus.comm_params.host
@@ -286,8 +313,83 @@ async def _probe_device_id(modbus: AsyncModbusTcpClient, device_id: int, device:
                 logger.info(f" -> IGNORED PID {device_id} at {host}:{port} - serial number {serial} already discovered")
 
 
-async def scan_host(ip: str, port: int, results: list, timeout: float = 0.25, retries: int = 0, max_reconnect_attempts: int = 3, max_device_id: int = 246, exclude_devices: list[str] | None = None) -> None:
-    """Connect to a single host, enumerate its Sigenergy devices, and append to results."""
+async def _responding_device_ids(
+    modbus: AsyncModbusTcpClient, device_ids: list[int], timeout: float, retries: int, max_reconnect_attempts: int, concurrency: int
+) -> set[int]:
+    """Return the device_ids that respond to a single-register read.
+
+    pymodbus serialises the requests of a client, so the IDs are probed over up
+    to `concurrency` connections to the host (modbus and additional ones opened
+    here), each taking the next unprobed ID from device_ids in turn. A device ID
+    that does not exist therefore only holds up one connection for its timeout.
+    """
+    host = modbus.comm_params.host
+    port = modbus.comm_params.port
+    pending = deque(device_ids)
+    responding: set[int] = set()
+    probed = 0
+    last_progress_log = 0
+    log_progress_every = max(1, len(device_ids) // 10)
+
+    async def probe_next(client: AsyncModbusTcpClient) -> None:
+        nonlocal probed, last_progress_log
+        while pending:
+            _check_interrupted()
+            device_id = pending.popleft()
+            if await device_id_responds(client, device_id, max_reconnect_attempts):
+                responding.add(device_id)
+            probed += 1
+            if probed - last_progress_log >= log_progress_every:
+                logger.info(f" -> Scanned {probed}/{len(device_ids)} device IDs on {host}:{port}")
+                last_progress_log = probed
+
+    async def connect(client: AsyncModbusTcpClient) -> bool:
+        try:
+            await client.connect()
+        except ModbusException as exc:
+            logger.debug(f"Additional Modbus connection to {host}:{port} failed: {exc}")
+        return bool(client.connected)
+
+    extra = [AsyncModbusTcpClient(host=host, port=port, framer=FramerType.SOCKET, reconnect_delay=0, timeout=timeout, retries=retries) for _ in range(min(concurrency, len(device_ids)) - 1)]
+    tasks: list[asyncio.Task] = []
+    try:
+        connected = await asyncio.gather(*[connect(client) for client in extra])
+        clients = [modbus] + [client for client, ok in zip(extra, connected) if ok]
+        logger.debug(f" -> Probing {len(device_ids)} device IDs on {host}:{port} over {len(clients)} connection{'s' if len(clients) > 1 else ''}")
+        tasks = [asyncio.ensure_future(probe_next(client)) for client in clients]
+        await asyncio.gather(*tasks)
+    except (DiscoveryInterruptedError, asyncio.CancelledError):
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        for client in extra:
+            client.close()
+    return responding
+
+
+async def scan_host(
+    ip: str,
+    port: int,
+    results: list,
+    timeout: float = 0.25,
+    retries: int = 0,
+    max_reconnect_attempts: int = 3,
+    max_device_id: int = 246,
+    exclude_devices: list[str] | None = None,
+    device_id_concurrency: int = 8,
+    likely_device_ids: list[int] | None = None,
+) -> None:
+    """Connect to a single host, enumerate its Sigenergy devices, and append to results.
+
+    Device IDs are probed in two passes. The first reads a single register from
+    every device ID concurrently (see _responding_device_ids), starting with the
+    likely IDs (1, and likely_device_ids, typically those found by a previous
+    scan), to rule out the IDs at which nothing answers. Only the device IDs that
+    responded are then identified, one at a time in ascending order.
+    """
     if exclude_devices is None:
         exclude_devices = []
 
@@ -307,21 +409,17 @@ async def scan_host(ip: str, port: int, results: list, timeout: float = 0.25, re
         logger.info(f" -> Found Sigenergy Plant at {ip}:{port} - Scanning {'first' if max_device_id < 246 else 'all'} {max_device_id} device ID{'s' if max_device_id > 1 else ''}...")
         device = DiscoveredDevice(host=ip, port=port)
 
-        # Sequential probing of up to max_device_id
-        # Each probe respects the modbus_timeout, and _check_interrupted() allows
-        # keyboard interrupt handling between each device scan.
-        last_progress_log = 0
-        log_progress_every = max(1, max_device_id // 10)
+        likely = [i for i in dict.fromkeys([1, *(likely_device_ids or [])]) if 1 <= i <= max_device_id]
+        device_ids = likely + [i for i in range(1, max_device_id + 1) if i not in likely]
+        responding = await _responding_device_ids(modbus, device_ids, timeout, retries, max_reconnect_attempts, device_id_concurrency)
+        logger.debug(f" -> {len(responding)} device ID{'s' if len(responding) != 1 else ''} responded on {ip}:{port}: {sorted(responding)}")
 
-        for device_id in range(1, max_device_id + 1):
+        # Each identification probe respects the modbus_timeout, and _check_interrupted()
+        # allows keyboard interrupt handling between each device identification.
+        for device_id in sorted(responding):
             _check_interrupted()
             await _probe_device_id(modbus, device_id, device, max_reconnect_attempts, exclude_devices)
 
-            # Log progress every 25 device IDs scanned
-            if device_id - last_progress_log >= log_progress_every:
-                logger.info(f" -> Scanned {device_id}/{max_device_id} device IDs on {ip}:{port}")
-                last_progress_log = device_id
-
         if not device.has_devices():
             logger.info(f" -> Ignored Modbus device at {ip}:{port}: No new inverters or chargers found with device IDs up to {max_device_id}")
             if max_device_id < 246:
@@ -419,6 +517,8 @@ async def scan(
     host_concurrency: int = 10,
     max_reconnect_attempts: int = 3,
     max_device_id: int = 246,
+    device_id_concurrency: int = 8,
+    likely_device_ids: dict[str, list[int]] | None = None,
 ) -> list[dict]:
     """Discover all Sigenergy plants reachable from local network interfaces.
 
@@ -428,6 +528,9 @@ async def scan(
     Scans both directly-attached networks and indirectly-accessible networks
     (via routing) that are specified in include_networks.
 
+    likely_device_ids maps host addresses to the device IDs expected on them
+    (typically from a previous scan), which are probed first.
+
     Notes:
         Connection closures: Pymodbus closes the connection after retries+3
         consecutive failures. This is handled gracefully with automatic
@@ -474,6 +577,8 @@ async def scan(
                     max_reconnect_attempts=max_reconnect_attempts,
                     max_device_id=max_device_id,
                     exclude_devices=exclude_devices or [],
+                    device_id_concurrency=device_id_concurrency,
+                    likely_device_ids=(likely_device_ids or {}).get(ip),
                 )
 
         try:
@@ -401,6 +401,32 @@ def get_parser() -> argparse.ArgumentParser:
         dest=const.SIGENERGY2MQTT_MODBUS_DISABLE_CHUNKING,
         help="Disable Modbus chunking when reading registers and read each register individually.",
     )
+    parser.add_argument(
+        "--modbus-max-bridged-gap",
+        nargs="?",
+        action="store",
+        dest=const.SIGENERGY2MQTT_MODBUS_MAX_BRIDGED_GAP,
+        type=int,
+        default=os.getenv(const.SIGENERGY2MQTT_MODBUS_MAX_BRIDGED_GAP, None),
+        help="The maximum number of unused registers that may be read to join non-contiguous sensors into a single Modbus request. The default is 0 (gaps are never bridged).",
+    )
+    parser.add_argument(
+        "--modbus-pipeline-depth",
+        nargs="?",
+        action="store",
+        dest=const.SIGENERGY2MQTT_MODBUS_PIPELINE_DEPTH,
+        type=int,
+        default=os.getenv(const.SIGENERGY2MQTT_MODBUS_PIPELINE_DEPTH, None),
+        help="The maximum number of Modbus transactions that may be in flight on the connection at once. The number actually in flight adapts to timeouts and busy responses from the device. The default is 1 (no pipelining).",
+    )
+    parser.add_argument(
+        "--modbus-capture-file",
+        nargs="?",
+        action="store",
+        dest=const.SIGENERGY2MQTT_MODBUS_CAPTURE_FILE,
+        default=os.getenv(const.SIGENERGY2MQTT_MODBUS_CAPTURE_FILE, None),
+        help="Record every Modbus request and response to this file, so that the traffic can be replayed offline by the Modbus test server.",
+    )
     parser.add_argument(
         "--modbus-log-level",
         action="store",
@@ -798,6 +824,49 @@ def get_parser() -> argparse.ArgumentParser:
         default=os.getenv(const.SIGENERGY2MQTT_INFLUX_MAX_SYNC_WORKERS, None),
         help="InfluxDB maximum sync workers (default: 4)",
     )
+    parser.add_argument(
+        "--influxdb-spool-max-size",
+        nargs="?",
+        action="store",
+        dest=const.SIGENERGY2MQTT_INFLUX_SPOOL_MAX_SIZE,
+        type=float,
+        default=os.getenv(const.SIGENERGY2MQTT_INFLUX_SPOOL_MAX_SIZE, None),
+        help="Maximum size in MiB of the on-disk spool of InfluxDB batches that failed to write, which are replayed when InfluxDB is available again (default: 64, 0 disables the spool)",
+    )
+    parser.add_argument(
+        "--influxdb-spool-max-age",
+        nargs="?",
+        action="store",
+        dest=const.SIGENERGY2MQTT_INFLUX_SPOOL_MAX_AGE,
+        type=float,
+        default=os.getenv(const.SIGENERGY2MQTT_INFLUX_SPOOL_MAX_AGE, None),
+        help="Maximum age in hours of spooled InfluxDB batches awaiting replay (default: 168)",
+    )
+    parser.add_argument(
+        "--influxdb-spool-replay-rate",
+        nargs="?",
+        action="store",
+        dest=const.SIGENERGY2MQTT_INFLUX_SPOOL_REPLAY_RATE,
+        type=int,
+        default=os.getenv(const.SIGENERGY2MQTT_INFLUX_SPOOL_REPLAY_RATE, None),
+        help="Maximum number of spooled InfluxDB points replayed per second (default: 1000)",
+    )
+    parser.add_argument(
+        "--influxdb-precision",
+        action="store",
+        dest=const.SIGENERGY2MQTT_INFLUX_PRECISION,
+        choices=["s", "ms", "us", "ns"],
+        default=os.getenv(const.SIGENERGY2MQTT_INFLUX_PRECISION, None),
+        help="Precision of the timestamps written to InfluxDB. Must be one of s, ms (the default), us or ns.",
+    )
+    parser.add_argument(
+        "--influxdb-point-schema",
+        action="store",
+        dest=const.SIGENERGY2MQTT_INFLUX_POINT_SCHEMA,
+        choices=["entity", "device"],
+        default=os.getenv(const.SIGENERGY2MQTT_INFLUX_POINT_SCHEMA, None),
+        help="How sensor states are written to InfluxDB: entity (the default) writes one point per sensor state; device writes one point per device, unit and timestamp, with a field per sensor.",
+    )
     parser.add_argument(
         "--no-influxdb-health-monitoring",
         action="store_false",
@@ -821,6 +890,14 @@ def get_parser() -> argparse.ArgumentParser:
         default=os.getenv(const.SIGENERGY2MQTT_PERSISTENCE_MQTT_STATE_PREFIX, None),
         help="MQTT topic prefix for persisted state messages (default: sigenergy2mqtt/_state)",
     )
+    parser.add_argument(
+        "--persistence-disk-backend",
+        action="store",
+        dest=const.SIGENERGY2MQTT_PERSISTENCE_DISK_BACKEND,
+        choices=["files", "sqlite"],
+        default=os.getenv(const.SIGENERGY2MQTT_PERSISTENCE_DISK_BACKEND, None),
+        help="How state is stored on disk. Must be one of files (one file per value, the default) or sqlite (a single transactional database).",
+    )
     parser.add_argument(
         "--persistence-cache-warmup-timeout",
         nargs="?",
@@ -839,6 +916,24 @@ def get_parser() -> argparse.ArgumentParser:
         default=os.getenv(const.SIGENERGY2MQTT_PERSISTENCE_SYNC_TIMEOUT, None),
         help="Timeout in seconds for synchronous persistence operations when called from a non-asyncio thread (default: 5.0, range: 0.1-30.0)",
     )
+    parser.add_argument(
+        "--persistence-write-behind-interval",
+        nargs="?",
+        action="store",
+        dest=const.SIGENERGY2MQTT_PERSISTENCE_WRITE_BEHIND_INTERVAL,
+        type=float,
+        default=os.getenv(const.SIGENERGY2MQTT_PERSISTENCE_WRITE_BEHIND_INTERVAL, None),
+        help="Maximum seconds a saved state value is held in memory before it is written, keeping only the latest value of each key (default: 0, which writes every save immediately, range: 0-3600)",
+    )
+    parser.add_argument(
+        "--persistence-write-behind-threshold",
+        nargs="?",
+        action="store",
+        dest=const.SIGENERGY2MQTT_PERSISTENCE_WRITE_BEHIND_THRESHOLD,
+        type=int,
+        default=os.getenv(const.SIGENERGY2MQTT_PERSISTENCE_WRITE_BEHIND_THRESHOLD, None),
+        help="Number of state keys awaiting write-behind that triggers an immediate write (default: 50)",
+    )
     parser.add_argument(
         "--persistence-debug",
         action="store_true",
@@ -280,6 +280,7 @@ class Config:
                     max_device_id=self._settings.modbus_auto_discovery_max_device_id,
                     include_networks=include_networks,
                     exclude_devices=self._settings.modbus_auto_discovery_exclude,
+                    likely_device_ids=self._previous_discovery_device_ids(auto_discovery_cache),
                 )
                 if auto_discovered:
                     await self._save_discovery_results(auto_discovery_cache, auto_discovered)
@@ -335,6 +336,23 @@ class Config:
             return auto_discovery_cache
         return None
 
+    @staticmethod
+    def _previous_discovery_device_ids(auto_discovery_cache: Path) -> dict[str, list[int]]:
+        """Return the device IDs found on each host by the previous auto-discovery, if its results are cached."""
+        if not auto_discovery_cache.is_file():
+            return {}
+        try:
+            data = YAML(typ="safe", pure=True).load(auto_discovery_cache.read_text())
+        except (OSError, UnicodeError, YAMLError) as exc:
+            logger.debug(f"Ignored previous auto-discovery results in {auto_discovery_cache}: {exc}")
+            return {}
+        device_ids: dict[str, list[int]] = {}
+        for entry in data if isinstance(data, list) else []:
+            if isinstance(entry, dict) and "host" in entry:
+                ids = [i for key in ("inverters", "ac-chargers", "dc-chargers", "pid", "pss") for i in entry.get(key) or [] if isinstance(i, int)]
+                device_ids[str(entry["host"])] = list(dict.fromkeys(device_ids.get(str(entry["host"]), []) + ids))
+        return device_ids
+
     async def _restore_discovery_from_mqtt(self, auto_discovery_cache: Path):
         try:
             # Configuration may not be fully loaded
@@ -495,6 +513,7 @@ class Config:
         timeout: float = AUTODISCOVERY_DEFAULT_TIMEOUT,
         include_networks: list[str] | None = None,
         exclude_devices: list[str] | None = None,
+        likely_device_ids: dict[str, list[int]] | None = None,
     ) -> list:
         """Asynchronous execution of auto-discovery scan."""
         try:
@@ -507,6 +526,7 @@ class Config:
                     modbus_timeout=modbus_timeout,
                     modbus_retries=modbus_retries,
                     max_device_id=max_device_id,
+                    likely_device_ids=likely_device_ids,
                 ),
                 timeout=timeout,
             )
@@ -13,10 +13,13 @@ SIGENERGY2MQTT_NO_METRICS: Final = "SIGENERGY2MQTT_NO_METRICS"
 SIGENERGY2MQTT_TOPIC_UPDATE_MONITORING: Final = "SIGENERGY2MQTT_TOPIC_UPDATE_MONITORING"  # added: 2026.7.22
 SIGENERGY2MQTT_PERSISTENCE_CACHE_WARMUP_TIMEOUT: Final = "SIGENERGY2MQTT_PERSISTENCE_CACHE_WARMUP_TIMEOUT"  # added: 2026.4.5
 SIGENERGY2MQTT_PERSISTENCE_DEBUG: Final = "SIGENERGY2MQTT_PERSISTENCE_DEBUG"  # added: 2026.6.8
+SIGENERGY2MQTT_PERSISTENCE_DISK_BACKEND: Final = "SIGENERGY2MQTT_PERSISTENCE_DISK_BACKEND"  # added: 2026.8.9
 SIGENERGY2MQTT_PERSISTENCE_DISK_PRIMARY: Final = "SIGENERGY2MQTT_PERSISTENCE_DISK_PRIMARY"  # added: 2026.4.5
 SIGENERGY2MQTT_PERSISTENCE_MQTT_REDUNDANCY: Final = "SIGENERGY2MQTT_PERSISTENCE_MQTT_REDUNDANCY"  # added: 2026.4.5
 SIGENERGY2MQTT_PERSISTENCE_MQTT_STATE_PREFIX: Final = "SIGENERGY2MQTT_PERSISTENCE_MQTT_STATE_PREFIX"  # added: 2026.4.5
 SIGENERGY2MQTT_PERSISTENCE_SYNC_TIMEOUT: Final = "SIGENERGY2MQTT_PERSISTENCE_SYNC_TIMEOUT"  # added: 2026.4.10
+SIGENERGY2MQTT_PERSISTENCE_WRITE_BEHIND_INTERVAL: Final = "SIGENERGY2MQTT_PERSISTENCE_WRITE_BEHIND_INTERVAL"  # added: 2026.8.9
+SIGENERGY2MQTT_PERSISTENCE_WRITE_BEHIND_THRESHOLD: Final = "SIGENERGY2MQTT_PERSISTENCE_WRITE_BEHIND_THRESHOLD"  # added: 2026.8.9
 SIGENERGY2MQTT_REPEATED_STATE_PUBLISH_INTERVAL: Final = "SIGENERGY2MQTT_REPEATED_STATE_PUBLISH_INTERVAL"  # added: 2026.2.19
 SIGENERGY2MQTT_SANITY_CHECK_DEFAULT_KW: Final = "SIGENERGY2MQTT_SANITY_CHECK_DEFAULT_KW"  # added: 2025.7.9
 SIGENERGY2MQTT_SANITY_CHECK_FAILURES_INCREMENT: Final = "SIGENERGY2MQTT_SANITY_CHECK_FAILURES_INCREMENT"  # added: 2026.1.21
@@ -57,6 +60,11 @@ SIGENERGY2MQTT_INFLUX_POOL_MAXSIZE: Final = "SIGENERGY2MQTT_INFLUX_POOL_MAXSIZE"
 SIGENERGY2MQTT_INFLUX_SYNC_CHUNK_SIZE: Final = "SIGENERGY2MQTT_INFLUX_SYNC_CHUNK_SIZE"  # added: 2026.2.5
 SIGENERGY2MQTT_INFLUX_MAX_SYNC_WORKERS: Final = "SIGENERGY2MQTT_INFLUX_MAX_SYNC_WORKERS"  # added: 2026.2.5
 SIGENERGY2MQTT_INFLUX_HEALTH_MONITORING: Final = "SIGENERGY2MQTT_INFLUX_HEALTH_MONITORING"  # added: 2026.7.22
+SIGENERGY2MQTT_INFLUX_SPOOL_MAX_SIZE: Final = "SIGENERGY2MQTT_INFLUX_SPOOL_MAX_SIZE"  # added: 2026.8.9
+SIGENERGY2MQTT_INFLUX_SPOOL_MAX_AGE: Final = "SIGENERGY2MQTT_INFLUX_SPOOL_MAX_AGE"  # added: 2026.8.9
+SIGENERGY2MQTT_INFLUX_SPOOL_REPLAY_RATE: Final = "SIGENERGY2MQTT_INFLUX_SPOOL_REPLAY_RATE"  # added: 2026.8.9
+SIGENERGY2MQTT_INFLUX_PRECISION: Final = "SIGENERGY2MQTT_INFLUX_PRECISION"  # added: 2026.8.9
+SIGENERGY2MQTT_INFLUX_POINT_SCHEMA: Final = "SIGENERGY2MQTT_INFLUX_POINT_SCHEMA"  # added: 2026.8.9
 
 SIGENERGY2MQTT_MODBUS_ACCHARGER_DEVICE_ID: Final = "SIGENERGY2MQTT_MODBUS_ACCHARGER_DEVICE_ID"
 SIGENERGY2MQTT_MODBUS_AUTO_DISCOVERY_EXCLUDE: Final = "SIGENERGY2MQTT_MODBUS_AUTO_DISCOVERY_EXCLUDE"  # added 2026.6.5
@@ -66,14 +74,17 @@ SIGENERGY2MQTT_MODBUS_AUTO_DISCOVERY_TIMEOUT: Final = "SIGENERGY2MQTT_MODBUS_AUT
 SIGENERGY2MQTT_MODBUS_AUTO_DISCOVERY: Final = "SIGENERGY2MQTT_MODBUS_AUTO_DISCOVERY"
 SIGENERGY2MQTT_MODBUS_AUTO_DISCOVERY_NETWORKS: Final = "SIGENERGY2MQTT_MODBUS_AUTO_DISCOVERY_NETWORKS"
 SIGENERGY2MQTT_MODBUS_AUTO_DISCOVERY_MAX_DEVICE_ID: Final = "SIGENERGY2MQTT_MODBUS_AUTO_DISCOVERY_MAX_DEVICE_ID"  # added 2026.6.13
+SIGENERGY2MQTT_MODBUS_CAPTURE_FILE: Final = "SIGENERGY2MQTT_MODBUS_CAPTURE_FILE"  # added: 2026.8.9
 SIGENERGY2MQTT_MODBUS_DCCHARGER_DEVICE_ID: Final = "SIGENERGY2MQTT_MODBUS_DCCHARGER_DEVICE_ID"
 SIGENERGY2MQTT_MODBUS_DISABLE_CHUNKING: Final = "SIGENERGY2MQTT_MODBUS_DISABLE_CHUNKING"  # added: 2025.9.19
 SIGENERGY2MQTT_MODBUS_HOST: Final = "SIGENERGY2MQTT_MODBUS_HOST"
 SIGENERGY2MQTT_MODBUS_INVERTER_DEVICE_ID: Final = "SIGENERGY2MQTT_MODBUS_INVERTER_DEVICE_ID"
 SIGENERGY2MQTT_MODBUS_LOG_LEVEL: Final = "SIGENERGY2MQTT_MODBUS_LOG_LEVEL"
 SIGENERGY2MQTT_MODBUS_LOG_SKIPPED: Final = "SIGENERGY2MQTT_MODBUS_LOG_SKIPPED"  # added: 2026.6.12
+SIGENERGY2MQTT_MODBUS_MAX_BRIDGED_GAP: Final = "SIGENERGY2MQTT_MODBUS_MAX_BRIDGED_GAP"  # added: 2026.8.9
 SIGENERGY2MQTT_MODBUS_NO_REMOTE_EMS: Final = "SIGENERGY2MQTT_MODBUS_NO_REMOTE_EMS"  # added: 2025.5.31
 SIGENERGY2MQTT_MODBUS_PID_DEVICE_ID: Final = "SIGENERGY2MQTT_MODBUS_PID_DEVICE_ID"  # added: 2026.6.4
+SIGENERGY2MQTT_MODBUS_PIPELINE_DEPTH: Final = "SIGENERGY2MQTT_MODBUS_PIPELINE_DEPTH"  # added: 2026.8.9
 SIGENERGY2MQTT_MODBUS_PORT: Final = "SIGENERGY2MQTT_MODBUS_PORT"
 SIGENERGY2MQTT_MODBUS_PSS_DEVICE_ID: Final = "SIGENERGY2MQTT_MODBUS_PSS_DEVICE_ID"  # added: 2026.6.4
 SIGENERGY2MQTT_MODBUS_READ_ONLY: Final = "SIGENERGY2MQTT_MODBUS_READ_ONLY"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -37,6 +38,11 @@ class InfluxDbConfig(BaseModel):
     pool_maxsize: int = Field(100, alias="pool-maxsize", ge=1)
     sync_chunk_size: int = Field(1000, alias="sync-chunk-size", ge=1)
     max_sync_workers: int = Field(4, alias="max-sync-workers", ge=1)
+    spool_max_size: float = Field(64.0, alias="spool-max-size", ge=0.0)
+    spool_max_age: float = Field(168.0, alias="spool-max-age", gt=0.0)
+    spool_replay_rate: int = Field(1000, alias="spool-replay-rate", ge=1)
+    precision: Literal["s", "ms", "us", "ns"] = Field("ms", alias="precision")
+    point_schema: Literal["entity", "device"] = Field("entity", alias="point-schema")
 
     @model_validator(mode="after")
     def check_credentials(self) -> InfluxDbConfig:
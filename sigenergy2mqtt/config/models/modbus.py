@@ -37,6 +37,9 @@ class ModbusConfig(BaseModel):
     timeout: float = Field(1.0, alias="timeout", ge=0.25)
     retries: int = Field(3, alias="retries", ge=0)
     disable_chunking: bool = Field(False, alias="disable-chunking")
+    max_bridged_gap: int = Field(0, alias="max-bridged-gap", ge=0)
+    pipeline_depth: int = Field(1, alias="pipeline-depth", ge=1, le=16)
+    capture_file: str | None = Field(None, alias="capture-file")
     inverters: list[int] = Field(default_factory=list, alias="inverters")
     ac_chargers: list[int] = Field(default_factory=list, alias="ac-chargers")
     dc_chargers: list[int] = Field(default_factory=list, alias="dc-chargers")
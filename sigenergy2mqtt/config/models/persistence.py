@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 from sigenergy2mqtt.config.models._base import _SUB
@@ -35,6 +37,13 @@ class PersistenceConfig(BaseModel):
     """When True (default), disk is tried first on load; MQTT is used as fallback.
     Set to False to prefer MQTT over disk."""
 
+    disk_backend: Literal["files", "sqlite"] = Field(
+        "files",
+        alias="disk-backend",
+    )
+    """How state is stored on disk: one file per key (default), or a single SQLite database.
+    Existing state files are migrated into the database the first time it is used."""
+
     cache_warmup_timeout: float = Field(
         10.0,
         alias="cache-warmup-timeout",
@@ -53,6 +62,22 @@ class PersistenceConfig(BaseModel):
     )
     """Timeout in seconds for synchronous persistence operations when called from a non-asyncio thread."""
 
+    write_behind_interval: float = Field(
+        0.0,
+        alias="write-behind-interval",
+        ge=0.0,
+        le=3600.0,
+    )
+    """Maximum seconds a saved value is held in memory before it is written, keeping only the latest value of each key.
+    This is the most state that can be lost if the process is killed. 0 (default) writes every save immediately."""
+
+    write_behind_threshold: int = Field(
+        50,
+        alias="write-behind-threshold",
+        ge=1,
+    )
+    """Number of keys awaiting write-behind that triggers an immediate write."""
+
     debug: bool = Field(
         False,
     )
@@ -150,6 +150,9 @@ class EnvSettingsSource(PydanticBaseSettingsSource):
         _set(modbus, "timeout", _float(g(const.SIGENERGY2MQTT_MODBUS_TIMEOUT)))
         _set(modbus, "retries", _int(g(const.SIGENERGY2MQTT_MODBUS_RETRIES)))
         _set(modbus, "disable_chunking", _bool(g(const.SIGENERGY2MQTT_MODBUS_DISABLE_CHUNKING)))
+        _set(modbus, "max_bridged_gap", _int(g(const.SIGENERGY2MQTT_MODBUS_MAX_BRIDGED_GAP)))
+        _set(modbus, "pipeline_depth", _int(g(const.SIGENERGY2MQTT_MODBUS_PIPELINE_DEPTH)))
+        _set(modbus, "capture_file", g(const.SIGENERGY2MQTT_MODBUS_CAPTURE_FILE))
         _set(modbus, "log_level", g(const.SIGENERGY2MQTT_MODBUS_LOG_LEVEL))
         _set(modbus, "log_skipped", _bool(g(const.SIGENERGY2MQTT_MODBUS_LOG_SKIPPED)))
         _set(modbus, "read_only", _bool(g(const.SIGENERGY2MQTT_MODBUS_READ_ONLY)))
@@ -224,6 +227,11 @@ class EnvSettingsSource(PydanticBaseSettingsSource):
         _set(influx, "pool_maxsize", _int(g(const.SIGENERGY2MQTT_INFLUX_POOL_MAXSIZE)))
         _set(influx, "sync_chunk_size", _int(g(const.SIGENERGY2MQTT_INFLUX_SYNC_CHUNK_SIZE)))
         _set(influx, "max_sync_workers", _int(g(const.SIGENERGY2MQTT_INFLUX_MAX_SYNC_WORKERS)))
+        _set(influx, "spool_max_size", _float(g(const.SIGENERGY2MQTT_INFLUX_SPOOL_MAX_SIZE)))
+        _set(influx, "spool_max_age", _float(g(const.SIGENERGY2MQTT_INFLUX_SPOOL_MAX_AGE)))
+        _set(influx, "spool_replay_rate", _int(g(const.SIGENERGY2MQTT_INFLUX_SPOOL_REPLAY_RATE)))
+        _set(influx, "precision", g(const.SIGENERGY2MQTT_INFLUX_PRECISION))
+        _set(influx, "point_schema", g(const.SIGENERGY2MQTT_INFLUX_POINT_SCHEMA))
         if influx:
             result["influxdb"] = influx
 
@@ -232,7 +240,10 @@ class EnvSettingsSource(PydanticBaseSettingsSource):
         _set(persist, "mqtt_redundancy", _bool(g(const.SIGENERGY2MQTT_PERSISTENCE_MQTT_REDUNDANCY)))
         _set(persist, "mqtt_state_prefix", g(const.SIGENERGY2MQTT_PERSISTENCE_MQTT_STATE_PREFIX))
         _set(persist, "disk_primary", _bool(g(const.SIGENERGY2MQTT_PERSISTENCE_DISK_PRIMARY)))
+        _set(persist, "disk_backend", g(const.SIGENERGY2MQTT_PERSISTENCE_DISK_BACKEND))
         _set(persist, "cache_warmup_timeout", _float(g(const.SIGENERGY2MQTT_PERSISTENCE_CACHE_WARMUP_TIMEOUT)))
+        _set(persist, "write_behind_interval", _float(g(const.SIGENERGY2MQTT_PERSISTENCE_WRITE_BEHIND_INTERVAL)))
+        _set(persist, "write_behind_threshold", _int(g(const.SIGENERGY2MQTT_PERSISTENCE_WRITE_BEHIND_THRESHOLD)))
         _set(persist, "debug", _bool(g(const.SIGENERGY2MQTT_PERSISTENCE_DEBUG)))
         if persist:
             result["persistence"] = persist
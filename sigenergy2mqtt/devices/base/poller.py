@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import math
 import time
 from random import uniform
 from typing import TYPE_CHECKING
@@ -7,9 +8,11 @@ from typing import TYPE_CHECKING
 import paho.mqtt.client as mqtt
 from pymodbus import ModbusException
 
-from sigenergy2mqtt.common import Constants
-from sigenergy2mqtt.modbus import ModbusClient, ModbusLock, ModbusLockFactory
-from sigenergy2mqtt.sensors.base import EnergyDailyAccumulationSensor, ModbusSensorMixin, ReadableSensorMixin, Sensor
+from sigenergy2mqtt.common import Constants, ScanScheduler
+from sigenergy2mqtt.config import active_config
+from sigenergy2mqtt.modbus import BusPriority, DeadlineExpired, ModbusClient, ModbusLock, ModbusLockFactory
+from sigenergy2mqtt.modbus.read_ahead import RegisterImage
+from sigenergy2mqtt.sensors.base import EnergyDailyAccumulationSensor, ModbusSensorMixin, ReadableSensorMixin, ReadOnlySensor, Sensor
 
 from .scan_groups import ReadableSensorGroup
 
@@ -25,6 +28,13 @@ RECONNECT_BACKOFF_MULTIPLIER = 2.0
 logger = logging.getLogger(__name__)
 
 
+def _seconds_until_midnight(now: float) -> float:
+    """Return the seconds from wall-clock time ``now`` until the next local midnight."""
+    t = time.localtime(now)
+    midnight = time.mktime((t.tm_year, t.tm_mon, t.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+    return max(1.0, midnight - now)
+
+
 class SensorGroupPoller:
     """Drives the runtime polling loop for a single sensor scan group.
 
@@ -65,7 +75,7 @@ class SensorGroupPoller:
         Returns:
             A tuple of:
             - next_publish_times: dict mapping each ReadableSensorMixin to its next
-              scheduled publish timestamp.
+              scheduled publish time on the time.monotonic() clock.
             - daily_sensors: list of sensors with EnergyDailyAccumulationSensor
               derived sensors that need special day-rollover handling.
             - debug_logging: True if any sensor in the group has debug logging enabled.
@@ -73,7 +83,7 @@ class SensorGroupPoller:
         debug_logging: bool = False
         daily_sensors: list[ReadableSensorMixin] = []
         next_publish_times: dict[ReadableSensorMixin, float] = {}
-        now = time.time()
+        now = time.monotonic()
         # Compute a single group-level jitter so that all sensors in the group become
         # due at the same time. Per-sensor jitter would permanently stagger sensors
         # within the group, causing each to be published in a separate loop iteration
@@ -109,7 +119,7 @@ class SensorGroupPoller:
 
         Args:
             next_publish_times: Mapping of sensor to next scheduled publish timestamp.
-            now:                Current timestamp from time.time().
+            now:                Current time from time.monotonic().
             name:               Scan group name, used in debug log messages.
             debug_logging:      Whether to emit debug logs for force_publish events.
 
@@ -128,76 +138,170 @@ class SensorGroupPoller:
                 due_sensors.append(sensor)
         return due_sensors
 
+    def _bus_priority(self, sensors: tuple[Sensor, ...]) -> BusPriority:
+        """Return the bus scheduling class of a scan group, based on its fastest scan interval.
+
+        Groups that do not belong to a configured Modbus plant are scheduled as
+        low priority.
+        """
+        interval = min((s.scan_interval for s in sensors if isinstance(s, ReadableSensorMixin)), default=None)
+        plant_index = self._device.plant_index
+        if interval is None or not 0 <= plant_index < len(active_config.modbus):
+            return BusPriority.LOW
+        intervals = active_config.modbus[plant_index].scan_interval
+        return BusPriority.for_scan_interval(interval, intervals.realtime, intervals.high, intervals.medium)
+
+    def _pre_decode(self, modbus_sensors: ReadableSensorGroup, modbus_client: ModbusClient, due_ids: set[int]) -> None:
+        """Decode a freshly pre-read register block in one pass and hand each due sensor its raw value.
+
+        Sensors that are handed a value consume it on their next read, instead of
+        individually converting their slice of the cached registers. Sensors whose
+        registers are identical to those of their latest recorded state are marked
+        as unchanged instead, and the block is only decoded if at least one due
+        sensor has changed.
+
+        Args:
+            modbus_sensors: The read range that was just pre-read successfully.
+            modbus_client:  The Modbus client holding the register image.
+            due_ids:        ``id()`` of the sensors due for publishing on this iteration.
+        """
+        decoder, decoded = modbus_sensors.decoder
+        if not any(id(sensor) in due_ids for sensor in decoded):
+            return
+        image = modbus_client.register_image(modbus_sensors.device_address, modbus_sensors.input_type)
+        if not isinstance(image, RegisterImage):
+            return
+        try:
+            registers = image.view(modbus_sensors.first_address, modbus_sensors.register_count)
+        except IndexError:
+            return
+        block = registers.tobytes()
+        read_at = image.filled_at(modbus_sensors.first_address)
+        values: list | None = None
+        for index, sensor in enumerate(decoded):
+            if id(sensor) not in due_ids:
+                continue
+            start = 2 * (sensor.address - modbus_sensors.first_address)
+            raw = block[start : start + 2 * sensor.count]
+            if start < 0 or len(raw) != 2 * sensor.count:
+                continue  # Not within the block
+            if sensor.pre_decode_unchanged(raw, read_at):
+                continue
+            if values is None:
+                values = decoder.decode(registers)
+            if values[index] is not None:
+                sensor.pre_decode(values[index], raw, read_at)
+
     async def _publish_read_ahead(
         self,
         due_sensors: list[ReadableSensorMixin],
         modbus_client: ModbusClient,
-        modbus_sensors: ReadableSensorGroup,
+        read_ranges: list[ReadableSensorGroup],
         modbus_lock: ModbusLock,
         name: str,
         debug_logging: bool,
-    ) -> bool:
-        """Perform a single bulk Modbus register read covering all due Modbus sensors.
-
-        Acquires the Modbus lock and calls read_ahead_registers() to pre-populate
-        the client's read cache for the entire address range of the group. Individual
-        sensor publish() calls issued after this will hit the cache rather than
-        generating separate wire requests.
-
-        If exception code 2 (ILLEGAL DATA ADDRESS) is returned, read-ahead is
-        permanently disabled for this group by returning False. Other non-zero
-        exception codes are logged as warnings but read-ahead remains enabled.
+        priority: BusPriority = BusPriority.LOW,
+        deadline: float | None = None,
+    ) -> list[ReadableSensorGroup]:
+        """Perform bulk Modbus register reads covering all due Modbus sensors.
+
+        Acquires shared use of the Modbus lock and calls read_ahead_registers()
+        for each read range containing a due sensor to pre-populate the client's
+        read cache. The reads are issued concurrently, and a client with
+        pipelining enabled admits the read-aheads of other scan groups alongside
+        them (up to its current window), so that it keeps them all in flight
+        together. Individual sensor publish() calls issued after this will hit
+        the cache rather than generating separate wire requests.
+
+        If exception code 2 (ILLEGAL DATA ADDRESS) is returned for a range that
+        bridges unused registers, the range is split into its contiguous runs,
+        which are pre-read separately from the next iteration. A contiguous range
+        that returns exception code 2 is dropped, permanently disabling read-ahead
+        for those sensors. Other non-zero exception codes are logged as warnings
+        but the range remains enabled.
+
+        Each range that is pre-read successfully is decoded in one pass with the
+        range's precompiled decoder (see _pre_decode).
 
         If no due sensors are Modbus sensors, the read-ahead is skipped and the
-        current enabled state is preserved.
+        current read ranges are preserved.
 
         Args:
             due_sensors:    Sensors due for publishing on this iteration.
             modbus_client:  The Modbus client to perform the read against.
-            modbus_sensors: The ReadableSensorGroup holding address range metadata.
-            modbus_lock:    The lock serialising access to the Modbus client.
+            read_ranges:    The ReadableSensorGroups holding the address range metadata of each pre-read.
+            modbus_lock:    The lock scheduling access to the Modbus client.
             name:           Scan group name, used in log messages.
             debug_logging:  Whether to emit timing debug logs.
+            priority:       Bus scheduling class used to acquire the Modbus lock.
+            deadline:       Wall-clock time after which the pre-reads are no longer worth performing.
 
         Returns:
-            True if read-ahead should remain enabled for future iterations,
-            False if it should be permanently disabled (ILLEGAL DATA ADDRESS).
+            The read ranges to use for future iterations. An empty list means
+            read-ahead is permanently disabled (ILLEGAL DATA ADDRESS).
+
+        Raises:
+            DeadlineExpired: If the Modbus lock was not granted before ``deadline``.
         """
-        read_ahead_enabled = True  # Must be currently enabled, otherwise should not have been called (multiple == True in calling method)
         due_modbus = [s for s in due_sensors if isinstance(s, ModbusSensorMixin)]
-        if due_modbus:
-            debug_read_ahead = any(s.debug_logging for s in due_modbus)
-            async with modbus_lock.lock():
-                read_ahead_start = 0.0
-                if debug_logging:
-                    read_ahead_start = time.time()
-                exception_code = await modbus_client.read_ahead_registers(
-                    modbus_sensors.first_address, count=modbus_sensors.register_count, device_id=modbus_sensors.device_address, input_type=modbus_sensors.input_type, trace=debug_read_ahead
-                )
-                if exception_code == 0:
-                    if debug_read_ahead:
-                        logger.debug(
-                            f"{self._device.log_identity} Sensor Scan Group [{name}] pre-read {modbus_sensors.first_address} to {modbus_sensors.last_address} ({modbus_sensors.register_count} registers) took {time.time() - read_ahead_start:.2f}s"
-                        )
-                else:
-                    match exception_code:
-                        case -1:
-                            reason = "NO RESPONSE FROM DEVICE"
-                        case 1:
-                            reason = "0x01 ILLEGAL FUNCTION"
-                        case 2:
-                            reason = "0x02 ILLEGAL DATA ADDRESS (pre-reads now disabled)"
-                            read_ahead_enabled = False
-                        case 3:
-                            reason = "0x03 ILLEGAL DATA VALUE"
-                        case 4:
-                            reason = "0x04 SLAVE DEVICE FAILURE"
-                        case _:
-                            reason = f"UNKNOWN PROBLEM ({exception_code=})"
-                    logger.warning(
-                        f"{self._device.log_identity} Sensor Scan Group [{name}] failed to pre-read {modbus_sensors.first_address} to {modbus_sensors.last_address} ({modbus_sensors.register_count} registers) - {reason}"
+        if not due_modbus:
+            return read_ranges
+        due_ids = {id(s) for s in due_modbus}
+        updated_ranges: list[ReadableSensorGroup] = []
+        debug_read_ahead = any(s.debug_logging for s in due_modbus)
+
+        async def _pre_read(modbus_sensors: ReadableSensorGroup) -> tuple[int, float]:
+            read_ahead_start = time.time()
+            exception_code = await modbus_client.read_ahead_registers(
+                modbus_sensors.first_address, count=modbus_sensors.register_count, device_id=modbus_sensors.device_address, input_type=modbus_sensors.input_type, trace=debug_read_ahead
+            )
+            return exception_code, time.time() - read_ahead_start
+
+        due_ranges = [r for r in read_ranges if len(read_ranges) == 1 or any(id(s) in due_ids for s in r)]
+        async with modbus_lock.lock(priority=priority, deadline=deadline, shared=True):
+            # Issued together so that a pipelined client can keep them all in flight at once
+            results = await asyncio.gather(*[_pre_read(r) for r in due_ranges], return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        outcomes: dict[int, tuple[int, float]] = {id(r): result for r, result in zip(due_ranges, results)}  # type: ignore[misc]
+        for modbus_sensors in read_ranges:
+            if id(modbus_sensors) not in outcomes:
+                updated_ranges.append(modbus_sensors)
+                continue
+            exception_code, elapsed = outcomes[id(modbus_sensors)]
+            if exception_code == 0:
+                updated_ranges.append(modbus_sensors)
+                self._pre_decode(modbus_sensors, modbus_client, due_ids)
+                if debug_read_ahead:
+                    logger.debug(
+                        f"{self._device.log_identity} Sensor Scan Group [{name}] pre-read {modbus_sensors.first_address} to {modbus_sensors.last_address} ({modbus_sensors.register_count} registers) took {elapsed:.2f}s"
                     )
-        return read_ahead_enabled
+            else:
+                match exception_code:
+                    case -1:
+                        reason = "NO RESPONSE FROM DEVICE"
+                    case 1:
+                        reason = "0x01 ILLEGAL FUNCTION"
+                    case 2:
+                        runs = modbus_sensors.split_at_gaps()
+                        if len(runs) > 1:
+                            reason = f"0x02 ILLEGAL DATA ADDRESS (pre-reads now split into {len(runs)} contiguous ranges)"
+                            updated_ranges.extend(run for run in runs if len(run) > 1)
+                        else:
+                            reason = "0x02 ILLEGAL DATA ADDRESS (pre-reads now disabled)"
+                    case 3:
+                        reason = "0x03 ILLEGAL DATA VALUE"
+                    case 4:
+                        reason = "0x04 SLAVE DEVICE FAILURE"
+                    case _:
+                        reason = f"UNKNOWN PROBLEM ({exception_code=})"
+                if exception_code != 2:
+                    updated_ranges.append(modbus_sensors)
+                logger.warning(
+                    f"{self._device.log_identity} Sensor Scan Group [{name}] failed to pre-read {modbus_sensors.first_address} to {modbus_sensors.last_address} ({modbus_sensors.register_count} registers) - {reason}"
+                )
+        return updated_ranges
 
     async def _reconnect_modbus_with_backoff(self, modbus_client: ModbusClient) -> bool:
         """Attempt to reconnect to the Modbus server using exponential backoff.
@@ -262,16 +366,17 @@ class SensorGroupPoller:
         1. Checks for a day change and forces immediate republish of any sensors
            with EnergyDailyAccumulationSensor derived sensors.
         2. Determines which sensors are due (by scheduled time or force_publish flag).
-        3. If multiple Modbus sensors are due and read-ahead is enabled, performs a
-           single bulk register read via _publish_read_ahead to pre-populate the
-           Modbus client's read cache.
+        3. If multiple Modbus sensors are due and read-ahead is enabled, performs
+           bulk register reads via _publish_read_ahead to pre-populate the Modbus
+           client's read cache, and decodes each block once for the due sensors.
         4. Publishes each due sensor and schedules its next publish time.
         5. If rediscover is set on the device, republishes discovery.
         6. On ModbusException, acquires the Modbus lock and attempts reconnection
            via _reconnect_modbus_with_backoff (lock is held for the duration to
            prevent concurrent reconnection attempts from sibling tasks).
-        7. Sleeps until the next sensor is due, up to a maximum of 1 second to
-           remain responsive to shutdown signals.
+        7. Waits on the thread's ScanScheduler until the next publishable sensor
+           is due (or local midnight, if the group has daily sensors). The wait
+           is woken early by force_publish and cancelled by shutdown.
 
         Args:
             modbus_client: The Modbus client for register reads, or None for
@@ -285,6 +390,7 @@ class SensorGroupPoller:
         # Setup for Modbus read-ahead optimization
         modbus_sensors: ReadableSensorGroup = ReadableSensorGroup(*[s for s in sensors if isinstance(s, ModbusSensorMixin)])
         multiple: bool = len(modbus_sensors) > 1 and modbus_sensors.register_count != -1 and 1 <= modbus_sensors.register_count <= Constants.MAX_MODBUS_REGISTERS_PER_REQUEST
+        read_ranges: list[ReadableSensorGroup] = [modbus_sensors] if multiple else []
 
         # Initialize per-sensor next publish times, find any daily sensors, and determine if debug logging is needed for this group
         next_publish_times, daily_sensors, debug_logging = await self._init_next_publish_times(modbus_client, mqtt_client, *sensors)
@@ -295,14 +401,16 @@ class SensorGroupPoller:
             )
 
         lock = ModbusLockFactory.get(modbus_client)
+        priority = self._bus_priority(sensors)
+        scheduler = ScanScheduler.get()
         last_day = time.localtime(time.time()).tm_yday
 
         # Main publishing loop - respects shutdown event
         while device.online and not device._shutdown_event.is_set():
-            now = time.time()
+            now = time.monotonic()
 
             # Check for day change (affects daily sensors)
-            now_struct = time.localtime(now)
+            now_struct = time.localtime(time.time())
             day_changed = now_struct.tm_yday != last_day
             if day_changed:
                 last_day = now_struct.tm_yday
@@ -317,8 +425,10 @@ class SensorGroupPoller:
 
             if due_sensors:
                 try:
-                    if multiple and modbus_client:
-                        multiple = await self._publish_read_ahead(due_sensors, modbus_client, modbus_sensors, lock, name, debug_logging)
+                    if read_ranges and modbus_client:
+                        # Pre-reads not granted the bus before the sensors are next due are dropped rather than served late
+                        deadline = time.time() + min(s.scan_interval for s in due_sensors)
+                        read_ranges = await self._publish_read_ahead(due_sensors, modbus_client, read_ranges, lock, name, debug_logging, priority, deadline)
 
                     # Publish each due sensor and update its next publish time
                     for sensor in due_sensors:
@@ -330,10 +440,15 @@ class SensorGroupPoller:
                         device.rediscover = False
                         device.publish_discovery(mqtt_client, clean=False)
 
+                except DeadlineExpired:
+                    logger.debug(f"{device.log_identity} Sensor Scan Group [{name}] {priority.name} pre-read was not granted the Modbus bus before its deadline: postponing {len(due_sensors)} sensors")
+                    for sensor in due_sensors:
+                        next_publish_times[sensor] = now + sensor.scan_interval
+                        sensor.force_publish = False
                 except ModbusException as e:
                     if modbus_client:
                         logger.debug(f"{device.log_identity} Sensor Scan Group [{name}] handling {e!s}: Acquiring lock before attempting to reconnect... ({lock.waiters=})")
-                        async with lock.lock(timeout=None):
+                        async with lock.lock(timeout=None, priority=BusPriority.WRITE):
                             if not modbus_client.connected and device.online:
                                 # Retain lock while attempting to reconnect to prevent multiple concurrent reconnection attempts from other tasks
                                 reconnected = await self._reconnect_modbus_with_backoff(modbus_client)
@@ -341,26 +456,31 @@ class SensorGroupPoller:
                                     logger.error(f"{device.log_identity} failed to reconnect to Modbus, sensor updates paused")
                 except RuntimeError as e:
                     logger.error(f"{device.log_identity} Sensor Scan Group [{name}] encountered an error: {e!r}")
-
-            # Sleep until the next sensor is due (max 1 second to stay responsive to shutdown)
-            if next_publish_times:
-                next_due = min(next_publish_times.values())
-                sleep_duration = max(0.1, min(next_due - time.time(), 1))
-            else:
-                sleep_duration = 1
-
-            if sleep_duration > 0:
-                task = asyncio.create_task(asyncio.sleep(sleep_duration))
-                for sensor in sensors:
-                    sensor.sleeper_task = task
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    if debug_logging:
-                        logger.debug(f"{device.log_identity} Sensor Scan Group [{name}] sleep interrupted")
                 finally:
-                    for sensor in sensors:
-                        sensor.sleeper_task = None
+                    # Values pre-decoded for sensors that were not read (e.g. after an error) must not be served on a later iteration
+                    for sensor in due_sensors:
+                        if isinstance(sensor, ReadOnlySensor):
+                            sensor.discard_pre_decoded()
+
+            # Wait until the next publishable sensor is due (and no later than midnight if day changes matter).
+            # Sensors flagged with force_publish while this iteration was publishing are due now.
+            monotonic_now = time.monotonic()
+            due_times = [monotonic_now if s.force_publish else t for s, t in next_publish_times.items() if s.publishable]
+            delay = max(0.1, min(due_times) - monotonic_now) if due_times else None
+            if daily_sensors:
+                delay = min(delay if delay is not None else math.inf, _seconds_until_midnight(time.time()))
+
+            waiter = scheduler.schedule(delay)
+            for sensor in sensors:
+                sensor.sleeper_task = waiter
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if debug_logging:
+                    logger.debug(f"{device.log_identity} Sensor Scan Group [{name}] sleep interrupted")
+            finally:
+                for sensor in sensors:
+                    sensor.sleeper_task = None
 
         if debug_logging:
             logger.debug(f"{device.log_identity} Sensor Scan Group [{name}] completed - {device.log_identity} completed - flagged as offline ({device.online=})")
@@ -32,6 +32,15 @@ class DeviceRegistry:
         """
         cls._devices[plant_index].append(device)
 
+    @classmethod
+    def all(cls) -> list["Device"]:
+        """Return a list of the devices registered under every plant index.
+
+        Returns:
+            A new list containing every registered Device instance.
+        """
+        return [device for devices in list(cls._devices.values()) for device in devices]
+
     @classmethod
     def clear(cls) -> None:
         """Remove all registered devices and reset the registry to a clean state.
@@ -1,11 +1,20 @@
 import logging
-from typing import TYPE_CHECKING
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from pymodbus.exceptions import ModbusException
 
 from sigenergy2mqtt.common import Constants, InputType
 from sigenergy2mqtt.config import active_config
-from sigenergy2mqtt.sensors.base import ModbusSensorMixin, ReadableSensorMixin, ReservedSensor
+from sigenergy2mqtt.modbus import BlockDecoder
+from sigenergy2mqtt.sensors.base import ModbusSensorMixin, ReadableSensorMixin, ReadOnlySensor, ReservedSensor
 
 if TYPE_CHECKING:
+    from sigenergy2mqtt.modbus import ModbusClient
+
     from .device import Device
 
 logger = logging.getLogger(__name__)
@@ -37,6 +46,7 @@ class ReadableSensorGroup(list[ReadableSensorMixin | ModbusSensorMixin]):
         self.last_address: int = -1
         self.device_address: int = -1
         self.input_type: InputType = InputType.NONE
+        self._decoder: tuple[BlockDecoder, list[ReadOnlySensor]] | None = None
         for sensor in sensors:
             self.append(sensor)
 
@@ -89,10 +99,286 @@ class ReadableSensorGroup(list[ReadableSensorMixin | ModbusSensorMixin]):
                     raise ValueError(f"All ModbusSensorMixin instances in a ReadableSensorGroup must have the same input type, expected {self.input_type}, got {sensor.input_type}")
         elif any(s for s in self if isinstance(s, ModbusSensorMixin)):
             raise ValueError("Cannot add non-ModbusSensorMixin to a ReadableSensorGroup that already contains ModbusSensorMixin instances")
+        self._decoder = None
         return super().append(sensor)
 
+    @property
+    def decoder(self) -> tuple[BlockDecoder, list[ReadOnlySensor]]:
+        """The precompiled decoder for the group's register block, and the sensors whose values it decodes (in field order).
+
+        Only sensors that read their value with the standard ReadOnlySensor read
+        path are included, because only they consume a pre-decoded value. The
+        decoder is compiled on first use and recompiled if sensors are appended.
+        """
+        if self._decoder is None:
+            decoded = [
+                s
+                for s in self
+                if isinstance(s, ReadOnlySensor)
+                and type(s)._update_internal_state is ReadOnlySensor._update_internal_state
+                and type(s)._perform_modbus_read is ReadOnlySensor._perform_modbus_read
+            ]
+            decoder = BlockDecoder(self.first_address, self.register_count, [(s.address, s.count, s.data_type) for s in decoded])
+            self._decoder = (decoder, decoded)
+        return self._decoder
+
+    async def pre_read(self, modbus_client: "ModbusClient") -> bool:
+        """Read the group's register block in one request, and hand each sensor its decoded value for its next read.
+
+        Batches one-off reads of adjacent registers, such as the probes made when
+        a device is first detected. If the block cannot be read, nothing is
+        handed over, and each sensor reads its own registers as usual.
+
+        Args:
+            modbus_client: The Modbus client to read the block with.
+
+        Returns:
+            True if the block was read and decoded.
+        """
+        if self.register_count < 1:
+            return False
+        if self.input_type == InputType.HOLDING:
+            read = modbus_client.read_holding_registers
+        elif self.input_type == InputType.INPUT:
+            read = modbus_client.read_input_registers
+        else:
+            return False
+        try:
+            rr = await read(self.first_address, count=self.register_count, device_id=self.device_address)
+        except (ModbusException, TimeoutError, OSError) as exc:
+            logger.debug(f"Pre-read of {self.register_count} registers from {self.first_address} (device_id={self.device_address}) failed: {exc}")
+            return False
+        if rr.isError() or len(rr.registers) != self.register_count:
+            return False
+        read_at = time.time()
+        decoder, decoded = self.decoder
+        for sensor, value in zip(decoded, decoder.decode(rr.registers)):
+            if value is not None:
+                sensor.pre_decode(value, read_at=read_at)
+        return True
+
+    def split_at_gaps(self) -> list["ReadableSensorGroup"]:
+        """Split the publishable Modbus sensors of the group into runs of contiguous register addresses.
+
+        Used when a read of the full span (which may bridge unused registers) is
+        rejected by the device, so that the contiguous runs can still be read
+        in bulk. Non-publishable and non-Modbus sensors are not included.
+
+        Returns:
+            A list of groups ordered by address. A group without gaps is
+            returned as a single run.
+        """
+        runs: list[ReadableSensorGroup] = []
+        next_address = -1
+        for sensor in sorted((s for s in self if isinstance(s, ModbusSensorMixin) and s.publishable), key=lambda s: s.address):
+            if not runs or sensor.address > next_address:
+                runs.append(ReadableSensorGroup())
+            runs[-1].append(sensor)
+            next_address = max(next_address, sensor.address + sensor.count)
+        return runs
+
+
+@dataclass(frozen=True)
+class ScanCostModel:
+    """Estimated Modbus bus time consumed by register reads.
+
+    Attributes:
+        request_overhead: Fixed cost in seconds of a single Modbus request
+                          (round trip, framing and device turnaround).
+        register_cost:    Incremental cost in seconds of each register in a request.
+    """
+
+    request_overhead: float = 0.05
+    register_cost: float = 0.0005
+
+    def request_cost(self, register_count: int) -> float:
+        """Return the expected bus time in seconds of one request for register_count registers."""
+        return self.request_overhead + register_count * self.register_cost
+
+    def hourly_cost(self, register_count: int, scan_interval: float) -> float:
+        """Return the expected bus time in seconds per hour of reading register_count registers every scan_interval seconds."""
+        return 3600 / scan_interval * self.request_cost(register_count)
+
+    @property
+    def break_even_gap(self) -> int:
+        """The largest number of unused registers that is cheaper to read than to issue a separate request."""
+        return int(self.request_overhead / self.register_cost) if self.register_cost > 0 else Constants.MAX_MODBUS_REGISTERS_PER_REQUEST
+
+
+DEFAULT_SCAN_COST_MODEL = ScanCostModel()
+
+
+@dataclass(frozen=True)
+class ScanGroupPlan:
+    """The planned read schedule of a single Modbus scan group."""
+
+    name: str
+    device_address: int
+    input_type: InputType
+    first_address: int
+    register_count: int
+    sensor_count: int
+    scan_interval: float
+    bus_secs_per_hour: float
+
+    @property
+    def reads_per_hour(self) -> float:
+        return 3600 / self.scan_interval
+
+    def describe(self) -> str:
+        """Return a one-line human-readable summary of the plan."""
+        return f"{self.first_address}-{self.first_address + self.register_count - 1} ({self.register_count} registers, {self.sensor_count} sensors) every {self.scan_interval:g}s = {self.bus_secs_per_hour:.2f}s/h"
+
+
+class IllegalAddressRegistry:
+    """Process-wide record of register addresses rejected with ILLEGAL DATA ADDRESS (0x02).
+
+    Populated by validate_publishable_sensors() before scan groups are created,
+    so that create_sensor_scan_groups() never bridges a gap across an address
+    the device is known to reject.
+    """
+
+    _addresses: ClassVar[dict[tuple[int, int, InputType], set[int]]] = defaultdict(set)
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def record(cls, plant_index: int, device_address: int, input_type: InputType, address: int, count: int = 1) -> None:
+        """Record count registers starting at address as illegal."""
+        with cls._lock:
+            cls._addresses[(plant_index, device_address, input_type)].update(range(address, address + count))
+
+    @classmethod
+    def overlaps(cls, plant_index: int, device_address: int, input_type: InputType, first_address: int, last_address: int) -> bool:
+        """Return True if any register from first_address to last_address inclusive has been recorded as illegal."""
+        with cls._lock:
+            addresses = cls._addresses.get((plant_index, device_address, input_type))
+            return bool(addresses) and any(address in addresses for address in range(first_address, last_address + 1))
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove all recorded addresses."""
+        with cls._lock:
+            cls._addresses = defaultdict(set)
+
+
+class ScanPlanRegistry:
+    """Process-wide record of the scan group plans created for each device.
+
+    Populated by create_sensor_scan_groups() and read by the diagnostics
+    collectors to report the plan and its predicted bus load per plant.
+    """
+
+    _plans: ClassVar[dict[int, dict[str, list[ScanGroupPlan]]]] = defaultdict(dict)
+    _lock: ClassVar[threading.Lock] = threading.Lock()  # Devices are scheduled from their own threads
+    cost_model: ClassVar[ScanCostModel] = DEFAULT_SCAN_COST_MODEL
+
+    @classmethod
+    def record(cls, plant_index: int, device_name: str, plans: list[ScanGroupPlan]) -> None:
+        """Record (or replace) the plans for a device."""
+        with cls._lock:
+            cls._plans[plant_index][device_name] = plans
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove all recorded plans."""
+        with cls._lock:
+            cls._plans = defaultdict(dict)
+
+    @classmethod
+    def snapshot(cls) -> dict[str, Any]:
+        """Return a JSON-serialisable summary of all recorded plans and their predicted bus load, grouped by plant."""
+        with cls._lock:
+            recorded = [(plant_index, [(device_name, plan) for device_name, device_plans in devices.items() for plan in device_plans]) for plant_index, devices in sorted(cls._plans.items())]
+        snapshot: dict[str, Any] = {}
+        for plant_index, plans in recorded:
+            bus_secs = sum(plan.bus_secs_per_hour for _, plan in plans)
+            snapshot[f"plant_{plant_index}"] = {
+                "scan_groups_count": len(plans),
+                "reads_per_hour": round(sum(plan.reads_per_hour for _, plan in plans), 2),
+                "predicted_bus_time_per_hour_secs": round(bus_secs, 3),
+                "predicted_bus_load_pct": round(bus_secs / 36, 3),
+                "groups": {f"{device_name} [{plan.name}]": plan.describe() for device_name, plan in plans},
+            }
+        snapshot["config"] = {
+            "request_overhead_ms": cls.cost_model.request_overhead * 1000,
+            "register_cost_ms": cls.cost_model.register_cost * 1000,
+        }
+        return snapshot
+
+
+def _scan_span(sensors: list[ReadableSensorMixin]) -> tuple[int, int, float]:
+    """Return (first_address, register_count, fastest scan_interval) of the publishable Modbus sensors in a list.
+
+    Returns (-1, 0, 0.0) if there are no publishable Modbus sensors.
+    """
+    first_address = last_address = -1
+    scan_interval = 0.0
+    for sensor in sensors:
+        if isinstance(sensor, ModbusSensorMixin) and sensor.publishable:
+            if first_address == -1 or sensor.address < first_address:
+                first_address = sensor.address
+            if last_address == -1 or sensor.address + sensor.count - 1 > last_address:
+                last_address = sensor.address + sensor.count - 1
+            if scan_interval == 0.0 or sensor.scan_interval < scan_interval:
+                scan_interval = sensor.scan_interval
+    if first_address == -1 or scan_interval <= 0:
+        return -1, 0, 0.0
+    return first_address, last_address - first_address + 1, scan_interval
+
+
+def partition_scan_group(sensors: list[ReadableSensorMixin], cost_model: ScanCostModel = DEFAULT_SCAN_COST_MODEL) -> list[list[ReadableSensorMixin]]:
+    """Split an address-ordered scan group into the contiguous runs with the lowest expected bus time.
+
+    A group is read in full whenever any of its sensors is due, so a single fast
+    sensor inside a group of slow sensors causes the whole span to be read at
+    the fast rate. Each candidate run is costed as the request overhead plus
+    the per-register cost of its span, multiplied by the number of reads per
+    hour at the run's fastest scan interval. The optimal partition into
+    contiguous runs is found by dynamic programming in O(n²).
+
+    Runs never reorder sensors, so each run covers a subset of the original
+    span and never exceeds its register count.
 
-def create_sensor_scan_groups(device: "Device") -> dict[str, list[ReadableSensorMixin]]:
+    Args:
+        sensors:    The sensors of a single group, ordered by address.
+        cost_model: The cost model used to estimate bus time.
+
+    Returns:
+        A list of sensor runs. A group that is already optimal is returned as a
+        single run containing all sensors.
+    """
+    n = len(sensors)
+    if n < 2:
+        return [list(sensors)]
+    best: list[float] = [0.0] + [float("inf")] * n
+    split: list[int] = [0] * (n + 1)
+    for end in range(1, n + 1):
+        # Extend the candidate run backwards from sensors[end - 1], maintaining its span and fastest interval incrementally
+        first_address = last_address = -1
+        scan_interval = 0.0
+        for start in range(end - 1, -1, -1):
+            sensor = sensors[start]
+            if isinstance(sensor, ModbusSensorMixin) and sensor.publishable:
+                if first_address == -1 or sensor.address < first_address:
+                    first_address = sensor.address
+                if last_address == -1 or sensor.address + sensor.count - 1 > last_address:
+                    last_address = sensor.address + sensor.count - 1
+                if scan_interval == 0.0 or sensor.scan_interval < scan_interval:
+                    scan_interval = sensor.scan_interval
+            run_cost = cost_model.hourly_cost(last_address - first_address + 1, scan_interval) if first_address != -1 and scan_interval > 0 else 0.0
+            cost = best[start] + run_cost
+            if cost <= best[end] + 1e-9:  # Candidates are visited shortest first, so ties prefer fewer, longer runs
+                best[end] = cost
+                split[end] = start
+    runs: list[list[ReadableSensorMixin]] = []
+    end = n
+    while end > 0:
+        runs.insert(0, list(sensors[split[end] : end]))
+        end = split[end]
+    return runs
+
+
+def create_sensor_scan_groups(device: "Device", cost_model: ScanCostModel | None = None) -> dict[str, list[ReadableSensorMixin]]:
     """Build optimised Modbus scan groups for all readable sensors on a device and its children.
 
     Groups are constructed to minimise the number of Modbus read requests:
@@ -101,10 +387,20 @@ def create_sensor_scan_groups(device: "Device") -> dict[str, list[ReadableSensor
     Constants.MAX_MODBUS_REGISTERS_PER_REQUEST limit. If active_config.modbus[plant_index].
     disable_chunking is True, each sensor gets its own group.
 
+    Gaps of up to active_config.modbus[plant_index].max_bridged_gap unused
+    registers (capped at the cost model's break-even gap) are bridged rather
+    than starting a new group, unless the gap or the next sensor covers an
+    address recorded in IllegalAddressRegistry.
+
     Named groups (registered via Device._add_sensor with a group key) are always
     kept intact and take priority. Auto-generated groups use the key format
     "{device_address:03d}_{first_address:05d}".
 
+    Each auto-generated group is then partitioned by partition_scan_group() so
+    that sensors with a much faster scan interval than their neighbours do not
+    drag the whole contiguous span into every fast read. The resulting plan and
+    its predicted bus time are recorded in ScanPlanRegistry for diagnostics.
+
     ReservedSensors at the start of a new group are skipped (they cannot lead
     a group). ReservedSensors trailing a group are removed in post-processing.
     Empty groups are deleted.
@@ -113,11 +409,15 @@ def create_sensor_scan_groups(device: "Device") -> dict[str, list[ReadableSensor
     group at the end.
 
     Args:
-        device: The root device whose sensors (and children's sensors) are to be grouped.
+        device:     The root device whose sensors (and children's sensors) are to be grouped.
+        cost_model: The cost model used to partition groups and predict bus time.
+                    Defaults to ScanPlanRegistry.cost_model.
 
     Returns:
         A dict mapping group name to list of ReadableSensorMixin instances.
     """
+    if cost_model is None:
+        cost_model = ScanPlanRegistry.cost_model
     all_child_sensors = device.get_all_sensors(search_children=True)
     combined_sensors: dict[str, ReadableSensorMixin] = {uid: s for uid, s in all_child_sensors.items() if isinstance(s, ReadableSensorMixin)}
 
@@ -133,6 +433,7 @@ def create_sensor_scan_groups(device: "Device") -> dict[str, list[ReadableSensor
             collect_groups(child)
 
     collect_groups(device)
+    named_groups = set(combined_groups.keys())
 
     named_group_sensors: dict[int, ModbusSensorMixin] = {  # Multiple sensors with the same address are not possible and would in any event be detected in the Sensor constructor
         s.address: s for sublist in combined_groups.values() for s in sublist if isinstance(s, ModbusSensorMixin)
@@ -144,20 +445,22 @@ def create_sensor_scan_groups(device: "Device") -> dict[str, list[ReadableSensor
     group_name: str | None = None
 
     # Create Modbus sensor scan groups for sensors that are not already in a named group.
-    # Grouped by device_address and contiguous addresses only (scan_interval handled per-sensor in publish_updates).
+    # Grouped by device_address and contiguous (or bridged) addresses only (scan_interval handled per-sensor in publish_updates).
     all_grouped = [gs for lst in combined_groups.values() for gs in lst]
     for sensor in sorted(
         [s for s in combined_sensors.values() if isinstance(s, ModbusSensorMixin) and s not in all_grouped],
         key=lambda s: (s.device_address, s.address),
     ):
+        modbus_config = active_config.modbus[device.plant_index]
         if (  # Conditions for creating a new sensor scan group
-            active_config.modbus[device.plant_index].disable_chunking  # If chunking is disabled, always create a new group
+            modbus_config.disable_chunking  # If chunking is disabled, always create a new group
             or group_name is None  # First sensor
             or first_address == -1  # Safety check for uninitialized first_address
             or sensor.device_address != device_address  # Device address changed
             or sensor.input_type != input_type  # Input type changed
-            or sensor.address > next_address  # Non-contiguous addresses
-            or (next_address - first_address + sensor.count) > Constants.MAX_MODBUS_REGISTERS_PER_REQUEST  # Modbus request size exceeded
+            or sensor.address - next_address > min(modbus_config.max_bridged_gap, cost_model.break_even_gap)  # Gap too large to bridge
+            or IllegalAddressRegistry.overlaps(device.plant_index, sensor.device_address, sensor.input_type, next_address, sensor.address + sensor.count - 1)  # Never read across illegal addresses
+            or (sensor.address + sensor.count - first_address) > Constants.MAX_MODBUS_REGISTERS_PER_REQUEST  # Modbus request size exceeded
         ):
             # Don't start a group with a ReservedSensor
             if isinstance(sensor, ReservedSensor):
@@ -180,6 +483,23 @@ def create_sensor_scan_groups(device: "Device") -> dict[str, list[ReadableSensor
         device_address = sensor.device_address
         input_type = sensor.input_type
 
+    # Partition auto-generated groups by expected bus time (named groups are kept intact)
+    auto_groups = [g for g in combined_groups if g not in named_groups]
+    if auto_groups and not active_config.modbus[device.plant_index].disable_chunking:
+        partitioned: dict[str, list[ReadableSensorMixin]] = {}
+        for g_name, group in combined_groups.items():
+            runs = partition_scan_group(group, cost_model) if g_name in auto_groups else [group]
+            if len(runs) == 1:
+                partitioned[g_name] = group
+                continue
+            for run in runs:
+                while run and isinstance(run[0], ReservedSensor):  # Don't start a group with a ReservedSensor
+                    run.pop(0)
+                if run:
+                    partitioned[f"{run[0].device_address:03d}_{run[0].address:05d}"] = run  # type: ignore[union-attr]
+            logger.debug(f"{device.log_identity} Sensor Scan Group [{g_name}] partitioned into {len(runs)} groups by scan interval")
+        combined_groups = partitioned
+
     # Post-process groups to remove trailing ReservedSensors and empty groups
     for g_name in list(combined_groups.keys()):
         group = combined_groups[g_name]
@@ -188,6 +508,25 @@ def create_sensor_scan_groups(device: "Device") -> dict[str, list[ReadableSensor
         if not group:
             del combined_groups[g_name]
 
+    plans: list[ScanGroupPlan] = []
+    for g_name, group in combined_groups.items():
+        first, register_count, scan_interval = _scan_span(group)
+        if register_count > 0:
+            modbus_sensor = next(s for s in group if isinstance(s, ModbusSensorMixin) and s.publishable)
+            plans.append(
+                ScanGroupPlan(
+                    name=g_name,
+                    device_address=modbus_sensor.device_address,
+                    input_type=modbus_sensor.input_type,
+                    first_address=first,
+                    register_count=register_count,
+                    sensor_count=len(group),
+                    scan_interval=scan_interval,
+                    bus_secs_per_hour=cost_model.hourly_cost(register_count, scan_interval),
+                )
+            )
+    ScanPlanRegistry.record(device.plant_index, device.name, plans)
+
     # Create a single scan group for remaining non-Modbus readable sensors
     non_modbus_sensors = [s for s in combined_sensors.values() if not isinstance(s, ModbusSensorMixin) and isinstance(s, ReadableSensorMixin) and s not in all_grouped]
     if non_modbus_sensors:
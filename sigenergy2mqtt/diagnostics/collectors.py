@@ -11,9 +11,11 @@ class DiagnosticsCollectors:
     @classmethod
     def collect_metrics(cls) -> None:
         """Register diagnostics collectors for metrics components."""
+        diagnostics_registry.register("bus_schedule", cls._diagnostics_collect_bus_schedule)
         diagnostics_registry.register("modbus", cls._diagnostics_collect_modbus_metrics)
         diagnostics_registry.register("mqtt", cls._diagnostics_collect_mqtt_metrics)
         diagnostics_registry.register("persistence", cls._diagnostics_collect_state_store_metrics)
+        diagnostics_registry.register("scan_plan", cls._diagnostics_collect_scan_plan)
         if active_config.influxdb.enabled:
             diagnostics_registry.register("influxdb", cls._diagnostics_collect_influxdb_metrics)
         if active_config.pvoutput.enabled:
@@ -21,13 +23,23 @@ class DiagnosticsCollectors:
 
     @classmethod
     async def _diagnostics_collect_influxdb_metrics(cls) -> dict[str, Any]:
-        """Diagnostics provider callback: exposes the latest InfluxDB metrics."""
+        """Diagnostics provider callback: exposes the latest InfluxDB metrics and spool depth."""
+        from sigenergy2mqtt.influxdb.spool import InfluxSpool
+
         async with Metrics.lock(timeout=1.0):
             return {
                 f"{_t('InfluxDBWriteErrors.name')}": Metrics.sigenergy2mqtt_influxdb_write_errors,
                 f"{_t('InfluxDBWriteMax.name')}_ms": Metrics.sigenergy2mqtt_influxdb_write_max,
                 f"{_t('InfluxDBWriteMean.name')}_ms": Metrics.sigenergy2mqtt_influxdb_write_mean,
                 f"{_t('InfluxDBWriteMin.name')}_ms": Metrics.sigenergy2mqtt_influxdb_write_min if Metrics.sigenergy2mqtt_influxdb_write_min != float("inf") else 0.0,
+                f"{_t('InfluxDBBatchSizeMax.name')}": Metrics.sigenergy2mqtt_influxdb_batch_size_max,
+                f"{_t('InfluxDBBatchSizeMean.name')}": Metrics.sigenergy2mqtt_influxdb_batch_size_mean,
+                f"{_t('InfluxDBBatchSizeP50.name')}": Metrics.sigenergy2mqtt_influxdb_batch_size_p50,
+                f"{_t('InfluxDBBatchSizeP99.name')}": Metrics.sigenergy2mqtt_influxdb_batch_size_p99,
+                f"{_t('InfluxDBFlushDelayMax.name')}_ms": Metrics.sigenergy2mqtt_influxdb_flush_delay_max,
+                f"{_t('InfluxDBFlushDelayMean.name')}_ms": Metrics.sigenergy2mqtt_influxdb_flush_delay_mean,
+                f"{_t('InfluxDBFlushDelayP50.name')}_ms": Metrics.sigenergy2mqtt_influxdb_flush_delay_p50,
+                f"{_t('InfluxDBFlushDelayP99.name')}_ms": Metrics.sigenergy2mqtt_influxdb_flush_delay_p99,
                 f"{_t('InfluxDBQueryErrors.name')}": Metrics.sigenergy2mqtt_influxdb_query_errors,
                 f"{_t('InfluxDBRetries.name')}": Metrics.sigenergy2mqtt_influxdb_retries,
                 f"{_t('InfluxDBRateLimitWaits.name')}": Metrics.sigenergy2mqtt_influxdb_rate_limit_waits,
@@ -35,7 +47,11 @@ class DiagnosticsCollectors:
                     "write_timeout_secs": active_config.influxdb.write_timeout,
                     "batch_size": active_config.influxdb.batch_size,
                     "flush_interval_secs": active_config.influxdb.flush_interval,
+                    "spool_max_size_mib": active_config.influxdb.spool_max_size,
+                    "spool_max_age_hours": active_config.influxdb.spool_max_age,
+                    "spool_replay_rate": active_config.influxdb.spool_replay_rate,
                 },
+                "spool": InfluxSpool.snapshot(),
             }
 
     @classmethod
@@ -45,6 +61,7 @@ class DiagnosticsCollectors:
             return {
                 f"{_t('ModbusPhysicalReads.name')}_pct": Metrics.sigenergy2mqtt_modbus_physical_read_percentage,
                 f"{_t('ModbusCacheHits.name')}_pct": Metrics.sigenergy2mqtt_modbus_cache_hit_percentage,
+                f"{_t('ModbusUnchangedReads.name')}_pct": Metrics.sigenergy2mqtt_modbus_unchanged_percentage,
                 f"{_t('ModbusReadMax.name')}_ms": Metrics.sigenergy2mqtt_modbus_read_max,
                 f"{_t('ModbusReadMean.name')}_ms": Metrics.sigenergy2mqtt_modbus_read_mean,
                 f"{_t('ModbusReadMin.name')}_ms": Metrics.sigenergy2mqtt_modbus_read_min if Metrics.sigenergy2mqtt_modbus_read_min != float("inf") else 0.0,
@@ -54,10 +71,14 @@ class DiagnosticsCollectors:
                 f"{_t('ModbusWriteMin.name')}_ms": Metrics.sigenergy2mqtt_modbus_write_min if Metrics.sigenergy2mqtt_modbus_write_min != float("inf") else 0.0,
                 f"{_t('ModbusWriteErrors.name')}": Metrics.sigenergy2mqtt_modbus_write_errors,
                 f"{_t('ModbusSkippedErrors.name')}": Metrics.sigenergy2mqtt_modbus_skipped_errors,
+                f"{_t('ModbusInFlight.name')}": Metrics.sigenergy2mqtt_modbus_in_flight,
+                f"{_t('ModbusQueueDelayMax.name')}_ms": Metrics.sigenergy2mqtt_modbus_queue_delay_max,
+                f"{_t('ModbusQueueDelayMean.name')}_ms": Metrics.sigenergy2mqtt_modbus_queue_delay_mean,
                 "config": {
                     "disable_chunking": "yes" if active_config.modbus[0].disable_chunking else "no",
                     "timeout_0_secs": active_config.modbus[0].timeout,
                     "max_retries_0": active_config.modbus[0].retries,
+                    "pipeline_depth_0": active_config.modbus[0].pipeline_depth,
                 },
             }
 
@@ -101,6 +122,20 @@ class DiagnosticsCollectors:
                 },
             }
 
+    @classmethod
+    def _diagnostics_collect_bus_schedule(cls) -> dict[str, Any]:
+        """Diagnostics provider callback: exposes per-priority Modbus bus queue wait times."""
+        from sigenergy2mqtt.modbus import ModbusLockFactory
+
+        return ModbusLockFactory.snapshot()
+
+    @classmethod
+    def _diagnostics_collect_scan_plan(cls) -> dict[str, Any]:
+        """Diagnostics provider callback: exposes the Modbus scan group plan and its predicted bus load."""
+        from sigenergy2mqtt.devices.base.scan_groups import ScanPlanRegistry
+
+        return ScanPlanRegistry.snapshot()
+
     @classmethod
     async def _diagnostics_collect_state_store_metrics(cls) -> dict[str, Any]:
         """Diagnostics provider callback: exposes the latest StateStore metrics."""
@@ -110,12 +145,17 @@ class DiagnosticsCollectors:
                 f"{_t('StateStoreSaveMean.name')}_ms": Metrics.sigenergy2mqtt_state_store_save_mean,
                 f"{_t('StateStoreSaveMin.name')}_ms": Metrics.sigenergy2mqtt_state_store_save_min if Metrics.sigenergy2mqtt_state_store_save_min != float("inf") else 0.0,
                 f"{_t('StateStoreLoadHitPercentage.name')}": Metrics.sigenergy2mqtt_state_store_load_hit_percentage,
+                f"{_t('StateStoreSaveRequests.name')}": Metrics.sigenergy2mqtt_state_store_save_requests,
+                f"{_t('StateStoreSaves.name')}": Metrics.sigenergy2mqtt_state_store_saves,
                 f"{_t('StateStoreSaveErrors.name')}": Metrics.sigenergy2mqtt_state_store_save_errors,
                 f"{_t('StateStoreLoadErrors.name')}": Metrics.sigenergy2mqtt_state_store_load_errors,
                 f"{_t('StateStoreDeleteErrors.name')}": Metrics.sigenergy2mqtt_state_store_delete_errors,
                 "config": {
                     "mqtt_redundancy": "yes" if active_config.persistence.mqtt_redundancy else "no",
                     "disk_primary": "yes" if active_config.persistence.disk_primary else "no",
+                    "disk_backend": active_config.persistence.disk_backend,
                     "sync_timeout_secs": active_config.persistence.sync_timeout,
+                    "write_behind_interval_secs": active_config.persistence.write_behind_interval,
+                    "write_behind_threshold": active_config.persistence.write_behind_threshold,
                 },
             }
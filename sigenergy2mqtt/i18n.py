@@ -3,6 +3,10 @@
 Provides YAML-backed translation loading with language fallback to English,
 system locale detection, and a simple key-based lookup API.
 
+Parsing the YAML translation files is slow, so each parsed file is also saved
+in a compiled (:mod:`marshal`) form in ``translations/__pycache__``, which is
+loaded instead while it matches the YAML file.
+
 Typical usage::
 
     import i18n
@@ -10,9 +14,13 @@ Typical usage::
     label = i18n._t("MyClass.name", default="Name")
 """
 
+import hashlib
 import locale
 import logging
+import marshal
 import os
+import sys
+import time
 from pathlib import Path
 from typing import Any, Final
 
@@ -39,7 +47,15 @@ class Translator:
     ``class.`` to preserve backwards compatibility.
 
     When a key is not found in the requested language the lookup falls back to
-    the default language (English).
+    the default language (English). Only the active language and English are
+    kept in memory; other languages are dropped when the language is changed.
+
+    Each parsed YAML file is saved in compiled form in
+    ``translations/__pycache__/<language>.<cache_tag>.marshal``, together with
+    the modification time, size and SHA-256 hash of the YAML file. The compiled
+    file is used instead of parsing the YAML while the modification time and
+    size match or, failing that, the hash does. If the directory is not
+    writable, the YAML is parsed on every start as before.
     """
 
     def __init__(self) -> None:
@@ -92,6 +108,10 @@ class Translator:
             # the translation dicts are never mutated after loading.
             self._fallback_translations = dict(self._translations)
 
+        # Only the active language and the fallback are needed from now on
+        for cached in [c for c in self._cache if c not in (resolved, DEFAULT_LANGUAGE)]:
+            del self._cache[cached]
+
     def reset(self) -> None:
         """Reset all state to initial defaults, clearing caches."""
         self._language = DEFAULT_LANGUAGE
@@ -186,14 +206,66 @@ class Translator:
             return {}
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data: dict[str, Any] = self._yaml.load(f) or {}
-                self._cache[language] = data
-                return data
-        except (YAMLError, OSError) as exc:
+            started = time.perf_counter()
+            data = self._load_compiled(resolved, file_path)
+            if data is None:
+                with open(file_path, "rb") as f:
+                    source = f.read()
+                data = self._yaml.load(source.decode("utf-8")) or {}
+                self._save_compiled(resolved, file_path, source, data)
+                logger.debug(f"Parsed translation file {file_path} in {(time.perf_counter() - started) * 1000:.1f}ms")
+            else:
+                logger.debug(f"Loaded compiled translation file for {resolved} in {(time.perf_counter() - started) * 1000:.1f}ms")
+            self._cache[language] = data
+            return data
+        except (YAMLError, OSError, UnicodeError) as exc:
             logger.error(f"Failed to load translation file {file_path}: {exc}")
             return {}
 
+    def _compiled_path(self, resolved: str) -> Path:
+        """Return the path of the compiled form of the translation file for *resolved*."""
+        return self._translations_dir / "__pycache__" / f"{resolved}.{sys.implementation.cache_tag}.marshal"
+
+    def _load_compiled(self, resolved: str, file_path: Path) -> dict[str, Any] | None:
+        """Return the compiled translations for *resolved*, or ``None`` if absent or stale.
+
+        The compiled file is fresh if the YAML file's modification time and size
+        are those it was compiled from. Otherwise the YAML file is hashed, and a
+        matching hash (e.g. after a copy that did not preserve modification
+        times) refreshes the recorded modification time instead of recompiling.
+        """
+        try:
+            with open(self._compiled_path(resolved), "rb") as f:
+                mtime_ns, size, digest, data = marshal.load(f)
+            stat = os.stat(file_path)
+            if (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
+                return data
+            if stat.st_size == size:
+                with open(file_path, "rb") as f:
+                    source = f.read()
+                if hashlib.sha256(source).hexdigest() == digest:
+                    self._save_compiled(resolved, file_path, source, data)
+                    return data
+        except (OSError, EOFError, ValueError, TypeError) as exc:
+            # Missing, unreadable or incompatible compiled files are simply recompiled
+            logger.debug(f"Compiled translation file for {resolved} not used: {exc}")
+        return None
+
+    def _save_compiled(self, resolved: str, file_path: Path, source: bytes, data: dict[str, Any]) -> None:
+        """Save *data* parsed from *source* as the compiled form of *file_path*, if possible."""
+        compiled_path = self._compiled_path(resolved)
+        temp_path = compiled_path.with_name(f"{compiled_path.name}.{os.getpid()}.tmp")
+        try:
+            stat = os.stat(file_path)
+            payload = marshal.dumps((stat.st_mtime_ns, stat.st_size, hashlib.sha256(source).hexdigest(), data))
+            compiled_path.parent.mkdir(exist_ok=True)
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+            os.replace(temp_path, compiled_path)
+        except (OSError, ValueError, TypeError) as exc:
+            # A read-only installation just parses the YAML every time
+            logger.debug(f"Compiled translation file for {resolved} not saved: {exc}")
+
     @staticmethod
     def _get_nested(data: dict, parts: list[str]) -> Any:
         """Traverse *data* along the dotted-key *parts* and return the value.
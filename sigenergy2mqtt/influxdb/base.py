@@ -1,10 +1,12 @@
 import asyncio
+import gzip
 import json
 import logging
 import time
 from datetime import datetime
 from typing import Any, TypedDict
 
+import aiohttp
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.exceptions import MaxRetryError
@@ -15,8 +17,34 @@ from sigenergy2mqtt.config import active_config
 from sigenergy2mqtt.devices import Device
 from sigenergy2mqtt.metrics import Metrics
 
+from .spool import InfluxSpool
+
 logger = logging.getLogger(__name__)
 
+# HTTP statuses with which InfluxDB rejects the points themselves, so that
+# retrying the batch later would fail the same way.
+_REJECTED_STATUSES = (400, 413, 422)
+
+# HTTP statuses after which a write is retried (as the requests session retries them).
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Line protocol compresses about tenfold at this level, at a fraction of the
+# CPU cost of the default (9) for a negligible difference in size.
+_GZIP_LEVEL: int = 5
+
+# Multiplier converting Unix seconds to each write precision.
+_PRECISION_MULTIPLIERS: dict[str, int] = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+
+# The names of the write precisions on the InfluxDB v1 /write endpoint.
+_V1_PRECISIONS: dict[str, str] = {"s": "s", "ms": "ms", "us": "u", "ns": "n"}
+
+# Buffered lines, in batches, above which writers wait for the buffer to be flushed.
+_HIGH_WATER_BATCHES: int = 4
+
+# Delay before retrying spool replay after a failed write, doubling on each failure.
+_REPLAY_MIN_BACKOFF: float = 1.0
+_REPLAY_MAX_BACKOFF: float = 300.0
+
 # Suppress verbose urllib3 connection logs at module level rather than per-instance,
 # since the logger is a global singleton and mutating it in __init__ has side-effects.
 logging.getLogger("urllib3").setLevel(logging.INFO)
@@ -78,6 +106,11 @@ class InfluxBase(Device):
     writes, and rate-limited querying for both InfluxDB v1 (InfluxQL) and v2
     (Flux) APIs.  Subclasses are expected to call :meth:`async_init` before
     issuing any write or query calls.
+
+    Connection probing and queries use a blocking ``requests`` session in a
+    worker thread.  Writes, which are far more frequent, are gzip-compressed
+    and sent over a pooled :class:`aiohttp.ClientSession` on the event loop
+    (see :meth:`execute_write`), which is closed by :meth:`close_write_session`.
     """
 
     def __init__(self, name: str, plant_index: int, unique: str, manufacturer: str, model: str) -> None:
@@ -118,15 +151,37 @@ class InfluxBase(Device):
         self._session.mount("http://", adapter)
         self._session.mount("https://", adapter)
 
+        # Pooled HTTP client for writes, created on the first write (it is bound to the running loop).
+        self._write_session: aiohttp.ClientSession | None = None
+        self._max_retries: int = active_config.influxdb.max_retries
+        self._precision: str = active_config.influxdb.precision
+
         # Cache mapping state_topic -> {uom, object_id, unique_id}
         self._topic_cache: dict[str, dict[str, Any]] = {}
 
-        # Batch write buffer
+        # Batch write buffers: lines are appended to the active buffer, which the
+        # flusher swaps for the (empty) spare buffer before writing it out.
         self._write_buffer: list[str] = []
+        self._spare_buffer: list[str] = []
+        self._buffer_started: float | None = None
+        # Points being grouped by write_grouped, keyed by measurement, tags and
+        # timestamp (at the configured precision); serialised when flushed.
+        self._grouped_points: dict[tuple[str, tuple[tuple[str, str], ...], int], dict[str, int | float | str]] = {}
         self._batch_size: int = active_config.influxdb.batch_size
-        self._batch_lock = asyncio.Lock()
-        self._last_flush: float = time.time()
         self._flush_interval: float = active_config.influxdb.flush_interval
+        # Serialises flushes so that batches are written in order; never held by write_line.
+        self._flush_lock = asyncio.Lock()
+        self._flush_wakeup = asyncio.Event()
+        self._flusher_task: asyncio.Task | None = None
+
+        # Durable spool of batches that failed to write, set by subclasses that
+        # replay them (see start_replay); None discards failed batches.
+        self._spool: InfluxSpool | None = None
+        self._replay_rate: int = 1000
+        self._replay_wakeup = asyncio.Event()
+        self._replay_task: asyncio.Task | None = None
+        # HTTP status of the last write, or None if no response was received.
+        self._last_write_status: int | None = None
 
         # Rate limiting for queries
         self._rate_limit_semaphore = asyncio.Semaphore(10)  # Max 10 concurrent queries
@@ -234,9 +289,8 @@ class InfluxBase(Device):
             ``True`` if the endpoint is writable and writer state has been set.
         """
         try:
-            # precision=s matches the seconds-precision timestamps emitted by
-            # to_line_protocol; the two must always stay in sync.
-            url_v2 = f"{base}/api/v2/write?bucket={bucket}&precision=s"
+            # The precision must match the timestamps emitted by to_line_protocol.
+            url_v2 = f"{base}/api/v2/write?bucket={bucket}&precision={self._precision}"
             if org:
                 url_v2 += f"&org={org}"
             headers = {"Authorization": f"Token {token}"} if token else {}
@@ -300,8 +354,9 @@ class InfluxBase(Device):
         """
         try:
             url_v1 = f"{base}/write"
-            # precision=s keeps v1 consistent with to_line_protocol's seconds output.
-            r = self._session.post(url_v1, params={"db": db, "precision": "s"}, data=test_line, auth=auth, timeout=5)
+            # The precision must match the timestamps emitted by to_line_protocol.
+            params = {"db": db, "precision": _V1_PRECISIONS[self._precision]}
+            r = self._session.post(url_v1, params=params, data=test_line, auth=auth, timeout=5)
             if r.status_code in (204, 200):
                 self._writer_type = "v1_http"
                 self._write_url = url_v1
@@ -311,7 +366,7 @@ class InfluxBase(Device):
 
             # Attempt to create database and retry
             if (r.status_code in (404, 400) or (r.status_code >= 400 and r.content and b"database" in r.content.lower())) and self._create_v1_database(base, db, auth):
-                r3 = self._session.post(url_v1, params={"db": db, "precision": "s"}, data=test_line, auth=auth, timeout=5)
+                r3 = self._session.post(url_v1, params=params, data=test_line, auth=auth, timeout=5)
                 if r3.status_code in (204, 200):
                     self._writer_type = "v1_http"
                     self._write_url = url_v1
@@ -460,12 +515,13 @@ class InfluxBase(Device):
     # Line protocol serialisation
     # ------------------------------------------------------------------
 
-    def to_line_protocol(self, measurement: str, tags: dict, fields: dict, timestamp: int) -> str:
-        """Serialise a data point to InfluxDB line protocol with second-precision timestamps.
+    def to_line_protocol(self, measurement: str, tags: dict, fields: dict, timestamp: float) -> str:
+        """Serialise a data point to InfluxDB line protocol.
 
-        Both the v1 write endpoint (with ``precision=s``) and the v2 write URL
-        (with ``precision=s`` in the query string) expect second-precision
-        timestamps, so no conversion is applied beyond truncating to an integer.
+        The timestamp is converted to the configured ``influxdb.precision``,
+        which is also passed to the v1 write endpoint and set in the v2 write
+        URL, so the two always agree.  Fractional seconds are rounded to that
+        precision, except at second precision, where they are truncated.
 
         Args:
             measurement: Measurement name (slashes are replaced by the caller
@@ -473,11 +529,26 @@ class InfluxBase(Device):
             tags: Mapping of tag keys to string values.
             fields: Mapping of field keys to ``int``, ``float``, or ``str`` values.
                 Integers are written with the ``i`` suffix; strings are quoted.
-            timestamp: Unix timestamp in **seconds**.
+            timestamp: Unix timestamp in **seconds**, with any fraction of a
+                second (integers are converted exactly).
 
         Returns:
             A single line-protocol string ready to be written to InfluxDB.
         """
+        return self._format_line(measurement, tags, fields, self._to_precision(timestamp))
+
+    def _to_precision(self, timestamp: float) -> int:
+        """Convert a Unix timestamp in seconds to an integer at the configured precision."""
+        multiplier = _PRECISION_MULTIPLIERS[self._precision]
+        if isinstance(timestamp, int):
+            return timestamp * multiplier
+        if multiplier == 1:
+            return int(timestamp)
+        return round(timestamp * multiplier)
+
+    @staticmethod
+    def _format_line(measurement: str, tags: dict, fields: dict, timestamp: int) -> str:
+        """Serialise a data point whose timestamp is already at the configured precision."""
 
         def esc(s: str) -> str:
             """Escape spaces and commas in measurement names, tag keys, and tag values."""
@@ -493,33 +564,145 @@ class InfluxBase(Device):
 
         tags_part = ",".join(f"{esc(k)}={esc(v)}" for k, v in tags.items()) if tags else ""
         fields_part = ",".join(f"{esc(k)}={fmt_val(v)}" for k, v in fields.items())
-
-        # Emit seconds — must stay consistent with precision=s on both write URLs.
-        ts_s = int(timestamp)
-        return f"{esc(measurement)}{',' + tags_part if tags_part else ''} {fields_part} {ts_s}"
+        return f"{esc(measurement)}{',' + tags_part if tags_part else ''} {fields_part} {timestamp}"
 
     # ------------------------------------------------------------------
     # Buffered writes
     # ------------------------------------------------------------------
 
-    async def _flush_buffer_internal(self) -> None:
-        """Flush the write buffer to InfluxDB in a single batched request.
+    async def _flush_periodically(self) -> None:
+        """Flush the write buffer every :attr:`_flush_interval` seconds, or sooner when woken.
 
-        Must be called while holding :attr:`_batch_lock`.  Clears the buffer
-        before issuing the network call so that new lines can be accepted
-        immediately even if the write fails.
+        :meth:`write_line` wakes the flusher when the buffer reaches
+        :attr:`_batch_size`.  Runs until the service goes offline or
+        :meth:`stop_flusher` is called.
         """
-        if not self._write_buffer:
-            return
+        while not self._shutdown_event.is_set():
+            try:
+                await asyncio.wait_for(self._flush_wakeup.wait(), timeout=self._flush_interval)
+            except TimeoutError:
+                pass
+            self._flush_wakeup.clear()
+            await self.flush_buffer()
 
-        batch = self._write_buffer
-        self._write_buffer = []
-        self._last_flush = time.time()
+    async def stop_flusher(self) -> None:
+        """Stop the background flusher started by :meth:`write_line`, if running.
 
-        batch_data = "\n".join(batch).encode("utf-8")
-        batch_size = len(batch)
-        start = time.time()
+        A batch whose write is interrupted is spooled (see :meth:`flush_buffer`).
+        """
+        task, self._flusher_task = self._flusher_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def write_line(self, line: str) -> None:
+        """Append a line-protocol string to the write buffer.
+
+        The buffer is written by a background flusher task (started on the
+        first call) every :attr:`_flush_interval` seconds, or as soon as it
+        reaches :attr:`_batch_size` lines.  Appending does not wait for a write
+        in progress unless the buffer holds more than a few batches (as when
+        history is being copied faster than it can be written), in which case
+        the buffer is flushed before returning.
 
+        Args:
+            line: A single line-protocol string as returned by
+                :meth:`to_line_protocol`.
+        """
+        if not self._write_buffer and not self._grouped_points:
+            self._buffer_started = time.monotonic()
+        self._write_buffer.append(line)
+        self._buffered()
+        await self._apply_backpressure()
+
+    async def write_grouped(self, measurement: str, tags: dict[str, str], fields: dict[str, int | float | str], timestamp: float) -> None:
+        """Add fields to the buffered point with the same measurement, tags and timestamp.
+
+        The point is started if there is none, and serialised to one line when
+        the buffer is next flushed, so that the states of a device read at the
+        same time are written as one point rather than one line each.  Points
+        are matched on their timestamp at the configured precision.  A field
+        added twice to the same point keeps its latest value.
+
+        Args:
+            measurement: Measurement name, as for :meth:`to_line_protocol`.
+            tags: Mapping of tag keys to string values.
+            fields: The fields to add to the point.
+            timestamp: Unix timestamp in seconds.
+        """
+        key = (measurement, tuple(tags.items()), self._to_precision(timestamp))
+        point = self._grouped_points.get(key)
+        if point is not None:
+            point.update(fields)
+            return
+        if not self._write_buffer and not self._grouped_points:
+            self._buffer_started = time.monotonic()
+        self._grouped_points[key] = dict(fields)
+        self._buffered()
+        await self._apply_backpressure()
+
+    def _buffered(self) -> None:
+        """Wake the flusher if a batch is ready, starting it if it is not running."""
+        if len(self._write_buffer) + len(self._grouped_points) >= self._batch_size:
+            self._flush_wakeup.set()
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flush_periodically(), name=f"{self.log_identity} InfluxDB flusher")
+
+    async def _apply_backpressure(self) -> None:
+        """Flush the buffer, waiting for any write in progress, if it is above the high-water mark."""
+        if len(self._write_buffer) + len(self._grouped_points) >= self._batch_size * _HIGH_WATER_BATCHES:
+            await self.flush_buffer()
+
+    def _serialise_grouped_points(self) -> None:
+        """Append the points buffered by :meth:`write_grouped` to the write buffer as line protocol."""
+        if self._grouped_points:
+            points, self._grouped_points = self._grouped_points, {}
+            self._write_buffer.extend(self._format_line(measurement, dict(tags), fields, timestamp) for (measurement, tags, timestamp), fields in points.items())
+
+    async def flush_buffer(self) -> None:
+        """Flush any pending buffered writes to InfluxDB immediately.
+
+        Points grouped by :meth:`write_grouped` are serialised into the active
+        buffer, which is then swapped for the empty spare buffer before the
+        batch is written, so lines can be accepted while the write is in
+        progress, even if it fails.  The batch is written in slices of at most
+        :attr:`_batch_size` lines.  A slice that fails, and any slices not
+        written because the flush was cancelled (by :meth:`stop_flusher` on
+        shutdown), are spooled if there is a spool.
+        """
+        async with self._flush_lock:
+            self._serialise_grouped_points()
+            if not self._write_buffer:
+                return
+
+            batch = self._write_buffer
+            self._write_buffer = self._spare_buffer
+            delay = time.monotonic() - self._buffer_started if self._buffer_started is not None else 0.0
+            self._buffer_started = None
+            await Metrics.influxdb_flush(len(batch), delay)
+
+            written = 0
+            try:
+                while written < len(batch):
+                    lines = batch[written : written + self._batch_size]
+                    await self._write_batch("\n".join(lines).encode("utf-8"), len(lines))
+                    written += len(lines)
+            except asyncio.CancelledError:
+                # The lines have already left the buffer, so would otherwise be lost
+                if self._spool is not None:
+                    await self._spool_batch("\n".join(batch[written:]).encode("utf-8"))
+                raise
+            finally:
+                batch.clear()
+                self._spare_buffer = batch
+
+    async def _write_batch(self, batch_data: bytes, batch_size: int) -> None:
+        """Write one slice of a flushed batch, spooling it if it fails; called while holding :attr:`_flush_lock`."""
+        start = time.time()
+        success = False
         try:
             success = await self.execute_write(batch_data)
             elapsed = time.time() - start
@@ -531,33 +714,130 @@ class InfluxBase(Device):
             logger.error(f"InfluxDB batch write failed: {e} (type={self._writer_type} url={self._write_url} batch_size={batch_size})")
             await Metrics.influxdb_write_error()
 
-    async def write_line(self, line: str) -> None:
-        """Append a line-protocol string to the write buffer.
+        if self._spool is not None:
+            if success:
+                if self._spool.pending_lines:
+                    self._replay_wakeup.set()  # InfluxDB is accepting writes again
+            elif self._last_write_status not in _REJECTED_STATUSES:
+                await self._spool_batch(batch_data)
+
+    async def spool_buffer(self) -> None:
+        """Move any pending buffered writes to the spool without attempting to write them.
 
-        The buffer is flushed immediately if it has reached :attr:`_batch_size`
-        or if more than :attr:`_flush_interval` seconds have elapsed since the
-        last flush.
+        Called on shutdown, when the lines can no longer be written, so that
+        they are replayed on the next start.  Does nothing without a spool.
+        """
+        if self._spool is None:
+            return
+        async with self._flush_lock:
+            self._serialise_grouped_points()
+            if not self._write_buffer:
+                return
+            batch = self._write_buffer
+            self._write_buffer = self._spare_buffer
+            self._buffer_started = None
+            batch_data = "\n".join(batch).encode("utf-8")
+            batch.clear()
+            self._spare_buffer = batch
+            await self._spool_batch(batch_data)
+
+    async def _spool_batch(self, batch_data: bytes) -> None:
+        """Append a batch that could not be written to the spool.
+
+        Must be called while holding :attr:`_flush_lock`, so that batches are
+        spooled in the order they were buffered.  Replay is woken only if the
+        spool was empty: otherwise it is already replaying or backing off.
+        """
+        assert self._spool is not None
+        was_empty = not self._spool.pending_lines
+        if await asyncio.to_thread(self._spool.append, batch_data):
+            logger.debug(f"{self.log_identity} Spooled a failed batch of {len(batch_data)} bytes for replay")
+            if was_empty:
+                self._replay_wakeup.set()
+
+    # ------------------------------------------------------------------
+    # Spool replay
+    # ------------------------------------------------------------------
+
+    def start_replay(self, spool: InfluxSpool, rate: int) -> None:
+        """Spool failed batches to *spool*, and replay them as InfluxDB accepts writes.
 
         Args:
-            line: A single line-protocol string as returned by
-                :meth:`to_line_protocol`.
+            spool: The spool holding this service's failed batches.
+            rate: Maximum number of spooled points replayed per second.
         """
-        async with self._batch_lock:
-            self._write_buffer.append(line)
-            should_flush = len(self._write_buffer) >= self._batch_size or (time.time() - self._last_flush) >= self._flush_interval
-            if should_flush:
-                await self._flush_buffer_internal()
+        self._spool = spool
+        self._replay_rate = rate
+        if self._replay_task is None or self._replay_task.done():
+            self._replay_task = asyncio.create_task(self._replay_spool(), name=f"{self.log_identity} InfluxDB spool replay")
+
+    async def stop_replay(self) -> None:
+        """Stop the spool replay task started by :meth:`start_replay`, if running."""
+        task, self._replay_task = self._replay_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
 
-    async def flush_buffer(self) -> None:
-        """Flush any pending buffered writes to InfluxDB immediately."""
-        async with self._batch_lock:
-            await self._flush_buffer_internal()
+    async def _replay_spool(self) -> None:
+        """Write spooled points to InfluxDB, oldest first, until the service goes offline.
+
+        Points are replayed in chunks of :attr:`_batch_size`, no faster than
+        :attr:`_replay_rate` points per second.  Live batches take priority:
+        a chunk is not started while a full live batch is waiting, and a live
+        flush waiting for the write lock is served before the next chunk.
+        After a failed write, replay backs off exponentially until a live
+        write succeeds or the backoff expires.
+        """
+        assert self._spool is not None
+        spool = self._spool
+        backoff = _REPLAY_MIN_BACKOFF
+        while not self._shutdown_event.is_set():
+            if not spool.pending_lines:
+                await self._replay_wakeup.wait()
+                self._replay_wakeup.clear()
+                continue
+            if self._flush_wakeup.is_set():
+                await asyncio.sleep(0.1)
+                continue
+
+            chunk = await asyncio.to_thread(spool.read, self._batch_size)
+            if chunk is None:
+                continue
+            async with self._flush_lock:
+                try:
+                    success = await self.execute_write(b"\n".join(chunk.lines))
+                except (ValueError, TypeError, RuntimeError) as e:
+                    logger.error(f"{self.log_identity} InfluxDB spool replay failed: {e}")
+                    success = False
+
+            if success:
+                await asyncio.to_thread(spool.commit, chunk)
+                backoff = _REPLAY_MIN_BACKOFF
+                if not spool.pending_lines:
+                    logger.info(f"{self.log_identity} InfluxDB spool replay complete ({spool.replayed_lines} points replayed)")
+                await asyncio.sleep(len(chunk.lines) / self._replay_rate)
+            elif self._last_write_status in _REJECTED_STATUSES:
+                logger.error(f"{self.log_identity} InfluxDB rejected {len(chunk.lines)} spooled points (HTTP {self._last_write_status}): discarding them")
+                await asyncio.to_thread(spool.commit, chunk, False)
+            else:
+                self._replay_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._replay_wakeup.wait(), timeout=backoff)
+                except TimeoutError:
+                    pass
+                backoff = min(backoff * 2, _REPLAY_MAX_BACKOFF)
 
     async def execute_write(self, data: bytes) -> bool:
         """Send a pre-encoded line-protocol payload to InfluxDB over HTTP.
 
-        Dispatches to either the v2 or v1 write endpoint depending on
-        :attr:`_writer_type`.  Returns ``False`` without raising if the service
+        The payload is gzip-compressed once, then posted to the v2 or v1 write
+        endpoint (depending on :attr:`_writer_type`) by :meth:`_post_write`.
+        Connection errors and transient HTTP statuses are retried up to
+        ``influxdb.max-retries`` times with exponential backoff, unless the
+        service goes offline.  Returns ``False`` without raising if the service
         is offline or the writer has not been initialised.
 
         Args:
@@ -566,46 +846,76 @@ class InfluxBase(Device):
         Returns:
             ``True`` if InfluxDB accepted the payload (HTTP 200 or 204).
         """
-        if not self.online:
+        self._last_write_status = None
+        if not self.online or self._writer_type not in ("v1_http", "v2_http") or not self._write_url:
             return False
 
-        try:
-            if self._writer_type == "v2_http" and self._write_url:
-                r = await asyncio.to_thread(
-                    self._session.post,
-                    self._write_url,
-                    headers=self._write_headers or {},
-                    data=data,
-                    timeout=active_config.influxdb.write_timeout,
-                )
-                if r.status_code in (204, 200):
-                    service_health_registry.set_health(self.service_health_key, True)
-                    return True
-                logger.error(f"InfluxDB v2 HTTP write failed: {r.status_code=} {r.text=} (url={self._write_url})")
-                service_health_registry.set_health(self.service_health_key, False)
-                return False
-
-            elif self._writer_type == "v1_http" and self._write_url:
-                r = await asyncio.to_thread(
-                    self._session.post,
-                    self._write_url,
-                    params={"db": active_config.influxdb.database, "precision": "s"},
-                    data=data,
-                    auth=self._write_auth,
-                    timeout=active_config.influxdb.write_timeout,
-                )
-                if r.status_code in (204, 200):
-                    service_health_registry.set_health(self.service_health_key, True)
-                    return True
-                logger.error(f"InfluxDB v1 HTTP write failed: {r.status_code=} {r.text=} (url={self._write_url})")
-                service_health_registry.set_health(self.service_health_key, False)
-                return False
+        body = gzip.compress(data, compresslevel=_GZIP_LEVEL, mtime=0)
+        failure = ""
+        for attempt in range(self._max_retries + 1):
+            if attempt > 0:
+                try:
+                    await asyncio.wait_for(self._shutdown_event.wait(), timeout=0.5 * 2 ** (attempt - 1))
+                    break  # Shutting down: don't retry
+                except TimeoutError:
+                    pass
+            try:
+                status, text = await self._post_write(body)
+            except (OSError, aiohttp.ClientError, TimeoutError) as e:
+                self._last_write_status = None
+                failure = f"InfluxDB write failed: {e!s} (type={self._writer_type} url={self._write_url})"
+                continue
+            self._last_write_status = status
+            if status in (204, 200):
+                service_health_registry.set_health(self.service_health_key, True)
+                return True
+            failure = f"InfluxDB {self._writer_type.removesuffix('_http')} HTTP write failed: {status=} {text=} (url={self._write_url})"
+            if status not in _RETRY_STATUSES:
+                break
 
-        except (OSError, requests.RequestException, TimeoutError) as e:
-            logger.error(f"InfluxDB write failed: {e} (type={self._writer_type} url={self._write_url})")
-            service_health_registry.set_health(self.service_health_key, False)
+        logger.error(failure)
+        service_health_registry.set_health(self.service_health_key, False)
         return False
 
+    def _get_write_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session used for writes, opening it if necessary.
+
+        The session is opened on first use, so that it belongs to the running
+        event loop, and keeps up to ``influxdb.pool-maxsize`` connections open
+        between writes.
+        """
+        if self._write_session is None or self._write_session.closed:
+            self._write_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=active_config.influxdb.pool_maxsize),
+                timeout=aiohttp.ClientTimeout(total=active_config.influxdb.write_timeout),
+            )
+        return self._write_session
+
+    async def _post_write(self, body: bytes) -> tuple[int, str]:
+        """Post a gzip-compressed payload to the write endpoint, once.
+
+        Args:
+            body: The gzip-compressed line-protocol payload.
+
+        Returns:
+            The HTTP status and body of the response.
+        """
+        assert self._write_url is not None
+        headers = {**(self._write_headers or {}), "Content-Encoding": "gzip", "Content-Type": "text/plain; charset=utf-8"}
+        params: dict[str, str] | None = None
+        if self._writer_type == "v1_http":
+            params = {"db": active_config.influxdb.database, "precision": _V1_PRECISIONS[self._precision]}
+            if self._write_auth:
+                headers["Authorization"] = aiohttp.encode_basic_auth(self._write_auth[0] or "", self._write_auth[1] or "")
+        async with self._get_write_session().post(self._write_url, data=body, headers=headers, params=params) as r:
+            return r.status, await r.text()
+
+    async def close_write_session(self) -> None:
+        """Close the pooled HTTP session used for writes, if one was opened."""
+        session, self._write_session = self._write_session, None
+        if session is not None and not session.closed:
+            await session.close()
+
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
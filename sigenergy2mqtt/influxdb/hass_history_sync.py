@@ -545,6 +545,9 @@ class HassHistorySync(InfluxBase):
             return results
 
         sync_results = await asyncio.gather(*sync_tasks)
+        await self.flush_buffer()
+        await self.stop_flusher()
+        await self.close_write_session()
 
         for measurement, tags, count in sync_results:
             result_key = f"{measurement}[{','.join(f'{k}={v}' for k, v in tags.items())}]"
@@ -3,6 +3,7 @@ import logging
 import re
 import time
 from collections.abc import Awaitable
+from pathlib import Path
 from typing import cast
 
 import paho.mqtt.client as mqtt
@@ -11,21 +12,35 @@ import requests
 from sigenergy2mqtt.config import active_config
 from sigenergy2mqtt.devices import DeviceRegistry
 from sigenergy2mqtt.modbus import ModbusClient
-from sigenergy2mqtt.mqtt import MqttHandler
+from sigenergy2mqtt.mqtt import MqttHandler, SensorEvent, sensor_event_bus
 
 from .base import InfluxBase
 from .hass_history_sync import HassHistorySync
+from .spool import InfluxSpool
 
 logger = logging.getLogger(__name__)
 
 
 class InfluxService(InfluxBase):
-    """MQTT-to-InfluxDB bridge that subscribes to sensor state topics and persists values.
+    """Sensor-state-to-InfluxDB bridge that receives sensor states and persists values.
 
     One :class:`InfluxService` instance is created per Modbus plant so that
     each plant maintains its own :attr:`~InfluxBase._topic_cache` and logger
-    hierarchy.  On startup the service optionally triggers a one-shot backfill
-    from the Home Assistant InfluxDB database via :class:`HassHistorySync`.
+    hierarchy.  The states of the plant's sensors are received from the
+    in-process sensor event bus rather than from the broker.  On startup the
+    service optionally triggers a one-shot backfill from the Home Assistant
+    InfluxDB database via :class:`HassHistorySync`.
+
+    States are written in the schema selected by ``influxdb.point-schema``:
+
+    * ``entity`` (the default): one point per state, in the measurement named
+      by the sensor's unit, tagged ``entity_id`` with the sensor's object ID,
+      and with a ``value`` (or ``value_str``) field.  This is the schema used by
+      Home Assistant, and by the backfill from it.
+    * ``device``: one point per device, unit and timestamp, in the same
+      measurement, tagged ``device_id`` with the device's unique ID, and with
+      one field per sensor named by its object ID (``<object_id>_str`` for a
+      non-numeric state).
     """
 
     def __init__(self, plant_index: int = -1) -> None:
@@ -40,6 +55,7 @@ class InfluxService(InfluxBase):
         super().__init__(name, plant_index, unique, "sigenergy2mqtt", "InfluxDB.Updater")
 
         self._history_sync: HassHistorySync | None = None
+        self._group_by_device: bool = active_config.influxdb.point_schema == "device"
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -74,13 +90,14 @@ class InfluxService(InfluxBase):
         """Main service coroutine: initialise, optionally sync history, then idle.
 
         Runs until :attr:`~Device.online` becomes ``False`` (set externally on
-        shutdown).  On exit, unsubscribes all MQTT topics and cancels any
-        in-flight history sync task.
+        shutdown).  On exit, unsubscribes all sensor topics, cancels any
+        in-flight history sync task, stops the background flushers and spool
+        replay, spools any lines not yet written, and closes the write sessions.
 
         Args:
             modbus_client: Modbus client for the plant (unused directly, passed
                 for interface compatibility).
-            mqtt_client: Active MQTT client used for unsubscription on shutdown.
+            mqtt_client: Active MQTT client (unused, for interface compatibility).
         """
         if not await self.async_init():
             logger.error(f"{self.log_identity} Initialisation failed — service will not write to InfluxDB")
@@ -88,6 +105,15 @@ class InfluxService(InfluxBase):
 
         sync_task: asyncio.Task | None = None
         if self._writer_type:
+            if active_config.influxdb.spool_max_size > 0:
+                spool = await asyncio.to_thread(
+                    InfluxSpool.get,
+                    Path(active_config.persistent_state_path, "influxdb-spool", f"plant{self.plant_index}"),
+                    int(active_config.influxdb.spool_max_size * 1024 * 1024),
+                    active_config.influxdb.spool_max_age * 3600,
+                    active_config.influxdb.precision,
+                )
+                self.start_replay(spool, active_config.influxdb.spool_replay_rate)
             if active_config.influxdb.load_hass_history:
                 # Create history sync helper and share our established connection.
                 self._history_sync = HassHistorySync(self.plant_index)
@@ -108,7 +134,7 @@ class InfluxService(InfluxBase):
                 self.sleeper_task = None
 
         for topic in self._topic_cache:
-            mqtt_client.unsubscribe(topic)
+            sensor_event_bus.unsubscribe(topic, self.handle_event)
         logger.info(f"{self.log_identity} Unsubscribed from {len(self._topic_cache)} topics")
         self._topic_cache.clear()
 
@@ -122,6 +148,14 @@ class InfluxService(InfluxBase):
                     pass
             elif sync_task.exception():
                 logger.error(f"{self.log_identity} Sync task failed: {sync_task.exception()}")
+            if self._history_sync:
+                await self._history_sync.stop_flusher()
+                await self._history_sync.close_write_session()
+
+        await self.stop_flusher()
+        await self.stop_replay()
+        await self.spool_buffer()
+        await self.close_write_session()
 
         logger.info(f"{self.log_identity} Completed: Flagged as offline ({self.online=})")
 
@@ -139,11 +173,6 @@ class InfluxService(InfluxBase):
     ) -> bool:
         """Process an incoming MQTT message and write the value to InfluxDB.
 
-        The measurement name is derived from the sensor's unit of measurement
-        (with ``/`` replaced by ``_``).  Numeric payloads are stored as
-        ``value`` (float); non-numeric payloads are stored as ``value_str``
-        (string).
-
         Args:
             modbus_client: Modbus client for the plant (unused, for interface compatibility).
             mqtt_client: Active MQTT client (unused, for interface compatibility).
@@ -151,6 +180,41 @@ class InfluxService(InfluxBase):
             topic: Full MQTT topic string.
             mqtt_handler: MQTT handler (unused, for interface compatibility).
 
+        Returns:
+            ``True`` if the value was successfully queued for writing,
+            ``False`` on any error.
+        """
+        return await self._write(topic, payload, time.time())
+
+    async def handle_event(self, event: SensorEvent) -> bool:
+        """Write a state published by one of this plant's sensors to InfluxDB.
+
+        The point is timestamped with the time the state was read (see
+        :attr:`SensorEvent.timestamp`).
+
+        Args:
+            event: The published state.
+
+        Returns:
+            ``True`` if the value was successfully queued for writing,
+            ``False`` on any error.
+        """
+        return await self._write(event.topic, event.payload, event.timestamp)
+
+    async def _write(self, topic: str, payload: str, timestamp: float) -> bool:
+        """Convert a sensor state to line protocol and queue it for writing.
+
+        The measurement name is derived from the sensor's unit of measurement
+        (with ``/`` replaced by ``_``).  Numeric payloads are stored as
+        ``value`` (float); non-numeric payloads are stored as ``value_str``
+        (string).  In the ``device`` point schema, the field is named by the
+        sensor's object ID instead, and added to the point of its device.
+
+        Args:
+            topic: State topic of the sensor.
+            payload: The state as published to MQTT.
+            timestamp: Unix timestamp (seconds, with any fraction) of the point.
+
         Returns:
             ``True`` if the value was successfully queued for writing,
             ``False`` on any error.
@@ -161,7 +225,6 @@ class InfluxService(InfluxBase):
                 logger.warning(f"{self.log_identity} Received update for unknown topic '{topic}' (no cache entry)")
                 return False
 
-            timestamp = int(time.time())
             tags: dict[str, str] = {}
             fields: dict[str, int | float | str] = {}
 
@@ -169,17 +232,30 @@ class InfluxService(InfluxBase):
             uom = sensor.get("uom") or active_config.influxdb.default_measurement
             measurement = uom.replace("/", "_")
 
-            try:
-                fields["value"] = float(payload)
-            except (ValueError, TypeError):
-                fields["value_str"] = payload
+            if self._group_by_device:
+                field = cast(str, sensor.get("object_id"))
+                try:
+                    fields[field] = float(payload)
+                except (ValueError, TypeError):
+                    fields[f"{field}_str"] = payload
+
+                tags["device_id"] = cast(str, sensor.get("device_id"))
 
-            tags["entity_id"] = cast(str, sensor.get("object_id"))
+                if sensor.get("debug_logging"):
+                    logger.debug(f"{self.log_identity} [{topic}] Adding {fields} to {measurement} point of device {tags['device_id']}")
+                await self.write_grouped(measurement, tags, fields, timestamp)
+            else:
+                try:
+                    fields["value"] = float(payload)
+                except (ValueError, TypeError):
+                    fields["value_str"] = payload
 
-            line = self.to_line_protocol(measurement, tags, fields, timestamp)
-            if sensor.get("debug_logging"):
-                logger.debug(f"{self.log_identity} [{topic}] Writing line protocol: {line}")
-            await self.write_line(line)
+                tags["entity_id"] = cast(str, sensor.get("object_id"))
+
+                line = self.to_line_protocol(measurement, tags, fields, timestamp)
+                if sensor.get("debug_logging"):
+                    logger.debug(f"{self.log_identity} [{topic}] Writing line protocol: {line}")
+                await self.write_line(line)
 
         except (requests.RequestException, ValueError, TypeError, RuntimeError) as e:
             logger.error(f"{self.log_identity} Failed to handle MQTT message from {topic}: {e}")
@@ -221,12 +297,13 @@ class InfluxService(InfluxBase):
 
         Sensors are filtered against the configured include/exclude regex lists
         before subscription.  Each accepted sensor is added to
-        :attr:`~InfluxBase._topic_cache` so that :meth:`handle_mqtt` can look
-        up its metadata by topic.
+        :attr:`~InfluxBase._topic_cache` so that :meth:`handle_event` can look
+        up its metadata by topic.  The sensors are in this process, so their
+        topics are subscribed on the sensor event bus rather than the broker.
 
         Args:
-            mqtt_client: Active MQTT client used to register subscriptions.
-            mqtt_handler: Handler that maps topics to callback coroutines.
+            mqtt_client: Active MQTT client (unused, for interface compatibility).
+            mqtt_handler: Handler whose event loop receives the sensor events.
         """
         devices = DeviceRegistry.get(self.plant_index)
         if not devices:
@@ -259,9 +336,10 @@ class InfluxService(InfluxBase):
                         "uom": s["unit_of_measurement"] if s["unit_of_measurement"] else active_config.influxdb.default_measurement,
                         "object_id": obj,
                         "unique_id": uid,
+                        "device_id": getattr(s.parent_device, "unique_id", None) or device.unique_id,
                         "debug_logging": s.debug_logging,
                     }
-                    mqtt_handler.register(mqtt_client, tpc, self.handle_mqtt)
+                    sensor_event_bus.subscribe(tpc, self.handle_event, mqtt_handler.loop)
 
             except requests.RequestException as e:
                 logger.warning(f"{self.log_identity} Failed to subscribe sensors for device '{device}': {e}")
@@ -0,0 +1,325 @@
+"""Durable on-disk spool of InfluxDB batches that could not be written.
+
+The spool is a directory of append-only segment files, named by sequence
+number and the precision of their timestamps (e.g. ``000000000007.ms.lp``),
+each holding line-protocol lines separated by newlines (line protocol
+escapes newlines within a line, so every line is one point). Failed batches
+are appended to the newest segment, which is closed once it reaches its size,
+or if the ``influxdb.precision`` option has changed, and a new one started.
+Points are replayed from the oldest segment, with their timestamps converted
+to the current precision, and a segment is deleted once all of its points
+have been written.
+
+The spool is bounded: when it exceeds its maximum size, or its oldest segment
+its maximum age, whole segments are dropped, oldest first. Replay progress
+within a segment is kept in memory only, so a segment partially replayed
+before a restart is replayed again in full; InfluxDB overwrites a point
+written twice with the same series and timestamp, so this is harmless.
+
+Spools are created by :class:`~sigenergy2mqtt.influxdb.service.InfluxService`
+when the ``influxdb.spool-max-size`` option is not ``0``. All methods block on
+file I/O, so are called from a worker thread.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".lp"
+
+# Number of segments the spool is divided into, so that dropping the oldest
+# segment discards a bounded fraction of the backlog.
+_SEGMENTS_PER_SPOOL = 16
+_MIN_SEGMENT_BYTES = 4096
+
+# Decimal digits of each timestamp precision below the second.
+_PRECISION_DIGITS = {"s": 0, "ms": 3, "us": 6, "ns": 9}
+
+
+def _convert_timestamp(line: bytes, from_precision: str, to_precision: str) -> bytes:
+    """Return *line* with its timestamp converted from one precision to another, or unchanged if it has none."""
+    head, _, timestamp = line.rpartition(b" ")
+    if not head or not timestamp.lstrip(b"-").isdigit():
+        return line
+    shift = _PRECISION_DIGITS[to_precision] - _PRECISION_DIGITS[from_precision]
+    value = int(timestamp) * 10**shift if shift >= 0 else int(timestamp) // 10**-shift
+    return b"%s %d" % (head, value)
+
+
+@dataclass(slots=True)
+class _Segment:
+    path: Path
+    size: int
+    lines: int
+    modified: float
+    precision: str
+
+
+@dataclass(frozen=True, slots=True)
+class SpoolChunk:
+    """Points returned by :meth:`InfluxSpool.read`, and the part of the segment they were read from.
+
+    Attributes:
+        path: The segment the points were read from.
+        start: Offset in the segment of the first point.
+        end: Offset in the segment after the last point.
+        lines: The points.
+    """
+
+    path: Path
+    start: int
+    end: int
+    lines: list[bytes]
+
+
+class InfluxSpool:
+    """A bounded, segmented, append-only spool of line-protocol points.
+
+    Use :meth:`get` so that a directory is only ever managed by one instance.
+
+    Attributes:
+        path: The spool directory.
+        max_bytes: Total size of the segments above which the oldest are dropped.
+        max_age: Seconds since a segment was last appended to after which it is dropped.
+        precision: Precision of the timestamps of the batches appended, and to
+            which the timestamps of the points read are converted.
+        spooled_lines: Points appended since startup.
+        replayed_lines: Points replayed (and removed) since startup.
+        dropped_lines: Points discarded since startup because the spool exceeded
+            its size or age limits, or InfluxDB rejected them.
+    """
+
+    _spools: ClassVar[dict[Path, "InfluxSpool"]] = {}
+    _spools_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get(cls, path: str | Path, max_bytes: int, max_age: float, precision: str = "ms") -> "InfluxSpool":
+        """Return the spool for the directory *path*, opening it if necessary.
+
+        Args:
+            path: The spool directory, created if it does not exist.
+            max_bytes: Maximum total size of the spool in bytes.
+            max_age: Maximum age of a segment in seconds.
+            precision: Timestamp precision (``s``, ``ms``, ``us`` or ``ns``) of the points written.
+        """
+        resolved = Path(path).resolve()
+        with cls._spools_lock:
+            spool = cls._spools.get(resolved)
+            if spool is None:
+                spool = cls._spools[resolved] = cls(resolved, max_bytes, max_age, precision)
+            else:
+                spool.max_bytes, spool.max_age, spool.precision = max_bytes, max_age, precision
+            return spool
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget all open spools (their files are left in place)."""
+        with cls._spools_lock:
+            cls._spools.clear()
+
+    @classmethod
+    def snapshot(cls) -> dict[str, dict[str, Any]]:
+        """Return the depth and replay progress of every open spool, for diagnostics."""
+        with cls._spools_lock:
+            spools = list(cls._spools.values())
+        return {spool.path.name: spool.stats() for spool in spools}
+
+    def __init__(self, path: str | Path, max_bytes: int, max_age: float, precision: str = "ms"):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.precision = precision
+        self.spooled_lines: int = 0
+        self.replayed_lines: int = 0
+        self.dropped_lines: int = 0
+        self._lock = threading.Lock()
+        self._segments: list[_Segment] = []
+        self._next_sequence: int = 0
+        self._read_offset: int = 0  # Bytes of the oldest segment already replayed
+        self._read_lines: int = 0  # Lines of the oldest segment already replayed
+        self._open_existing()
+
+    @property
+    def segment_bytes(self) -> int:
+        """Size at which the newest segment is closed and a new one started."""
+        return max(_MIN_SEGMENT_BYTES, self.max_bytes // _SEGMENTS_PER_SPOOL)
+
+    @property
+    def pending_bytes(self) -> int:
+        """Bytes spooled and not yet replayed."""
+        return sum(s.size for s in self._segments) - self._read_offset
+
+    @property
+    def pending_lines(self) -> int:
+        """Points spooled and not yet replayed."""
+        return sum(s.lines for s in self._segments) - self._read_lines
+
+    def _open_existing(self) -> None:
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            paths = sorted(p for p in self.path.iterdir() if p.suffix == SEGMENT_SUFFIX and p.stem.partition(".")[0].isdigit())
+        except OSError as e:
+            logger.warning(f"InfluxDB spool {self.path} is unavailable: {e}")
+            return
+        for path in paths:
+            sequence, _, precision = path.stem.partition(".")
+            precision = precision or self.precision  # Named before the precision was recorded
+            if precision not in _PRECISION_DIGITS:
+                logger.warning(f"Ignoring InfluxDB spool segment {path} of unknown timestamp precision")
+                continue
+            try:
+                data = path.read_bytes()
+                modified = path.stat().st_mtime
+            except OSError as e:
+                logger.warning(f"Ignoring unreadable InfluxDB spool segment {path}: {e}")
+                continue
+            if data and not data.endswith(b"\n"):
+                # The application stopped part-way through an append: drop the partial line.
+                data = data[: data.rfind(b"\n") + 1]
+                try:
+                    with open(path, "r+b") as f:
+                        f.truncate(len(data))
+                except OSError as e:
+                    logger.warning(f"Ignoring unrepairable InfluxDB spool segment {path}: {e}")
+                    continue
+            self._segments.append(_Segment(path, len(data), data.count(b"\n"), modified, precision))
+            self._next_sequence = int(sequence) + 1
+        with self._lock:
+            self._enforce_limits()
+        if self._segments:
+            logger.info(f"InfluxDB spool {self.path} holds {self.pending_lines} points awaiting replay")
+
+    def append(self, data: bytes) -> bool:
+        """Append a batch of line-protocol points.
+
+        Args:
+            data: Newline-separated line-protocol points.
+
+        Returns:
+            ``True`` if the batch was written to disk.
+        """
+        data = data.rstrip(b"\n") + b"\n"
+        lines = data.count(b"\n")
+        with self._lock:
+            try:
+                segment = self._segments[-1] if self._segments else None
+                if segment is None or segment.size >= self.segment_bytes or segment.precision != self.precision:
+                    segment = _Segment(self.path / f"{self._next_sequence:012d}.{self.precision}{SEGMENT_SUFFIX}", 0, 0, 0.0, self.precision)
+                    self._next_sequence += 1
+                    self._segments.append(segment)
+                with open(segment.path, "ab") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                logger.error(f"Failed to spool {lines} InfluxDB points to {self.path}: {e}")
+                self.dropped_lines += lines
+                if segment is not None and segment.size == 0:
+                    self._segments.remove(segment)
+                return False
+            segment.size += len(data)
+            segment.lines += lines
+            segment.modified = time.time()
+            self.spooled_lines += lines
+            self._enforce_limits()
+            return True
+
+    def read(self, max_lines: int) -> SpoolChunk | None:
+        """Return up to *max_lines* of the oldest points not yet replayed, without removing them.
+
+        Call :meth:`commit` with the returned chunk once the points have been
+        written. Timestamps spooled at another precision are converted to
+        :attr:`precision`.
+
+        Returns:
+            The points, or ``None`` if there are none.
+        """
+        with self._lock:
+            self._enforce_limits()
+            if not self._segments:
+                return None
+            segment = self._segments[0]
+            lines: list[bytes] = []
+            try:
+                with open(segment.path, "rb") as f:
+                    f.seek(self._read_offset)
+                    while len(lines) < max_lines and (line := f.readline()):
+                        lines.append(line.rstrip(b"\n"))
+                    end = f.tell()
+            except OSError as e:
+                logger.error(f"Failed to read InfluxDB spool segment {segment.path}: {e}")
+                self._drop_oldest("unreadable")
+                return None
+            if not lines:
+                self._drop_oldest("truncated")
+                return None
+            if segment.precision != self.precision:
+                lines = [_convert_timestamp(line, segment.precision, self.precision) for line in lines]
+            return SpoolChunk(segment.path, self._read_offset, end, lines)
+
+    def commit(self, chunk: SpoolChunk, replayed: bool = True) -> None:
+        """Remove points returned by :meth:`read` from the spool.
+
+        Does nothing if the points are no longer the oldest in the spool: the
+        segment they were read from was dropped (and its points counted as
+        dropped) while they were being written, or they were already committed.
+
+        Args:
+            chunk: The points returned by the last call to :meth:`read`.
+            replayed: ``False`` if the points are being discarded rather than
+                having been written.
+        """
+        with self._lock:
+            if not self._segments or self._segments[0].path != chunk.path or self._read_offset != chunk.start:
+                logger.debug(f"Not committing {len(chunk.lines)} InfluxDB points from {chunk.path}: no longer the oldest in the spool")
+                return
+            segment = self._segments[0]
+            self._read_offset = chunk.end
+            self._read_lines += len(chunk.lines)
+            if replayed:
+                self.replayed_lines += len(chunk.lines)
+            else:
+                self.dropped_lines += len(chunk.lines)
+            if self._read_offset >= segment.size:
+                self._remove(segment)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the spool depth and replay progress."""
+        with self._lock:
+            oldest = self._segments[0].modified if self._segments else None
+            return {
+                "pending_points": self.pending_lines,
+                "pending_bytes": self.pending_bytes,
+                "segments": len(self._segments),
+                "oldest_segment_age_secs": round(time.time() - oldest, 1) if oldest else 0.0,
+                "spooled_points": self.spooled_lines,
+                "replayed_points": self.replayed_lines,
+                "dropped_points": self.dropped_lines,
+            }
+
+    def _enforce_limits(self) -> None:
+        now = time.time()
+        while self._segments and (self.pending_bytes > self.max_bytes or now - self._segments[0].modified > self.max_age):
+            self._drop_oldest("size or age limit exceeded")
+
+    def _drop_oldest(self, reason: str) -> None:
+        segment = self._segments[0]
+        dropped = segment.lines - self._read_lines
+        self.dropped_lines += dropped
+        logger.warning(f"Dropped {dropped} InfluxDB points from spool segment {segment.path} ({reason})")
+        self._remove(segment)
+
+    def _remove(self, segment: _Segment) -> None:
+        self._segments.remove(segment)
+        self._read_offset = 0
+        self._read_lines = 0
+        try:
+            segment.path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove InfluxDB spool segment {segment.path}: {e}")
@@ -69,6 +69,8 @@ async def read_and_publish_device_sensors(
             config.port if config.port else 502,
             config.timeout,
             config.retries,
+            config.pipeline_depth,
+            config.capture_file,
         )
 
     mqtt_client_id = f"{active_config.mqtt.client_id_prefix}_{config.description}"
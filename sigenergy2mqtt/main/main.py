@@ -4,6 +4,7 @@ import json
 import logging
 import signal
 import sys
+import time
 from collections.abc import Mapping
 from datetime import UTC, timedelta, timezone
 from typing import Any, cast
@@ -19,10 +20,12 @@ from pymodbus.pdu import ModbusPDU
 from sigenergy2mqtt.common import Constants, ConsumptionMethod, FirmwareVersion, HybridInverter, InputType, Protocol, ProtocolApplies, PVInverter, service_health_registry
 from sigenergy2mqtt.config import active_config, configure_root_logger, initialize_async, is_docker
 from sigenergy2mqtt.devices import PID, PSS, ACCharger, DCCharger, Device, Inverter, PowerPlant, bind_cross_device_sensors
+from sigenergy2mqtt.devices.base.scan_groups import IllegalAddressRegistry, ReadableSensorGroup, ScanPlanRegistry
 from sigenergy2mqtt.diagnostics import DiagnosticsService
 from sigenergy2mqtt.influxdb import get_influxdb_services
 from sigenergy2mqtt.metrics import Metrics, MetricsService
 from sigenergy2mqtt.modbus import ModbusClient
+from sigenergy2mqtt.modbus.capture import ModbusCapture
 from sigenergy2mqtt.monitor import MonitorService
 from sigenergy2mqtt.mqtt import interrupt_mqtt_reconnection, mqtt_health_registry, reset_mqtt_reconnection_interrupt
 from sigenergy2mqtt.persistence import Category, state_store
@@ -312,68 +315,82 @@ async def make_plant_and_inverter(plant_index: int, modbus_client: ModbusClient,
     """Create an Inverter and, on first call, a PowerPlant.
 
     ``seen_serial_numbers`` is updated in-place to guard
-    against duplicate serial numbers.
+    against duplicate serial numbers. The serial number is
+    added as soon as it is read (and removed again if the
+    inverter cannot be created), because hosts are probed
+    concurrently.
     """
-    sn = await get_state(InverterSerialNumber(plant_index, device_address), modbus_client, "inverter")
+    serial_number = InverterSerialNumber(plant_index, device_address)
+    model = InverterModel(plant_index, device_address)
+    firmware_version = InverterFirmwareVersion(plant_index, device_address)
+    # The model, serial number and firmware version registers are adjacent, so are read in one request
+    await ReadableSensorGroup(model, serial_number, *((firmware_version,) if plant is None else ())).pre_read(modbus_client)
+
+    sn = await get_state(serial_number, modbus_client, "inverter")
     if sn in seen_serial_numbers:
         logger.info(f"Inverter {sn} has already been detected - ignoring (idx={plant_index} id={device_address})")
         return None, None
-
-    mdl = await get_state(InverterModel(plant_index, device_address), modbus_client, "inverter")
-    if mdl is None:
-        raise ValueError(f"Inverter {sn} Model ID cannot be None (idx={plant_index} id={device_address})")
-
-    batteries = cast(int, await get_state(PACKBCUCount(plant_index, device_address), modbus_client, "plant", default_value=0))
-    if batteries == 0:
-        device_type = PVInverter()
-        logger.debug(f"Inverter {sn} has no batteries - assuming PVInverter (idx={plant_index} id={device_address})")
-    else:
-        device_type = HybridInverter()
-        logger.debug(f"Inverter {sn} has {batteries} batter{'y' if batteries == 1 else 'ies'} - assuming HybridInverter (idx={plant_index} id={device_address})")
-
-    device_type.has_independent_phase_power_control_interface = await probe_optional_interface(modbus_client, IndependentPhasePowerControl.ADDRESS, "Independent Phase Control Interface")
-    device_type.has_grid_code_interface = await probe_optional_interface(modbus_client, GridCodeLVRT.ADDRESS, "Grid Code Interface")
+    if sn is not None:
+        # Reserved before any further reads, so that another host probed concurrently cannot also claim this inverter
+        seen_serial_numbers.add(str(sn))
 
     try:
-        sys_tz_offset = await get_state(SystemTimeZone(plant_index), modbus_client, "plant", raw=True)
-        if sys_tz_offset is None or not isinstance(sys_tz_offset, int):
-            logger.warning(f"Plant {plant_index} System Timezone offset not available - defaulting to UTC")
-            sys_tz_offset = 0
-        if sys_tz_offset > 1440 or sys_tz_offset < -1440:
-            logger.warning(f"Plant {plant_index} System Timezone offset {sys_tz_offset} is out of range - defaulting to UTC")
-            sys_tz_offset = 0
-        tz = timezone(timedelta(minutes=cast(int, sys_tz_offset)))
-    except (ModbusException, TimeoutError, OSError, SanityCheckException) as e:
-        logger.error(f"Plant {plant_index} System Timezone offset read failed - defaulting to UTC ({e})")
-        tz = UTC
-
-    if plant is None:
-        firmware = FirmwareVersion(cast(str, await get_state(InverterFirmwareVersion(plant_index, device_address), modbus_client, "plant/inverter")))
-        protocol = await probe_protocol(modbus_client)
-        if protocol == Protocol.V2_8 and firmware.service_pack >= 114:
-            logger.debug(f"IGNORED {get_modbus_url(modbus_client)} detection of Protocol V{protocol.value} because Firmware {firmware} supports V2.9 features")
-            protocol = Protocol.V2_9
-        logger.info(f"Interrogated {get_modbus_url(modbus_client)} and found Sigenergy Modbus Protocol V{protocol.value} ({ProtocolApplies(protocol)})")
-
-        if protocol < Protocol.V2_8 and active_config.consumption != ConsumptionMethod.CALCULATED:
-            logger.warning(f"Resetting consumption configuration to {ConsumptionMethod.CALCULATED.name} because {active_config.consumption.name} is not supported on Modbus Protocol V{protocol.value}")
-            active_config.consumption = ConsumptionMethod.CALCULATED
-
-        ot = await get_state(OutputType(plant_index, device_address), modbus_client, "plant/inverter", raw=True)
-        if ot is None:
-            raise ValueError(f"Inverter {sn} OutputType cannot be None — cannot create PowerPlant (idx={plant_index} id={device_address})")
-
-        pre_heating = await get_state(ESSPreHeatingEnable(plant_index), modbus_client, "plant/inverter")
-
-        plant = await PowerPlant.create(plant_index, device_type, firmware, protocol, tz, cast(int, ot), pre_heating is not None, modbus_client)
-    else:
-        protocol = plant.protocol_version
+        mdl = await get_state(model, modbus_client, "inverter")
+        if mdl is None:
+            raise ValueError(f"Inverter {sn} Model ID cannot be None (idx={plant_index} id={device_address})")
+
+        batteries = cast(int, await get_state(PACKBCUCount(plant_index, device_address), modbus_client, "plant", default_value=0))
+        if batteries == 0:
+            device_type = PVInverter()
+            logger.debug(f"Inverter {sn} has no batteries - assuming PVInverter (idx={plant_index} id={device_address})")
+        else:
+            device_type = HybridInverter()
+            logger.debug(f"Inverter {sn} has {batteries} batter{'y' if batteries == 1 else 'ies'} - assuming HybridInverter (idx={plant_index} id={device_address})")
 
-    inverter = await Inverter.create(plant_index, device_address, device_type, protocol, tz, modbus_client)
-    inverter.via_device = plant.unique_id
+        device_type.has_independent_phase_power_control_interface = await probe_optional_interface(modbus_client, IndependentPhasePowerControl.ADDRESS, "Independent Phase Control Interface")
+        device_type.has_grid_code_interface = await probe_optional_interface(modbus_client, GridCodeLVRT.ADDRESS, "Grid Code Interface")
 
-    if sn is not None:
-        seen_serial_numbers.add(str(sn))
+        try:
+            sys_tz_offset = await get_state(SystemTimeZone(plant_index), modbus_client, "plant", raw=True)
+            if sys_tz_offset is None or not isinstance(sys_tz_offset, int):
+                logger.warning(f"Plant {plant_index} System Timezone offset not available - defaulting to UTC")
+                sys_tz_offset = 0
+            if sys_tz_offset > 1440 or sys_tz_offset < -1440:
+                logger.warning(f"Plant {plant_index} System Timezone offset {sys_tz_offset} is out of range - defaulting to UTC")
+                sys_tz_offset = 0
+            tz = timezone(timedelta(minutes=cast(int, sys_tz_offset)))
+        except (ModbusException, TimeoutError, OSError, SanityCheckException) as e:
+            logger.error(f"Plant {plant_index} System Timezone offset read failed - defaulting to UTC ({e})")
+            tz = UTC
+
+        if plant is None:
+            firmware = FirmwareVersion(cast(str, await get_state(firmware_version, modbus_client, "plant/inverter")))
+            protocol = await probe_protocol(modbus_client)
+            if protocol == Protocol.V2_8 and firmware.service_pack >= 114:
+                logger.debug(f"IGNORED {get_modbus_url(modbus_client)} detection of Protocol V{protocol.value} because Firmware {firmware} supports V2.9 features")
+                protocol = Protocol.V2_9
+            logger.info(f"Interrogated {get_modbus_url(modbus_client)} and found Sigenergy Modbus Protocol V{protocol.value} ({ProtocolApplies(protocol)})")
+
+            if protocol < Protocol.V2_8 and active_config.consumption != ConsumptionMethod.CALCULATED:
+                logger.warning(f"Resetting consumption configuration to {ConsumptionMethod.CALCULATED.name} because {active_config.consumption.name} is not supported on Modbus Protocol V{protocol.value}")
+                active_config.consumption = ConsumptionMethod.CALCULATED
+
+            ot = await get_state(OutputType(plant_index, device_address), modbus_client, "plant/inverter", raw=True)
+            if ot is None:
+                raise ValueError(f"Inverter {sn} OutputType cannot be None — cannot create PowerPlant (idx={plant_index} id={device_address})")
+
+            pre_heating = await get_state(ESSPreHeatingEnable(plant_index), modbus_client, "plant/inverter")
+
+            plant = await PowerPlant.create(plant_index, device_type, firmware, protocol, tz, cast(int, ot), pre_heating is not None, modbus_client)
+        else:
+            protocol = plant.protocol_version
+
+        inverter = await Inverter.create(plant_index, device_address, device_type, protocol, tz, modbus_client)
+        inverter.via_device = plant.unique_id
+    except BaseException:
+        if sn is not None:
+            seen_serial_numbers.discard(str(sn))
+        raise
 
     return inverter, plant
 
@@ -411,16 +428,24 @@ async def make_pss(
 # ---------------------------------------------------------------------------
 
 
+class _ConnectionFailed(Exception):
+    """Raised by :func:`_setup_host` when a configured host cannot be connected for register probing."""
+
+
 async def setup_devices(seen_serial_numbers: set[str]) -> tuple[list[ThreadConfig], Protocol | None]:
-    """Iterate over all configured Modbus hosts, probe registers, and populate ThreadConfigs."""
-    protocol_version: Protocol | None = None
+    """Probe all configured Modbus hosts and populate ThreadConfigs.
+
+    Configuration entries that share an endpoint (host and port) are probed one after the other, in configuration
+    order, so that each endpoint only ever has one probe in flight. Distinct endpoints are probed concurrently.
+    ThreadConfigs are created and device sequence numbers allocated in configuration order before probing starts,
+    so the resulting thread and device order does not depend on which endpoint answers first.
+    """
+    started = time.monotonic()
     devices = active_config.modbus
     total_ac_chargers = sum(len(d.ac_chargers) if d.ac_chargers else 0 for d in devices)  # type: ignore[reportGeneralTypeIssues]
     total_dc_chargers = sum(len(d.dc_chargers) if d.dc_chargers else 0 for d in devices)  # type: ignore[reportGeneralTypeIssues]
-    ac_charger_sequence = 0
-    dc_charger_sequence = 0
-    pid_sequence = 0
-    pss_sequence = 0
+    sequence_starts = [0, 0, 0, 0]  # AC chargers, DC chargers, PIDs, PSSs
+    endpoints: dict[tuple[str, int], list[tuple[int, Any, ThreadConfig, tuple[int, ...]]]] = {}
 
     if devices and devices[0].registers.read_only is True and devices[0].registers.read_write is False and devices[0].registers.write_only is False:
         # registers is a single entity that is propagated to all devices (sigenergy2mqtt.config.merge.propagate_to_all_devices), so we only need to check the first device
@@ -430,134 +455,182 @@ async def setup_devices(seen_serial_numbers: set[str]) -> tuple[list[ThreadConfi
         if not (device.registers.read_only or device.registers.read_write or device.registers.write_only):
             logger.info(f"Ignored configured host modbus://{device.host}:{device.port} (Plant Index = {plant_index}): All registers are disabled (read-only=false read-write=false write-only=false)")
             continue
-        if device.pss or device.pid:
-            logger.info(
-                f"Creating devices from configured host modbus://{device.host}:{device.port} (Plant: {plant_index}, Device IDs: Inverter={device.inverters} AC Charger={device.ac_chargers} DC Charger={device.dc_chargers} PSS={device.pss} PID={device.pid})"
+        config: ThreadConfig = ThreadConfig.create(device.host, device.port, device.timeout, device.retries, pipeline_depth=device.pipeline_depth, capture_file=device.capture_file)
+        endpoints.setdefault((device.host, device.port), []).append((plant_index, device, config, tuple(sequence_starts)))
+        for i, addresses in enumerate((device.ac_chargers, device.dc_chargers, device.pid, device.pss)):
+            sequence_starts[i] += len(addresses) if addresses else 0
+
+    async def _probe_endpoint(entries: list[tuple[int, Any, ThreadConfig, tuple[int, ...]]]) -> list[Protocol | None]:
+        return [await _setup_host(plant_index, device, config, seen_serial_numbers, starts, total_ac_chargers, total_dc_chargers) for plant_index, device, config, starts in entries]
+
+    tasks = [asyncio.create_task(_probe_endpoint(entries)) for entries in endpoints.values()]
+    if tasks:
+        _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in tasks:  # Report the failure of the earliest configured endpoint, regardless of which failed first
+            if not task.cancelled() and task.exception() is not None:
+                if isinstance(task.exception(), _ConnectionFailed):
+                    sys.exit(1)
+                raise cast(BaseException, task.exception())
+
+    protocol_version: Protocol | None = max((p for task in tasks for p in task.result() if p is not None), default=None)
+    if len(endpoints) > 1:
+        logger.info(f"Register probing of {len(endpoints)} hosts completed in {time.monotonic() - started:.2f}s")
+    return thread_config_registry.get_all(), protocol_version
+
+
+async def _setup_host(
+    plant_index: int,
+    device,
+    config: ThreadConfig,
+    seen_serial_numbers: set[str],
+    sequence_starts: tuple[int, ...],
+    total_ac_chargers: int,
+    total_dc_chargers: int,
+) -> Protocol | None:
+    """Probe the devices of one configured host and add them to its ThreadConfig, returning the plant protocol version."""
+    if device.pss or device.pid:
+        logger.info(
+            f"Creating devices from configured host modbus://{device.host}:{device.port} (Plant: {plant_index}, Device IDs: Inverter={device.inverters} AC Charger={device.ac_chargers} DC Charger={device.dc_chargers} PSS={device.pss} PID={device.pid})"
+        )
+    else:
+        logger.info(
+            f"Creating devices from configured host modbus://{device.host}:{device.port} (Plant: {plant_index}, Device IDs: Inverter={device.inverters} AC Charger={device.ac_chargers} DC Charger={device.dc_chargers})"
+        )
+
+    ac_charger_sequence, dc_charger_sequence, pid_sequence, pss_sequence = sequence_starts
+    phase = time.monotonic()
+    timings: list[str] = []
+
+    def _lap(name: str) -> None:
+        nonlocal phase
+        now = time.monotonic()
+        timings.append(f"{name}={now - phase:.2f}s")
+        phase = now
+
+    modbus = ModbusClient(device.host, port=device.port, timeout=device.timeout, retries=device.retries, capture_file=device.capture_file)
+
+    async with modbus:
+        if not modbus.connected:
+            logger.fatal(f"Failed to connect to modbus://{device.host}:{device.port}")
+            raise _ConnectionFailed(f"modbus://{device.host}:{device.port}")
+
+        logger.info(f"Connected to modbus://{device.host}:{device.port} for register probing")
+        _lap("connect")
+
+        plant: PowerPlant | None = None
+        inverters: dict[int, str] = {}
+        inverter_devices: list[Inverter] = []
+        inverter_firmware_versions: dict[int, str] = {}
+
+        for device_address in device.inverters:  # type: ignore[reportGeneralTypeIssues]
+            inverter, plant_tmp = await make_plant_and_inverter(plant_index, modbus, device_address, plant, seen_serial_numbers)
+
+            if plant is None and plant_tmp is not None:
+                plant = plant_tmp
+
+                config.add_device(plant)
+
+                if not plant.has_battery:
+                    logger.debug(f"No battery modules attached to plant {device.host}:{device.port} - disabling charging/discharging statistics interface sensors")
+                    for register in (SITotalChargedEnergy.ADDRESS, SITotalDischargedEnergy.ADDRESS):
+                        si_sensor = plant.get_sensor(
+                            f"{active_config.home_assistant.unique_id_prefix}_{plant_index}_{Constants.PLANT_DEVICE_ADDRESS}_{register}",
+                            search_children=True,
+                        )
+                        if si_sensor:
+                            si_sensor.publishable = False
+
+            if inverter is not None:
+                inverters[device_address] = inverter.unique_id
+                inverter_devices.append(inverter)
+                inverter_firmware_versions[device_address] = str(inverter["hw"])
+                config.add_device(inverter)
+        _lap("inverters")
+
+        if plant is not None:
+            protocol_version = plant.protocol_version
+
+            await validate_publishable_sensors(modbus, plant, inverter_firmware_versions)
+            for inverter in inverter_devices:
+                await validate_publishable_sensors(modbus, inverter, inverter_firmware_versions)
+            _lap("validation")
+
+            await _setup_dc_chargers(
+                plant_index,
+                device,
+                plant,
+                modbus,
+                inverters,
+                config,
+                dc_charger_sequence,
+                total_dc_chargers,
+                inverter_firmware_versions,
             )
-        else:
-            logger.info(
-                f"Creating devices from configured host modbus://{device.host}:{device.port} (Plant: {plant_index}, Device IDs: Inverter={device.inverters} AC Charger={device.ac_chargers} DC Charger={device.dc_chargers})"
+            await _setup_ac_chargers(
+                plant_index,
+                device,
+                plant,
+                modbus,
+                config,
+                protocol_version,
+                ac_charger_sequence,
+                total_ac_chargers,
+                inverter_firmware_versions,
+            )
+            await _setup_pid(
+                plant_index,
+                device,
+                plant,
+                seen_serial_numbers,
+                modbus,
+                config,
+                protocol_version,
+                pid_sequence,
+                len(device.pid) if device.pid else 0,
+                inverter_firmware_versions,
+            )
+            await _setup_pss(
+                plant_index,
+                device,
+                plant,
+                seen_serial_numbers,
+                modbus,
+                config,
+                protocol_version,
+                pss_sequence,
+                len(device.pss) if device.pss else 0,
+                inverter_firmware_versions,
             )
 
-        config: ThreadConfig = ThreadConfig.create(device.host, device.port, device.timeout, device.retries)
-        modbus = ModbusClient(device.host, port=device.port, timeout=device.timeout, retries=device.retries)
-
-        async with modbus:
-            if not modbus.connected:
-                logger.fatal(f"Failed to connect to modbus://{device.host}:{device.port}")
-                sys.exit(1)
-
-            logger.info(f"Connected to modbus://{device.host}:{device.port} for register probing")
-
-            plant: PowerPlant | None = None
-            inverters: dict[int, str] = {}
-            inverter_devices: list[Inverter] = []
-            inverter_firmware_versions: dict[int, str] = {}
-
-            for device_address in device.inverters:  # type: ignore[reportGeneralTypeIssues]
-                inverter, plant_tmp = await make_plant_and_inverter(plant_index, modbus, device_address, plant, seen_serial_numbers)
-
-                if plant is None and plant_tmp is not None:
-                    plant = plant_tmp
-
-                    config.add_device(plant)
-
-                    if plant.protocol_version is not None:
-                        protocol_version = plant.protocol_version if protocol_version is None or protocol_version < plant.protocol_version else protocol_version
-
-                    if not plant.has_battery:
-                        logger.debug(f"No battery modules attached to plant {device.host}:{device.port} - disabling charging/discharging statistics interface sensors")
-                        for register in (SITotalChargedEnergy.ADDRESS, SITotalDischargedEnergy.ADDRESS):
-                            si_sensor = plant.get_sensor(
-                                f"{active_config.home_assistant.unique_id_prefix}_{plant_index}_{Constants.PLANT_DEVICE_ADDRESS}_{register}",
-                                search_children=True,
-                            )
-                            if si_sensor:
-                                si_sensor.publishable = False
-
-                if inverter is not None:
-                    inverters[device_address] = inverter.unique_id
-                    inverter_devices.append(inverter)
-                    inverter_firmware_versions[device_address] = str(inverter["hw"])
-                    config.add_device(inverter)
-
-            if plant is not None:
-                await validate_publishable_sensors(modbus, plant, inverter_firmware_versions)
-                for inverter in inverter_devices:
-                    await validate_publishable_sensors(modbus, inverter, inverter_firmware_versions)
-
-                dc_charger_sequence = await _setup_dc_chargers(
-                    plant_index,
-                    device,
-                    plant,
-                    modbus,
-                    inverters,
-                    config,
-                    dc_charger_sequence,
-                    total_dc_chargers,
-                    inverter_firmware_versions,
-                )
-                ac_charger_sequence = await _setup_ac_chargers(
-                    plant_index,
-                    device,
-                    plant,
-                    modbus,
-                    config,
-                    protocol_version,
-                    ac_charger_sequence,
-                    total_ac_chargers,
-                    inverter_firmware_versions,
-                )
-                pid_sequence = await _setup_pid(
-                    plant_index,
-                    device,
-                    plant,
-                    seen_serial_numbers,
-                    modbus,
-                    config,
-                    protocol_version,
-                    pid_sequence,
-                    len(device.pid) if device.pid else 0,
-                    inverter_firmware_versions,
-                )
-                pss_sequence = await _setup_pss(
-                    plant_index,
-                    device,
-                    plant,
-                    seen_serial_numbers,
-                    modbus,
-                    config,
-                    protocol_version,
-                    pss_sequence,
-                    len(device.pss) if device.pss else 0,
-                    inverter_firmware_versions,
-                )
-
-                # Finalise cross-device sensor bindings now that all inverters and chargers are registered
-                bind_cross_device_sensors(plant_index)
-
-                # Set the min/max bounds for Active/Reactive Power Fixed Adjustment Target Value
-                total_rated_active_power: int = 0
-                for i in config.devices:
-                    if isinstance(i, Inverter) and i.plant_index == plant_index:
-                        sensor = i.get_sensor(RatedActivePower, search_children=True)
-                        if sensor is None:
-                            logger.warning(f"{i.log_identity} RatedActivePower sensor not found - cannot set bounds for Active/Reactive Power Fixed Adjustment Target Value sensors")
+            # Finalise cross-device sensor bindings now that all inverters and chargers are registered
+            bind_cross_device_sensors(plant_index)
+
+            # Set the min/max bounds for Active/Reactive Power Fixed Adjustment Target Value
+            total_rated_active_power: int = 0
+            for i in config.devices:
+                if isinstance(i, Inverter) and i.plant_index == plant_index:
+                    sensor = i.get_sensor(RatedActivePower, search_children=True)
+                    if sensor is None:
+                        logger.warning(f"{i.log_identity} RatedActivePower sensor not found - cannot set bounds for Active/Reactive Power Fixed Adjustment Target Value sensors")
+                    else:
+                        rap = await get_state(sensor, modbus, "inverter", raw=True)
+                        if rap is not None:
+                            total_rated_active_power += cast(int, rap)
                         else:
-                            rap = await get_state(sensor, modbus, "inverter", raw=True)
-                            if rap is not None:
-                                total_rated_active_power += cast(int, rap)
-                            else:
-                                logger.warning(f"{i.log_identity} Failed to acquire RatedActivePower")
-                if total_rated_active_power > 0:
-                    for sensor in [s for s in plant.sensors.values() if isinstance(s, (ActivePowerFixedAdjustmentTargetValue, PhaseActivePowerFixedAdjustmentTargetValue))]:
-                        sensor.apply_min_max(-total_rated_active_power, total_rated_active_power)
-                    for sensor in [s for s in plant.sensors.values() if isinstance(s, (ReactivePowerFixedAdjustmentTargetValue, PhaseReactivePowerFixedAdjustmentTargetValue))]:
-                        sensor.apply_min_max(-60 * total_rated_active_power, 60 * total_rated_active_power)
-
-            logger.info(f"Disconnecting from modbus://{device.host}:{device.port} - register probing complete")
+                            logger.warning(f"{i.log_identity} Failed to acquire RatedActivePower")
+            if total_rated_active_power > 0:
+                for sensor in [s for s in plant.sensors.values() if isinstance(s, (ActivePowerFixedAdjustmentTargetValue, PhaseActivePowerFixedAdjustmentTargetValue))]:
+                    sensor.apply_min_max(-total_rated_active_power, total_rated_active_power)
+                for sensor in [s for s in plant.sensors.values() if isinstance(s, (ReactivePowerFixedAdjustmentTargetValue, PhaseReactivePowerFixedAdjustmentTargetValue))]:
+                    sensor.apply_min_max(-60 * total_rated_active_power, 60 * total_rated_active_power)
+            _lap("other-devices")
 
-    return thread_config_registry.get_all(), protocol_version
+        logger.info(f"Disconnecting from modbus://{device.host}:{device.port} - register probing complete ({' '.join(timings)})")
+
+    return plant.protocol_version if plant is not None else None
 
 
 def setup_services(configs: list[ThreadConfig], protocol_version: Protocol | None) -> list[ThreadConfig]:
@@ -878,12 +951,12 @@ async def _is_grid_outage(plant_index: int, modbus_client: ModbusClient) -> bool
         return None
 
 
-async def _watch_grid_restore_and_request_restart(host: str, port: int, timeout: float, retries: int, plant_index: int) -> None:
+async def _watch_grid_restore_and_request_restart(host: str, port: int, timeout: float, retries: int, plant_index: int, capture_file: str | None = None) -> None:
     """Watch GridStatus and request runtime restart once grid returns on-line."""
     key = (host, port, plant_index)
     try:
         while True:
-            modbus = ModbusClient(host, port=port, timeout=timeout, retries=retries)
+            modbus = ModbusClient(host, port=port, timeout=timeout, retries=retries, capture_file=capture_file)
             async with modbus:
                 if modbus.connected:
                     is_outage = await _is_grid_outage(plant_index, modbus)
@@ -901,7 +974,7 @@ def _schedule_restart_on_grid_restore(device, plant_index: int) -> None:
         return
     _GRID_RESTORE_WATCH_TASKS.add(key)
     logger.info(f"Scheduling grid-restore watcher for modbus://{device.host}:{device.port} plant {plant_index} due to outage-time AC charger skip")
-    asyncio.create_task(_watch_grid_restore_and_request_restart(device.host, device.port, device.timeout, device.retries, plant_index))
+    asyncio.create_task(_watch_grid_restore_and_request_restart(device.host, device.port, device.timeout, device.retries, plant_index, device.capture_file))
 
 
 # ---------------------------------------------------------------------------
@@ -1126,12 +1199,48 @@ def _is_valid_validation_cache_payload(value: str) -> bool:
     )
 
 
+def _validation_ranges(sensors: list[ModbusSensorMixin], plant_index: int) -> list[list[ModbusSensorMixin]]:
+    """Split sensors into runs of contiguous register addresses that can each be validated with one read.
+
+    Runs never bridge unused registers, because a gap could be illegal even though no sensor reads it, and are
+    limited to Constants.MAX_MODBUS_REGISTERS_PER_REQUEST registers. When chunking is disabled for the plant,
+    each sensor is validated on its own.
+    """
+    try:
+        disable_chunking = active_config.modbus[plant_index].disable_chunking is True
+    except (IndexError, TypeError):
+        disable_chunking = False
+    ranges: list[list[ModbusSensorMixin]] = []
+    next_address = -1
+    for sensor in sorted(sensors, key=lambda s: (s.device_address, s.input_type, s.address)):
+        current = ranges[-1] if ranges else None
+        if (
+            current is None
+            or disable_chunking
+            or sensor.device_address != current[0].device_address
+            or sensor.input_type != current[0].input_type
+            or sensor.address > next_address
+            or sensor.address + sensor.count - current[0].address > Constants.MAX_MODBUS_REGISTERS_PER_REQUEST
+        ):
+            ranges.append([sensor])
+            next_address = sensor.address + sensor.count
+        else:
+            current.append(sensor)
+            next_address = max(next_address, sensor.address + sensor.count)
+    return ranges
+
+
 async def validate_publishable_sensors(modbus_client: ModbusClient, device: Device, inverter_firmware_versions: Mapping[int, str] | None = None) -> None:
     """Validate all publishable sensors for illegal data addresses.
 
     Scans all publishable ModbusSensorMixin sensors that are not WriteOnlySensors and
     have not been previously probed (state_count == 0), then marks those returning
     Modbus 0x02 ILLEGAL_DATA_ADDRESS as unpublishable before scan groups are created.
+    Each run of contiguous sensor addresses is read in one request; a run that returns
+    an error is bisected until the sensors at illegal addresses are isolated, so a
+    device with few illegal addresses is validated in a handful of reads.
+    Their addresses are recorded in IllegalAddressRegistry so that scan groups never
+    bridge gaps across them.
 
     Physical scan results are cached per device and reused on later startups while both
     the active Modbus configuration and the full plant inverter firmware set are
@@ -1169,6 +1278,7 @@ async def validate_publishable_sensors(modbus_client: ModbusClient, device: Devi
                     sensor = sensor_lookup.get(sensor_unique_id)
                     if sensor is not None:
                         sensor.publishable = False
+                        IllegalAddressRegistry.record(device.plant_index, sensor.device_address, sensor.input_type, sensor.address, sensor.count)
                         _log_illegal_data_address(sensor)
                 return
             else:
@@ -1180,23 +1290,42 @@ async def validate_publishable_sensors(modbus_client: ModbusClient, device: Devi
 
     illegal_sensor_unique_ids: list[str] = []
     scan_completed = True
-
-    # Test each sensor for illegal address exceptions
-    for sensor in sensors_to_test:
-        for s in sensor.alarms if isinstance(sensor, AlarmCombinedSensor) else [sensor]:
-            try:
-                rr = await read_registers(modbus_client, s.address, s.count, s.device_address, s.input_type)
-                if rr and rr.isError() and rr.exception_code == 0x02:
-                    _log_illegal_data_address(s)
-                    s.publishable = False
-                    illegal_sensor_unique_ids.append(s.unique_id)
-            except (ModbusException, TimeoutError, OSError, ConnectionError) as e:
-                scan_completed = False
-                # Log but don't suppress sensor on transient errors (only explicit 0x02)
-                if "0x02 ILLEGAL DATA ADDRESS" in str(e):
-                    logger.debug(f"{s.log_identity}: Validation detected illegal address: {e}")
-                else:
-                    logger.debug(f"{s.log_identity}: Validation read failed: {e}")
+    reads = 0
+
+    async def _validate_range(sensors: list[ModbusSensorMixin]) -> None:
+        """Read a contiguous range in one request, bisecting it on error until the illegal addresses are isolated."""
+        nonlocal scan_completed, reads
+        first = sensors[0]
+        count = max(s.address + s.count for s in sensors) - first.address
+        reads += 1
+        try:
+            rr = await read_registers(modbus_client, first.address, count, first.device_address, first.input_type)
+        except (ModbusException, TimeoutError, OSError, ConnectionError) as e:
+            scan_completed = False
+            # Log but don't suppress sensors on transient errors (only explicit 0x02)
+            identity = first.log_identity if len(sensors) == 1 else f"{device.log_identity} {len(sensors)} sensors at {first.address}-{first.address + count - 1}"
+            if "0x02 ILLEGAL DATA ADDRESS" in str(e):
+                logger.debug(f"{identity}: Validation detected illegal address: {e}")
+            else:
+                logger.debug(f"{identity}: Validation read failed: {e}")
+            return
+        if not (rr and rr.isError()):
+            return
+        if len(sensors) > 1:
+            middle = len(sensors) // 2
+            await _validate_range(sensors[:middle])
+            await _validate_range(sensors[middle:])
+        elif rr.exception_code == 0x02:
+            _log_illegal_data_address(first)
+            first.publishable = False
+            IllegalAddressRegistry.record(device.plant_index, first.device_address, first.input_type, first.address, first.count)
+            illegal_sensor_unique_ids.append(first.unique_id)
+
+    # Test each contiguous range of sensor addresses, so that only ranges containing illegal addresses are read in parts
+    for sensors in _validation_ranges([s for sensor in sensors_to_test for s in (sensor.alarms if isinstance(sensor, AlarmCombinedSensor) else [sensor])], device.plant_index):
+        await _validate_range(sensors)
+
+    logger.debug(f"{device.log_identity} Validated {len(sensors_to_test)} sensor{'s' if len(sensors_to_test) != 1 else ''} addresses with {reads} read{'s' if reads != 1 else ''}")
 
     if not scan_completed:
         logger.debug(f"{device.log_identity} Validation scan not cached because one or more sensor reads failed")
@@ -1235,6 +1364,8 @@ async def async_main() -> None:
         thread_config_registry.clear()
         mqtt_health_registry.clear()
         service_health_registry.clear()
+        IllegalAddressRegistry.clear()
+        ScanPlanRegistry.clear()
 
         # Phase 2 config load — must run before StateStore so that the correct
         # MQTT broker address (and other settings) from the YAML config file are
@@ -1249,6 +1380,8 @@ async def async_main() -> None:
             active_config.persistent_state_path,
             active_config.persistence,
         )
+        # Read the sensor and PVOutput state in bulk, rather than each sensor reading its own as it is constructed
+        await state_store.preload(Category.SENSOR, Category.PVOUTPUT)
 
         seen_serial_numbers: set[str] = set()
         configs, protocol_version = await setup_devices(seen_serial_numbers)
@@ -1264,6 +1397,7 @@ async def async_main() -> None:
 
         # Shutdown StateStore
         state_store.shutdown()
+        ModbusCapture.close_all()
 
         if not restart_controller.requested:
             logger.info(f"Shutdown of Release {active_config.version} completed")
@@ -28,6 +28,10 @@ class ThreadConfig:
             Defaults to ``1.0``.
         retries: Number of retry attempts on failure passed to the Modbus
             client. Defaults to ``3``.
+        pipeline_depth: Maximum number of Modbus transactions kept in flight
+            on the connection. Defaults to ``1`` (no pipelining).
+        capture_file: File to record the Modbus transactions to, for offline
+            replay. Defaults to ``None`` (no capture).
 
     Raises:
         ValueError: If both ``name`` and ``host`` are absent or blank.
@@ -39,6 +43,8 @@ class ThreadConfig:
     port: int | None
     timeout: float = 1.0
     retries: int = 3
+    pipeline_depth: int = 1
+    capture_file: str | None = None
 
     _devices: list[Device] = field(default_factory=list)
     _token: Any = None
@@ -57,14 +63,14 @@ class ThreadConfig:
             raise ValueError("Port must be between 0 and 65535")
 
     @classmethod
-    def create(cls, host: str | None, port: int | None, timeout: float = 1.0, retries: int = 3, name: str | None = None):
+    def create(cls, host: str | None, port: int | None, timeout: float = 1.0, retries: int = 3, name: str | None = None, pipeline_depth: int = 1, capture_file: str | None = None):
         if (host is None or port is None) and name is None:
             raise ValueError("Name must be provided when host or port are None")
         instance = thread_config_registry.get_config(host, port, name)
         if instance is None:
             if name is None:
                 name = cls._make_name(host, port)  # type: ignore
-            instance = cls(name=name, host=host, port=port, timeout=timeout, retries=retries, _token=cls.__INTERNAL_TOKEN)
+            instance = cls(name=name, host=host, port=port, timeout=timeout, retries=retries, pipeline_depth=pipeline_depth, capture_file=capture_file, _token=cls.__INTERNAL_TOKEN)
             thread_config_registry.add_config(instance)
         return instance
 
@@ -1,9 +1,13 @@
 """
 Centralised runtime metrics store for sigenergy2mqtt.
 
-All mutable state is protected by a :class:`threading.Lock`. Callers should
-use the async helper methods rather than mutating class attributes directly.
-Timing values are stored in milliseconds unless noted otherwise.
+Metrics are recorded without locking: each thread accumulates into its own
+:class:`_Shard` of plain slots, which only that thread ever writes. The
+shards are folded into the ``Metrics.sigenergy2mqtt_*`` class attributes
+(the read API) under a :class:`threading.Lock` whenever they are read through
+:meth:`Metrics.lock` or :meth:`Metrics.aggregate`, e.g. by the ``MetricsService``
+sensors and the diagnostics collectors. Timing values are stored in
+milliseconds unless noted otherwise.
 
 Call :meth:`Metrics.commence` from the service ``on_commencement`` handler to
 initialise the time-sensitive ``_started`` and ``sigenergy2mqtt_started``
@@ -11,33 +15,185 @@ fields at actual service start rather than at module-import time.
 """
 
 import asyncio
+import itertools
+import math
 import logging
 import threading
 import time
-from collections.abc import Callable
-from concurrent.futures import Future, ThreadPoolExecutor, wait
+from bisect import bisect_left
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import ClassVar
+from typing import Any, ClassVar
 
 logger = logging.getLogger(__name__)
 
+_PREFIX = "sigenergy2mqtt_"
+
+# Counters and totals, accumulated per thread and added to the class attributes.
+_SUMS = (
+    "modbus_cache_fill_reads",
+    "modbus_reads",
+    "modbus_read_total",
+    "modbus_read_errors",
+    "modbus_skipped_errors",
+    "modbus_decoded_reads",
+    "modbus_unchanged_reads",
+    "modbus_pipelined",
+    "modbus_queue_delay_total",
+    "mqtt_publish_attempts",
+    "mqtt_publish_failures",
+    "mqtt_physical_publishes",
+    "modbus_writes",
+    "modbus_write_total",
+    "modbus_write_errors",
+    "influxdb_writes",
+    "influxdb_write_errors",
+    "influxdb_write_total",
+    "influxdb_queries",
+    "influxdb_query_errors",
+    "influxdb_retries",
+    "influxdb_rate_limit_waits",
+    "influxdb_batch_total",
+    "influxdb_flushes",
+    "influxdb_flushed_points",
+    "influxdb_flush_delay_total",
+    "state_store_save_requests",
+    "state_store_saves",
+    "state_store_save_errors",
+    "state_store_save_total",
+    "state_store_loads",
+    "state_store_load_hits",
+    "state_store_load_errors",
+    "state_store_deletes",
+    "state_store_delete_errors",
+    "pvoutput_uploads",
+    "pvoutput_upload_errors",
+    "pvoutput_upload_skipped",
+    "pvoutput_upload_total",
+)
+
+# Extremes since the shard's epoch began.
+_MAXIMA = (
+    "modbus_read_max",
+    "modbus_in_flight_max",
+    "modbus_queue_delay_max",
+    "modbus_write_max",
+    "influxdb_write_max",
+    "influxdb_batch_size_max",
+    "influxdb_flush_delay_max",
+    "state_store_save_max",
+    "pvoutput_upload_max",
+)
+_MINIMA = ("modbus_read_min", "modbus_write_min", "influxdb_write_min", "state_store_save_min", "pvoutput_upload_min")
+_EXTREMES = frozenset(_MAXIMA + _MINIMA)
+
+# Gauges where the most recently recorded value (from any thread) wins.
+_LATEST = ("modbus_cache_hit_percentage", "modbus_in_flight")
+
+# (metric, numerator, denominator, percentage) recomputed from the folded counters.
+_RATIOS = (
+    ("modbus_physical_read_percentage", "modbus_cache_fill_reads", "modbus_reads", True),
+    ("modbus_read_mean", "modbus_read_total", "modbus_reads", False),
+    ("modbus_unchanged_percentage", "modbus_unchanged_reads", "modbus_decoded_reads", True),
+    ("modbus_queue_delay_mean", "modbus_queue_delay_total", "modbus_pipelined", False),
+    ("mqtt_physical_publish_percentage", "mqtt_physical_publishes", "mqtt_publish_attempts", True),
+    ("modbus_write_mean", "modbus_write_total", "modbus_writes", False),
+    ("influxdb_write_mean", "influxdb_write_total", "influxdb_writes", False),
+    ("influxdb_batch_size_mean", "influxdb_flushed_points", "influxdb_flushes", False),
+    ("influxdb_flush_delay_mean", "influxdb_flush_delay_total", "influxdb_flushes", False),
+    ("state_store_save_mean", "state_store_save_total", "state_store_saves", False),
+    ("state_store_load_hit_percentage", "state_store_load_hits", "state_store_loads", True),
+    ("pvoutput_upload_mean", "pvoutput_upload_total", "pvoutput_uploads", False),
+)
+
+# Bucket upper bounds (1, 2, 5, 10, ... 500000) of the distributions, with a final bucket for larger values.
+_BUCKETS = tuple(m * 10**e for e in range(6) for m in (1, 2, 5))
+
+# Distributions counted per thread in _BUCKETS, and summarised as the metric's
+# _p50 and _p99 percentiles (estimated as the upper bound of the bucket holding
+# the percentile, capped at the metric's _max).
+_HISTOGRAMS = ("influxdb_batch_size", "influxdb_flush_delay")
+_PERCENTILES = (50, 99)
+
+_ERRORS = (ArithmeticError, LookupError, ReferenceError, TypeError, ValueError)
+
+# Orders the values recorded for the _LATEST gauges across threads.
+_sequence = itertools.count(1)
+
+
+class _Shard:
+    """Metric accumulators for one thread.
+
+    Only the owning thread writes to a shard, so recording a metric is a few
+    plain slot updates with no locking. :meth:`Metrics._fold` only reads the
+    shard, under ``Metrics._lock``. The extremes are kept since the shard's
+    ``epoch`` began: when the extremes are reset, ``Metrics._epoch`` advances
+    and the owning thread restarts its extremes the next time it records, and
+    until then they are ignored by the fold (so a maximum or minimum recorded
+    at the moment they are reset may be missed).
+    """
+
+    __slots__ = ("epoch",) + _SUMS + _MAXIMA + _MINIMA + _LATEST + tuple(f"{name}_at" for name in _LATEST) + tuple(f"{name}_buckets" for name in _HISTOGRAMS)
+
+    def __init__(self, epoch: int = 0) -> None:
+        for name in _SUMS:
+            setattr(self, name, 0)
+        for name in _HISTOGRAMS:
+            setattr(self, f"{name}_buckets", [0] * (len(_BUCKETS) + 1))
+        for name in _LATEST:
+            setattr(self, name, None)
+            setattr(self, f"{name}_at", 0)
+        self.restart(epoch)
+
+    def restart(self, epoch: int) -> None:
+        """Clear the extremes and start recording them for *epoch*."""
+        for name in _MAXIMA:
+            setattr(self, name, float("-inf"))
+        for name in _MINIMA:
+            setattr(self, name, float("inf"))
+        self.epoch = epoch
+
+
+class _MetricsType(type):
+    """Metaclass that folds pending shards before a metric is assigned directly.
+
+    This keeps direct assignment (e.g. ``Metrics.sigenergy2mqtt_modbus_reads = 0``)
+    authoritative: increments recorded before the assignment are not added on
+    top of the assigned value by the next fold, and extremes recorded before
+    the assignment are not applied to it.
+    """
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if name.startswith(_PREFIX):
+            with cls._lock:
+                cls._fold()
+                super().__setattr__(name, value)
+                if name[len(_PREFIX) :] in _EXTREMES:
+                    super().__setattr__("_epoch", cls._epoch + 1)
+        else:
+            super().__setattr__(name, value)
+
 
-class Metrics:
+class Metrics(metaclass=_MetricsType):
     """
     Class-level store for all sigenergy2mqtt operational metrics.
 
     Attributes are class variables so they can be read cheaply from anywhere
-    without an instance. All writes go through the provided async helper
-    methods, which acquire the internal :class:`threading.Lock` before mutating
-    state, preventing TOCTOU races.
+    without an instance. All writes go through the provided helper methods,
+    which record into the calling thread's shard. Read the attributes inside
+    :meth:`lock` (or after :meth:`aggregate`) to include the latest recordings.
     """
 
     _lock: threading.Lock = threading.Lock()
-    _pending_lock: threading.Lock = threading.Lock()
-    _executor_lock: threading.Lock = threading.Lock()
-    _executor: ThreadPoolExecutor | None = None
-    _pending_updates: ClassVar[list[Future]] = []
+    _local: ClassVar[threading.local] = threading.local()
+    # (owning thread, live shard, shard values already folded) per recording thread. Protected by _lock.
+    _shards: ClassVar[list[tuple[threading.Thread, _Shard, _Shard]]] = []
+    # Sequence number of the value last applied for each _LATEST gauge. Protected by _lock.
+    _applied: ClassVar[dict[str, int]] = dict.fromkeys(_LATEST, 0)
+    # Advanced under _lock whenever the extremes are reset; shard extremes recorded in an earlier epoch are ignored.
+    _epoch: ClassVar[int] = 0
+    # Folded bucket counts of each _HISTOGRAMS distribution. Protected by _lock.
+    _buckets: ClassVar[dict[str, list[int]]] = {name: [0] * (len(_BUCKETS) + 1) for name in _HISTOGRAMS}
 
     _started: float = 0.0
     """Monotonic reference timestamp set by :meth:`commence`. Used for rate calculations."""
@@ -76,6 +232,37 @@ class Metrics:
     sigenergy2mqtt_modbus_skipped_errors: int = 0
     """Number of modbus skipped read errors."""
 
+    sigenergy2mqtt_modbus_decoded_reads: int = 0
+    """Number of sensor reads served from a decoded read-ahead block."""
+
+    sigenergy2mqtt_modbus_unchanged_reads: int = 0
+    """Number of decoded sensor reads short-circuited because the sensor's registers were unchanged."""
+
+    sigenergy2mqtt_modbus_unchanged_percentage: float = 0.0
+    """Percentage of decoded sensor reads short-circuited because the sensor's registers were unchanged."""
+
+    # ------------------------------------------------------------------
+    # Modbus pipelining metrics
+    # ------------------------------------------------------------------
+
+    sigenergy2mqtt_modbus_in_flight: int = 0
+    """Number of pipelined modbus transactions in flight when the latest transaction was sent."""
+
+    sigenergy2mqtt_modbus_in_flight_max: int = 0
+    """Maximum number of pipelined modbus transactions observed in flight at once."""
+
+    sigenergy2mqtt_modbus_pipelined: int = 0
+    """Total number of modbus transactions sent through a pipelined connection."""
+
+    sigenergy2mqtt_modbus_queue_delay_total: float = 0.0
+    """Cumulative time pipelined transactions waited for an in-flight slot, in milliseconds."""
+
+    sigenergy2mqtt_modbus_queue_delay_max: float = 0.0
+    """Maximum time a single pipelined transaction waited for an in-flight slot, in milliseconds."""
+
+    sigenergy2mqtt_modbus_queue_delay_mean: float = 0.0
+    """Mean time pipelined transactions waited for an in-flight slot, in milliseconds."""
+
     # ------------------------------------------------------------------
     # MQTT publish metrics
     # ------------------------------------------------------------------
@@ -151,12 +338,48 @@ class Metrics:
     sigenergy2mqtt_influxdb_batch_total: int = 0
     """Total number of data points written to InfluxDB across all batches."""
 
+    sigenergy2mqtt_influxdb_flushes: int = 0
+    """Total number of batches flushed from the InfluxDB write buffer (written or not)."""
+
+    sigenergy2mqtt_influxdb_flushed_points: int = 0
+    """Total number of data points flushed from the InfluxDB write buffer."""
+
+    sigenergy2mqtt_influxdb_batch_size_max: int = 0
+    """Maximum number of data points in a single flushed InfluxDB batch."""
+
+    sigenergy2mqtt_influxdb_batch_size_mean: float = 0.0
+    """Mean number of data points per flushed InfluxDB batch."""
+
+    sigenergy2mqtt_influxdb_batch_size_p50: float = 0.0
+    """Median number of data points per flushed InfluxDB batch (upper bound of its bucket)."""
+
+    sigenergy2mqtt_influxdb_batch_size_p99: float = 0.0
+    """99th percentile of the number of data points per flushed InfluxDB batch (upper bound of its bucket)."""
+
+    sigenergy2mqtt_influxdb_flush_delay_total: float = 0.0
+    """Cumulative time the oldest data point of each batch waited in the InfluxDB write buffer, in milliseconds."""
+
+    sigenergy2mqtt_influxdb_flush_delay_max: float = 0.0
+    """Maximum time the oldest data point of a batch waited in the InfluxDB write buffer, in milliseconds."""
+
+    sigenergy2mqtt_influxdb_flush_delay_mean: float = 0.0
+    """Mean time the oldest data point of each batch waited in the InfluxDB write buffer, in milliseconds."""
+
+    sigenergy2mqtt_influxdb_flush_delay_p50: float = 0.0
+    """Median time the oldest data point of each batch waited in the InfluxDB write buffer, in milliseconds (upper bound of its bucket)."""
+
+    sigenergy2mqtt_influxdb_flush_delay_p99: float = 0.0
+    """99th percentile of the time the oldest data point of each batch waited in the InfluxDB write buffer, in milliseconds (upper bound of its bucket)."""
+
     # ------------------------------------------------------------------
     # StateStore metrics
     # ------------------------------------------------------------------
 
+    sigenergy2mqtt_state_store_save_requests: int = 0
+    """Total number of StateStore save calls (with write-behind, several may be coalesced into one save)."""
+
     sigenergy2mqtt_state_store_saves: int = 0
-    """Total number of StateStore save calls."""
+    """Total number of StateStore saves written to the backends."""
 
     sigenergy2mqtt_state_store_save_errors: int = 0
     """Number of StateStore save errors."""
@@ -232,15 +455,13 @@ class Metrics:
     @classmethod
     async def reset(cls) -> None:
         """Reset all public int and float metrics class fields to their default values."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                for name, default in cls._defaults.items():
-                    setattr(cls, name, default)
-
-            cls._update_with_lock(_operation, "metrics reset")
-
-        cls._submit(_update)
+        with cls._lock:
+            cls._fold()
+            for name, default in cls._defaults.items():
+                type.__setattr__(cls, name, default)
+            for counts in cls._buckets.values():
+                counts[:] = [0] * len(counts)
+            type.__setattr__(cls, "_epoch", cls._epoch + 1)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -251,6 +472,9 @@ class Metrics:
     async def lock(cls, timeout: float | None = 1.0):
         """Async context manager that acquires threading.Lock without blocking the event loop.
 
+        Once the lock is held, all recorded metrics are folded into the class
+        attributes, so they can be read consistently within the context.
+
         Cancellation-safe: if a ``CancelledError`` is raised while the thread-pool
         worker is blocked inside ``threading.Lock.acquire``, the worker may still
         acquire the lock after the coroutine has been unwound.  A ``threading.Event``
@@ -286,6 +510,7 @@ class Metrics:
             raise TimeoutError("Failed to acquire Metrics lock within the timeout period.")
 
         try:
+            cls._fold()
             yield
         finally:
             cls._lock.release()
@@ -310,86 +535,114 @@ class Metrics:
         DiagnosticsCollectors.collect_metrics()
 
     @classmethod
-    def _submit(cls, operation: Callable[[], None]) -> None:
-        """Queue a metric update to the internal worker and return immediately."""
-        with cls._executor_lock:
-            if cls._executor is None:
-                cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metrics")
-            executor = cls._executor
+    def _shard(cls) -> _Shard:
+        """Return the calling thread's shard, registering it on first use and restarting its extremes in a new epoch."""
+        try:
+            shard = cls._local.shard
+        except AttributeError:
+            shard = cls._local.shard = _Shard(cls._epoch)
+            with cls._lock:
+                cls._shards.append((threading.current_thread(), shard, _Shard()))
+            return shard
+        if shard.epoch != cls._epoch:
+            shard.restart(cls._epoch)
+        return shard
 
-        future = executor.submit(operation)
-        with cls._pending_lock:
-            cls._pending_updates.append(future)
+    @classmethod
+    def _fold(cls) -> None:
+        """Fold every shard's new recordings into the class attributes.
 
-        def _cleanup(completed: Future) -> None:
-            with cls._pending_lock:
-                if completed in cls._pending_updates:
-                    cls._pending_updates.remove(completed)
+        .. warning::
+            The caller **must** hold ``_lock`` before calling this method.
+        """
+        changed: set[str] = set()
+        latest: dict[str, tuple[int, Any]] = {}
+        for thread, shard, folded in cls._shards:
+            for name in _SUMS:
+                value = getattr(shard, name)
+                delta = value - getattr(folded, name)
+                if delta:
+                    setattr(folded, name, value)
+                    type.__setattr__(cls, _PREFIX + name, getattr(cls, _PREFIX + name) + delta)
+                    changed.add(name)
+            if shard.epoch == cls._epoch:  # Extremes are applied again on every fold, which leaves the class attributes unchanged
+                for name in _MAXIMA:
+                    value = getattr(shard, name)
+                    if value > getattr(cls, _PREFIX + name):
+                        type.__setattr__(cls, _PREFIX + name, value)
+                for name in _MINIMA:
+                    value = getattr(shard, name)
+                    if value < getattr(cls, _PREFIX + name):
+                        type.__setattr__(cls, _PREFIX + name, value)
+            for name in _LATEST:
+                at = getattr(shard, f"{name}_at")
+                if at > cls._applied[name] and at > latest.get(name, (0, None))[0]:
+                    latest[name] = (at, getattr(shard, name))
+            for name in _HISTOGRAMS:
+                counts = list(getattr(shard, f"{name}_buckets"))
+                previous = getattr(folded, f"{name}_buckets")
+                if counts != previous:
+                    setattr(folded, f"{name}_buckets", counts)
+                    cls._buckets[name][:] = [total + count - before for total, count, before in zip(cls._buckets[name], counts, previous)]
+                    changed.add(name)
+        for name, (at, value) in latest.items():
+            cls._applied[name] = at
+            type.__setattr__(cls, _PREFIX + name, value)
+        for name, numerator, denominator, percentage in _RATIOS:
+            if numerator in changed or denominator in changed:
+                count = getattr(cls, _PREFIX + denominator)
+                ratio = getattr(cls, _PREFIX + numerator) / count if count > 0 else 0.0
+                type.__setattr__(cls, _PREFIX + name, round(ratio * 100.0, 2) if percentage else ratio)
+        for name in _HISTOGRAMS:
+            if name in changed:
+                counts = cls._buckets[name]
+                maximum = getattr(cls, f"{_PREFIX}{name}_max")
+                for percentile in _PERCENTILES:
+                    rank = max(1, math.ceil(sum(counts) * percentile / 100))
+                    index = next(i for i, cumulative in enumerate(itertools.accumulate(counts)) if cumulative >= rank)
+                    type.__setattr__(cls, f"{_PREFIX}{name}_p{percentile}", min(_BUCKETS[index], maximum) if index < len(_BUCKETS) else maximum)
+        # Shards of finished threads have now been folded for the last time
+        cls._shards[:] = [entry for entry in cls._shards if entry[0].is_alive()]
 
-        future.add_done_callback(_cleanup)
+    @classmethod
+    def aggregate(cls) -> None:
+        """Fold all recorded metrics into the class attributes."""
+        with cls._lock:
+            cls._fold()
 
     @classmethod
-    def _update_with_lock(cls, operation: Callable[[], None], warning: str) -> None:
-        """Run a metric update while holding the class lock."""
-        try:
-            # Standard synchronous lock for regular methods
-            if not cls._lock.acquire(timeout=1.0):
-                raise TimeoutError("Failed to acquire Metrics lock within the timeout period.")
-            try:
-                operation()
-            finally:
-                cls._lock.release()
-        except (ArithmeticError, LookupError, OSError, ReferenceError, RuntimeError, TimeoutError, TypeError, ValueError) as exc:
-            logger.warning(f"Error during {warning}: {exc!r}")
+    def _warn(cls, warning: str, exc: Exception) -> None:
+        logger.warning(f"Error during {warning}: {exc!r}")
 
     @classmethod
     async def drain(cls, timeout: float | None = 1.0) -> None:
-        """Await completion of queued metrics updates. Primarily intended for tests."""
-        with cls._pending_lock:
-            pending = list(cls._pending_updates)
-        if not pending:
-            return
-        _, not_done = await asyncio.to_thread(wait, pending, timeout=timeout)
-        if not_done:
-            raise TimeoutError(f"Timed out waiting for {len(not_done)} metrics updates to finish.")
+        """Fold all recorded metrics into the class attributes. Primarily intended for tests.
+
+        Raises:
+            TimeoutError: If the lock could not be acquired within *timeout* seconds.
+        """
+        async with cls.lock(timeout=timeout):
+            pass
 
     @classmethod
     def shutdown(cls, timeout: float | None = 1.0) -> None:
-        """Flush pending metric tasks and stop the internal worker thread.
+        """Fold any metrics recorded since they were last read.
 
-        This is intended for process shutdown paths so interpreter teardown
-        does not race with the executor's background thread.
+        This is intended for process shutdown paths, so the final values are
+        visible to anything reporting them after the worker threads stop.
         """
-        with cls._pending_lock:
-            pending = list(cls._pending_updates)
-            cls._pending_updates.clear()
-
-        with cls._executor_lock:
-            executor = cls._executor
-            cls._executor = None
-
-        if executor is None:
+        if not cls._lock.acquire(timeout=-1.0 if timeout is None else timeout):
+            logger.warning("Metrics shutdown timed out waiting for the metrics lock")
             return
-
-        not_done: set[Future] = set()
-        if pending:
-            _, not_done = wait(pending, timeout=timeout)
-            if not_done:
-                logger.warning(f"Metrics shutdown timed out with {len(not_done)} pending updates")
-
-        executor.shutdown(wait=not not_done, cancel_futures=bool(not_done))
+        try:
+            cls._fold()
+        finally:
+            cls._lock.release()
 
     @classmethod
     async def modbus_cache_fill(cls) -> None:
         """Increment the cache-fill read counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_modbus_cache_fill_reads += 1
-
-            cls._update_with_lock(_operation, "modbus cache metrics collection")
-
-        cls._submit(_update)
+        cls._shard().modbus_cache_fill_reads += 1
 
     @classmethod
     async def modbus_cache_hits(cls, reads: int, hits: int) -> None:
@@ -400,15 +653,14 @@ class Metrics:
             reads: Total reads attempted in the cycle.
             hits:  Reads satisfied from cache in the cycle.
         """
-
-        def _update() -> None:
-            def _operation() -> None:
-                percentage = round(hits / reads * 100.0, 2)
-                cls.sigenergy2mqtt_modbus_cache_hit_percentage = percentage
-
-            cls._update_with_lock(_operation, "modbus cache metrics collection")
-
-        cls._submit(_update)
+        try:
+            percentage = round(hits / reads * 100.0, 2)
+        except _ERRORS as exc:
+            cls._warn("modbus cache metrics collection", exc)
+            return
+        shard = cls._shard()
+        shard.modbus_cache_hit_percentage = percentage
+        shard.modbus_cache_hit_percentage_at = next(_sequence)
 
     @classmethod
     async def modbus_read(cls, registers: int, seconds: float) -> None:
@@ -419,45 +671,65 @@ class Metrics:
             registers: Number of registers read in this operation. (Unused in current metrics but recorded for potential future use in mean calculations.)
             seconds:   Wall-clock duration of the operation in seconds.
         """
+        try:
+            elapsed = seconds * 1000.0
+        except _ERRORS as exc:
+            cls._warn("modbus read metrics collection", exc)
+            return
+        shard = cls._shard()
+        shard.modbus_reads += 1
+        shard.modbus_read_total += elapsed
+        if elapsed > shard.modbus_read_max:
+            shard.modbus_read_max = elapsed
+        if elapsed < shard.modbus_read_min:
+            shard.modbus_read_min = elapsed
 
-        def _update() -> None:
-            def _operation() -> None:
-                elapsed = seconds * 1000.0
-                cls.sigenergy2mqtt_modbus_reads += 1
-                cls.sigenergy2mqtt_modbus_physical_read_percentage = round(cls.sigenergy2mqtt_modbus_cache_fill_reads / cls.sigenergy2mqtt_modbus_reads * 100.0, 2)
-                cls.sigenergy2mqtt_modbus_read_total += elapsed
-                # min/max computed inside the lock to prevent TOCTOU races
-                cls.sigenergy2mqtt_modbus_read_max = max(cls.sigenergy2mqtt_modbus_read_max, elapsed)
-                cls.sigenergy2mqtt_modbus_read_min = min(cls.sigenergy2mqtt_modbus_read_min, elapsed)
-                cls.sigenergy2mqtt_modbus_read_mean = cls.sigenergy2mqtt_modbus_read_total / cls.sigenergy2mqtt_modbus_reads if cls.sigenergy2mqtt_modbus_reads > 0 else 0.0
+    @classmethod
+    async def modbus_decoded_read(cls, unchanged: bool) -> None:
+        """
+        Record a sensor read served from a decoded read-ahead block.
+
+        Args:
+            unchanged: Whether the read was short-circuited because the sensor's registers were unchanged.
+        """
+        shard = cls._shard()
+        shard.modbus_decoded_reads += 1
+        if unchanged:
+            shard.modbus_unchanged_reads += 1
 
-            cls._update_with_lock(_operation, "modbus read metrics collection")
+    @classmethod
+    async def modbus_pipeline(cls, in_flight: int, seconds: float) -> None:
+        """
+        Record a transaction admitted to a pipelined modbus connection.
 
-        cls._submit(_update)
+        Args:
+            in_flight: Number of transactions in flight, including this one.
+            seconds:   Time the transaction waited for an in-flight slot, in seconds.
+        """
+        try:
+            delay = seconds * 1000.0
+        except _ERRORS as exc:
+            cls._warn("modbus pipeline metrics collection", exc)
+            return
+        shard = cls._shard()
+        shard.modbus_in_flight = in_flight
+        shard.modbus_in_flight_at = next(_sequence)
+        if in_flight > shard.modbus_in_flight_max:
+            shard.modbus_in_flight_max = in_flight
+        shard.modbus_pipelined += 1
+        shard.modbus_queue_delay_total += delay
+        if delay > shard.modbus_queue_delay_max:
+            shard.modbus_queue_delay_max = delay
 
     @classmethod
     async def modbus_read_error(cls) -> None:
         """Increment the modbus read error counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_modbus_read_errors += 1
-
-            cls._update_with_lock(_operation, "modbus read error metrics collection")
-
-        cls._submit(_update)
+        cls._shard().modbus_read_errors += 1
 
     @classmethod
     def modbus_skipped_error(cls) -> None:
         """Increment the modbus skipped read counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_modbus_skipped_errors += 1
-
-            cls._update_with_lock(_operation, "modbus skipped read metrics collection")
-
-        cls._submit(_update)
+        cls._shard().modbus_skipped_errors += 1
 
     @classmethod
     async def modbus_write(cls, registers: int, seconds: float) -> None:
@@ -468,20 +740,19 @@ class Metrics:
             registers: Number of registers written in this operation.
             seconds:   Wall-clock duration of the operation in seconds.
         """
-
-        def _update() -> None:
-            def _operation() -> None:
-                elapsed = seconds * 1000.0
-                cls.sigenergy2mqtt_modbus_writes += registers
-                cls.sigenergy2mqtt_modbus_write_total += elapsed
-                # min/max computed inside the lock to prevent TOCTOU races
-                cls.sigenergy2mqtt_modbus_write_max = max(cls.sigenergy2mqtt_modbus_write_max, elapsed)
-                cls.sigenergy2mqtt_modbus_write_min = min(cls.sigenergy2mqtt_modbus_write_min, elapsed)
-                cls.sigenergy2mqtt_modbus_write_mean = cls.sigenergy2mqtt_modbus_write_total / cls.sigenergy2mqtt_modbus_writes if cls.sigenergy2mqtt_modbus_writes > 0 else 0.0
-
-            cls._update_with_lock(_operation, "modbus write metrics collection")
-
-        cls._submit(_update)
+        shard = cls._shard()
+        try:
+            elapsed = seconds * 1000.0
+            writes = shard.modbus_writes + registers
+        except _ERRORS as exc:
+            cls._warn("modbus write metrics collection", exc)
+            return
+        shard.modbus_writes = writes
+        shard.modbus_write_total += elapsed
+        if elapsed > shard.modbus_write_max:
+            shard.modbus_write_max = elapsed
+        if elapsed < shard.modbus_write_min:
+            shard.modbus_write_min = elapsed
 
     @classmethod
     async def mqtt_publish_attempt(cls, physical_publish: bool) -> None:
@@ -491,43 +762,20 @@ class Metrics:
             physical_publish: ``True`` when the state message was physically
                 published to MQTT; ``False`` when it was suppressed or failed.
         """
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_mqtt_publish_attempts += 1
-                if physical_publish:
-                    cls.sigenergy2mqtt_mqtt_physical_publishes += 1
-                cls.sigenergy2mqtt_mqtt_physical_publish_percentage = (
-                    round(cls.sigenergy2mqtt_mqtt_physical_publishes / cls.sigenergy2mqtt_mqtt_publish_attempts * 100.0, 2) if cls.sigenergy2mqtt_mqtt_publish_attempts > 0 else 0.0
-                )
-
-            cls._update_with_lock(_operation, "mqtt publish attempt metrics collection")
-
-        cls._submit(_update)
+        shard = cls._shard()
+        shard.mqtt_publish_attempts += 1
+        if physical_publish:
+            shard.mqtt_physical_publishes += 1
 
     @classmethod
     async def mqtt_publish_failure(cls) -> None:
         """Increment the MQTT state publish failure counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_mqtt_publish_failures += 1
-
-            cls._update_with_lock(_operation, "mqtt publish failure metrics collection")
-
-        cls._submit(_update)
+        cls._shard().mqtt_publish_failures += 1
 
     @classmethod
     async def modbus_write_error(cls) -> None:
         """Increment the modbus write error counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_modbus_write_errors += 1
-
-            cls._update_with_lock(_operation, "modbus write error metrics collection")
-
-        cls._submit(_update)
+        cls._shard().modbus_write_errors += 1
 
     @classmethod
     async def influxdb_write(cls, batch_size: int, seconds: float) -> None:
@@ -538,81 +786,70 @@ class Metrics:
             batch_size: Number of data points in the written batch.
             seconds:    Wall-clock duration of the operation in seconds.
         """
+        shard = cls._shard()
+        try:
+            elapsed = seconds * 1000.0
+            batch_total = shard.influxdb_batch_total + batch_size
+        except _ERRORS as exc:
+            cls._warn("influxdb write metrics collection", exc)
+            return
+        shard.influxdb_writes += 1
+        shard.influxdb_batch_total = batch_total
+        shard.influxdb_write_total += elapsed
+        if elapsed > shard.influxdb_write_max:
+            shard.influxdb_write_max = elapsed
+        if elapsed < shard.influxdb_write_min:
+            shard.influxdb_write_min = elapsed
 
-        def _update() -> None:
-            def _operation() -> None:
-                elapsed = seconds * 1000.0
-                cls.sigenergy2mqtt_influxdb_writes += 1
-                cls.sigenergy2mqtt_influxdb_batch_total += batch_size
-                cls.sigenergy2mqtt_influxdb_write_total += elapsed
-                # min/max computed inside the lock to prevent TOCTOU races
-                cls.sigenergy2mqtt_influxdb_write_max = max(cls.sigenergy2mqtt_influxdb_write_max, elapsed)
-                cls.sigenergy2mqtt_influxdb_write_min = min(cls.sigenergy2mqtt_influxdb_write_min, elapsed)
-                cls.sigenergy2mqtt_influxdb_write_mean = cls.sigenergy2mqtt_influxdb_write_total / cls.sigenergy2mqtt_influxdb_writes if cls.sigenergy2mqtt_influxdb_writes > 0 else 0.0
-
-            cls._update_with_lock(_operation, "influxdb write metrics collection")
+    @classmethod
+    async def influxdb_flush(cls, batch_size: int, seconds: float) -> None:
+        """
+        Record a batch flushed from the InfluxDB write buffer.
 
-        cls._submit(_update)
+        Args:
+            batch_size: Number of data points in the batch.
+            seconds:    Time the oldest data point waited in the buffer, in seconds.
+        """
+        try:
+            delay = seconds * 1000.0
+        except _ERRORS as exc:
+            cls._warn("influxdb flush metrics collection", exc)
+            return
+        shard = cls._shard()
+        shard.influxdb_flushes += 1
+        shard.influxdb_flushed_points += batch_size
+        shard.influxdb_flush_delay_total += delay
+        shard.influxdb_batch_size_buckets[bisect_left(_BUCKETS, batch_size)] += 1
+        shard.influxdb_flush_delay_buckets[bisect_left(_BUCKETS, delay)] += 1
+        if batch_size > shard.influxdb_batch_size_max:
+            shard.influxdb_batch_size_max = batch_size
+        if delay > shard.influxdb_flush_delay_max:
+            shard.influxdb_flush_delay_max = delay
 
     @classmethod
     async def influxdb_write_error(cls) -> None:
         """Increment the InfluxDB write error counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_influxdb_write_errors += 1
-
-            cls._update_with_lock(_operation, "influxdb write error metrics collection")
-
-        cls._submit(_update)
+        cls._shard().influxdb_write_errors += 1
 
     @classmethod
     async def influxdb_query(cls) -> None:
         """Record a completed InfluxDB query operation."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_influxdb_queries += 1
-
-            cls._update_with_lock(_operation, "influxdb query metrics collection")
-
-        cls._submit(_update)
+        cls._shard().influxdb_queries += 1
 
     @classmethod
     async def influxdb_query_error(cls) -> None:
         """Increment the InfluxDB query error counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_influxdb_query_errors += 1
-
-            cls._update_with_lock(_operation, "influxdb query error metrics collection")
-
-        cls._submit(_update)
+        cls._shard().influxdb_query_errors += 1
 
     @classmethod
     async def influxdb_retry(cls) -> None:
         """Increment the InfluxDB retry counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_influxdb_retries += 1
-
-            cls._update_with_lock(_operation, "influxdb retry metrics collection")
-
-        cls._submit(_update)
+        cls._shard().influxdb_retries += 1
 
     @classmethod
     async def influxdb_rate_limit_wait(cls) -> None:
         """Increment the InfluxDB rate-limit wait counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_influxdb_rate_limit_waits += 1
-
-            cls._update_with_lock(_operation, "influxdb rate limit metrics collection")
-
-        cls._submit(_update)
+        cls._shard().influxdb_rate_limit_waits += 1
 
     @classmethod
     async def state_store_save(cls, seconds: float) -> None:
@@ -622,31 +859,28 @@ class Metrics:
         Args:
             seconds: Wall-clock duration of the operation in seconds.
         """
+        try:
+            elapsed = seconds * 1000.0
+        except _ERRORS as exc:
+            cls._warn("state store save metrics collection", exc)
+            return
+        shard = cls._shard()
+        shard.state_store_saves += 1
+        shard.state_store_save_total += elapsed
+        if elapsed > shard.state_store_save_max:
+            shard.state_store_save_max = elapsed
+        if elapsed < shard.state_store_save_min:
+            shard.state_store_save_min = elapsed
 
-        def _update() -> None:
-            def _operation() -> None:
-                elapsed = seconds * 1000.0
-                cls.sigenergy2mqtt_state_store_saves += 1
-                cls.sigenergy2mqtt_state_store_save_total += elapsed
-                cls.sigenergy2mqtt_state_store_save_max = max(cls.sigenergy2mqtt_state_store_save_max, elapsed)
-                cls.sigenergy2mqtt_state_store_save_min = min(cls.sigenergy2mqtt_state_store_save_min, elapsed)
-                cls.sigenergy2mqtt_state_store_save_mean = cls.sigenergy2mqtt_state_store_save_total / cls.sigenergy2mqtt_state_store_saves if cls.sigenergy2mqtt_state_store_saves > 0 else 0.0
-
-            cls._update_with_lock(_operation, "state store save metrics collection")
-
-        cls._submit(_update)
+    @classmethod
+    async def state_store_save_request(cls) -> None:
+        """Increment the StateStore save request counter."""
+        cls._shard().state_store_save_requests += 1
 
     @classmethod
     async def state_store_save_error(cls) -> None:
         """Increment the StateStore save error counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_state_store_save_errors += 1
-
-            cls._update_with_lock(_operation, "state store save error metrics collection")
-
-        cls._submit(_update)
+        cls._shard().state_store_save_errors += 1
 
     @classmethod
     async def state_store_load(cls, hit: bool) -> None:
@@ -656,55 +890,25 @@ class Metrics:
             hit: ``True`` when the load returned a value; ``False`` when it
                  returned ``None`` (miss, stale, or invalid).
         """
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_state_store_loads += 1
-                if hit:
-                    cls.sigenergy2mqtt_state_store_load_hits += 1
-                cls.sigenergy2mqtt_state_store_load_hit_percentage = (
-                    round(cls.sigenergy2mqtt_state_store_load_hits / cls.sigenergy2mqtt_state_store_loads * 100.0, 2) if cls.sigenergy2mqtt_state_store_loads > 0 else 0.0
-                )
-
-            cls._update_with_lock(_operation, "state store load metrics collection")
-
-        cls._submit(_update)
+        shard = cls._shard()
+        shard.state_store_loads += 1
+        if hit:
+            shard.state_store_load_hits += 1
 
     @classmethod
     async def state_store_load_error(cls) -> None:
         """Increment the StateStore load error counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_state_store_load_errors += 1
-
-            cls._update_with_lock(_operation, "state store load error metrics collection")
-
-        cls._submit(_update)
+        cls._shard().state_store_load_errors += 1
 
     @classmethod
     async def state_store_delete(cls) -> None:
         """Record a completed StateStore delete call."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_state_store_deletes += 1
-
-            cls._update_with_lock(_operation, "state store delete metrics collection")
-
-        cls._submit(_update)
+        cls._shard().state_store_deletes += 1
 
     @classmethod
     async def state_store_delete_error(cls) -> None:
         """Increment the StateStore delete error counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_state_store_delete_errors += 1
-
-            cls._update_with_lock(_operation, "state store delete error metrics collection")
-
-        cls._submit(_update)
+        cls._shard().state_store_delete_errors += 1
 
     @classmethod
     async def pvoutput_upload(cls, seconds: float) -> None:
@@ -714,43 +918,28 @@ class Metrics:
         Args:
             seconds: Wall-clock duration of the operation in seconds.
         """
-
-        def _update() -> None:
-            def _operation() -> None:
-                elapsed = seconds * 1000.0
-                cls.sigenergy2mqtt_pvoutput_uploads += 1
-                cls.sigenergy2mqtt_pvoutput_upload_total += elapsed
-                cls.sigenergy2mqtt_pvoutput_upload_max = max(cls.sigenergy2mqtt_pvoutput_upload_max, elapsed)
-                cls.sigenergy2mqtt_pvoutput_upload_min = min(cls.sigenergy2mqtt_pvoutput_upload_min, elapsed)
-                cls.sigenergy2mqtt_pvoutput_upload_mean = cls.sigenergy2mqtt_pvoutput_upload_total / cls.sigenergy2mqtt_pvoutput_uploads if cls.sigenergy2mqtt_pvoutput_uploads > 0 else 0.0
-
-            cls._update_with_lock(_operation, "pvoutput upload metrics collection")
-
-        cls._submit(_update)
+        try:
+            elapsed = seconds * 1000.0
+        except _ERRORS as exc:
+            cls._warn("pvoutput upload metrics collection", exc)
+            return
+        shard = cls._shard()
+        shard.pvoutput_uploads += 1
+        shard.pvoutput_upload_total += elapsed
+        if elapsed > shard.pvoutput_upload_max:
+            shard.pvoutput_upload_max = elapsed
+        if elapsed < shard.pvoutput_upload_min:
+            shard.pvoutput_upload_min = elapsed
 
     @classmethod
     async def pvoutput_upload_error(cls) -> None:
         """Increment the PVOutput upload error counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_pvoutput_upload_errors += 1
-
-            cls._update_with_lock(_operation, "pvoutput upload error metrics collection")
-
-        cls._submit(_update)
+        cls._shard().pvoutput_upload_errors += 1
 
     @classmethod
     async def pvoutput_upload_skipped(cls) -> None:
         """Increment the PVOutput upload skipped counter."""
-
-        def _update() -> None:
-            def _operation() -> None:
-                cls.sigenergy2mqtt_pvoutput_upload_skipped += 1
-
-            cls._update_with_lock(_operation, "pvoutput upload skipped metrics collection")
-
-        cls._submit(_update)
+        cls._shard().pvoutput_upload_skipped += 1
 
 
 # Snapshot the pristine default values at class-definition time, before any
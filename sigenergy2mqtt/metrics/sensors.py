@@ -63,6 +63,12 @@ class MetricsSensor(ReadableSensorMixin):
     async def _update_internal_state(self, **kwargs) -> bool:
         raise NotImplementedError
 
+    async def get_state(self, raw: bool = False, republish: bool = False, **kwargs) -> float | int | str | None:
+        """Fold the metrics recorded by every thread before reading the :class:`Metrics` attributes."""
+        if not republish:
+            Metrics.aggregate()
+        return await super().get_state(raw=raw, republish=republish, **kwargs)
+
     def configure_mqtt_topics(self, device_id: str) -> str:
         """
         Override topic configuration to use the ``sigenergy2mqtt/metrics/`` namespace.
@@ -367,6 +373,81 @@ class ModbusWriteMin(MetricsSensor):
         return True
 
 
+class ModbusUnchangedReads(MetricsSensor):
+    """Percentage of decoded sensor reads short-circuited because their registers were unchanged."""
+
+    def __init__(self):
+        super().__init__(
+            name="Modbus Unchanged Reads",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_modbus_unchanged_percentage",
+            object_id="sigenergy2mqtt_modbus_unchanged_percentage",
+            unit=PERCENTAGE,
+            icon="mdi:percent",
+            precision=2,
+        )
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_modbus_unchanged_percentage
+        self.set_latest_state(value)
+        return True
+
+
+class ModbusInFlight(MetricsSensor):
+    """Number of pipelined modbus transactions in flight."""
+
+    def __init__(self):
+        super().__init__(
+            name="Modbus In Flight",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_modbus_in_flight",
+            object_id="sigenergy2mqtt_modbus_in_flight",
+            icon="mdi:transit-connection-variant",
+            precision=0,
+        )
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_modbus_in_flight
+        self.set_latest_state(value)
+        return True
+
+
+class ModbusQueueDelayMax(MetricsSensor):
+    """Maximum time a pipelined modbus transaction waited for an in-flight slot in milliseconds."""
+
+    def __init__(self):
+        super().__init__(
+            name="Modbus Queue Delay Max",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_modbus_queue_delay_max",
+            object_id="sigenergy2mqtt_modbus_queue_delay_max",
+            unit="ms",
+            icon="mdi:timer-sand-full",
+            precision=2,
+        )
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_modbus_queue_delay_max
+        self.set_latest_state(value)
+        return True
+
+
+class ModbusQueueDelayMean(MetricsSensor):
+    """Mean time pipelined modbus transactions waited for an in-flight slot in milliseconds."""
+
+    def __init__(self):
+        super().__init__(
+            name="Modbus Queue Delay Mean",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_modbus_queue_delay_mean",
+            object_id="sigenergy2mqtt_modbus_queue_delay_mean",
+            unit="ms",
+            icon="mdi:timer-sand",
+            precision=2,
+        )
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_modbus_queue_delay_mean
+        self.set_latest_state(value)
+        return True
+
+
 class ModbusActiveLocks(MetricsSensor):
     """Number of coroutines currently waiting to acquire a modbus lock."""
 
@@ -552,6 +633,162 @@ class InfluxDBWriteMean(MetricsSensor):
         return True
 
 
+class InfluxDBBatchSizeMax(MetricsSensor):
+    """Maximum number of data points in a single flushed InfluxDB batch."""
+
+    def __init__(self):
+        super().__init__(
+            name="InfluxDB Batch Size Max",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_influxdb_batch_size_max",
+            object_id="sigenergy2mqtt_influxdb_batch_size_max",
+            icon="mdi:database-plus",
+            precision=0,
+        )
+        self.publishable = active_config.influxdb.enabled
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_influxdb_batch_size_max
+        self.set_latest_state(value)
+        return True
+
+
+class InfluxDBBatchSizeMean(MetricsSensor):
+    """Mean number of data points per flushed InfluxDB batch."""
+
+    def __init__(self):
+        super().__init__(
+            name="InfluxDB Batch Size Mean",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_influxdb_batch_size_mean",
+            object_id="sigenergy2mqtt_influxdb_batch_size_mean",
+            icon="mdi:database-outline",
+            precision=1,
+        )
+        self.publishable = active_config.influxdb.enabled
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_influxdb_batch_size_mean
+        self.set_latest_state(value)
+        return True
+
+
+class InfluxDBBatchSizeP50(MetricsSensor):
+    """Median number of data points per flushed InfluxDB batch."""
+
+    def __init__(self):
+        super().__init__(
+            name="InfluxDB Batch Size P50",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_influxdb_batch_size_p50",
+            object_id="sigenergy2mqtt_influxdb_batch_size_p50",
+            icon="mdi:database-outline",
+            precision=0,
+        )
+        self.publishable = active_config.influxdb.enabled
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_influxdb_batch_size_p50
+        self.set_latest_state(value)
+        return True
+
+
+class InfluxDBBatchSizeP99(MetricsSensor):
+    """99th percentile of the number of data points per flushed InfluxDB batch."""
+
+    def __init__(self):
+        super().__init__(
+            name="InfluxDB Batch Size P99",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_influxdb_batch_size_p99",
+            object_id="sigenergy2mqtt_influxdb_batch_size_p99",
+            icon="mdi:database-plus-outline",
+            precision=0,
+        )
+        self.publishable = active_config.influxdb.enabled
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_influxdb_batch_size_p99
+        self.set_latest_state(value)
+        return True
+
+
+class InfluxDBFlushDelayMax(MetricsSensor):
+    """Maximum time a batch waited in the InfluxDB write buffer before being flushed, in milliseconds."""
+
+    def __init__(self):
+        super().__init__(
+            name="InfluxDB Flush Delay Max",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_influxdb_flush_delay_max",
+            object_id="sigenergy2mqtt_influxdb_flush_delay_max",
+            unit="ms",
+            icon="mdi:timer-sand-full",
+            precision=2,
+        )
+        self.publishable = active_config.influxdb.enabled
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_influxdb_flush_delay_max
+        self.set_latest_state(value)
+        return True
+
+
+class InfluxDBFlushDelayMean(MetricsSensor):
+    """Mean time a batch waited in the InfluxDB write buffer before being flushed, in milliseconds."""
+
+    def __init__(self):
+        super().__init__(
+            name="InfluxDB Flush Delay Mean",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_influxdb_flush_delay_mean",
+            object_id="sigenergy2mqtt_influxdb_flush_delay_mean",
+            unit="ms",
+            icon="mdi:timer-sand",
+            precision=2,
+        )
+        self.publishable = active_config.influxdb.enabled
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_influxdb_flush_delay_mean
+        self.set_latest_state(value)
+        return True
+
+
+class InfluxDBFlushDelayP50(MetricsSensor):
+    """Median time a batch waited in the InfluxDB write buffer before being flushed, in milliseconds."""
+
+    def __init__(self):
+        super().__init__(
+            name="InfluxDB Flush Delay P50",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_influxdb_flush_delay_p50",
+            object_id="sigenergy2mqtt_influxdb_flush_delay_p50",
+            unit="ms",
+            icon="mdi:timer-sand",
+            precision=2,
+        )
+        self.publishable = active_config.influxdb.enabled
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_influxdb_flush_delay_p50
+        self.set_latest_state(value)
+        return True
+
+
+class InfluxDBFlushDelayP99(MetricsSensor):
+    """99th percentile of the time a batch waited in the InfluxDB write buffer before being flushed, in milliseconds."""
+
+    def __init__(self):
+        super().__init__(
+            name="InfluxDB Flush Delay P99",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_influxdb_flush_delay_p99",
+            object_id="sigenergy2mqtt_influxdb_flush_delay_p99",
+            unit="ms",
+            icon="mdi:timer-sand-full",
+            precision=2,
+        )
+        self.publishable = active_config.influxdb.enabled
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        value = Metrics.sigenergy2mqtt_influxdb_flush_delay_p99
+        self.set_latest_state(value)
+        return True
+
+
 class InfluxDBQueries(MetricsSensor):
     """Cumulative count of InfluxDB query operations."""
 
@@ -656,8 +893,25 @@ class InfluxDBThroughput(MetricsSensor):
 # =============================================================================
 
 
+class StateStoreSaveRequests(MetricsSensor):
+    """Cumulative count of StateStore save requests, before write-behind coalescing."""
+
+    def __init__(self):
+        super().__init__(
+            name="State Store Save Requests",
+            unique_id=f"{active_config.home_assistant.unique_id_prefix}_state_store_save_requests",
+            object_id="sigenergy2mqtt_state_store_save_requests",
+            icon="mdi:content-save-edit",
+            precision=0,
+        )
+
+    async def _update_internal_state(self, **kwargs) -> bool:
+        self.set_latest_state(Metrics.sigenergy2mqtt_state_store_save_requests)
+        return True
+
+
 class StateStoreSaves(MetricsSensor):
-    """Cumulative count of StateStore save operations."""
+    """Cumulative count of StateStore saves written to the backends."""
 
     def __init__(self):
         super().__init__(
@@ -40,6 +40,14 @@ class MetricsService(Device):
         self._add_sensor(sensors.InfluxDBWriteMax())
         self._add_sensor(sensors.InfluxDBWriteMean())
         self._add_sensor(sensors.InfluxDBWriteMin())
+        self._add_sensor(sensors.InfluxDBBatchSizeMax())
+        self._add_sensor(sensors.InfluxDBBatchSizeMean())
+        self._add_sensor(sensors.InfluxDBBatchSizeP50())
+        self._add_sensor(sensors.InfluxDBBatchSizeP99())
+        self._add_sensor(sensors.InfluxDBFlushDelayMax())
+        self._add_sensor(sensors.InfluxDBFlushDelayMean())
+        self._add_sensor(sensors.InfluxDBFlushDelayP50())
+        self._add_sensor(sensors.InfluxDBFlushDelayP99())
         self._add_sensor(sensors.InfluxDBQueries())
         self._add_sensor(sensors.InfluxDBQueryErrors())
         self._add_sensor(sensors.InfluxDBRateLimitWaits())
@@ -48,13 +56,17 @@ class MetricsService(Device):
 
         self._add_sensor(sensors.ModbusActiveLocks())
         self._add_sensor(sensors.ModbusCacheHits())
+        self._add_sensor(sensors.ModbusInFlight())
         self._add_sensor(sensors.ModbusPhysicalReads())
+        self._add_sensor(sensors.ModbusQueueDelayMax())
+        self._add_sensor(sensors.ModbusQueueDelayMean())
         self._add_sensor(sensors.ModbusReadsPerSecond())
         self._add_sensor(sensors.ModbusReadErrors())
         self._add_sensor(sensors.ModbusReadMax())
         self._add_sensor(sensors.ModbusReadMean())
         self._add_sensor(sensors.ModbusReadMin())
         self._add_sensor(sensors.ModbusSkippedErrors())
+        self._add_sensor(sensors.ModbusUnchangedReads())
         self._add_sensor(sensors.ModbusWriteErrors())
         self._add_sensor(sensors.ModbusWriteMax())
         self._add_sensor(sensors.ModbusWriteMean())
@@ -70,6 +82,7 @@ class MetricsService(Device):
         self._add_sensor(sensors.PVOutputUploadMean())
         self._add_sensor(sensors.PVOutputUploadMin())
 
+        self._add_sensor(sensors.StateStoreSaveRequests())
         self._add_sensor(sensors.StateStoreSaves())
         self._add_sensor(sensors.StateStoreSaveErrors())
         self._add_sensor(sensors.StateStoreSaveMax())
@@ -4,10 +4,11 @@ from pymodbus.client.mixin import ModbusClientMixin
 
 from .client import ModbusClient
 from .client_factory import ModbusClientFactory
-from .lock import ModbusLock
+from .decoder import BlockDecoder
+from .lock import BusPriority, DeadlineExpired, ModbusLock
 from .lock_factory import ModbusLockFactory
 
 ModbusDataType = ModbusClientMixin.DATATYPE
 
 
-__all__ = ["ModbusClient", "ModbusClientFactory", "ModbusDataType", "ModbusLock", "ModbusLockFactory"]
+__all__ = ["BlockDecoder", "BusPriority", "DeadlineExpired", "ModbusClient", "ModbusClientFactory", "ModbusDataType", "ModbusLock", "ModbusLockFactory"]
@@ -0,0 +1,195 @@
+"""Recording of Modbus traffic for offline replay.
+
+A capture file starts with :data:`MAGIC` and holds one record per Modbus
+transaction, each the fixed-size :data:`_RECORD` header followed by the
+response registers (big-endian uint16). Records are appended, so a capture
+may span several runs of the application; a record left incomplete by a
+previous run (e.g. one that was killed) is truncated before appending.
+
+Captures are written by :class:`~sigenergy2mqtt.modbus.client.ModbusClient`
+when the ``modbus[].capture-file`` option is set, and served by the replay
+mode of ``tests/utils/modbus_test_server.py``.
+"""
+
+import logging
+import struct
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, ClassVar
+
+from pymodbus.pdu import ModbusPDU
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"S2MCAP\x01\n"
+NO_RESPONSE = 0xFF
+
+# Wall time (s), latency (s), device id, function code, address, count, exception code, register count
+_RECORD = struct.Struct("<dfBBHHBB")
+
+
+@dataclass(slots=True)
+class CaptureRecord:
+    """One captured Modbus transaction.
+
+    Attributes:
+        timestamp: Wall-clock time the request was sent.
+        latency: Seconds from sending the request to receiving the response
+            (or giving up on it).
+        device_id: Modbus unit/device id.
+        function_code: Modbus function code of the request.
+        address: Start register address of the request.
+        count: Number of registers requested or written.
+        exception_code: Modbus exception code of the response, ``0`` for a
+            normal response, or :data:`NO_RESPONSE` when none was received.
+        registers: Registers returned by the response, if any.
+    """
+
+    timestamp: float
+    latency: float
+    device_id: int
+    function_code: int
+    address: int
+    count: int
+    exception_code: int = 0
+    registers: list[int] = field(default_factory=list)
+
+
+class ModbusCapture:
+    """Appends the Modbus transactions of one or more clients to a capture file.
+
+    The file is opened on the first record, and written through a buffer that
+    is flushed by :meth:`flush` (called when a client closes its connection)
+    and :meth:`close_all` (called on application shutdown).
+    Failure to write the capture is logged once and otherwise ignored, so
+    that capturing never interrupts polling.
+
+    Use :meth:`get` so that clients configured with the same path share one
+    instance, rather than interleaving partial records.
+    """
+
+    _captures: ClassVar[dict[Path, "ModbusCapture"]] = {}
+    _captures_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get(cls, path: str | Path) -> "ModbusCapture":
+        """Return the capture writing to *path*, creating it if necessary."""
+        resolved = Path(path).resolve()
+        with cls._captures_lock:
+            if resolved not in cls._captures:
+                cls._captures[resolved] = cls(resolved)
+            return cls._captures[resolved]
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every capture, writing out any buffered records."""
+        with cls._captures_lock:
+            captures = list(cls._captures.values())
+        for capture in captures:
+            capture.close()
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file: BinaryIO | None = None
+        self._failed: bool = False
+        self._lock = threading.Lock()
+
+    def record(self, start: float, latency: float, request: ModbusPDU, response: ModbusPDU | None) -> None:
+        """Append one transaction.
+
+        Args:
+            start: Wall-clock time the request was sent.
+            latency: Seconds until the response was received or abandoned.
+            request: The request PDU.
+            response: The response PDU, or ``None`` when no response was received.
+        """
+        if response is None:
+            exception_code = NO_RESPONSE
+            registers = []
+        else:
+            exception_code = response.exception_code if response.isError() else 0
+            registers = [] if exception_code else list(getattr(response, "registers", None) or [])
+        count = getattr(request, "count", 0) or len(getattr(request, "registers", None) or [])
+        data = _RECORD.pack(start, latency, request.dev_id, request.function_code, getattr(request, "address", 0), count, exception_code, len(registers))
+        if registers:
+            data += struct.pack(f">{len(registers)}H", *registers)
+        with self._lock:
+            if self._failed:
+                return
+            try:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = self._open()
+                    logger.info(f"Capturing Modbus traffic to {self.path}")
+                self._file.write(data)
+            except (OSError, ValueError) as e:
+                self._failed = True
+                logger.warning(f"Modbus capture to {self.path} disabled: {e}")
+
+    def _open(self) -> BinaryIO:
+        """Open the capture for appending, after truncating any incomplete record at the end of an existing capture."""
+        file = open(self.path, "ab")
+        try:
+            size = file.tell()
+            if size == 0:
+                file.write(MAGIC)
+            else:
+                with open(self.path, "rb") as f:
+                    if f.read(len(MAGIC)) != MAGIC:
+                        raise ValueError(f"{self.path} is not a Modbus capture file")
+                    end = f.tell()
+                    for _ in _read_records(f):
+                        end = f.tell()
+                if end < size:
+                    logger.warning(f"Truncated an incomplete record of {size - end} bytes from the end of Modbus capture {self.path}")
+                    file.truncate(end)
+        except BaseException:
+            file.close()
+            raise
+        return file
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                try:
+                    self._file.flush()
+                except OSError as e:
+                    logger.debug(f"Failed to flush Modbus capture {self.path}: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                try:
+                    self._file.close()
+                except OSError as e:
+                    logger.debug(f"Failed to close Modbus capture {self.path}: {e}")
+                self._file = None
+
+
+def read_capture(path: str | Path) -> Iterator[CaptureRecord]:
+    """Yield the records of a capture file in the order they were written.
+
+    A record truncated by the application stopping mid-write ends the capture.
+
+    Raises:
+        ValueError: The file is not a Modbus capture.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a Modbus capture file")
+        yield from _read_records(f)
+
+
+def _read_records(f: BinaryIO) -> Iterator[CaptureRecord]:
+    """Yield the records of a capture file positioned after its :data:`MAGIC`, stopping at the first incomplete record."""
+    while header := f.read(_RECORD.size):
+        if len(header) < _RECORD.size:
+            return
+        timestamp, latency, device_id, function_code, address, count, exception_code, length = _RECORD.unpack(header)
+        data = f.read(length * 2)
+        if len(data) < length * 2:
+            return
+        yield CaptureRecord(timestamp, latency, device_id, function_code, address, count, exception_code, list(struct.unpack(f">{length}H", data)))
+
@@ -13,7 +13,9 @@ from pymodbus.pdu import ExceptionResponse, ModbusPDU
 
 from sigenergy2mqtt.common import InputType
 
-from .read_ahead import ReadAhead
+from .capture import ModbusCapture
+from .pipeline import PipelinedTransactionManager
+from .read_ahead import RegisterImage
 
 logger = logging.getLogger(__name__)
 
@@ -39,10 +41,16 @@ class ModbusClient(AsyncModbusTcpClient, ModbusClientMixin):
     * Per-device register read-ahead cache that can satisfy future reads without
       additional network calls.
     * Metrics tracking for latency, read volume, cache fill/hit rates, and errors.
-
-    The cache stores one :class:`~sigenergy2mqtt.modbus.read_ahead.ReadAhead`
-    object per register address and device. Cache entries are invalidated for
-    specific ranges when :meth:`bypass_read_ahead` is called.
+    * Optional pipelining of up to ``pipeline_depth`` concurrent transactions
+      on the one connection (see
+      :class:`~sigenergy2mqtt.modbus.pipeline.PipelinedTransactionManager`).
+    * Optional capture of every transaction to a file for offline replay (see
+      :class:`~sigenergy2mqtt.modbus.capture.ModbusCapture`).
+
+    The cache holds one :class:`~sigenergy2mqtt.modbus.read_ahead.RegisterImage`
+    per device and register space. Cache hits are served as zero-copy views
+    into the image. Cache entries are invalidated for specific ranges when
+    :meth:`bypass_read_ahead` is called.
     """
 
     def _trace_packet_handler(self, is_send: bool, data: bytes) -> bytes:
@@ -69,11 +77,32 @@ class ModbusClient(AsyncModbusTcpClient, ModbusClientMixin):
         The constructor enforces socket framer mode and installs this instance's
         packet trace handler. It also initializes the read-ahead cache and cache
         counters used by :meth:`_read_registers`.
+
+        A ``pipeline_depth`` keyword greater than 1 replaces the pymodbus
+        transaction manager with one that keeps up to that many requests in
+        flight, matched by transaction id.
+
+        A ``capture_file`` keyword records every transaction to that file.
         """
+        pipeline_depth: int = kwargs.pop("pipeline_depth", 1)
+        capture_file: str | None = kwargs.pop("capture_file", None)
         kwargs["framer"] = FramerType.SOCKET
         kwargs["trace_packet"] = self._trace_packet_handler
         super().__init__(*args, **kwargs)
-        self._read_ahead_pdu: dict[int, dict[int, ReadAhead | None]] = {}
+        self.pipeline_depth: int = pipeline_depth
+        if pipeline_depth > 1:
+            self.ctx = PipelinedTransactionManager(
+                self.comm_params,
+                self.ctx.framer,
+                self.ctx.retries,
+                False,
+                self._trace_packet_handler,
+                None,
+                None,
+                depth=pipeline_depth,
+            )
+        self._capture: ModbusCapture | None = ModbusCapture.get(capture_file) if capture_file else None
+        self._register_images: dict[tuple[int, InputType], RegisterImage] = {}
         self._trace: bool = False
         self._read_count: int = 0
         self._cache_hits: int = 0
@@ -107,16 +136,15 @@ class ModbusClient(AsyncModbusTcpClient, ModbusClientMixin):
         """
         if use_pre_read:
             self._read_count += 1
-            if device_id in self._read_ahead_pdu and address in self._read_ahead_pdu[device_id]:
-                pre_read = self._read_ahead_pdu[device_id][address]
-                if pre_read is not None:
-                    try:
-                        rr = pre_read.get_registers(address, count=count)
-                        self._cache_hits += 1
-                        await Metrics.modbus_cache_hits(self._read_count, self._cache_hits)
-                        return rr
-                    except IndexError as e:
-                        logger.debug(f"Pre-read failed: {e}")
+            image = self._register_images.get((device_id, input_type))
+            if image is not None:
+                try:
+                    rr = image.get_registers(address, count=count)
+                    self._cache_hits += 1
+                    await Metrics.modbus_cache_hits(self._read_count, self._cache_hits)
+                    return rr
+                except IndexError as e:
+                    logger.debug(f"Pre-read failed: {e}")
             await Metrics.modbus_cache_hits(self._read_count, self._cache_hits)
         self._trace = trace
         try:
@@ -146,19 +174,50 @@ class ModbusClient(AsyncModbusTcpClient, ModbusClientMixin):
         finally:
             self._trace = False
 
+    async def record_read_ahead_hit(self) -> None:
+        """Account for a read that was satisfied from the read-ahead cache without calling :meth:`_read_registers`.
+
+        Used when a sensor consumes a value already decoded from a read-ahead
+        block, so that the cache-hit metrics match a read served from the image.
+        """
+        from sigenergy2mqtt.metrics import Metrics
+
+        self._read_count += 1
+        self._cache_hits += 1
+        await Metrics.modbus_cache_hits(self._read_count, self._cache_hits)
+
     def bypass_read_ahead(self, address: int, count: int = 1, device_id: int = 1) -> None:
         """Invalidate read-ahead cache entries for a register range.
 
-        This marks the addressed range as ``None`` for the specified device to
-        prevent stale cached reads after writes or other out-of-band changes.
+        This marks the addressed range as invalid in every register image of the
+        specified device to prevent stale cached reads after writes or other
+        out-of-band changes.
 
         Args:
             address: Start register address to invalidate.
             count: Number of registers to invalidate.
             device_id: Modbus unit/device id.
         """
-        if device_id in self._read_ahead_pdu:
-            self._read_ahead_pdu[device_id].update({key: None for key in range(address, address + count)})
+        for (image_device_id, _), image in self._register_images.items():
+            if image_device_id == device_id:
+                image.invalidate(address, count)
+
+    def execute(self, no_response_expected: bool, request: ModbusPDU):
+        """Execute a request, recording the transaction when capturing."""
+        if self._capture is None:
+            return super().execute(no_response_expected, request)
+        return self._execute_captured(super().execute(no_response_expected, request), request)
+
+    async def _execute_captured(self, execution, request: ModbusPDU) -> ModbusPDU:
+        start = time.time()
+        began = time.monotonic()
+        try:
+            rr = await execution
+        except ModbusException:
+            self._capture.record(start, time.monotonic() - began, request, None)  # type: ignore[union-attr]
+            raise
+        self._capture.record(start, time.monotonic() - began, request, rr)  # type: ignore[union-attr]
+        return rr
 
     async def connect(self) -> bool:
         connected = await super().connect()
@@ -171,11 +230,17 @@ class ModbusClient(AsyncModbusTcpClient, ModbusClientMixin):
     def close(self) -> None:
         was_connected = self.connected
         super().close()
+        if self._capture is not None:
+            self._capture.flush()
         if was_connected:
             with self._health_lock:
                 self._health.close_count += 1
                 self._health.last_closed_at = time.monotonic()
 
+    def register_image(self, device_id: int, input_type: InputType) -> RegisterImage | None:
+        """Return the read-ahead register image for a device and register space, if any."""
+        return self._register_images.get((device_id, input_type))
+
     async def read_ahead_registers(self, address, count: int = 1, device_id: int = 1, input_type: InputType = InputType.INPUT, no_response_expected: bool = False, trace: bool = False) -> int:
         from sigenergy2mqtt.metrics import Metrics
 
@@ -196,12 +261,10 @@ class ModbusClient(AsyncModbusTcpClient, ModbusClientMixin):
         result: int = -1
         rr = await self._read_registers(address, count=count, device_id=device_id, input_type=input_type, no_response_expected=no_response_expected, use_pre_read=False, trace=trace)
         if rr:
-            if device_id not in self._read_ahead_pdu:
-                self._read_ahead_pdu[device_id] = {}
-            if rr.isError() or isinstance(rr, ExceptionResponse):
-                self._read_ahead_pdu[device_id].update({key: None for key in range(address, address + count)})  # Set registers to None to prevent unexpected values
-            else:
-                self._read_ahead_pdu[device_id].update({key: ReadAhead(address, count, device_id, input_type, rr) for key in range(address, address + count)})
+            image = self._register_images.get((device_id, input_type))
+            if image is None:
+                image = self._register_images[(device_id, input_type)] = RegisterImage(device_id, input_type)
+            image.update(address, count, rr)
             result = rr.exception_code
         if result == 0:
             await Metrics.modbus_cache_fill()
@@ -15,7 +15,7 @@ class ModbusClientFactory:
     _hosts: ClassVar[dict[ModbusClient, str]] = {}
 
     @classmethod
-    async def get_client(cls, host: str, port: int, timeout: float = 1.0, retries: int = 3) -> ModbusClient:
+    async def get_client(cls, host: str, port: int, timeout: float = 1.0, retries: int = 3, pipeline_depth: int = 1, capture_file: str | None = None) -> ModbusClient:
         """Get or create a connected Modbus client for ``host:port``.
 
         Args:
@@ -23,6 +23,10 @@ class ModbusClientFactory:
             port: Target TCP port.
             timeout: Per-request timeout passed to pymodbus.
             retries: Retry count passed to pymodbus.
+            pipeline_depth: Maximum number of transactions kept in flight on
+                the connection (1 disables pipelining).
+            capture_file: File to record the client's Modbus transactions
+                to, or ``None`` to disable capture.
 
         Returns:
             A connected :class:`ModbusClient` instance from the pool.
@@ -33,8 +37,8 @@ class ModbusClientFactory:
         """
         key = (host, port)
         if key not in cls._clients:
-            logger.debug(f"Creating Modbus client for {host}:{port} ({timeout=}s {retries=})")
-            modbus = ModbusClient(host, port=port, timeout=timeout, retries=retries)
+            logger.debug(f"Creating Modbus client for {host}:{port} ({timeout=}s {retries=} {pipeline_depth=})")
+            modbus = ModbusClient(host, port=port, timeout=timeout, retries=retries, pipeline_depth=pipeline_depth, capture_file=capture_file)
             cls._clients[key] = modbus
             cls._hosts[modbus] = f"{host}:{port}"
         client = cls._clients[key]
@@ -0,0 +1,123 @@
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+from pymodbus.client.mixin import ModbusClientMixin
+
+ModbusDataType = ModbusClientMixin.DATATYPE
+
+_SCALAR = 0
+_ARRAY = 1
+_STRING = 2
+_FALLBACK = 3
+
+
+class BlockDecoder:
+    """Precompiled decoder for every field held in one block of registers.
+
+    A read-ahead returns a contiguous block of registers covering all the
+    sensors of a scan group. Rather than converting each sensor's slice of the
+    block separately with ``convert_from_registers``, the decoder compiles the
+    fields into a single big-endian :class:`struct.Struct` (with pad bytes for
+    unused registers) and unpacks the whole block in one call.
+
+    Results are identical to ``ModbusClientMixin.convert_from_registers`` with
+    the default big-endian word order:
+
+    * Numeric fields spanning one value decode to a scalar, and fields spanning
+      several values decode to a list.
+    * ``STRING`` fields are decoded as UTF-8 with trailing nulls removed.
+    * ``BITS`` fields, which cannot be expressed as a struct format, fall back
+      to ``convert_from_registers``.
+    * Fields whose register count is not a multiple of the data type size
+      (which ``convert_from_registers`` rejects) are never decoded.
+
+    Fields that overlap an earlier field are unpacked with their own struct at
+    the appropriate offset.
+    """
+
+    __slots__ = ("first_address", "register_count", "_fields", "_struct", "_ops")
+
+    def __init__(self, first_address: int, register_count: int, fields: Sequence[tuple[int, int, ModbusDataType]]):
+        """Compile the decode plan for a register block.
+
+        Args:
+            first_address:  Address of the first register in the block.
+            register_count: Number of registers in the block.
+            fields:         ``(address, count, data_type)`` of each field to decode.
+                            Fields that do not lie entirely within the block are
+                            never decoded.
+        """
+        self.first_address = first_address
+        self.register_count = register_count
+        self._fields = len(fields)
+        formats: list[str] = [">"]
+        ops: list[tuple[int, int, Any, int, int]] = []
+        position = 0
+        slot = 0
+        for index, (address, count, data_type) in sorted(enumerate(fields), key=lambda field: (field[1][0], -field[1][1])):
+            offset = address - first_address
+            if count < 1 or offset < 0 or offset + count > register_count:
+                continue
+            code, size = data_type.value
+            if data_type == ModbusDataType.STRING:
+                kind, values, fmt = _STRING, 1, f"{2 * count}s"
+            elif not size:
+                ops.append((index, _FALLBACK, data_type, offset, offset + count))
+                continue
+            elif count % size == 0:
+                values = count // size
+                kind, fmt = (_SCALAR if values == 1 else _ARRAY), f"{values}{code}"
+            else:
+                continue
+            if offset >= position:
+                if offset > position:
+                    formats.append(f"{2 * (offset - position)}x")
+                formats.append(fmt)
+                ops.append((index, kind, None, slot, slot + values))
+                slot += values
+                position = offset + count
+            else:
+                ops.append((index, kind, struct.Struct(f">{fmt}"), 2 * offset, 0))
+        self._struct = struct.Struct("".join(formats))
+        self._ops = tuple(ops)
+
+    def decode(self, registers: Sequence[int]) -> list[Any]:
+        """Decode all fields from the registers of the block.
+
+        Args:
+            registers: The ``register_count`` register values of the block.
+
+        Returns:
+            The decoded value of each field, in the order the fields were
+            compiled. Fields that are never decoded, or strings that are not
+            valid UTF-8, are ``None``.
+
+        Raises:
+            ValueError: If the number of registers does not match the block.
+        """
+        if len(registers) != self.register_count:
+            raise ValueError(f"Expected {self.register_count} registers, got {len(registers)}")
+        words = array("H", registers)
+        if sys.byteorder == "little":
+            words.byteswap()
+        buffer = words.tobytes()
+        unpacked = self._struct.unpack_from(buffer)
+        values: list[Any] = [None] * self._fields
+        for index, kind, source, start, stop in self._ops:
+            if kind == _FALLBACK:
+                values[index] = ModbusClientMixin.convert_from_registers(list(registers[start:stop]), source)
+                continue
+            items = unpacked[start:stop] if source is None else source.unpack_from(buffer, start)
+            if kind == _SCALAR:
+                values[index] = items[0]
+            elif kind == _ARRAY:
+                values[index] = list(items)
+            else:
+                try:
+                    values[index] = items[0].rstrip(b"\0").decode("utf-8")
+                except UnicodeDecodeError:
+                    pass
+        return values
@@ -1,17 +1,104 @@
 import asyncio
+import itertools
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, ClassVar
 
 from .client import ModbusClient
 from .client_factory import ModbusClientFactory
+from .pipeline import PipelinedTransactionManager
+
+
+class BusPriority(IntEnum):
+    """Scheduling class of a request for the Modbus bus. Lower values are served first."""
+
+    WRITE = 0
+    REALTIME = 1
+    HIGH = 2
+    MEDIUM = 3
+    LOW = 4
+
+    @classmethod
+    def for_scan_interval(cls, seconds: float, realtime: float, high: float, medium: float) -> "BusPriority":
+        """Return the read class for a scan interval, given the configured realtime/high/medium intervals."""
+        if seconds <= realtime:
+            return cls.REALTIME
+        if seconds <= high:
+            return cls.HIGH
+        if seconds <= medium:
+            return cls.MEDIUM
+        return cls.LOW
+
+
+class DeadlineExpired(TimeoutError):
+    """Raised when a request's deadline passes before it is granted the bus."""
+
+
+@dataclass
+class QueueWaitStats:
+    """Accumulated queue wait times for one :class:`BusPriority` class."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    expired: int = 0
+
+    @property
+    def mean(self) -> float:
+        """Return the mean wait in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record the wait of one granted request."""
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+@dataclass
+class _Waiter:
+    priority: BusPriority
+    deadline: float | None
+    sequence: int
+    enqueued: float
+    future: asyncio.Future = field(repr=False)
+    shared: bool = False
+
+    def rank(self, now: float, aging_interval: float) -> tuple[int, float, int]:
+        promoted = max(0, self.priority - int((now - self.enqueued) / aging_interval))
+        return promoted, self.deadline if self.deadline is not None else float("inf"), self.sequence
 
 
 class ModbusLock:
-    """Async lock wrapper that tracks queued waiters per Modbus client.
+    """Priority- and deadline-aware scheduler for exclusive use of a Modbus client.
 
     This lock is used to serialize network operations against the same Modbus
     endpoint and expose queue depth for diagnostics/metrics.
+
+    Unlike a FIFO :class:`asyncio.Lock`, when the lock is released it is handed
+    to the waiter with the best :class:`BusPriority` and, within a class, the
+    earliest deadline. Waiters are promoted one class for every
+    :attr:`AGING_INTERVAL` seconds they have queued, so low-priority reads cannot
+    be starved indefinitely. A waiter whose deadline passes before it is granted
+    the bus is dropped with :class:`DeadlineExpired` rather than served late.
+
+    Requests may instead ask for *shared* use of the client (read-aheads, which
+    only fill the client's register images). When the client pipelines its
+    transactions, up to the current size of its
+    :class:`~sigenergy2mqtt.modbus.pipeline.AdaptiveWindow` shared holders are
+    granted the bus together, so that the reads of different scan groups are
+    kept in flight at once; otherwise shared use is exclusive. Exclusive and
+    shared holders never overlap, and a queued request is never overtaken by
+    a lower ranked one, so a queued write waits only for the shared holders
+    already granted.
     """
+
+    AGING_INTERVAL: ClassVar[float] = 5.0
+    """Seconds of queueing that promote a waiter by one priority class."""
+
     def __init__(self, modbus: ModbusClient | None):
         """Create a lock instance associated with an optional Modbus client.
 
@@ -19,56 +106,157 @@ class ModbusLock:
             modbus: Modbus client this lock belongs to, or ``None`` for a
                 standalone lock without host metadata.
         """
-        self._lock: asyncio.Lock = asyncio.Lock()
+        self._modbus = modbus
+        self._locked: bool = False
+        self._shared: int = 0
+        self._queue: list[_Waiter] = []
+        self._sequence = itertools.count()
         self.waiters: int = 0
         self.host: str | None = ModbusClientFactory.get_host(modbus)
+        self.wait_stats: dict[BusPriority, QueueWaitStats] = {priority: QueueWaitStats() for priority in BusPriority}
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of shared holders currently allowed at once."""
+        ctx = getattr(self._modbus, "ctx", None)
+        return max(1, ctx.window.size) if isinstance(ctx, PipelinedTransactionManager) else 1
 
-    async def acquire(self, timeout=None):
+    async def acquire(self, timeout=None, priority: BusPriority = BusPriority.LOW, deadline: float | None = None, shared: bool = False):
         """Acquire the lock and account for waiting coroutines.
 
         Args:
-            timeout: Optional timeout in seconds. If provided, acquisition is
-                wrapped in :func:`asyncio.wait_for`.
+            timeout: Optional timeout in seconds.
+            priority: Scheduling class of the request.
+            deadline: Optional wall-clock time (as returned by :func:`time.time`)
+                after which the request is no longer worth serving.
+            shared: Request shared rather than exclusive use of the client.
 
         Returns:
             ``True`` when the lock is acquired.
+
+        Raises:
+            TimeoutError: If the lock is not acquired within ``timeout``.
+            DeadlineExpired: If ``deadline`` passes before the lock is acquired.
         """
+        start = time.monotonic()
+        if deadline is not None and deadline <= time.time():
+            self.wait_stats[priority].expired += 1
+            raise DeadlineExpired(f"Deadline passed before {priority.name} request was queued")
+        if not self._queue and self._available(shared):
+            self._grant(shared)
+            self.wait_stats[priority].record(0.0)
+            return True
+
+        waiter = _Waiter(priority, deadline, next(self._sequence), start, asyncio.get_running_loop().create_future(), shared)
+        self._queue.append(waiter)
+        limit = timeout
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.time())
+            limit = remaining if limit is None else min(limit, remaining)
         self.waiters += 1
         try:
-            if timeout is None:
-                return await self._lock.acquire()
+            if limit is None:
+                await waiter.future
             else:
-                return await asyncio.wait_for(self._lock.acquire(), timeout)
+                await asyncio.wait_for(waiter.future, limit)
+        except (TimeoutError, asyncio.CancelledError) as exc:
+            if waiter in self._queue:
+                self._queue.remove(waiter)
+            if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+                # Granted at the same moment as the timeout/cancellation: pass the bus on
+                self.release(shared)
+            if isinstance(exc, TimeoutError) and not isinstance(exc, DeadlineExpired) and deadline is not None and deadline <= time.time():
+                self.wait_stats[priority].expired += 1
+                raise DeadlineExpired(f"Deadline passed while {priority.name} request was queued") from exc
+            raise
         finally:
             self.waiters -= 1
+        self.wait_stats[priority].record(time.monotonic() - start)
+        return True
 
     @asynccontextmanager
-    async def lock(self, timeout=None) -> AsyncIterator[None]:
+    async def lock(self, timeout=None, priority: BusPriority = BusPriority.LOW, deadline: float | None = None, shared: bool = False) -> AsyncIterator[None]:
         """Async context manager that acquires and reliably releases the lock.
 
         Args:
             timeout: Optional timeout in seconds for acquisition.
+            priority: Scheduling class of the request.
+            deadline: Optional wall-clock time after which the request is dropped.
+            shared: Request shared rather than exclusive use of the client.
 
         Yields:
             None while the lock is held.
 
         Raises:
             TimeoutError: If acquisition fails before the timeout.
+            DeadlineExpired: If the deadline passes before acquisition.
         """
-        acquired = await self.acquire(timeout)
+        acquired = await self.acquire(timeout, priority=priority, deadline=deadline, shared=shared)
         try:
             if not acquired:
                 raise TimeoutError("Failed to acquire lock within the timeout period.")
             yield
         finally:
             if acquired:
-                self.release()
+                self.release(shared)
 
-    def release(self):
-        """Release the lock if it is currently held."""
-        if self._lock.locked():
-            self._lock.release()
+    def release(self, shared: bool = False):
+        """Release the lock if it is currently held, handing it to the next eligible waiters.
+
+        Args:
+            shared: Release shared rather than exclusive use of the client.
+        """
+        if shared and self._shared:
+            self._shared -= 1
+            self._grant_next()
+        elif not shared and self._locked:
+            self._locked = False
+            self._grant_next()
 
     def locked(self):
-        """Return whether the underlying lock is currently held."""
-        return self._lock.locked()
+        """Return whether the lock is currently held, exclusively or shared."""
+        return self._locked or self._shared > 0
+
+    def _available(self, shared: bool) -> bool:
+        if shared:
+            return not self._locked and self._shared < self.capacity
+        return not self._locked and not self._shared
+
+    def _grant(self, shared: bool) -> None:
+        if shared:
+            self._shared += 1
+        else:
+            self._locked = True
+
+    def _grant_next(self) -> None:
+        now = time.monotonic()
+        wall_clock = time.time()
+        while self._queue:
+            waiter = min(self._queue, key=lambda w: w.rank(now, self.AGING_INTERVAL))
+            if waiter.future.done():
+                self._queue.remove(waiter)
+                continue
+            if waiter.deadline is not None and waiter.deadline <= wall_clock:
+                self._queue.remove(waiter)
+                self.wait_stats[waiter.priority].expired += 1
+                waiter.future.set_exception(DeadlineExpired(f"Deadline passed while {waiter.priority.name} request was queued"))
+                continue
+            if not self._available(waiter.shared):
+                return  # The best ranked waiter is not overtaken
+            self._queue.remove(waiter)
+            self._grant(waiter.shared)
+            waiter.future.set_result(True)
+            if not waiter.shared:
+                return
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return per-class queue wait statistics, in milliseconds."""
+        return {
+            priority.name.lower(): {
+                "granted_count": stats.count,
+                "expired_count": stats.expired,
+                "wait_mean_ms": round(stats.mean * 1000, 3),
+                "wait_max_ms": round(stats.max * 1000, 3),
+            }
+            for priority, stats in self.wait_stats.items()
+        }
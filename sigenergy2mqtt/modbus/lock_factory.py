@@ -1,5 +1,5 @@
 import logging
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from .client import ModbusClient
 from .lock import ModbusLock
@@ -43,3 +43,10 @@ class ModbusLockFactory:
         for lock in cls._locks.values():
             waiters += lock.waiters
         return waiters
+
+    @classmethod
+    def snapshot(cls) -> dict[str, Any]:
+        """Return per-host, per-priority-class queue wait statistics for diagnostics."""
+        snapshot: dict[str, Any] = {lock.host or f"lock_{index}": lock.snapshot() for index, lock in enumerate(cls._locks.values())}
+        snapshot["config"] = {"aging_interval_secs": ModbusLock.AGING_INTERVAL}
+        return snapshot
@@ -0,0 +1,207 @@
+import asyncio
+import logging
+import time
+
+from pymodbus.exceptions import ConnectionException
+from pymodbus.logging import Log
+from pymodbus.pdu import ExceptionResponse, ModbusPDU
+from pymodbus.transaction import TransactionManager
+
+logger = logging.getLogger(__name__)
+
+# Exception codes that indicate the device is overloaded rather than that the
+# request itself was invalid: SERVER DEVICE FAILURE, ACKNOWLEDGE, SERVER DEVICE BUSY.
+CONGESTION_EXCEPTION_CODES: frozenset[int] = frozenset({0x04, 0x05, 0x06})
+
+# Largest Modbus TCP ADU (7 byte MBAP header + 253 byte PDU).
+MAX_TCP_ADU_SIZE: int = 260
+
+
+class AdaptiveWindow:
+    """Additive-increase/multiplicative-decrease limit on in-flight transactions.
+
+    The window starts at a single transaction (i.e. the behaviour of an
+    unpipelined client) and grows by roughly one slot per window's worth of
+    successful responses, up to ``limit``. Each timeout or congestion
+    exception response halves the window, so a device that cannot keep up
+    quickly falls back to serial request/response.
+    """
+
+    def __init__(self, limit: int):
+        """Create a window that never allows more than ``limit`` transactions in flight.
+
+        Args:
+            limit: Maximum number of concurrent transactions (at least 1).
+        """
+        self.limit: int = max(1, limit)
+        self.in_flight: int = 0
+        self.peak: int = 0
+        self._size: float = 1.0
+        self._waiters: list[asyncio.Future] = []
+
+    @property
+    def size(self) -> int:
+        """Return the number of transactions currently allowed in flight."""
+        return int(self._size)
+
+    async def acquire(self) -> float:
+        """Wait for a free slot in the window and claim it.
+
+        Returns:
+            The time spent queued for a slot, in seconds.
+        """
+        start = time.monotonic()
+        while self.in_flight >= self.size:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        return time.monotonic() - start
+
+    def release(self) -> None:
+        """Return a slot to the window and wake queued transactions that now fit."""
+        self.in_flight = max(0, self.in_flight - 1)
+        self._wake()
+
+    def succeeded(self) -> None:
+        """Record a timely, non-congested response and grow the window additively."""
+        self._size = min(float(self.limit), self._size + 1.0 / self._size)
+        self._wake()
+
+    def congested(self) -> None:
+        """Record a timeout or congestion response and halve the window."""
+        self._size = max(1.0, self._size / 2.0)
+
+    def _wake(self) -> None:
+        available = self.size - self.in_flight
+        for waiter in self._waiters[:available]:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+class PipelinedTransactionManager(TransactionManager):
+    """Transaction manager that keeps several Modbus TCP requests in flight.
+
+    The stock pymodbus :class:`~pymodbus.transaction.TransactionManager`
+    serialises every request behind a single lock and a single response
+    future. This subclass instead tracks one future per outstanding
+    transaction id, so responses are matched to their requests whatever order
+    they arrive in, and admission is governed by an :class:`AdaptiveWindow`.
+
+    Each retry is sent with a fresh transaction id, so a late response to an
+    abandoned attempt is discarded rather than being mistaken for the retry.
+    """
+
+    def __init__(self, *args, depth: int, **kwargs):
+        """Create the manager.
+
+        Args:
+            *args: Positional arguments for :class:`TransactionManager`.
+            depth: Maximum number of transactions allowed in flight.
+            **kwargs: Keyword arguments for :class:`TransactionManager`.
+        """
+        super().__init__(*args, **kwargs)
+        self.window: AdaptiveWindow = AdaptiveWindow(depth)
+        self._pending: dict[int, asyncio.Future] = {}
+
+    async def execute(self, no_response_expected: bool, request: ModbusPDU) -> ModbusPDU:
+        """Send a request and wait for the response matching its transaction id.
+
+        Retry, disconnect and error semantics mirror
+        :meth:`TransactionManager.execute`.
+        """
+        from sigenergy2mqtt.metrics import Metrics
+
+        if not self.transport:
+            Log.warning("Not connected, trying to connect!")
+            if not await self.connect():
+                raise ConnectionException("Client cannot connect (automatic retry continuing) !!")
+        queued = await self.window.acquire()
+        try:
+            await Metrics.modbus_pipeline(self.window.in_flight, queued)
+            count_retries = 0
+            while count_retries <= self.retries:
+                transaction_id = self.getNextTID()
+                request.transaction_id = transaction_id
+                future = asyncio.get_running_loop().create_future()
+                self._pending[transaction_id] = future
+                try:
+                    self.pdu_send(request)
+                    if no_response_expected:
+                        return None  # type: ignore[return-value]
+                    response: ModbusPDU = await asyncio.wait_for(future, timeout=self.comm_params.timeout_connect)
+                except asyncio.exceptions.TimeoutError:
+                    self.window.congested()
+                    count_retries += 1
+                    continue
+                except asyncio.exceptions.CancelledError as exc:
+                    raise self._io_exception_from_request("Request cancelled outside library.", request) from exc
+                finally:
+                    self._pending.pop(transaction_id, None)
+                self.count_until_disconnect = self.max_until_disconnect
+                if isinstance(response, ExceptionResponse) and response.exception_code in CONGESTION_EXCEPTION_CODES:
+                    self.window.congested()
+                else:
+                    self.window.succeeded()
+                if request.dev_id and response.dev_id != request.dev_id:
+                    raise self._io_exception_from_request(f"ERROR: request uses device id={request.dev_id} but received {response.dev_id}.", request)
+                response.retries = count_retries
+                return response
+            if self.count_until_disconnect < 0:
+                self.connection_lost(asyncio.TimeoutError("Server not responding"))
+                raise self._io_exception_from_request("ERROR: No response received of the last requests (default: retries+3), CLOSING CONNECTION.", request)
+            self.count_until_disconnect -= 1
+            txt = f"No response received after {self.retries} retries, continue with next request"
+            Log.error(txt)
+            raise self._io_exception_from_request(txt, request)
+        finally:
+            self.window.release()
+
+    def getNextTID(self) -> int:
+        """Return the next transaction id that is not still awaiting a response."""
+        transaction_id = super().getNextTID()
+        while transaction_id in self._pending:
+            transaction_id = super().getNextTID()
+        return transaction_id
+
+    def callback_data(self, data: bytes, addr: tuple | None = None) -> int:
+        """Decode every complete frame in ``data`` and resolve the matching requests."""
+        self.last_pdu = self.last_addr = None
+        data = self.trace_packet(False, data)
+        consumed = 0
+        while consumed < len(data):
+            used_len, pdu = self.framer.handleFrame(data[consumed:], 0, 0)
+            consumed += used_len
+            if pdu is None:
+                break
+            self.last_pdu = self.trace_pdu(False, pdu)
+            self.last_addr = addr
+            future = self._pending.get(pdu.transaction_id)
+            if future is None or future.done():
+                logger.debug(f"Discarding response with unknown or expired transaction_id={pdu.transaction_id}")
+            else:
+                future.set_result(self.last_pdu)
+        return consumed
+
+    def datagram_received(self, data: bytes, addr: tuple | None) -> None:
+        """Buffer received data, allowing for a full window of responses in one read."""
+        self.recv_buffer += data
+        if len(self.recv_buffer) > MAX_TCP_ADU_SIZE * (self.window.limit + 1):
+            logger.debug(f"Discarding {len(self.recv_buffer)} bytes of unframed data")
+            self.recv_buffer = b""
+            return
+        consumed = self.callback_data(self.recv_buffer, addr=addr)
+        self.recv_buffer = self.recv_buffer[consumed:]
+
+    def callback_disconnected(self, exc: Exception | None) -> None:
+        """Fail every outstanding transaction immediately when the connection drops."""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionException(f"Connection lost with transactions in flight: {exc}"))
+        self._pending.clear()
+        super().callback_disconnected(exc)
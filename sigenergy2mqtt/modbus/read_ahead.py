@@ -1,59 +1,150 @@
-import copy
-from dataclasses import dataclass
+import time
+from array import array
 
 from pymodbus.pdu import ExceptionResponse, ModbusPDU
+from pymodbus.pdu.register_message import ReadHoldingRegistersResponse, ReadInputRegistersResponse
 
 from sigenergy2mqtt.common import InputType
 
 
-@dataclass
-class ReadAhead:
-    """Snapshot of a contiguous Modbus register response for cache reuse.
+class RegisterImage:
+    """Array-backed image of one device's register space for read-ahead reuse.
 
-    The object stores the original address range and response PDU from a
-    successful read. Future narrower reads can be fulfilled by slicing the
-    original register payload through :meth:`get_registers`.
+    One image exists per ``(device_id, input_type)`` pair. Register values are
+    held in a single ``array('H')`` with a parallel validity map and per-register
+    fill timestamps, so successful read-ahead responses are copied in once and
+    narrower reads are served as zero-copy ``memoryview`` slices.
+
+    The image grows to cover whatever ranges are filled. Growth always swaps in
+    a new backing array rather than resizing the existing one, so views handed
+    out earlier remain valid (albeit stale) and never block a resize.
+
+    Views reflect the image at the time they are read: callers should decode
+    the registers before the same range is filled again.
     """
-    address: int
-    count: int
-    device_id: int
-    input_type: InputType
-    pdu: ModbusPDU
+
+    __slots__ = ("device_id", "input_type", "_base", "_values", "_valid", "_filled_at", "_response_type")
+
+    def __init__(self, device_id: int, input_type: InputType):
+        self.device_id = device_id
+        self.input_type = input_type
+        self._base: int = 0
+        self._values: array = array("H")
+        self._valid: bytearray = bytearray()
+        self._filled_at: array = array("d")
+        self._response_type: type[ModbusPDU] = ReadHoldingRegistersResponse if input_type == InputType.HOLDING else ReadInputRegistersResponse
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def first_address(self) -> int:
+        """Return the first register address covered by the image."""
+        return self._base
 
     @property
     def last_address(self) -> int:
-        """Return the inclusive final register address in this cached range."""
-        return self.address + self.count - 1
+        """Return the inclusive final register address covered by the image."""
+        return self._base + len(self._values) - 1
+
+    def _ensure_span(self, address: int, count: int) -> None:
+        """Grow the backing storage so that ``address..address+count-1`` is addressable."""
+        size = len(self._values)
+        if size == 0:
+            self._base = address
+            self._values = array("H", bytes(2 * count))
+            self._valid = bytearray(count)
+            self._filled_at = array("d", bytes(8 * count))
+            return
+        first = min(self._base, address)
+        last = max(self._base + size, address + count)
+        if first == self._base and last == self._base + size:
+            return
+        offset = self._base - first
+        values = array("H", bytes(2 * (last - first)))
+        values[offset : offset + size] = self._values
+        valid = bytearray(last - first)
+        valid[offset : offset + size] = self._valid
+        filled_at = array("d", bytes(8 * (last - first)))
+        filled_at[offset : offset + size] = self._filled_at
+        self._base, self._values, self._valid, self._filled_at = first, values, valid, filled_at
+
+    def fill(self, address: int, registers: list[int], timestamp: float | None = None) -> None:
+        """Copy a successful response payload into the image and mark it valid.
+
+        Args:
+            address: Start address of the response.
+            registers: Register values returned by the device.
+            timestamp: Wall-clock time of the read (defaults to now).
+        """
+        count = len(registers)
+        if count == 0:
+            return
+        self._ensure_span(address, count)
+        start = address - self._base
+        end = start + count
+        self._values[start:end] = array("H", registers)
+        self._valid[start:end] = b"\x01" * count
+        self._filled_at[start:end] = array("d", [time.time() if timestamp is None else timestamp]) * count
+
+    def invalidate(self, address: int, count: int = 1) -> None:
+        """Mark a register range as invalid so that it is no longer served."""
+        size = len(self._values)
+        start = max(address - self._base, 0)
+        end = min(address + count - self._base, size)
+        if start < end:
+            self._valid[start:end] = bytes(end - start)
+
+    def is_valid(self, address: int, count: int = 1) -> bool:
+        """Return ``True`` when every register in the range holds a cached value."""
+        start = address - self._base
+        end = start + count
+        if count < 1 or start < 0 or end > len(self._values):
+            return False
+        return self._valid.find(0, start, end) == -1
+
+    def filled_at(self, address: int) -> float | None:
+        """Return the wall-clock time at which ``address`` was last filled, or ``None`` if it is not valid."""
+        if not self.is_valid(address):
+            return None
+        return self._filled_at[address - self._base]
+
+    def view(self, address: int, count: int) -> memoryview:
+        """Return a zero-copy view of a cached register range.
+
+        Raises:
+            IndexError: If any register in the range is outside the image or not valid.
+        """
+        if not self.is_valid(address, count):
+            raise IndexError(f"{address=} {count=} not cached for device_id={self.device_id} ({self.input_type})")
+        start = address - self._base
+        return memoryview(self._values)[start : start + count]
 
     def get_registers(self, address: int, count: int) -> ModbusPDU:
-        """Extract a sub-range from the cached PDU as a new response object.
+        """Extract a sub-range from the image as a response object.
 
         Args:
             address: Start address for the requested sub-range.
-            count: Number of registers requested from the cached span.
+            count: Number of registers requested.
 
         Returns:
-            A deep-copied PDU with ``address``, ``count``, and ``registers`` set
-            to the requested sub-range.
+            A read response PDU whose ``registers`` are a zero-copy view into
+            the image.
 
         Raises:
-            IndexError: If the request falls outside the cached span, the source
-                PDU is an error response, or the sliced payload length mismatches
-                ``count``.
+            IndexError: If any register in the range is outside the image or not valid.
         """
-        if address < self.address:
-            raise IndexError(f"{address=} < {self.address=})")
-        elif address + count - 1 > self.last_address:
-            raise IndexError(f"{address=} + {count=} - 1 > {self.last_address=})")
-        elif isinstance(self.pdu, ExceptionResponse) or self.pdu.isError():
-            raise IndexError(f"Underlying PDU is in error ({self.pdu.exception_code=})")
-        start = address - self.address
-        end = start + count
-        registers = self.pdu.registers[start:end]
-        if len(registers) != count:
-            raise IndexError(f"Requested {count=} but {len(registers)=}")
-        pdu = copy.deepcopy(self.pdu)
-        pdu.address = address
-        pdu.count = count
-        pdu.registers = registers
+        pdu = self._response_type(dev_id=self.device_id, address=address, count=count)
+        pdu.registers = self.view(address, count)  # type: ignore[assignment]
         return pdu
+
+    def update(self, address: int, count: int, rr: ModbusPDU) -> None:
+        """Apply a read-ahead response to the image.
+
+        Successful responses are filled; error responses invalidate the range
+        to prevent unexpected values being served.
+        """
+        if rr.isError() or isinstance(rr, ExceptionResponse) or len(rr.registers) != count:
+            self.invalidate(address, count)
+        else:
+            self.fill(address, rr.registers)
@@ -17,7 +17,7 @@ from sigenergy2mqtt.devices import Device
 from sigenergy2mqtt.diagnostics import diagnostics_registry
 from sigenergy2mqtt.i18n import _t
 from sigenergy2mqtt.modbus import ModbusClientFactory
-from sigenergy2mqtt.mqtt import MqttHandler, mqtt_health_registry, mqtt_setup, mqtt_teardown
+from sigenergy2mqtt.mqtt import MqttHandler, SensorEvent, mqtt_health_registry, mqtt_setup, mqtt_teardown, sensor_event_bus
 from sigenergy2mqtt.sensors.base import DerivedSensor, ReadableSensorMixin
 
 from .dashboard import extract_dashboard_state
@@ -387,7 +387,30 @@ class MonitorService(Device):
         Returns:
             ``True`` if the topic is known and was updated; otherwise ``False``.
         """
+        return await self._update(source, value, time.time())
 
+    async def on_sensor_event(self, event: SensorEvent) -> bool:
+        """Update the ``last_seen`` timestamp for a monitored sensor from the sensor event bus.
+
+        Args:
+            event: The state published by the sensor.
+
+        Returns:
+            ``True`` if the topic is known and was updated; otherwise ``False``.
+        """
+        return await self._update(event.topic, event.payload, event.timestamp)
+
+    async def _update(self, source: str, value: str, timestamp: float) -> bool:
+        """Record the state of a monitored topic and when it was seen.
+
+        Args:
+            source: Topic that emitted the state.
+            value: The state as published to MQTT.
+            timestamp: Wall-clock time the state was published.
+
+        Returns:
+            ``True`` if the topic is known and was updated; otherwise ``False``.
+        """
         if source in self._topics:
             sensor = self._topics[source]
             if sensor.notified:
@@ -398,7 +421,7 @@ class MonitorService(Device):
             except ValueError:
                 state = value
             async with self._lock:
-                sensor.last_seen = time.time()
+                sensor.last_seen = timestamp
                 sensor.last_state = state
                 sensor.notified = False
             return True
@@ -471,9 +494,12 @@ class MonitorService(Device):
     def subscribe(self, mqtt_client: mqtt.Client, mqtt_handler: MqttHandler) -> None:
         """Subscribe to all publishable readable sensor state topics and clear health checks if disabled.
 
+        The monitored sensors are in this process, so their topics are
+        subscribed on the sensor event bus rather than the broker.
+
         Args:
-            mqtt_client: MQTT client used for subscriptions.
-            mqtt_handler: Helper used to register topic callbacks.
+            mqtt_client: MQTT client used to clear health checks.
+            mqtt_handler: Handler whose event loop receives the sensor events.
         """
         is_enabled = active_config.health_check.enabled or is_docker()
         if not is_enabled:
@@ -508,7 +534,7 @@ class MonitorService(Device):
                         unit=str(unit) if unit else None,
                     )
                     sensors += 1
-                    mqtt_handler.register(mqtt_client, topic, handler=self.on_topic_update)
+                    sensor_event_bus.subscribe(topic, self.on_sensor_event, mqtt_handler.loop)
             if sensors > 0:
                 logger.debug(f"{self.log_identity} Monitoring {sensors} topic{'s' if sensors > 1 else ''} for {d.log_identity}")
         logger.info(f"{self.log_identity} Subscribed to {len(self._topics)} topics")
@@ -13,10 +13,11 @@ if TYPE_CHECKING:
     from sigenergy2mqtt.modbus import ModbusClient
 
 from .client import MqttClient
+from .events import SensorEvent, SensorEventBus
 from .handler import MqttHandler
 from .registry import MqttHealthRegistry
 
-__all__ = ["MqttHandler", "interrupt_mqtt_reconnection", "mqtt_health_registry", "mqtt_setup", "mqtt_teardown", "reset_mqtt_reconnection_interrupt"]
+__all__ = ["MqttHandler", "SensorEvent", "interrupt_mqtt_reconnection", "mqtt_health_registry", "mqtt_setup", "mqtt_teardown", "reset_mqtt_reconnection_interrupt", "sensor_event_bus"]
 
 _MAX_CONNECT_ATTEMPTS: int = 3
 
@@ -54,6 +55,8 @@ def reset_mqtt_reconnection_interrupt() -> None:
 
 mqtt_health_registry = MqttHealthRegistry()
 
+sensor_event_bus = SensorEventBus()
+
 
 def _build_broker_url() -> str:
     """Construct the broker URL string from active config for use in log messages."""
@@ -162,6 +165,7 @@ async def mqtt_teardown(mqtt_client: MqttClient, mqtt_handler: MqttHandler) -> N
 
     logger.debug(f"Deregistering and unsubscribing MQTT handlers for Client ID {mqtt_client_id} to {broker_url}")
     mqtt_handler.deregister_all(mqtt_client)
+    sensor_event_bus.unsubscribe_all(mqtt_handler.loop)
 
     logger.info(f"Closing MQTT connection for Client ID {mqtt_client_id} to {broker_url}")
     mqtt_client.loop_stop()
@@ -0,0 +1,200 @@
+"""In-process delivery of sensor state updates.
+
+Services that consume the states published by this process (InfluxDB,
+Monitor and PVOutput) would otherwise subscribe to the state topics on the
+broker and receive every state back from it.  :class:`SensorEventBus` lets
+them receive each state directly from :meth:`Sensor.publish` instead, so
+that the round trip through the broker (and its latency, and the decoding of
+the payload on the paho network thread) is avoided.  Topics that are not
+published by this process must still be subscribed through
+:meth:`MqttHandler.register`.
+
+Thread-safety
+-------------
+Sensors publish from their device thread, while subscribers run on the event
+loop of their own thread.  Each subscribing event loop has an inbox, a
+:class:`collections.deque` that the publishing threads append to and the
+subscribing loop drains, so no lock is taken when a state is published.  The
+topic routes are replaced (never modified) when a subscription changes, so
+they may also be read without a lock.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Events awaiting delivery on one event loop before the oldest are discarded.
+_MAX_PENDING_EVENTS: int = 10000
+
+
+@dataclass(frozen=True, slots=True)
+class SensorEvent:
+    """A state published by a sensor.
+
+    Attributes:
+        topic: The MQTT topic the state was published to.
+        value: The state, before it was formatted as an MQTT payload.
+        timestamp: Wall-clock time the state was read (for a Modbus sensor,
+            when its registers were read), or published if that is unknown.
+        unique_id: Unique ID of the publishing sensor.
+        object_id: Object ID of the publishing sensor.
+    """
+
+    topic: str
+    value: Any
+    timestamp: float
+    unique_id: str
+    object_id: str
+
+    @property
+    def payload(self) -> str:
+        """The state as published to MQTT."""
+        return f"{self.value}"
+
+
+SensorEventHandler = Callable[[SensorEvent], Awaitable[Any] | Any]
+
+
+class _Inbox:
+    """Events awaiting delivery to the handlers running on one event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self._events: deque[tuple[SensorEventHandler, SensorEvent]] = deque(maxlen=_MAX_PENDING_EVENTS)
+        self._scheduled = False
+        self._tasks: set[asyncio.Future] = set()
+
+    def put(self, handler: SensorEventHandler, event: SensorEvent) -> None:
+        self._events.append((handler, event))
+        if not self._scheduled:
+            # A redundant drain (when two threads race here) is harmless; a missed one is not,
+            # which is why the flag is cleared before, rather than after, the inbox is drained.
+            self._scheduled = True
+            try:
+                self.loop.call_soon_threadsafe(self._drain)
+            except RuntimeError as e:
+                logger.debug(f"Failed to schedule delivery of sensor events – loop probably closed: {e}")
+                self._events.clear()
+
+    def _drain(self) -> None:
+        self._scheduled = False
+        while self._events:
+            handler, event = self._events.popleft()
+            try:
+                result = handler(event)
+            except Exception as e:
+                logger.error(f"Sensor event handler {getattr(handler, '__qualname__', handler)} failed for topic {event.topic}: {e!r}")
+                continue
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Future) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Sensor event handler failed: {task.exception()!r}")
+
+
+class SensorEventBus:
+    """Typed publish/subscribe of sensor states within the process.
+
+    Handlers are subscribed per topic and are always called on the event loop
+    they were subscribed with, in the order the states were published.  A
+    handler that returns an awaitable has it scheduled as a task on that loop.
+    """
+
+    def __init__(self) -> None:
+        # Guards subscription changes; publishing reads the current routes without it.
+        self._lock = threading.Lock()
+        self._inboxes: dict[asyncio.AbstractEventLoop, _Inbox] = {}
+        self._routes: dict[str, tuple[tuple[_Inbox, SensorEventHandler], ...]] = {}
+
+    def clear(self) -> None:
+        """Remove all subscriptions."""
+        with self._lock:
+            self._inboxes = {}
+            self._routes = {}
+
+    def is_subscribed(self, topic: str) -> bool:
+        """Return ``True`` if any handler is subscribed to *topic*."""
+        return topic in self._routes
+
+    def publish(self, topic: str, value: Any, unique_id: str, object_id: str, timestamp: float | None = None) -> bool:
+        """Deliver a published state to the handlers subscribed to its topic.
+
+        Args:
+            topic: The MQTT topic the state was published to.
+            value: The published state.
+            unique_id: Unique ID of the publishing sensor.
+            object_id: Object ID of the publishing sensor.
+            timestamp: Wall-clock time the state was read, or ``None`` for now.
+
+        Returns:
+            ``True`` if any handler is subscribed to *topic*.
+        """
+        routes = self._routes.get(topic)
+        if not routes:
+            return False
+        event = SensorEvent(topic, value, time.time() if timestamp is None else timestamp, unique_id, object_id)
+        for inbox, handler in routes:
+            inbox.put(handler, event)
+        return True
+
+    def subscribe(self, topic: str, handler: SensorEventHandler, loop: asyncio.AbstractEventLoop) -> None:
+        """Subscribe *handler* to the states published to *topic*.
+
+        Args:
+            topic: The MQTT state topic of a sensor in this process.
+            handler: Called with each :class:`SensorEvent` published to *topic*.
+            loop: The event loop on which *handler* is to be called.
+        """
+        with self._lock:
+            inbox = self._inboxes.get(loop)
+            if inbox is None:
+                inbox = self._inboxes[loop] = _Inbox(loop)
+            routes = dict(self._routes)
+            routes[topic] = routes.get(topic, ()) + ((inbox, handler),)
+            self._routes = routes
+        logger.debug(f"Subscribed {getattr(handler, '__qualname__', handler)} to sensor events for topic {topic}")
+
+    def unsubscribe(self, topic: str, handler: SensorEventHandler) -> None:
+        """Unsubscribe *handler* from *topic*.
+
+        Args:
+            topic: The topic *handler* was subscribed to.
+            handler: The handler to remove.
+        """
+        with self._lock:
+            routes = dict(self._routes)
+            remaining = tuple(route for route in routes.get(topic, ()) if route[1] != handler)
+            if remaining:
+                routes[topic] = remaining
+            else:
+                routes.pop(topic, None)
+            self._routes = routes
+
+    def unsubscribe_all(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Unsubscribe every handler that was subscribed with *loop*.
+
+        Args:
+            loop: The event loop being shut down.
+        """
+        with self._lock:
+            inbox = self._inboxes.pop(loop, None)
+            if inbox is None:
+                return
+            routes: dict[str, tuple[tuple[_Inbox, SensorEventHandler], ...]] = {}
+            for topic, subscribed in self._routes.items():
+                remaining = tuple(route for route in subscribed if route[0] is not inbox)
+                if remaining:
+                    routes[topic] = remaining
+            self._routes = routes
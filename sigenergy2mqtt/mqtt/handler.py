@@ -11,6 +11,8 @@ application.  Its responsibilities are:
 * **Publish acknowledgement** – allow callers to await confirmation that
   a publish or subscribe operation has been acknowledged by the broker
   (``wait_for``).
+* **Publish pipeline** – publish without blocking the asyncio loop, with
+  a bounded number of publishes awaiting acknowledgement (``publish``).
 
 Thread-safety
 -------------
@@ -19,7 +21,8 @@ is protected by explicit :class:`threading.Lock` objects so that the MQTT
 thread and the asyncio loop can access it concurrently without races:
 
 * ``_state_lock``  – guards ``connected`` and ``_topics``.
-* ``_mids_lock``   – guards ``_seen_mids`` and ``_pending_mids``.
+* ``_mids_lock``   – guards ``_seen_mids``, ``_pending_mids`` and
+  ``_pending_publishes``.
 
 ``_closing`` is a :class:`threading.Event` so that its value is
 immediately visible across threads without relying on the GIL.
@@ -49,12 +52,16 @@ from .registry import MqttHealthRegistry
 
 logger = logging.getLogger("paho.mqtt")
 
-# Pending MID record: the wall-clock time it was registered and the response handler.
-MqttResponse = namedtuple("MqttResponse", ["now", "handler"])
+# Pending MID record: the wall-clock time it was registered, the response handler
+# and, for publishes made through MqttHandler.publish, the future resolved by the acknowledgement.
+MqttResponse = namedtuple("MqttResponse", ["now", "handler", "future"], defaults=[None])
 
 # MIDs older than this many seconds are considered stale and are purged.
 _MID_EXPIRY_SECONDS: float = 60.0
 
+# Publishes awaiting acknowledgement before MqttHandler.publish rejects new publishes.
+_MAX_PENDING_PUBLISHES: int = 2000
+
 
 def _get_method_name(method) -> str:
     """Return a human-readable qualified name for *method*.
@@ -91,9 +98,20 @@ class MqttHandler:
         Optional :class:`MqttHealthRegistry` to register with, allowing
         the monitor to report on publish success and failure. Should only
         be omitted for testing.
+    max_pending_publishes:
+        Maximum number of publishes made through :meth:`publish` that may
+        await acknowledgement at once.  Further publishes are rejected
+        until the broker catches up.
     """
 
-    def __init__(self, client_id: str, modbus_client: ModbusClient | None, loop: asyncio.AbstractEventLoop, health_registry: MqttHealthRegistry | None = None):
+    def __init__(
+        self,
+        client_id: str,
+        modbus_client: ModbusClient | None,
+        loop: asyncio.AbstractEventLoop,
+        health_registry: MqttHealthRegistry | None = None,
+        max_pending_publishes: int = _MAX_PENDING_PUBLISHES,
+    ):
         """Initialise internal state; no network I/O is performed here."""
         self._loop = loop
         self._modbus = modbus_client
@@ -111,7 +129,12 @@ class MqttHandler:
         self._seen_mids: set[Any] = set()
         # MIDs that wait_for is actively watching, mapped to their response record.
         self._pending_mids: dict[Any, MqttResponse] = {}
-        # Protects: self._seen_mids, self._pending_mids.
+        # Futures of publishes made through publish() that await acknowledgement.
+        self._pending_publishes: set[concurrent.futures.Future[bool]] = set()
+        self._max_pending_publishes = max_pending_publishes
+        # Set while publish() is rejecting publishes, so the backlog is only logged once.
+        self._publish_backlog = False
+        # Protects: self._seen_mids, self._pending_mids, self._pending_publishes.
         self._mids_lock = threading.Lock()
 
         self._topics: dict[
@@ -124,6 +147,10 @@ class MqttHandler:
         # scheduling new coroutines.
         self._closing = threading.Event()
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
     @property
     def registry(self) -> MqttHealthRegistry:
         return self._registry
@@ -167,7 +194,7 @@ class MqttHandler:
             if hasattr(method_result, "close"):
                 method_result.close()
 
-    def _purge_expired_mids(self) -> None:
+    def _purge_expired_mids(self) -> list[concurrent.futures.Future[bool]]:
         """Evict stale entries from ``_pending_mids``.
 
         An entry is considered stale when it was inserted more than
@@ -179,12 +206,53 @@ class MqttHandler:
         .. warning::
             The caller **must** hold ``_mids_lock`` before calling this
             method.
+
+        Returns
+        -------
+        list[concurrent.futures.Future[bool]]
+            The futures of expired publishes.  The caller should resolve
+            them with :meth:`_resolve_publishes` *after* releasing
+            ``_mids_lock``.
         """
         cutoff = time.time() - _MID_EXPIRY_SECONDS
         stale = [mid for mid, rec in self._pending_mids.items() if rec.now < cutoff]
+        expired: list[concurrent.futures.Future[bool]] = []
         for mid in stale:
             logger.debug(f"Removing expired MID={mid} (client_id={self.client_id})")
-            del self._pending_mids[mid]
+            record = self._pending_mids.pop(mid)
+            if record.future is not None:
+                logger.warning(f"No acknowledgement of publish MID={mid} received within {_MID_EXPIRY_SECONDS}s (client_id={self.client_id})")
+                expired.append(record.future)
+        return expired
+
+    @staticmethod
+    def _resolve_publishes(futures: list[concurrent.futures.Future[bool]], published: bool) -> None:
+        """Resolve publish futures that have not already been resolved."""
+        for future in futures:
+            if not future.done():
+                future.set_result(published)
+
+    def _publish_done(self, future: concurrent.futures.Future[bool]) -> None:
+        """Release the pipeline slot held by a resolved publish."""
+        with self._mids_lock:
+            self._pending_publishes.discard(future)
+            resumed = self._publish_backlog and len(self._pending_publishes) < self._max_pending_publishes
+            if resumed:
+                self._publish_backlog = False
+        if resumed:
+            logger.info(f"Publish backlog cleared - accepting publishes again (client_id={self.client_id})")
+
+    def _publish_completed(self, future: concurrent.futures.Future[bool], on_complete: Callable[[bool], Any]) -> None:
+        """Pass the outcome of a publish to its *on_complete* callback.
+
+        Runs on whichever thread resolved *future*, so an awaitable
+        returned by the callback is scheduled on the asyncio loop via
+        :meth:`_schedule_coroutine`.
+        """
+        method_name = _get_method_name(on_complete)
+        method_result = on_complete(future.result())
+        if inspect.isawaitable(method_result):
+            self._schedule_coroutine(method_result, method_name)
 
     # ------------------------------------------------------------------
     # MQTT callbacks
@@ -275,7 +343,9 @@ class MqttHandler:
            the MID is parked in ``_seen_mids`` so that :meth:`wait_for`
            can detect the race and return immediately.
 
-        Stale entries in ``_pending_mids`` are purged on every call.
+        Stale entries in ``_pending_mids`` are purged on every call, and
+        the futures of expired publishes are resolved with ``False``.
+        The future of an acknowledged publish is resolved with ``True``.
 
         Parameters
         ----------
@@ -289,21 +359,23 @@ class MqttHandler:
         """
         with self._mids_lock:
             if mid in self._pending_mids:
-                # wait_for is watching this MID.
+                # wait_for or publish is watching this MID.
                 record = self._pending_mids.pop(mid)
                 handler = record.handler
+                future = record.future
             elif mid in self._seen_mids:
                 # Already processed once; ignore the duplicate.
                 return
             else:
-                # wait_for hasn't registered yet – park the MID so wait_for can
-                # detect the "already acknowledged" case.
+                # wait_for/publish hasn't registered yet – park the MID so it
+                # can detect the "already acknowledged" case.
                 self._seen_mids.add(mid)
-                self._purge_expired_mids()
-                return
-
-            self._purge_expired_mids()
+                handler = future = None
+            expired = self._purge_expired_mids()
 
+        self._resolve_publishes(expired, False)
+        if future is not None:
+            self._resolve_publishes([future], True)
         if handler is not None:
             method_name = _get_method_name(handler)
             logger.debug(f"Handling topic {topic} response for MID={mid} with method {method_name} (client_id={self.client_id})")
@@ -361,6 +433,107 @@ class MqttHandler:
                 logger.debug(f"Unsubscribed from topic {topic} (client_id={self.client_id}) -> {result}")
             self._topics.clear()
 
+    def publish(
+        self,
+        client: mqtt.Client,
+        topic: str,
+        payload: bytes | str,
+        qos: int = 0,
+        retain: bool = False,
+        on_complete: Callable[[bool], Any] | None = None,
+    ) -> concurrent.futures.Future[bool]:
+        """Publish a message without waiting for the broker.
+
+        The message is handed to paho and the method returns immediately
+        with a future.  The future is resolved from the paho network
+        thread by :meth:`on_response` when the publish is acknowledged
+        (``True``), or with ``False`` if no acknowledgement arrives within
+        :data:`_MID_EXPIRY_SECONDS`.  For QoS 0 paho acknowledges the
+        publish once it has been written to the socket.
+
+        At most ``max_pending_publishes`` publishes may await
+        acknowledgement.  When that limit is reached (typically because
+        the broker is unreachable or slow), the message is **not**
+        published and the future is resolved with ``False`` at once; a
+        warning is logged when the backlog starts and an info message
+        when it clears.  Messages paho refuses to queue are treated the
+        same way.  A QoS 1/2 message published while disconnected is
+        kept by paho and sent on reconnection, so it remains pending.
+
+        Parameters
+        ----------
+        client:
+            The paho client used to publish the message.
+        topic:
+            The topic that the message should be published on.
+        payload:
+            The payload to publish.
+        qos:
+            The quality of service level to use.
+        retain:
+            Whether the broker should retain the message.
+        on_complete:
+            Optional callable invoked with the outcome when the future is
+            resolved, on whichever thread resolved it.  If it returns an
+            awaitable, that awaitable is scheduled on the asyncio loop.
+
+        Returns
+        -------
+        concurrent.futures.Future[bool]
+            Resolved with ``True`` once the broker acknowledges the
+            publish, or ``False`` if it was rejected or never acknowledged.
+
+        Raises
+        ------
+        ValueError
+            If paho rejects the topic, QoS or payload.
+        """
+        future: concurrent.futures.Future[bool] = concurrent.futures.Future()
+        future.add_done_callback(self._publish_done)
+        if on_complete is not None:
+            future.add_done_callback(lambda done: self._publish_completed(done, on_complete))
+
+        with self._mids_lock:
+            if len(self._pending_publishes) >= self._max_pending_publishes:
+                expired = self._purge_expired_mids()
+            else:
+                expired = []
+            backlogged = len(self._pending_publishes) - len(expired) >= self._max_pending_publishes
+            if backlogged:
+                first = not self._publish_backlog
+                self._publish_backlog = True
+            else:
+                self._pending_publishes.add(future)
+        self._resolve_publishes(expired, False)
+
+        if backlogged:
+            if first:
+                logger.warning(f"Publish backlog of {self._max_pending_publishes} messages awaiting acknowledgement - rejecting publishes until it clears (client_id={self.client_id})")
+            logger.debug(f"Publish to {topic} rejected - backlog full (client_id={self.client_id})")
+            future.set_result(False)
+            return future
+
+        try:
+            info = client.publish(topic, payload, qos=qos, retain=retain)
+        except Exception:
+            future.set_result(False)
+            raise
+
+        if info.rc != MQTTErrorCode.MQTT_ERR_SUCCESS and not (qos > 0 and info.rc == MQTTErrorCode.MQTT_ERR_NO_CONN):
+            logger.debug(f"Publish to {topic} not queued: {mqtt.error_string(info.rc)} (client_id={self.client_id})")
+            future.set_result(False)
+            return future
+
+        with self._mids_lock:
+            already_seen = info.mid in self._seen_mids
+            if already_seen:
+                self._seen_mids.discard(info.mid)
+            else:
+                self._pending_mids[info.mid] = MqttResponse(time.time(), None, future)
+        if already_seen:
+            future.set_result(True)
+        return future
+
     async def close(self) -> None:
         """Signal shutdown and wait for all in-flight handler coroutines.
 
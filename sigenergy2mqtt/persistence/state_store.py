@@ -25,6 +25,36 @@ retained messages are received before the method returns:
 The ``cache_warmup_timeout`` setting is a safety limit for degraded broker
 conditions; under normal circumstances the sentinel arrives within milliseconds.
 
+Write-behind
+------------
+When ``write-behind-interval`` is greater than zero, :meth:`StateStore.save`
+only records the latest value of each ``(category, key)`` in memory. Pending
+values are written together when the interval expires, when
+``write-behind-threshold`` keys are pending, at local midnight, when a save
+requests an immediate ``flush``, and on :meth:`StateStore.shutdown`. Loads see
+pending values, and deletes discard them.
+
+Preloading
+----------
+:meth:`StateStore.preload` reads every key of the given categories from disk
+in one pass per category (a directory scan, or one query) before the devices
+are constructed. Loads of those categories are then answered from memory,
+which saves and deletes keep up to date, instead of each reading its own file.
+The MQTT backend needs no preloading: its cache is filled by the wildcard
+subscription during cache warming.
+
+Disk backends
+-------------
+The ``disk-backend`` setting selects how the envelopes are stored on disk:
+
+* ``files`` (``DiskBackend``): one file per key, under
+  ``{state_path}/{category}/{key}``.
+* ``sqlite`` (``SqliteBackend``): one row per key in ``{state_path}/state.db``,
+  in WAL mode. Every write is a transaction, and all the values of a
+  write-behind flush are committed in a single transaction. When first
+  selected, the files of the per-file layout are imported into the database
+  and removed.
+
 Legacy migration
 ----------------
 Disk files written by earlier versions of sigenergy2mqtt contain raw values
@@ -39,12 +69,14 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
+import sqlite3
 import threading
 import time
 from collections import deque
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
-from datetime import timedelta
+from datetime import datetime, timedelta
 from enum import StrEnum
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -64,6 +96,9 @@ _PAYLOAD_VALUE_KEY = "v"
 _PAYLOAD_TS_KEY = "ts"
 _PAYLOAD_VER_KEY = "ver"
 
+# Raised by the disk backends when a value cannot be written.
+_DISK_ERRORS = (OSError, ValueError, sqlite3.Error)
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,11 +109,11 @@ class Category(StrEnum):
     SENSOR = "sensor"
 
 
-def _make_envelope(value: str, version: str) -> str:
-    """Return a JSON-encoded persistence envelope for *value*."""
+def _make_envelope(value: str, version: str, ts: int | None = None) -> str:
+    """Return a JSON-encoded persistence envelope for *value*, timestamped now unless *ts* is given."""
     return json.dumps({
         _PAYLOAD_VALUE_KEY: value,
-        _PAYLOAD_TS_KEY: int(time.time()),
+        _PAYLOAD_TS_KEY: int(time.time()) if ts is None else ts,
         _PAYLOAD_VER_KEY: version,
     })
 
@@ -193,6 +228,36 @@ class _DiskBackend:
         except OSError:
             pass
 
+    def load_category(self, category: Category | str) -> dict[str, tuple[str, int, bool, bool]]:
+        """Read every file of *category* in one directory scan, returning ``{key: (value, ts, was_legacy, found_in_root)}``.
+
+        Legacy files in the root state directory are not included.
+        """
+        results: dict[str, tuple[str, int, bool, bool]] = {}
+        try:
+            with os.scandir(self._path_for(category, "")) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    try:
+                        with open(entry.path, encoding="utf-8") as f:
+                            raw = f.read()
+                        result = _parse_envelope(raw, fallback_ts=int(entry.stat().st_mtime))
+                    except OSError as exc:
+                        logger.warning(f"DiskBackend.load failed for {category}/{entry.name}: {exc}")
+                        continue
+                    if result is not None:
+                        results[entry.name] = (*result, False)
+        except FileNotFoundError:
+            pass
+        return results
+
+    def root_keys(self) -> list[str]:
+        """Return the names of the legacy files in the root state directory."""
+        if not self._state_path.is_dir():
+            return []
+        return [file.name for file in self._state_path.iterdir() if file.is_file()]
+
     def all_keys(self) -> list[tuple[Category | str, str]]:
         """Return all ``(category, key)`` pairs currently on disk."""
         results: list[tuple[Category | str, str]] = []
@@ -200,9 +265,8 @@ class _DiskBackend:
             return results
 
         # Include legacy root files
-        for file in self._state_path.iterdir():
-            if file.is_file():
-                results.append((Category._ROOT, file.name))
+        for key in self.root_keys():
+            results.append((Category._ROOT, key))
 
         for category_dir in self._state_path.iterdir():
             if category_dir.is_dir():
@@ -217,6 +281,157 @@ class _DiskBackend:
 
         return results
 
+    def close(self) -> None:
+        """Nothing to release: every file is closed once written."""
+
+
+# ---------------------------------------------------------------------------
+# SqliteBackend
+# ---------------------------------------------------------------------------
+
+
+class _SqliteBackend:
+    """Single-file persistence in an SQLite database, using the unified JSON envelope format.
+
+    Each ``(category, key)`` is one row holding the envelope the per-file
+    layout would have written. The database is in WAL mode with
+    ``synchronous=NORMAL``: a power loss may lose the last commits, but never
+    leaves a partially written value. Legacy files in the root state directory
+    are still read (and removed) through a :class:`_DiskBackend`.
+    """
+
+    FILENAME = "state.db"
+
+    def __init__(self, state_path: Path, version: str) -> None:
+        self._version = version
+        self._files = _DiskBackend(state_path, version)
+        state_path.mkdir(parents=True, exist_ok=True)
+        # Used from the persistence executor and, for direct synchronous calls, from the event loop thread.
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(state_path / self.FILENAME, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS state (category TEXT NOT NULL, key TEXT NOT NULL, envelope TEXT NOT NULL, PRIMARY KEY (category, key)) WITHOUT ROWID")
+        self._db.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def save(self, category: Category | str, key: str, value: str) -> None:
+        """Write *value* to the ``(category, key)`` row."""
+        self.save_many({(category, key): value})
+
+    def save_many(self, items: dict[tuple[Category | str, str], str]) -> None:
+        """Write all of *items*, mapping ``(category, key)`` to value, in a single transaction."""
+        from sigenergy2mqtt.config import active_config
+
+        rows = [(str(category), key, _make_envelope(value, self._version)) for (category, key), value in items.items()]
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR REPLACE INTO state (category, key, envelope) VALUES (?, ?, ?)", rows)
+        if active_config.persistence_debug:
+            logger.debug(f"SqliteBackend.save {len(rows)} values")
+
+    def load(self, category: Category | str, key: str) -> tuple[str, int, bool, bool] | None:
+        """Read and return ``(value, ts, was_legacy, found_in_root)``, or ``None`` if absent."""
+        try:
+            with self._lock:
+                row = self._db.execute("SELECT envelope FROM state WHERE category = ? AND key = ?", (str(category), key)).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning(f"SqliteBackend.load failed for {category}/{key}: {exc}")
+            return None
+        if row is None:
+            # A legacy file in the root state directory, which is moved into the database when saved.
+            return self._files.load(category, key)
+        result = _parse_envelope(row[0])
+        if result is None:
+            return None
+        value, ts, was_legacy = result
+        return value, ts, was_legacy, False
+
+    def load_category(self, category: Category | str) -> dict[str, tuple[str, int, bool, bool]]:
+        """Read every row of *category* in one query, returning ``{key: (value, ts, was_legacy, found_in_root)}``."""
+        with self._lock:
+            rows = self._db.execute("SELECT key, envelope FROM state WHERE category = ?", (str(category),)).fetchall()
+        results: dict[str, tuple[str, int, bool, bool]] = {}
+        for key, envelope in rows:
+            result = _parse_envelope(envelope)
+            if result is not None:
+                results[key] = (*result, False)
+        return results
+
+    def delete(self, category: Category | str, key: str) -> None:
+        """Remove the ``(category, key)`` row, and any legacy file of the same key."""
+        from sigenergy2mqtt.config import active_config
+
+        try:
+            with self._lock, self._db:
+                self._db.execute("DELETE FROM state WHERE category = ? AND key = ?", (str(category), key))
+            if active_config.persistence_debug:
+                logger.debug(f"SqliteBackend.delete {category}/{key} successful")
+        except sqlite3.Error as exc:
+            logger.error(f"SqliteBackend.delete failed for {category}/{key}: {exc}")
+        self._files.delete(category, key)
+
+    def delete_root_legacy(self, key: str) -> None:
+        """Explicitly remove a legacy file from the root state path."""
+        self._files.delete_root_legacy(key)
+
+    def root_keys(self) -> list[str]:
+        """Return the names of the legacy files in the root state directory."""
+        return [key for key in self._files.root_keys() if not key.startswith(self.FILENAME)]
+
+    def all_keys(self) -> list[tuple[Category | str, str]]:
+        """Return all ``(category, key)`` pairs in the database, and any legacy root files."""
+        with self._lock:
+            rows = self._db.execute("SELECT category, key FROM state").fetchall()
+        results: list[tuple[Category | str, str]] = []
+        for name, key in rows:
+            try:
+                results.append((Category(name), key))
+            except ValueError:
+                results.append((name, key))
+        for key in self.root_keys():
+            results.append((Category._ROOT, key))
+        return results
+
+    def migrate(self) -> int:
+        """Import the files of the per-file layout, then remove them; returns the number imported.
+
+        Timestamps are preserved, and a key already in the database is only
+        overwritten by a newer file (e.g. one saved after switching back to the
+        per-file layout), so every file is either imported or superseded before
+        it is removed. Legacy files in the root state directory are left to be
+        migrated when they are loaded, as for the per-file layout.
+        """
+        items: dict[tuple[Category | str, str], str] = {}
+        for category, key in self._files.all_keys():
+            if category == Category._ROOT:
+                continue
+            result = self._files.load(category, key)
+            if result is not None:
+                value, ts, _, _ = result
+                items[(category, key)] = _make_envelope(value, self._version, ts)
+        if not items:
+            return 0
+        rows = [(str(category), key, envelope) for (category, key), envelope in items.items()]
+        ts = f"'$.{_PAYLOAD_TS_KEY}'"
+        with self._lock, self._db:
+            imported = self._db.executemany(
+                "INSERT INTO state (category, key, envelope) VALUES (?, ?, ?) "
+                f"ON CONFLICT (category, key) DO UPDATE SET envelope = excluded.envelope WHERE json_extract(excluded.envelope, {ts}) > json_extract(state.envelope, {ts})",
+                rows,
+            ).rowcount
+        for category, key in items:
+            path = self._files._path_for(category, key)
+            path.unlink(missing_ok=True)
+            try:
+                path.parent.rmdir()
+            except OSError:
+                pass  # Not yet empty
+        return imported
+
 
 # ---------------------------------------------------------------------------
 # MqttBackend
@@ -388,8 +603,7 @@ class StateStore:
 
     Provides a unified interface for saving, loading and deleting persisted
     state.  Writes are dispatched to a background ``ThreadPoolExecutor``
-    (``max_workers=1``) so they never block the asyncio event loop, mirroring
-    the pattern used by :class:`~sigenergy2mqtt.metrics.metrics.Metrics`.
+    (``max_workers=1``) so they never block the asyncio event loop.
 
     The store is **degradation-safe**: if the MQTT backend is unavailable,
     disk operations continue normally.  If both are unavailable, operations
@@ -397,7 +611,7 @@ class StateStore:
     """
 
     def __init__(self) -> None:
-        self._disk: _DiskBackend | None = None
+        self._disk: _DiskBackend | _SqliteBackend | None = None
         self._mqtt: _MqttBackend = _MqttBackend()
         self._client: mqtt.Client | None = None
         self._executor: ThreadPoolExecutor | None = None
@@ -408,6 +622,19 @@ class StateStore:
         self._disk_primary: bool = True
         self._version: str = ""
         self._sync_timeout: float = 5.0
+        self._write_behind: float = 0.0
+        self._write_behind_threshold: int = 50
+        # Latest value of each key awaiting write-behind. Protected by _pending_lock.
+        self._pending: dict[tuple[Category | str, str], str] = {}
+        self._pending_lock = threading.Lock()
+        # The write-behind timer, always on _loop, whichever thread saved. Protected by _pending_lock.
+        self._flush_armed: bool = False
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Disk values of the preloaded categories, and the legacy root files that may hold
+        # keys missing from them. Protected by _pending_lock.
+        self._preloaded: dict[tuple[Category | str, str], tuple[str, int, bool, bool]] = {}
+        self._preloaded_categories: set[str] = set()
+        self._root_keys: set[str] = set()
 
     # ------------------------------------------------------------------
     # Properties
@@ -444,12 +671,23 @@ class StateStore:
 
         self._loop = asyncio.get_running_loop()
         self._loop_thread_id = threading.get_ident()
-        self._disk = _DiskBackend(state_path, self._version)
+        state_path = Path(state_path)
+        if persistence_config.disk_backend == "sqlite":
+            self._disk = _SqliteBackend(state_path, self._version)
+        else:
+            self._disk = _DiskBackend(state_path, self._version)
         self._mqtt_enabled = persistence_config.mqtt_redundancy
         self._disk_primary = persistence_config.disk_primary
         self._sync_timeout = persistence_config.sync_timeout
+        self._write_behind = persistence_config.write_behind_interval
+        self._write_behind_threshold = persistence_config.write_behind_threshold
         self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="persistence")
 
+        if isinstance(self._disk, _SqliteBackend):
+            migrated = await self._loop.run_in_executor(self._executor, self._disk.migrate)
+            if migrated:
+                logger.info(f"StateStore: migrated {migrated} state files into {_SqliteBackend.FILENAME}")
+
         if not self._mqtt_enabled:
             logger.info("StateStore: MQTT redundancy disabled — disk only")
             self._initialised = True
@@ -495,9 +733,15 @@ class StateStore:
 
     def shutdown(self) -> None:
         """Flush pending writes, disconnect the persistence MQTT client, and stop the executor."""
+        pending = self._take_pending()
         if self._executor:
+            if pending:
+                self._executor.submit(self._flush_sync_impl, pending)
             self._executor.shutdown(wait=True, cancel_futures=False)
             self._executor = None
+        if self._disk is not None:
+            self._disk.close()
+        self._forget_preloaded()
 
         if self._client:
             try:
@@ -514,14 +758,18 @@ class StateStore:
     # Core async API
     # ------------------------------------------------------------------
 
-    async def save(self, category: Category | str, key: str, value: str, *, stale_after: timedelta | None = None) -> None:
+    async def save(self, category: Category | str, key: str, value: str, *, stale_after: timedelta | None = None, flush: bool = False) -> None:
         """Persist *value* to both disk and MQTT (fire-and-forget via executor).
 
+        With write-behind enabled, the value is held in memory (replacing any
+        earlier value of the same key) until the pending values are flushed.
+
         Args:
             category:    Logical grouping (e.g. ``"sensor"``, ``"pvoutput"``, ``"config"``).
             key:         File/topic name within the category.
             value:       String value to persist.
             stale_after: Unused on save; present for API symmetry with :meth:`load`.
+            flush:       Write immediately, together with all other pending values.
         """
         from sigenergy2mqtt.config import active_config
 
@@ -529,9 +777,40 @@ class StateStore:
             if active_config.persistence_debug:
                 logger.debug(f"StateStore.save called before initialise — skipping {category}/{key}")
             return
+        self._fire_metric("state_store_save_request")
+        self._remember(category, key, value)
+        if self._write_behind > 0:
+            with self._pending_lock:
+                self._pending[(category, key)] = value
+                due = flush or len(self._pending) >= self._write_behind_threshold
+            if due:
+                await self.flush()
+            else:
+                self._arm_flush()
+            return
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(self._executor, self._save_sync_impl, category, key, value)
 
+    async def flush(self) -> None:
+        """Write all values awaiting write-behind now."""
+        if not self._initialised or self._executor is None:
+            return
+        pending = self._take_pending()
+        if pending:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self._flush_sync_impl, pending)
+
+    async def preload(self, *categories: Category | str) -> None:
+        """Read every key of *categories* from disk into memory, so that later loads need not read them one by one.
+
+        Call once the store is initialised and before the sensors that load
+        their state are constructed.
+        """
+        if not self._initialised or self._executor is None:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._preload_sync_impl, categories)
+
     async def load(self, category: Category | str, key: str, *, stale_after: timedelta | None = None, validator: Callable[[str], bool] | None = None) -> str | None:
         """Load a persisted value, applying staleness check and optional validator.
 
@@ -570,6 +849,8 @@ class StateStore:
         """
         if not self._initialised or self._executor is None:
             return
+        self._discard_pending(category, key)
+        self._remember(category, key, None)
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(self._executor, self._delete_sync_impl, category, key)
 
@@ -582,6 +863,8 @@ class StateStore:
         """
         if not self._initialised or self._executor is None:
             return
+        self._take_pending()
+        self._forget_preloaded()
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(self._executor, self._clean_all_sync_impl)
 
@@ -595,7 +878,8 @@ class StateStore:
         When called from a synchronous context while an asyncio event loop is
         running (e.g. from :meth:`~sigenergy2mqtt.config.config.Config.reload`),
         uses :func:`asyncio.run_coroutine_threadsafe` to submit the work.
-        Otherwise falls back to direct execution.
+        Otherwise falls back to direct execution, which is never deferred by
+        write-behind.
         """
         if not self._initialised or self._executor is None:
             return
@@ -608,6 +892,9 @@ class StateStore:
                 future.cancel()
                 logger.warning(f"StateStore.save_sync failed for {category}/{key}: {exc!r}")
         else:
+            self._fire_metric("state_store_save_request")
+            self._discard_pending(category, key)
+            self._remember(category, key, value)
             self._save_sync_impl(category, key, value)
 
     def load_sync(
@@ -650,8 +937,135 @@ class StateStore:
                 future.cancel()
                 logger.warning(f"StateStore.delete_sync failed for {category}/{key}: {exc!r}")
         else:
+            self._discard_pending(category, key)
+            self._remember(category, key, None)
             self._delete_sync_impl(category, key)
 
+    # ------------------------------------------------------------------
+    # Write-behind
+    # ------------------------------------------------------------------
+
+    def _arm_flush(self) -> None:
+        """Schedule a flush of the pending values, if one is not already scheduled.
+
+        The flush is due after the write-behind interval, or at local midnight
+        if that is sooner, so that daily values are never held across the day
+        boundary. The timer runs on the store's own event loop, not that of the
+        (device) thread that saved, which may stop before the timer is due; if
+        the store's loop is not running, the values are written now.
+        """
+        with self._pending_lock:
+            if self._flush_armed:
+                return
+            self._flush_armed = True
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        delay = min(self._write_behind, (midnight - now).total_seconds())
+        loop = self._loop
+        if threading.get_ident() == self._loop_thread_id:
+            self._schedule_flush(delay)
+            return
+        if loop is not None and loop.is_running():
+            try:
+                loop.call_soon_threadsafe(self._schedule_flush, delay)
+                return
+            except RuntimeError as exc:
+                logger.debug(f"StateStore: could not schedule write-behind flush ({exc}) — writing now")
+        self._flush_due()
+
+    def _schedule_flush(self, delay: float) -> None:
+        """Start the write-behind timer; called on the store's event loop."""
+        assert self._loop is not None
+        with self._pending_lock:
+            # Not if the pending values were taken (or the timer started) since the flush was armed
+            if self._flush_armed and self._flush_handle is None:
+                self._flush_handle = self._loop.call_later(delay, self._flush_due)
+
+    def _flush_due(self) -> None:
+        """Timer callback: hand the pending values to the executor to be written."""
+        pending = self._take_pending()
+        if pending and self._executor is not None:
+            self._executor.submit(self._flush_sync_impl, pending)
+
+    def _take_pending(self) -> dict[tuple[Category | str, str], str]:
+        """Remove and return all pending values, cancelling any scheduled flush."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            handle, self._flush_handle = self._flush_handle, None
+            self._flush_armed = False
+        if handle is not None:
+            if threading.get_ident() == self._loop_thread_id:
+                handle.cancel()
+            else:
+                # TimerHandle.cancel() is not thread-safe; a timer that fires first only flushes early
+                try:
+                    assert self._loop is not None
+                    self._loop.call_soon_threadsafe(handle.cancel)
+                except RuntimeError:
+                    pass
+        return pending
+
+    def _discard_pending(self, category: Category | str, key: str) -> None:
+        """Forget any pending value of *category*/*key*, so that it can no longer overwrite a newer write or a delete."""
+        with self._pending_lock:
+            self._pending.pop((category, key), None)
+
+    # ------------------------------------------------------------------
+    # Preloading
+    # ------------------------------------------------------------------
+
+    def _preload_sync_impl(self, categories: tuple[Category | str, ...]) -> None:
+        """Read the preloaded categories from disk; called from the ThreadPoolExecutor."""
+        assert self._disk is not None
+        t0 = time.perf_counter()
+        loaded: dict[tuple[Category | str, str], tuple[str, int, bool, bool]] = {}
+        complete: set[str] = set()
+        for category in categories:
+            try:
+                values = self._disk.load_category(category)
+            except _DISK_ERRORS as exc:
+                logger.warning(f"StateStore: preload failed for {category}: {exc}")
+                continue
+            loaded.update(((category, key), result) for key, result in values.items())
+            complete.add(str(category))
+        try:
+            root_keys = self._disk.root_keys()
+        except OSError as exc:
+            logger.warning(f"StateStore: preload failed for legacy state files: {exc}")
+            return
+        with self._pending_lock:
+            self._preloaded.update(loaded)
+            self._preloaded_categories.update(complete)
+            self._root_keys = set(root_keys)
+        logger.info(f"StateStore: preloaded {len(loaded)} values from {len(complete)} categories in {(time.perf_counter() - t0) * 1000:.1f}ms")
+
+    def _preloaded_value(self, category: Category | str, key: str) -> tuple[bool, tuple[str, int, bool, bool] | None]:
+        """Return ``(True, result)`` if the disk value of *category*/*key* is known without reading it, else ``(False, None)``."""
+        with self._pending_lock:
+            if str(category) not in self._preloaded_categories:
+                return False, None
+            result = self._preloaded.get((category, key))
+            if result is None and key in self._root_keys:
+                return False, None  # Possibly in a legacy root file
+            return True, result
+
+    def _remember(self, category: Category | str, key: str, value: str | None) -> None:
+        """Keep a preloaded category in step with a save of *value* to *category*/*key*, or its deletion if *value* is ``None``."""
+        with self._pending_lock:
+            if str(category) not in self._preloaded_categories:
+                return
+            if value is None:
+                self._preloaded.pop((category, key), None)
+                self._root_keys.discard(key)
+            else:
+                self._preloaded[(category, key)] = (value, int(time.time()), False, False)
+
+    def _forget_preloaded(self) -> None:
+        with self._pending_lock:
+            self._preloaded = {}
+            self._preloaded_categories = set()
+            self._root_keys = set()
+
     def _accept(self, value: str, ts: int, cutoff: int | None, validator: Callable[[str], bool] | None) -> bool:
         from sigenergy2mqtt.config import active_config
 
@@ -668,7 +1082,8 @@ class StateStore:
     def _load_from_backend(self, backend: str, category: Category | str, key: str) -> tuple[str, int, bool, bool] | None:
         if backend == "disk":
             assert self._disk is not None
-            return self._disk.load(category, key)
+            known, result = self._preloaded_value(category, key)
+            return result if known else self._disk.load(category, key)
         elif backend == "mqtt" and self._mqtt_enabled:
             res = self._mqtt.load(category, key)
             if res is not None:
@@ -704,10 +1119,13 @@ class StateStore:
         error = False
         try:
             self._disk.save(category, key, value)
-        except (OSError, ValueError) as exc:
+        except _DISK_ERRORS as exc:
             error = True
             logger.warning(f"StateStore: disk save failed for {category}/{key}: {exc}")
+        self._replicate(category, key, value, error, t0)
 
+    def _replicate(self, category: Category | str, key: str, value: str, error: bool, t0: float) -> None:
+        """Publish a value just written to disk to MQTT, and record the outcome of the save started at *t0*."""
         if self._mqtt_enabled and self._client is not None:
             try:
                 self._mqtt.publish(self._client, category, key, value)
@@ -721,6 +1139,28 @@ class StateStore:
         else:
             self._fire_metric("state_store_save", elapsed)
 
+    def _flush_sync_impl(self, pending: dict[tuple[Category | str, str], str]) -> None:
+        """Write the pending values taken by a flush; called from the ThreadPoolExecutor."""
+        from sigenergy2mqtt.config import active_config
+
+        if isinstance(self._disk, _SqliteBackend):
+            # Group commit: one transaction for all values, each charged an equal share of its time.
+            t0 = time.perf_counter()
+            error = False
+            try:
+                self._disk.save_many(pending)
+            except _DISK_ERRORS as exc:
+                error = True
+                logger.warning(f"StateStore: disk save failed for {len(pending)} write-behind values: {exc}")
+            share = (time.perf_counter() - t0) / len(pending)
+            for (category, key), value in pending.items():
+                self._replicate(category, key, value, error, time.perf_counter() - share)
+        else:
+            for (category, key), value in pending.items():
+                self._save_sync_impl(category, key, value)
+        if active_config.persistence_debug:
+            logger.debug(f"StateStore: flushed {len(pending)} write-behind values")
+
     def _load_sync_impl(
         self,
         category: Category | str,
@@ -733,6 +1173,16 @@ class StateStore:
 
         assert self._disk is not None
 
+        with self._pending_lock:
+            pending = self._pending.get((category, key))
+        if pending is not None:
+            # Not yet written, so newer than anything held by the backends.
+            accepted = self._accept(pending, int(time.time()), None, validator)
+            if accepted and active_config.persistence_debug:
+                logger.debug(f"StateStore.load {category}/{key} from write-behind")
+            self._fire_metric("state_store_load", accepted)
+            return pending if accepted else None
+
         cutoff: int | None = None
         if stale_after is not None:
             cutoff = int(time.time() - stale_after.total_seconds())
@@ -748,6 +1198,7 @@ class StateStore:
                     if was_legacy or found_in_root:
                         if active_config.persistence_debug:
                             logger.debug(f"StateStore.load migrating legacy file {category}/{key}")
+                        self._remember(category, key, value)
                         self._save_sync_impl(category, key, value)
                         if found_in_root:
                             self._disk.delete_root_legacy(key)
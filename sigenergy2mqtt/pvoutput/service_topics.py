@@ -17,7 +17,8 @@ import paho.mqtt.client as mqtt
 from sigenergy2mqtt.common.output_field import OutputField
 from sigenergy2mqtt.common.status_field import StatusField
 from sigenergy2mqtt.config import active_config
-from sigenergy2mqtt.mqtt import MqttHandler
+from sigenergy2mqtt.devices import DeviceRegistry
+from sigenergy2mqtt.mqtt import MqttHandler, SensorEvent, sensor_event_bus
 from sigenergy2mqtt.persistence import Category, state_store
 
 from .service import Service
@@ -26,6 +27,18 @@ from .topic import Topic
 logger = logging.getLogger(__name__)
 
 
+def _local_topics() -> set[str]:
+    """Return the topics published by the sensors of this process."""
+    topics: set[str] = set()
+    for device in DeviceRegistry.all():
+        for sensor in device.get_all_sensors().values():
+            if sensor.publishable:
+                topics.add(sensor.state_topic)
+                if sensor.publish_raw:
+                    topics.add(sensor.raw_state_topic)
+    return topics
+
+
 class Calculation(Flag):
     """Bitwise flags describing how topic values are aggregated."""
 
@@ -404,22 +417,39 @@ class ServiceTopics(dict[str, Topic]):
             state_store.delete_sync(Category.PVOUTPUT, self._persistence_key)
 
     def subscribe(self, mqtt_client: mqtt.Client, mqtt_handler: MqttHandler) -> None:
-        """Subscribe each registered topic to MQTT updates.
+        """Subscribe each registered topic to updates.
+
+        Topics published by sensors in this process are subscribed on the
+        sensor event bus; only externally sourced topics are subscribed on
+        the broker.
 
         Args:
             mqtt_client: MQTT client used to create subscriptions.
             mqtt_handler: MQTT handler used to register callbacks.
         """
+        local_topics = _local_topics() if self.enabled else set()
         for topic in self.keys():
             if self.enabled:
                 if topic.startswith("__ha_sensor__:"):
                     logger.debug(f"{self._service.log_identity} Skipping MQTT subscription for Home Assistant Supervisor source {topic} ({self._name})")
                     continue
+                if topic in local_topics:
+                    sensor_event_bus.subscribe(topic, self.handle_event, mqtt_handler.loop)
+                    logger.debug(f"{self._service.log_identity} Subscribed to sensor events for topic {topic} to record {self._name}")
+                    continue
                 result = mqtt_handler.register(mqtt_client, topic, self.handle_update)
                 logger.debug(f"{self._service.log_identity} Subscribed to topic {topic} to record {self._name} ({result=})")
             else:
                 logger.debug(f"{self._service.log_identity} Not subscribing to topic {topic} because {self._name} uploading is disabled")
 
+    async def handle_event(self, event: SensorEvent) -> bool:
+        """Handle a state published by a sensor in this process.
+
+        Args:
+            event: The published state.
+        """
+        return await self.handle_update(None, None, event.payload, event.topic, None)
+
     async def handle_update(self, modbus_client: Any, mqtt_client: mqtt.Client | None, value: float | str, topic: str, handler: MqttHandler | None) -> bool:
         """Handle a new MQTT value and update aggregate state.
 
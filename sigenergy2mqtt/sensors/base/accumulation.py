@@ -113,15 +113,16 @@ class AccumulationSensor(DerivedSensor):
             except (ValueError, TypeError) as e:
                 logger.warning(f"{self.log_identity} Failed to parse persisted state for {self._state_persistence_key}: {e}")
 
-    async def _persist_current_total(self, new_total: float) -> None:
+    async def _persist_current_total(self, new_total: float, flush: bool = False) -> None:
         """Persist accumulated value.
 
         Args:
             new_total: New total value to persist
+            flush: Write immediately, even if the state store defers writes
         """
         async with self._current_total_lock:
             try:
-                await state_store.save(Category.SENSOR, self._state_persistence_key, str(new_total))
+                await state_store.save(Category.SENSOR, self._state_persistence_key, str(new_total), flush=flush)
             except PermissionError as e:
                 logger.warning(f"{self.log_identity} Failed to persist state for {self._state_persistence_key}: {e}")
             except (ValueError, TypeError, RuntimeError) as e:
@@ -424,7 +425,7 @@ class EnergyDailyAccumulationSensor(ResettableAccumulationSensor):
 
         async with self._state_at_midnight_lock:
             try:
-                await state_store.save(Category.SENSOR, self._midnight_persistence_key, str(midnight_state))
+                await state_store.save(Category.SENSOR, self._midnight_persistence_key, str(midnight_state), flush=True)
             except (ValueError, TypeError, RuntimeError) as e:
                 logger.warning(f"{self.log_identity} Failed to update midnight state for {self._midnight_persistence_key}: {e}")
 
@@ -600,7 +601,7 @@ class SimpleEnergyDailyAccumulationSensor(AccumulationSensor):
                 if self.debug_logging:
                     logger.debug(f"{self.log_identity} Day changed from {self._last_day_tuple} to {current_day}, resetting accumulation")
                 self._current_total = 0.0
-                self.run_persistence_coroutine(self._persist_current_total(0.0))
+                self.run_persistence_coroutine(self._persist_current_total(0.0, flush=True))
                 self._states.clear()
 
             self._last_day_tuple = current_day
@@ -76,9 +76,9 @@ class DerivedSensor(TypedSensorMixin, Sensor):
             # Re-apply sensor overrides so that an explicit debug-logging=False override will be respected
             self.apply_sensor_overrides()
 
-    def set_latest_state(self, state: float | str | list[bool] | list[int] | list[float]) -> bool:
+    def set_latest_state(self, state: float | str | list[bool] | list[int] | list[float], timestamp: float | None = None) -> bool:
         """Update latest state and track pending updates for publishing."""
-        updated = super().set_latest_state(state)
+        updated = super().set_latest_state(state, timestamp)
         if updated:
             self._pending_update = True
         return updated
@@ -15,7 +15,7 @@ from pymodbus.pdu import ExceptionResponse, ModbusPDU
 
 from sigenergy2mqtt.common import Constants, DeviceClass, InputType
 from sigenergy2mqtt.config import active_config
-from sigenergy2mqtt.modbus import ModbusClient, ModbusDataType
+from sigenergy2mqtt.modbus import BusPriority, ModbusClient, ModbusDataType
 
 from .constants import (
     DiscoveryKeys,
@@ -440,7 +440,7 @@ class WritableSensorMixin(TypedSensorMixin, ModbusSensorMixin, Sensor):
         """
         start = time.monotonic()
 
-        async with ModbusLockFactory.get(modbus_client).lock(2):  # max_wait=2
+        async with ModbusLockFactory.get(modbus_client).lock(2, priority=BusPriority.WRITE):  # max_wait=2
             if len(registers) == 1:
                 rr = await modbus_client.write_register(self.address, registers[0], device_id=device_id, no_response_expected=no_response_expected)
             else:
@@ -11,15 +11,20 @@ from pymodbus.exceptions import ModbusException
 from pymodbus.pdu import ExceptionResponse
 
 from sigenergy2mqtt.common import DeviceClass, InputType, Protocol, StateClass
+from sigenergy2mqtt.config import active_config
 from sigenergy2mqtt.config.models import RegisterAccess
 from sigenergy2mqtt.i18n import _t
 from sigenergy2mqtt.modbus import ModbusClient, ModbusDataType
+from sigenergy2mqtt.modbus.read_ahead import RegisterImage
 
 from .constants import SensorAttributeKeys
 from .mixins import ModbusSensorMixin, ReadableSensorMixin
 from .sensor import AvailabilityMixin, Sensor, TypedSensorMixin
 
 logger = logging.getLogger(__name__)
+
+_UNCHANGED = object()
+"""Pre-decoded marker for registers identical to those of the latest recorded state."""
 # =============================================================================
 
 
@@ -27,8 +32,23 @@ class ReadOnlySensor(TypedSensorMixin, ReadableSensorMixin, ModbusSensorMixin, S
     """Sensor that reads values from Modbus registers.
 
     This is the primary sensor type for monitoring device state.
+
+    When a scan group's read-ahead block has already been decoded, the poller
+    supplies this sensor's raw value via :meth:`pre_decode`, and the next read
+    consumes it instead of converting the cached registers again. If the
+    sensor's registers are identical to those of its latest recorded state
+    (see :meth:`pre_decode_unchanged`), the next read skips decoding and
+    sanity checking altogether.
+
+    Each state is recorded with the time its registers were read from the
+    device: for a value from the read-ahead cache, when the block was read.
     """
 
+    _pre_decoded: Any = None
+    _pre_decoded_registers: bytes | None = None
+    _pre_decoded_at: float | None = None
+    _latest_registers: tuple[bytes, Any] | None = None
+
     def __init__(
         self,
         name: str,
@@ -71,6 +91,73 @@ class ReadOnlySensor(TypedSensorMixin, ReadableSensorMixin, ModbusSensorMixin, S
             **kwargs,
         )
 
+    def pre_decode(self, value: float | int | str | list[bool] | list[int] | list[float], registers: bytes | None = None, read_at: float | None = None) -> None:
+        """Supply the raw value decoded from a read-ahead block for the next read to consume.
+
+        Args:
+            value:     The value decoded from this sensor's registers.
+            registers: The raw bytes of this sensor's registers, remembered for
+                       comparison by :meth:`pre_decode_unchanged` if ``value``
+                       becomes the latest recorded state.
+            read_at:   Wall-clock time the block was read, or ``None`` if unknown.
+        """
+        self._pre_decoded = value
+        self._pre_decoded_registers = registers
+        self._pre_decoded_at = read_at
+
+    def pre_decode_unchanged(self, registers: bytes, read_at: float | None = None) -> bool:
+        """Short-circuit the next read if the registers are identical to those of the latest recorded state.
+
+        Args:
+            registers: The raw bytes of this sensor's registers from a read-ahead block.
+            read_at:   Wall-clock time the block was read, or ``None`` if unknown.
+
+        Returns:
+            True if the registers are unchanged, in which case the next read
+            repeats the latest state without decoding or sanity checking it.
+        """
+        latest = self._latest_registers
+        if latest is None or latest[0] != registers or not self._states or self._states[-1][1] != latest[1]:
+            return False
+        self._pre_decoded = _UNCHANGED
+        self._pre_decoded_registers = None
+        self._pre_decoded_at = read_at
+        return True
+
+    def discard_pre_decoded(self) -> None:
+        """Discard any pre-decoded value that has not been consumed, so that it cannot be served stale."""
+        self._pre_decoded = None
+        self._pre_decoded_registers = None
+        self._pre_decoded_at = None
+
+    def _repeat_latest_state(self, timestamp: float | None = None) -> bool:
+        """Repeat the latest state for registers that are unchanged since it was recorded.
+
+        Follows the same ``repeated_state_publish_interval`` rules as
+        :meth:`set_latest_state` for a repeated value, but without decoding or
+        sanity checking the value again. Derived sensors are still updated,
+        because accumulation sensors act on every update of their source.
+
+        Args:
+            timestamp: Wall-clock time the registers were read, or ``None`` for now.
+
+        Returns:
+            True if the state was republished, False if it was suppressed as a repeat.
+        """
+        recorded, state = self._states[-1]
+        interval = active_config.repeated_state_publish_interval
+        now = time.time()
+        if interval == 0 or (interval > 0 and now - recorded >= interval):
+            self._states.append((now if timestamp is None else timestamp, state))
+            updated = True
+        else:
+            if self.debug_logging:
+                logger.debug(f"{self.log_identity} Unchanged registers suppressed (repeated_state_publish_interval={interval}): {state=}")
+            updated = False
+        if self.derived_sensors:
+            self._update_derived_sensors()
+        return updated
+
     async def _update_internal_state(self, **kwargs) -> bool | Exception | ExceptionResponse:
         """Read current value from Modbus registers.
 
@@ -129,6 +216,34 @@ class ReadOnlySensor(TypedSensorMixin, ReadableSensorMixin, ModbusSensorMixin, S
         """
         start = time.monotonic()
 
+        if self._pre_decoded is not None:
+            # Already decoded from this iteration's read-ahead block: no need to convert the cached registers again
+            value, registers, read_at = self._pre_decoded, self._pre_decoded_registers, self._pre_decoded_at
+            self._pre_decoded = self._pre_decoded_registers = self._pre_decoded_at = None
+            await modbus_client.record_read_ahead_hit()
+            elapsed = time.monotonic() - start
+
+            from sigenergy2mqtt.metrics import Metrics
+
+            await Metrics.modbus_read(self.count, elapsed)
+            await Metrics.modbus_decoded_read(unchanged=value is _UNCHANGED)
+            if value is _UNCHANGED:
+                if self.debug_logging:
+                    logger.debug(f"{self.log_identity} Registers unchanged since raw state value: {self._states[-1][1]}")
+                result = self._repeat_latest_state(read_at)
+            else:
+                if self.debug_logging:
+                    logger.debug(f"{self.log_identity} Using pre-decoded {self.data_type.name} raw state value: {value}")
+                result = self.set_latest_state(value, timestamp=read_at)
+                # Only registers that produced the latest recorded state can short-circuit the next read
+                self._latest_registers = (registers, value) if registers is not None and self._states and self._states[-1][1] == value else None
+            if self.debug_logging:
+                self._log_read_complete(elapsed, result)
+            return result
+
+        self._latest_registers = None
+        requested_at = time.time()
+
         # Perform read based on input type
         if self.input_type == InputType.HOLDING:
             rr = await modbus_client.read_holding_registers(self.address, count=self.count, device_id=self.device_address, trace=self.debug_logging)
@@ -151,19 +266,36 @@ class ReadOnlySensor(TypedSensorMixin, ReadableSensorMixin, ModbusSensorMixin, S
             # Convert registers to value and update state
             value = modbus_client.convert_from_registers(rr.registers, cast(Any, self.data_type))
             if self.debug_logging:
-                logger.debug(f"{self.log_identity} Converted registers {rr.registers} to {self.data_type.name} raw state value: {value}")
+                logger.debug(f"{self.log_identity} Converted registers {list(rr.registers)} to {self.data_type.name} raw state value: {value}")
             # set_latest_state returns True only when self._states was updated
             # (i.e. the value changed, or the repeat-publish interval has elapsed).
             # Returning False here causes get_state() to return None, which
             # suppresses MQTT publication for unchanged repeated values while
             # still allowing derived sensors to evaluate their own state.
-            result = self.set_latest_state(value)
+            result = self.set_latest_state(value, timestamp=self._read_time(modbus_client, requested_at))
 
         if self.debug_logging:
             self._log_read_complete(elapsed, result)
 
         return result
 
+    def _read_time(self, modbus_client: ModbusClient, requested_at: float) -> float:
+        """Return when the registers just read were read from the device.
+
+        A read served from the read-ahead cache returns registers that were read
+        when the cache was filled, before this read was requested.
+
+        Args:
+            modbus_client: The Modbus client that served the read.
+            requested_at:  Wall-clock time the read was requested.
+        """
+        image = modbus_client.register_image(self.device_address, self.input_type)
+        if isinstance(image, RegisterImage) and image.is_valid(self.address, self.count):
+            filled_at = image.filled_at(self.address)
+            if filled_at is not None and filled_at <= requested_at:
+                return filled_at
+        return time.time()
+
     def _log_read_complete(self, elapsed: float, result: bool) -> None:
         """Log completion of Modbus read.
 
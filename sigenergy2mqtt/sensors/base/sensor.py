@@ -10,17 +10,19 @@ import logging
 import re
 import time
 from collections import deque
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import paho.mqtt.client as mqtt
 from pymodbus.exceptions import ModbusException
 from pymodbus.pdu import ExceptionResponse
 
-from sigenergy2mqtt.common import DeviceClass, Protocol, StateClass
+from sigenergy2mqtt.common import DeviceClass, Protocol, ScanScheduler, StateClass
 from sigenergy2mqtt.config import active_config
 from sigenergy2mqtt.config.models import RegisterAccess
 from sigenergy2mqtt.i18n import _t
 from sigenergy2mqtt.modbus import ModbusClient, ModbusDataType
+from sigenergy2mqtt.mqtt import MqttHandler, sensor_event_bus
 from sigenergy2mqtt.persistence import Category, state_store
 
 from .constants import _DEFAULT_STATE_HISTORY_SIZE, DiscoveryKeys, SensorAttribute, SensorAttributeKeys, _sanitize_path_component
@@ -154,12 +156,12 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
 
         # Public attributes
         self.derived_sensors: dict[str, DerivedSensor] = {}
-        self.force_publish: bool = False
+        self._force_publish: bool = False
         self.name: str = str(self[DiscoveryKeys.NAME])
         self.object_id: str = object_id
         self.parent_device: Any = None
         self.precision: int | None = precision
-        self.sleeper_task: asyncio.Task[None] | None = None
+        self.sleeper_task: asyncio.Future[None] | None = None
         self.state_class: StateClass | None = state_class
         self.unit: str | None = unit
         self.unique_id: str = unique_id
@@ -230,6 +232,18 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
         """Get the device class of this sensor."""
         return cast(DeviceClass, self[DiscoveryKeys.DEVICE_CLASS])
 
+    @property
+    def force_publish(self) -> bool:
+        """Check if this sensor should be published on the next poll regardless of its scan interval."""
+        return self._force_publish
+
+    @force_publish.setter
+    def force_publish(self, value: bool):
+        """Set whether this sensor should be published on the next poll, waking its idle scan group."""
+        self._force_publish = value
+        if value and self.sleeper_task is not None:
+            ScanScheduler.wake(self.sleeper_task)
+
     @property
     def gain(self) -> float:
         """Get the gain multiplier for this sensor (default 1.0)."""
@@ -351,6 +365,8 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
         else:
             self._publishable = value
             logger.debug(f"{self.log_identity}.publishable set to {value}")
+            if value and self.sleeper_task is not None:
+                ScanScheduler.wake(self.sleeper_task)
 
     @property
     def monitorable(self) -> bool:
@@ -923,10 +939,17 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
             logger.debug(f"{self.log_identity} Publishing state={state} to topic {self[DiscoveryKeys.STATE_TOPIC]}")
 
         # Don't catch exceptions here - they will be handled by the caller
-        published = self._publish_message(mqtt_client, cast(str, self[DiscoveryKeys.STATE_TOPIC]), f"{state}", self._qos, self._retain)
-        await Metrics.mqtt_publish_attempt(physical_publish=published)
-        if not published:
-            await Metrics.mqtt_publish_failure()
+        if isinstance(mqtt_client.user_data_get(), MqttHandler):
+            # The publish metrics are recorded when the broker acknowledges (or fails to acknowledge) the state
+            published = self._publish_message(mqtt_client, cast(str, self[DiscoveryKeys.STATE_TOPIC]), f"{state}", self._qos, self._retain, on_complete=self._record_state_publish)
+        else:
+            published = self._publish_message(mqtt_client, cast(str, self[DiscoveryKeys.STATE_TOPIC]), f"{state}", self._qos, self._retain)
+            await self._record_state_publish(published)
+
+        # Deliver the state to in-process subscribers (e.g. InfluxDB) without a round trip through the broker,
+        # timestamped with when it was read rather than now
+        read_at = self.latest_time or None
+        sensor_event_bus.publish(cast(str, self[DiscoveryKeys.STATE_TOPIC]), state, self.unique_id, cast(str, self[DiscoveryKeys.OBJECT_ID]), read_at)
 
         # Publish raw state if configured
         if self.publish_raw:
@@ -934,6 +957,7 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
                 logger.debug(f"{self.log_identity} Publishing raw state={self.latest_raw_state} to topic {self[DiscoveryKeys.RAW_STATE_TOPIC]}")
             try:
                 self._publish_message(mqtt_client, cast(str, self[DiscoveryKeys.RAW_STATE_TOPIC]), f"{self.latest_raw_state}", self._qos, self._retain, timeout=0.1)
+                sensor_event_bus.publish(cast(str, self[DiscoveryKeys.RAW_STATE_TOPIC]), self.latest_raw_state, self.unique_id, cast(str, self[DiscoveryKeys.OBJECT_ID]), read_at)
             except ValueError:
                 logger.warning(f"{self.log_identity} Failed to publish raw state={self.latest_raw_state} to topic {self[DiscoveryKeys.RAW_STATE_TOPIC]} - Queue full")
             except RuntimeError:
@@ -941,9 +965,35 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
 
         return published
 
-    def _publish_message(self, mqtt_client: mqtt.Client, topic: str, payload: bytes | str, qos: int = 0, retain: bool = False, timeout: float | None = 0.5) -> bool:
+    async def _record_state_publish(self, published: bool) -> None:
+        """Record the outcome of a state publish in the MQTT publish metrics.
+
+        Args:
+            published: True if the state was published
+        """
+        from sigenergy2mqtt.metrics import Metrics
+
+        await Metrics.mqtt_publish_attempt(physical_publish=published)
+        if not published:
+            await Metrics.mqtt_publish_failure()
+
+    def _publish_message(
+        self,
+        mqtt_client: mqtt.Client,
+        topic: str,
+        payload: bytes | str,
+        qos: int = 0,
+        retain: bool = False,
+        timeout: float | None = 0.5,
+        on_complete: Callable[[bool], Any] | None = None,
+    ) -> bool:
         """Publish a message to MQTT.
 
+        When the client's userdata is an :class:`MqttHandler` (as for all
+        clients created by ``mqtt_setup``), the message is published through
+        the handler's pipeline and this method returns without waiting for
+        the broker. Otherwise, it waits for the message to be published.
+
         Args:
             mqtt_client: MQTT client for publishing
             topic: The topic that the message should be published on.
@@ -952,10 +1002,15 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
             retain: If set to true, the message will be set as the "last
                     known good"/retained message for the topic.
             timeout: The timeout in seconds to wait for the message to be
-                     published. If None, it will never timeout. If negative,
-                     it will not wait for the message to be published.
+                     published when there is no MqttHandler. If None, it will
+                     never timeout. If negative, it will not wait for the
+                     message to be published.
+            on_complete: Passed to :meth:`MqttHandler.publish` to receive the
+                     outcome once the broker acknowledges the publish (or it
+                     is rejected). Ignored when there is no MqttHandler.
         Returns:
-            True if successfully published
+            True if successfully published or, with an MqttHandler, accepted
+            into the publish pipeline
 
 
         :raises ValueError: if the message was not queued due to the outgoing
@@ -964,6 +1019,16 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
         :raises RuntimeError: if the message was not published for another
             reason.
         """
+        handler = mqtt_client.user_data_get()
+        if isinstance(handler, MqttHandler):
+            outcome = handler.publish(mqtt_client, topic, payload, qos=qos, retain=retain, on_complete=on_complete)
+            accepted = not outcome.done() or outcome.result()
+            if not accepted:
+                logger.warning(f"{self.log_identity} Failed to publish state={payload} to topic {topic} - not accepted by the publish pipeline")
+            elif self.debug_logging:
+                logger.debug(f"{self.log_identity} Queued     state={payload} to topic {topic}")
+            return accepted
+
         message = mqtt_client.publish(topic, payload, qos=qos, retain=retain)
         if timeout is None or timeout >= 0:
             message.wait_for_publish(timeout=timeout)
@@ -1096,11 +1161,12 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
                 except (ValueError, TypeError, RuntimeError) as error:
                     logger.warning(f"{self.log_identity} Failed to update derived sensor {sensor.log_identity} source values: {error!r}")
 
-    def set_latest_state(self, state: float | str | list[bool] | list[int] | list[float]) -> bool:
+    def set_latest_state(self, state: float | str | list[bool] | list[int] | list[float], timestamp: float | None = None) -> bool:
         """Update latest state and propagate to derived sensors.
 
         Args:
             state: The new state value
+            timestamp: Wall-clock time the state was read, or None for now
 
         Returns:
             True if state was updated and should be published, False if state was suppressed as a repeated
@@ -1111,13 +1177,13 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
 
         if not state_is_repeated:
             # Value has changed – always record and publish.
-            self.set_state(state)
+            self.set_state(state, timestamp)
             updated = True
         else:
             interval = active_config.repeated_state_publish_interval
             if interval == 0:
                 # Always republish even when the value is unchanged.
-                self.set_state(state)
+                self.set_state(state, timestamp)
                 updated = True
             elif interval < 0:
                 # Never republish an unchanged value.
@@ -1131,7 +1197,7 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
                 if elapsed >= interval:
                     if self.debug_logging:
                         logger.debug(f"{self.log_identity} Repeated state republished after {elapsed:.1f}s (repeated_state_publish_interval={interval}): {state=}")
-                    self.set_state(state)
+                    self.set_state(state, timestamp)
                     updated = True
                 else:
                     if self.debug_logging:
@@ -1158,17 +1224,18 @@ class Sensor(SensorDebuggingMixin, dict[str, SensorAttribute], metaclass=abc.ABC
             return active_config.sensor_overrides[identifier]
         return None
 
-    def set_state(self, state: float | str | list[bool] | list[int] | list[float]) -> None:
+    def set_state(self, state: float | str | list[bool] | list[int] | list[float], timestamp: float | None = None) -> None:
         """Update latest state without propagating to derived sensors.
 
         Args:
             state: The new state value
+            timestamp: Wall-clock time the state was read, or None for now
         """
         if isinstance(state, str) or (isinstance(state, (int, float)) and self.sanity_check.is_sane(state, list(self._states))):
             if self.debug_logging:
                 logger.debug(f"{self.log_identity} Acquired raw state={state}")
 
-            self._states.append((time.time(), state))
+            self._states.append((time.time() if timestamp is None else timestamp, state))
 
     # =========================================================================
     # Helper Methods
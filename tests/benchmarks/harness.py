@@ -0,0 +1,394 @@
+"""
+harness.py - Shared infrastructure for the end-to-end benchmarks.
+
+Provides:
+
+* :func:`modbus_test_server`: runs :func:`tests.utils.modbus_test_server.run_async_server`
+  in a child process on loopback, so that the simulator's CPU time and memory
+  are not attributed to the code being measured.
+* :class:`SimulatedModbusClient`: an in-process stand-in for a Modbus host,
+  serving the register values the test server would, with configurable
+  latency and jitter, for benchmarks that simulate more hosts than it is
+  practical to run servers for.
+* :class:`LoopbackMqttClient`: an in-process stand-in for the paho client that
+  acknowledges every publish on the next event loop iteration, so the real
+  :class:`~sigenergy2mqtt.mqtt.MqttHandler` publish pipeline runs without a
+  broker.
+* :class:`CycleRecorder` and :class:`TimedSensorGroupPoller`: record the
+  latency of every poll cycle of the real
+  :class:`~sigenergy2mqtt.devices.base.poller.SensorGroupPoller`.
+* :class:`LoopLagMonitor`: samples how late an event loop runs its callbacks.
+* :func:`write_results` and :func:`compare_results`: save results as JSON and
+  compare them with the results saved from another commit.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from random import uniform
+from typing import Any
+
+from paho.mqtt.client import MQTTMessageInfo
+from paho.mqtt.enums import MQTTErrorCode
+from pymodbus import __version__ as pymodbus_version
+from pymodbus.pdu import ExceptionResponse, ModbusPDU
+from pymodbus.pdu.register_message import ReadHoldingRegistersResponse, ReadInputRegistersResponse
+
+from sigenergy2mqtt.common import ScanScheduler
+from sigenergy2mqtt.config import Config, _swap_active_config
+from sigenergy2mqtt.devices import Device
+from sigenergy2mqtt.devices.base.poller import SensorGroupPoller
+from sigenergy2mqtt.devices.base.scan_groups import create_sensor_scan_groups
+from sigenergy2mqtt.modbus import ModbusClient
+from sigenergy2mqtt.sensors.base import ReadableSensorMixin, Sensor
+
+# Results that are marked better or worse when comparing results
+HIGHER_IS_BETTER = ("sensor_reads_per_s", "publishes_per_s", "batches_per_s", "points_per_s")
+LOWER_IS_BETTER = (
+    "cpu_per_tick_ms",
+    "cpu_utilisation",
+    "cycle_p50_ms",
+    "cycle_p99_ms",
+    "loop_lag_p50_ms",
+    "loop_lag_p99_ms",
+    "loop_lag_max_ms",
+    "peak_rss_mb",
+    "wire_bytes_per_batch",
+    "cpu_per_batch_ms",
+    "write_p50_ms",
+    "write_p99_ms",
+)
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Return the *q*-th percentile (0-100) of *samples* by the nearest-rank method, or 0 when empty."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, min(len(ordered), round(q / 100.0 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process, in MiB."""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+def _serve(port: int, latency_ms: tuple[int, int, int]) -> None:
+    """Child process entry point: run the Modbus test server until terminated."""
+    from tests.utils import modbus_test_server
+
+    logging.disable(logging.WARNING)
+    modbus_test_server.DELAY_MIN, modbus_test_server.DELAY_AVG, modbus_test_server.DELAY_MAX = latency_ms
+
+    class _NoMqttClient:
+        def __init__(self):
+            self._user_data = modbus_test_server.CustomMqttHandler(asyncio.get_running_loop())
+
+        def user_data_get(self):
+            return self._user_data
+
+        def subscribe(self, topic):
+            return (MQTTErrorCode.MQTT_ERR_SUCCESS, 1)
+
+    async def _run() -> None:
+        await modbus_test_server.run_async_server(_NoMqttClient(), modbus_client=None, use_simplified_topics=False, host="127.0.0.1", port=port, log_level=logging.WARNING)
+
+    with _swap_active_config(Config()):
+        asyncio.run(_run())
+
+
+@contextlib.contextmanager
+def modbus_test_server(latency_ms: tuple[int, int, int] = (0, 0, 0), timeout: float = 120.0) -> Iterator[int]:
+    """Run the Modbus test server in a child process and yield its loopback port.
+
+    The server simulates the plant, a hybrid inverter (device 1), a PV inverter
+    (device 3), a DC charger (device 1), an AC charger (device 2), a PID (device
+    241) and a PSS (device 242), each populated with valid random values.
+
+    Args:
+        latency_ms: The ``(min, average, max)`` simulated response latency, in milliseconds.
+        timeout: Seconds to wait for the server to accept connections.
+    """
+    from tests.utils.modbus_test_server import wait_for_server_start
+
+    port = free_port()
+    # Forked before any threads are started, so that the child does not need to re-parse the configuration
+    process = multiprocessing.get_context("fork").Process(target=_serve, args=(port, latency_ms), daemon=True)
+    process.start()
+    try:
+        if not asyncio.run(wait_for_server_start("127.0.0.1", port, timeout=timeout)):
+            raise RuntimeError(f"Modbus test server did not start on port {port} within {timeout}s (exitcode={process.exitcode})")
+        yield port
+    finally:
+        process.terminate()
+        process.join(timeout=10)
+
+
+def register_values(sensors: dict[str, Sensor]) -> dict[int, dict[int, int]]:
+    """Return the register values the Modbus test server would serve for *sensors*, by device address and register address.
+
+    Addresses that are not covered by a sensor are absent, so that reading them
+    is answered with ILLEGAL DATA ADDRESS as by the test server.
+    """
+    from tests.utils.modbus_test_server import CustomDataBlock, LatencyBudget
+
+    blocks: dict[int, CustomDataBlock] = {}
+    for sensor in sorted(
+        (s for s in sensors.values() if hasattr(s, "address") and s["platform"] != "button" and not hasattr(s, "alarms")),
+        key=lambda s: (s.device_address, s.address),
+    ):
+        if sensor.device_address not in blocks:
+            blocks[sensor.device_address] = CustomDataBlock(sensor.device_address, None, LatencyBudget())  # type: ignore[arg-type]
+        blocks[sensor.device_address].add_sensor(sensor)
+    return {
+        device_address: {address + i: block._initial_registers.get(address + i, 0) for address, sensor in block.addresses.items() for i in range(sensor.count)}
+        for device_address, block in blocks.items()
+    }
+
+
+class SimulatedModbusClient(ModbusClient):
+    """In-process stand-in for a Modbus TCP host, serving fixed register values.
+
+    All of :class:`~sigenergy2mqtt.modbus.ModbusClient` (read-ahead, register
+    images and metrics) is used; only the transport is replaced. Requests are
+    answered one at a time, as over one TCP connection, after a simulated
+    latency of ``latency`` ± ``jitter`` seconds. Reads of registers that are not
+    in *registers* are answered with ILLEGAL DATA ADDRESS, and anything other
+    than a register read with ILLEGAL FUNCTION.
+
+    Args:
+        registers: Register values by device address and register address (see :func:`register_values`).
+        latency:   Mean simulated response time, in seconds.
+        jitter:    Maximum deviation from ``latency``, in seconds.
+    """
+
+    def __init__(self, registers: dict[int, dict[int, int]], latency: float = 0.0, jitter: float = 0.0):
+        super().__init__("127.0.0.1", port=502)
+        self._registers = registers
+        self._latency = latency
+        self._jitter = jitter
+        self._bus: asyncio.Lock | None = None
+        self._online = False
+        self.requests = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._online
+
+    async def connect(self) -> bool:
+        self._online = True
+        return True
+
+    def close(self) -> None:
+        self._online = False
+
+    async def execute(self, no_response_expected: bool, request: ModbusPDU) -> ModbusPDU:  # type: ignore[override]
+        if self._bus is None:
+            self._bus = asyncio.Lock()  # Created on first use, so that it belongs to the loop of the device thread
+        async with self._bus:
+            await asyncio.sleep(max(0.0, self._latency + uniform(-self._jitter, self._jitter)))
+            self.requests += 1
+            match request.function_code:
+                case 0x03:
+                    response = ReadHoldingRegistersResponse
+                case 0x04:
+                    response = ReadInputRegistersResponse
+                case _:
+                    return ExceptionResponse(request.function_code, exception_code=0x01, device_id=request.dev_id)
+            values = self._registers.get(request.dev_id, {})
+            try:
+                registers = [values[address] for address in range(request.address, request.address + request.count)]
+            except KeyError:
+                return ExceptionResponse(request.function_code, exception_code=0x02, device_id=request.dev_id)
+            return response(dev_id=request.dev_id, transaction_id=request.transaction_id, registers=registers)
+
+
+class LoopbackMqttClient:
+    """In-process stand-in for :class:`paho.mqtt.client.Client` that acknowledges every publish.
+
+    Publishes are encoded as paho would, counted, and acknowledged to the
+    :class:`~sigenergy2mqtt.mqtt.MqttHandler` on the next iteration of its
+    event loop, as paho does for a QoS 0 publish once it is written to the socket.
+    """
+
+    def __init__(self, handler: Any, loop: asyncio.AbstractEventLoop):
+        self._handler = handler
+        self._loop = loop
+        self._mid = 0
+        self.publishes = 0
+        self.payload_bytes = 0
+
+    def user_data_get(self) -> Any:
+        return self._handler
+
+    def is_connected(self) -> bool:
+        return True
+
+    def publish(self, topic: str, payload: bytes | str | None = None, qos: int = 0, retain: bool = False, properties: Any = None) -> MQTTMessageInfo:
+        encoded = payload.encode("utf-8") if isinstance(payload, str) else (payload or b"")
+        self._mid += 1
+        self.publishes += 1
+        self.payload_bytes += len(topic.encode("utf-8")) + len(encoded)
+        info = MQTTMessageInfo(self._mid)
+        info.rc = MQTTErrorCode.MQTT_ERR_SUCCESS
+        self._loop.call_soon(self._acknowledge, info, topic)
+        return info
+
+    def _acknowledge(self, info: MQTTMessageInfo, topic: str) -> None:
+        info._set_as_published()
+        self._handler.on_response(info.mid, topic, self)
+
+
+class CycleRecorder:
+    """Records the latency of each poll cycle of :class:`TimedSensorGroupPoller` instances on one event loop.
+
+    A cycle starts when a poller finds sensors due for publishing and ends when
+    it next waits on the :class:`~sigenergy2mqtt.common.ScanScheduler`.
+    """
+
+    def __init__(self) -> None:
+        self.cycles: list[float] = []
+        self._started: dict[asyncio.Task, float] = {}
+
+    def install(self) -> None:
+        """Hook the scheduler of the running event loop to end cycles."""
+        scheduler = ScanScheduler.get()
+        schedule = scheduler.schedule
+
+        def _schedule(delay: float | None) -> asyncio.Future[None]:
+            started = self._started.pop(asyncio.current_task(), None)  # type: ignore[arg-type]
+            if started is not None:
+                self.cycles.append(time.perf_counter() - started)
+            return schedule(delay)
+
+        scheduler.schedule = _schedule  # type: ignore[method-assign]
+
+    def start(self) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._started[task] = time.perf_counter()
+
+
+class TimedSensorGroupPoller(SensorGroupPoller):
+    """A :class:`SensorGroupPoller` that reports the start of each poll cycle to a :class:`CycleRecorder`."""
+
+    def __init__(self, device: Device, recorder: CycleRecorder) -> None:
+        super().__init__(device)
+        self._recorder = recorder
+
+    def _get_sensors_to_publish_now(self, next_publish_times: dict[ReadableSensorMixin, float], now: float, name: str, debug_logging: bool) -> list[ReadableSensorMixin]:
+        due_sensors = super()._get_sensors_to_publish_now(next_publish_times, now, name, debug_logging)
+        if due_sensors:
+            self._recorder.start()
+        return due_sensors
+
+
+class LoopLagMonitor:
+    """Samples how late the running event loop wakes a task that sleeps for ``interval`` seconds.
+
+    The lag is the time the loop was busy with other callbacks when the task was
+    due, which is also how late scan groups are started when their sensors are due.
+    """
+
+    def __init__(self, interval: float = 0.1) -> None:
+        self.interval = interval
+        self.samples: list[float] = []
+
+    async def run(self) -> None:
+        """Sample until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - due))
+
+
+def root_devices(sensors: dict[str, Sensor]) -> list[Device]:
+    """Return the top-level devices (those that are not a child of another device) owning *sensors*."""
+    devices: dict[int, Device] = {}
+    for sensor in sensors.values():
+        if isinstance(sensor.parent_device, Device):
+            devices[id(sensor.parent_device)] = sensor.parent_device
+    children: set[int] = set()
+    pending = list(devices.values())
+    while pending:
+        for child in pending.pop().children:
+            children.add(id(child))
+            pending.append(child)
+    return [device for key, device in devices.items() if key not in children]
+
+
+def schedule(device: Device, modbus_client: Any, mqtt_client: Any, recorder: CycleRecorder) -> list:
+    """Return the poll loops of *device*, as :meth:`Device.schedule` builds them, with each poll cycle timed."""
+    poller = TimedSensorGroupPoller(device, recorder)
+    return [poller.run(modbus_client, mqtt_client, name, *sensors) for name, sensors in create_sensor_scan_groups(device).items() if any(s.publishable for s in sensors)]
+
+
+def environment() -> dict[str, Any]:
+    """Describe the code and platform that produced a set of results."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "pymodbus": pymodbus_version,
+        "machine": platform.machine(),
+    }
+
+
+def write_results(path: Path | None, benchmark: str, parameters: dict[str, Any], results: Any) -> dict[str, Any]:
+    """Write *results* as JSON to *path* (or standard output when ``None``) and return the document."""
+    document = {"benchmark": benchmark, "environment": environment(), "parameters": parameters, "results": results}
+    text = json.dumps(document, indent=2)
+    if path is None:
+        print(text)
+    else:
+        path.write_text(text + "\n", encoding="utf-8")
+    return document
+
+
+def compare_results(baseline: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Return one line per numeric result comparing *current* with *baseline* (both as written by :func:`write_results`)."""
+
+    def _flatten(value: Any, prefix: str = "") -> dict[str, float]:
+        if isinstance(value, dict):
+            return {k: v for key, item in value.items() for k, v in _flatten(item, f"{prefix}{key}.").items()}
+        if isinstance(value, list):
+            return {k: v for index, item in enumerate(value) for k, v in _flatten(item, f"{prefix}{index}.").items()}
+        return {prefix.rstrip("."): float(value)} if isinstance(value, (int, float)) and not isinstance(value, bool) else {}
+
+    before = _flatten(baseline["results"])
+    after = _flatten(current["results"])
+    lines = [f"{baseline['environment'].get('commit')} -> {current['environment'].get('commit')}"]
+    for key, value in after.items():
+        if key not in before:
+            continue
+        change = (value - before[key]) / before[key] * 100.0 if before[key] else 0.0
+        name = key.rsplit(".", 1)[-1]
+        verdict = ""
+        if abs(change) >= 0.05 and name in HIGHER_IS_BETTER + LOWER_IS_BETTER:
+            verdict = " better" if (change > 0) == (name in HIGHER_IS_BETTER) else " worse"
+        lines.append(f"{key:>40}: {before[key]:12.3f} -> {value:12.3f} ({change:+7.1f}%){verdict}")
+    return lines
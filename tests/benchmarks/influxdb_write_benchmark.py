@@ -0,0 +1,223 @@
+"""
+influxdb_write_benchmark.py - Benchmark of writing a plant's states to InfluxDB.
+
+Starts a stand-in for the InfluxDB v2 write endpoint on loopback (in a child
+process, so that its CPU time is not attributed to the code being measured),
+which counts the bytes of every request on the wire, decompresses and counts
+the points it receives, and answers 204 after an optional simulated latency.
+
+Each batch holds one point for every publishable sensor of the plant, a hybrid
+and a PV inverter, a DC and an AC charger, a PID and a PSS, as
+:func:`tests.utils.modbus_sensors.get_sensor_instances` constructs them, as
+the InfluxDB service would write them after one poll of every sensor. Batches
+are serialised and written one at a time (as the background flusher does)
+in turn by:
+
+* ``before``: the previous write path, which serialised timestamps to the
+  second and posted the uncompressed batch through the ``requests`` session
+  from a worker thread.
+* ``after``: :meth:`~sigenergy2mqtt.influxdb.base.InfluxBase.execute_write`,
+  which posts the gzip-compressed batch, serialised at the configured
+  precision (``ms`` by default) and in the configured point schema
+  (``entity`` by default, or ``device`` to group the states of each device,
+  unit and timestamp into one point), over a pooled ``aiohttp`` session.
+
+Reported for each (and written as JSON):
+
+* ``batches_per_s`` / ``points_per_s``: batches and points (lines) accepted.
+* ``wire_bytes_per_batch``: request line, headers and body, as received.
+* ``cpu_per_batch_ms``: process CPU time to serialise and write one batch.
+* ``write_p50_ms`` / ``write_p99_ms``: wall time to write one batch.
+
+Usage::
+
+    python tests/benchmarks/influxdb_write_benchmark.py [--batches 500] [--latency-ms 0] [--precision ms] [--point-schema entity]
+        [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from random import uniform
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+    parser = argparse.ArgumentParser(description="Benchmark of writing a plant's states to a stand-in InfluxDB write endpoint.")
+    parser.add_argument("--batches", type=int, default=500, help="Batches to write with each write path (default: 500)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated InfluxDB response latency (default: 0)")
+    parser.add_argument("--precision", choices=["s", "ms", "us", "ns"], default="ms", help="Timestamp precision of the new write path (default: ms)")
+    parser.add_argument("--point-schema", choices=["entity", "device"], default="entity", help="Point schema of the new write path (default: entity)")
+    parser.add_argument("--output", type=Path, help="Write the JSON results to this file instead of standard output")
+    parser.add_argument("--compare", type=Path, help="Compare the results with those previously written to this file")
+    ARGS = parser.parse_args()
+    # Removed before the project imports, which parse the command line for configuration options
+    del sys.argv[1:]
+
+import requests
+from aiohttp import web
+
+from sigenergy2mqtt.config import Config, _swap_active_config, active_config
+from sigenergy2mqtt.influxdb.service import InfluxService
+from sigenergy2mqtt.persistence import state_store
+from tests.benchmarks.harness import compare_results, free_port, percentile, write_results
+from tests.utils.modbus_sensors import get_sensor_instances
+
+
+def _serve(port: int, latency_ms: float) -> None:
+    """Child process entry point: run the stand-in InfluxDB write endpoint until terminated."""
+    stats = {"requests": 0, "wire_bytes": 0, "points": 0}
+
+    async def write(request: web.Request) -> web.Response:
+        body = await request.read()  # Decompressed by aiohttp when Content-Encoding is gzip
+        stats["requests"] += 1
+        stats["points"] += body.count(b"\n") + 1 if body else 0
+        request_line = len(f"{request.method} {request.path_qs} HTTP/{request.version.major}.{request.version.minor}\r\n")
+        headers = sum(len(k) + len(v) + 4 for k, v in request.raw_headers) + 2
+        stats["wire_bytes"] += request_line + headers + (request.content_length or 0)
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000.0)
+        return web.Response(status=204)
+
+    async def get_stats(request: web.Request) -> web.Response:
+        return web.json_response(stats)
+
+    logging.disable(logging.WARNING)
+    app = web.Application()
+    app.router.add_post("/api/v2/write", write)
+    app.router.add_get("/stats", get_stats)
+    web.run_app(app, host="127.0.0.1", port=port, print=None, access_log=None)
+
+
+def _stats(base: str) -> dict:
+    return requests.get(f"{base}/stats", timeout=5).json()
+
+
+async def _plant_states() -> list[tuple[str, str, str, float]]:
+    """Return the measurement, entity ID, device ID and a value for each publishable sensor of the plant."""
+    sensors = await get_sensor_instances(pv_inverter_device_address=3)
+    return [
+        (
+            (sensor.get("unit_of_measurement") or active_config.influxdb.default_measurement).replace("/", "_"),
+            sensor["object_id"],
+            getattr(sensor.parent_device, "unique_id", None) or sensor.unique_id,  # The service tags sensors without one with the subscribing device
+            round(uniform(0.0, 10000.0), 2),
+        )
+        for sensor in sensors.values()
+        if getattr(sensor, "state_topic", None) and sensor.publishable
+    ]
+
+
+async def _batch(service: InfluxService, states: list[tuple[str, str, str, float]], grouped: bool) -> tuple[bytes, int]:
+    """Serialise one state of every sensor, read at the same time, as the service would; return the batch and its number of lines."""
+    now = time.time()
+    if not grouped:
+        lines = [service.to_line_protocol(measurement, {"entity_id": entity_id}, {"value": value}, now) for measurement, entity_id, _, value in states]
+    else:
+        for measurement, entity_id, device_id, value in states:
+            await service.write_grouped(measurement, {"device_id": device_id}, {entity_id: value}, now)
+        service._serialise_grouped_points()
+        lines, service._write_buffer = service._write_buffer, []
+    return "\n".join(lines).encode("utf-8"), len(lines)
+
+
+async def _legacy_write(service: InfluxService, data: bytes) -> bool:
+    """The previous v2 write path: an uncompressed post through the ``requests`` session from a worker thread."""
+    r = await asyncio.to_thread(service._session.post, service._write_url, headers=service._write_headers or {}, data=data, timeout=active_config.influxdb.write_timeout)
+    return r.status_code in (204, 200)
+
+
+async def _run(base: str, batches: int, precision: str, point_schema: str, legacy: bool) -> dict:
+    active_config.influxdb.precision = "s" if legacy else precision
+    grouped = not legacy and point_schema == "device"
+    service = InfluxService(plant_index=0)
+    service._writer_type = "v2_http"
+    service._write_url = f"{base}/api/v2/write?org=benchmark&bucket=benchmark&precision={active_config.influxdb.precision}"
+    service._write_headers = {"Authorization": "Token benchmark"}
+    service._online = True
+    states = await _plant_states()
+    write = (lambda data: _legacy_write(service, data)) if legacy else service.execute_write
+    try:
+        data, lines = await _batch(service, states, grouped)
+        assert await write(data), "Warm-up write failed"
+        before = await asyncio.to_thread(_stats, base)
+        latencies: list[float] = []
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        for _ in range(batches):
+            data, lines = await _batch(service, states, grouped)
+            started = time.perf_counter()
+            assert await write(data), "Write failed"
+            latencies.append((time.perf_counter() - started) * 1000.0)
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        after = await asyncio.to_thread(_stats, base)
+    finally:
+        await service.stop_flusher()
+        await service.close_write_session()
+        service._session.close()
+
+    received = after["points"] - before["points"]
+    assert received == batches * lines, f"Stand-in received {received} points, expected {batches * lines}"
+    return {
+        "states_per_batch": len(states),
+        "points_per_batch": lines,
+        "wall_s": round(wall, 3),
+        "batches_per_s": round(batches / wall, 2),
+        "points_per_s": round(received / wall, 2),
+        "wire_bytes_per_batch": round((after["wire_bytes"] - before["wire_bytes"]) / batches, 1),
+        "cpu_per_batch_ms": round(cpu * 1000.0 / batches, 3),
+        "write_p50_ms": round(percentile(latencies, 50), 3),
+        "write_p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    logging.disable(logging.WARNING)
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    # Forked before any threads are started, so that the child does not need to re-parse the configuration
+    process = multiprocessing.get_context("fork").Process(target=_serve, args=(port, args.latency_ms), daemon=True)
+    process.start()
+    try:
+        deadline = time.monotonic() + 30.0
+        while True:
+            try:
+                _stats(base)
+                break
+            except requests.RequestException:
+                if time.monotonic() > deadline or not process.is_alive():
+                    raise RuntimeError(f"InfluxDB stand-in did not start on port {port} (exitcode={process.exitcode})") from None
+                time.sleep(0.1)
+        with tempfile.TemporaryDirectory() as directory, _swap_active_config(Config()):
+            active_config.persistence.mqtt_redundancy = False
+            asyncio.run(state_store.initialise(Path(directory), active_config.persistence))
+            try:
+                results = {
+                    "before": asyncio.run(_run(base, args.batches, args.precision, args.point_schema, legacy=True)),
+                    "after": asyncio.run(_run(base, args.batches, args.precision, args.point_schema, legacy=False)),
+                }
+            finally:
+                state_store.shutdown()
+    finally:
+        process.terminate()
+        process.join(timeout=10)
+
+    parameters = {"batches": args.batches, "latency_ms": args.latency_ms, "precision": args.precision, "point_schema": args.point_schema}
+    document = write_results(args.output, "influxdb_write", parameters, results)
+    for path, values in results.items():
+        for key, value in values.items():
+            print(f"{path:>6} {key:>22}: {value}", file=sys.stderr)
+    if args.compare is not None:
+        for line in compare_results(json.loads(args.compare.read_text(encoding="utf-8")), document):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main(ARGS)
@@ -0,0 +1,132 @@
+"""
+poller_benchmark.py - End-to-end benchmark of polling and publishing a plant.
+
+Starts the Modbus test server on loopback (in a child process), constructs the
+plant, a hybrid and a PV inverter, a DC and an AC charger, a PID and a PSS as
+:func:`tests.utils.modbus_sensors.get_sensor_instances` does, and runs the real
+scan groups and :class:`~sigenergy2mqtt.devices.base.poller.SensorGroupPoller`
+loops over a real :class:`~sigenergy2mqtt.modbus.ModbusClient` for a fixed wall
+time. States are published through a real
+:class:`~sigenergy2mqtt.mqtt.MqttHandler` to an in-process stand-in for the
+broker, and persisted to a temporary state directory.
+
+The scan intervals are shortened (by default to 1, 2, 5 and 10 seconds) so that
+a short run covers many poll cycles of every priority.
+
+Reported (and written as JSON):
+
+* ``modbus_requests_per_s``: Modbus requests sent to the server.
+* ``sensor_reads_per_s``: sensor reads, most of which are served from read-ahead.
+* ``publishes_per_s``: MQTT publishes acknowledged by the stand-in broker.
+* ``cpu_per_tick_ms``: process CPU time per poll cycle (a scan group finding sensors due).
+* ``cycle_p50_ms`` / ``cycle_p99_ms``: wall time from a scan group finding sensors
+  due to it having published them.
+* ``peak_rss_mb``: peak resident set size of the benchmark process.
+
+Usage::
+
+    python tests/benchmarks/poller_benchmark.py [--duration 30] [--latency-ms 0 0 0] [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+    parser = argparse.ArgumentParser(description="End-to-end benchmark of polling and publishing a plant against the Modbus test server.")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to poll for (default: 30)")
+    parser.add_argument("--latency-ms", type=int, nargs=3, default=[0, 0, 0], metavar=("MIN", "AVG", "MAX"), help="Simulated Modbus response latency (default: 0 0 0)")
+    parser.add_argument("--scan-intervals", type=int, nargs=4, default=[1, 2, 5, 10], metavar=("REALTIME", "HIGH", "MEDIUM", "LOW"), help="Scan intervals in seconds (default: 1 2 5 10)")
+    parser.add_argument("--pipeline-depth", type=int, default=1, help="Modbus pipeline depth (default: 1)")
+    parser.add_argument("--output", type=Path, help="Write the JSON results to this file instead of standard output")
+    parser.add_argument("--compare", type=Path, help="Compare the results with those previously written to this file")
+    ARGS = parser.parse_args()
+    # Removed before the project imports, which parse the command line for configuration options
+    del sys.argv[1:]
+
+from sigenergy2mqtt.config import Config, _swap_active_config, active_config
+from sigenergy2mqtt.metrics import Metrics
+from sigenergy2mqtt.modbus import ModbusClientFactory
+from sigenergy2mqtt.mqtt import MqttHandler
+from sigenergy2mqtt.mqtt.registry import MqttHealthRegistry
+from sigenergy2mqtt.persistence import state_store
+from tests.benchmarks.harness import CycleRecorder, LoopbackMqttClient, compare_results, modbus_test_server, peak_rss_mb, percentile, root_devices, schedule, write_results
+from tests.utils.modbus_sensors import get_sensor_instances
+
+
+async def _poll(port: int, duration: float, pipeline_depth: int, state_path: Path) -> dict:
+    loop = asyncio.get_running_loop()
+    await state_store.initialise(state_path, active_config.persistence)
+    devices = root_devices(await get_sensor_instances(pv_inverter_device_address=3))
+
+    modbus_client = await ModbusClientFactory.get_client("127.0.0.1", port, pipeline_depth=pipeline_depth)
+    mqtt_handler = MqttHandler("benchmark", modbus_client, loop, MqttHealthRegistry())
+    mqtt_client = LoopbackMqttClient(mqtt_handler, loop)
+    recorder = CycleRecorder()
+    recorder.install()
+    try:
+        tasks = [task for device in devices for task in schedule(device, modbus_client, mqtt_client, recorder)]
+        await Metrics.reset()
+        sensor_reads = modbus_client._read_count
+        gathered = asyncio.gather(*tasks, return_exceptions=True)
+        # Cancelled when the devices are taken offline
+        online = loop.create_future()
+        for device in devices:
+            device.online = online
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        await asyncio.sleep(duration)
+        for device in devices:
+            device.online = False
+        await gathered
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        await Metrics.drain()
+    finally:
+        ModbusClientFactory.remove(modbus_client)
+        await mqtt_handler.close()
+        await state_store.flush()
+        state_store.shutdown()
+
+    cycles = [c * 1000.0 for c in recorder.cycles]
+    return {
+        "devices": len(devices),
+        "scan_groups": len(tasks),
+        "wall_s": round(wall, 3),
+        "ticks": len(cycles),
+        "modbus_requests_per_s": round(Metrics.sigenergy2mqtt_modbus_reads / wall, 2),
+        "sensor_reads_per_s": round((modbus_client._read_count - sensor_reads) / wall, 2),
+        "publishes_per_s": round(mqtt_client.publishes / wall, 2),
+        "cpu_per_tick_ms": round(cpu * 1000.0 / len(cycles), 3) if cycles else None,
+        "cycle_p50_ms": round(percentile(cycles, 50), 3),
+        "cycle_p99_ms": round(percentile(cycles, 99), 3),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    logging.disable(logging.WARNING)
+    with modbus_test_server(tuple(args.latency_ms)) as port:
+        with tempfile.TemporaryDirectory() as directory, _swap_active_config(Config()):
+            active_config.persistence.mqtt_redundancy = False
+            intervals = active_config.modbus[0].scan_interval
+            intervals.realtime, intervals.high, intervals.medium, intervals.low = args.scan_intervals
+            results = asyncio.run(_poll(port, args.duration, args.pipeline_depth, Path(directory)))
+            parameters = {"duration_s": args.duration, "latency_ms": args.latency_ms, "scan_intervals_s": args.scan_intervals, "pipeline_depth": args.pipeline_depth}
+            document = write_results(args.output, "poller", parameters, results)
+    for key, value in results.items():
+        print(f"{key:>22}: {value}", file=sys.stderr)
+    if args.compare is not None:
+        for line in compare_results(json.loads(args.compare.read_text(encoding="utf-8")), document):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main(ARGS)
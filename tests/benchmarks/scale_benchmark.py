@@ -0,0 +1,306 @@
+"""
+scale_benchmark.py - Simulates many plants in one instance to plot how it scales.
+
+For each number of plants, constructs that many synthetic plants, each with the
+configured number of inverters, DC chargers (on the first inverters), AC
+chargers and PSS, from the production device and sensor classes. Each plant is
+backed by its own :class:`~tests.benchmarks.harness.SimulatedModbusClient`,
+serving the register values the Modbus test server would after a simulated
+latency (15 ± 10 ms by default), and is polled on its own thread and event
+loop, as each host of a multi-plant configuration is. Scan groups are built
+with :func:`~sigenergy2mqtt.devices.base.scan_groups.create_sensor_scan_groups`
+and polled by the real
+:class:`~sigenergy2mqtt.devices.base.poller.SensorGroupPoller`, publishing
+through a real :class:`~sigenergy2mqtt.mqtt.MqttHandler` per plant to an
+in-process stand-in for the broker. The production scan intervals are used
+unless ``--scan-intervals`` is given.
+
+After a warm-up (which includes the initial publish of every sensor), each
+point of the curve reports, over ``--duration`` seconds:
+
+* ``modbus_requests_per_s``, ``sensor_reads_per_s`` and ``publishes_per_s``.
+* ``cpu_utilisation``: process CPU time per wall-clock second. Because of the
+  GIL, the plants' threads saturate the instance as this approaches 1.
+* ``cpu_per_tick_ms`` and ``cycle_p50_ms`` / ``cycle_p99_ms``: as for ``poller_benchmark.py``.
+* ``loop_lag_p50_ms`` / ``loop_lag_p99_ms`` / ``loop_lag_max_ms``: how late the
+  plants' event loops woke a task that was due.
+* ``peak_rss_mb``: peak resident set size.
+
+Each point is measured in a separate process, so that its memory use is not
+inflated by the points before it.
+
+Usage::
+
+    python tests/benchmarks/scale_benchmark.py [--plants 1 2 4 8 16] [--inverters 1] [--dc-chargers 0] [--ac-chargers 0] [--pss 0]
+        [--latency-ms 15] [--jitter-ms 10] [--warmup 10] [--duration 30] [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta, timezone
+from pathlib import Path
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+    parser = argparse.ArgumentParser(description="Simulates many plants in one instance to plot how it scales.")
+    parser.add_argument("--plants", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Numbers of plants to simulate (default: 1 2 4 8 16)")
+    parser.add_argument("--inverters", type=int, default=1, help="Inverters per plant (default: 1)")
+    parser.add_argument("--dc-chargers", type=int, default=0, help="DC chargers per plant, on the first inverters (default: 0)")
+    parser.add_argument("--ac-chargers", type=int, default=0, help="AC chargers per plant (default: 0)")
+    parser.add_argument("--pss", type=int, default=0, help="PSS per plant (default: 0)")
+    parser.add_argument("--latency-ms", type=float, default=15.0, help="Mean simulated Modbus response latency (default: 15)")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="Maximum deviation from the mean latency (default: 10)")
+    parser.add_argument("--scan-intervals", type=int, nargs=4, metavar=("REALTIME", "HIGH", "MEDIUM", "LOW"), help="Scan intervals in seconds (default: the production defaults)")
+    parser.add_argument("--warmup", type=float, default=10.0, help="Seconds to poll before measuring (default: 10)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to measure for (default: 30)")
+    parser.add_argument("--output", type=Path, help="Write the JSON results to this file instead of standard output")
+    parser.add_argument("--compare", type=Path, help="Compare the results with those previously written to this file")
+    ARGS = parser.parse_args()
+    if ARGS.dc_chargers > ARGS.inverters or ARGS.ac_chargers + ARGS.inverters > 240 or ARGS.pss > 5:
+        parser.error("DC chargers cannot outnumber inverters, inverters and AC chargers share device IDs 1-240, and PSS use device IDs 242-246")
+    # Removed before the project imports, which parse the command line for configuration options
+    del sys.argv[1:]
+
+from sigenergy2mqtt.common import FirmwareVersion, HybridInverter, Protocol
+from sigenergy2mqtt.config import Config, _swap_active_config, active_config
+from sigenergy2mqtt.devices import PSS, ACCharger, DCCharger, Device, Inverter, PowerPlant, bind_cross_device_sensors
+from sigenergy2mqtt.mqtt import MqttHandler
+from sigenergy2mqtt.mqtt.registry import MqttHealthRegistry
+from sigenergy2mqtt.persistence import state_store
+from sigenergy2mqtt.sensors.base import Sensor
+from sigenergy2mqtt.sensors.plant_read_write import (
+    ActivePowerFixedAdjustmentTargetValue,
+    PhaseActivePowerFixedAdjustmentTargetValue,
+    PhaseReactivePowerFixedAdjustmentTargetValue,
+    ReactivePowerFixedAdjustmentTargetValue,
+)
+from tests.benchmarks.harness import (
+    CycleRecorder,
+    LoopbackMqttClient,
+    LoopLagMonitor,
+    SimulatedModbusClient,
+    compare_results,
+    peak_rss_mb,
+    percentile,
+    register_values,
+    schedule,
+    write_results,
+)
+from tests.utils.modbus_sensors import FIRMWARE_VERSION, OUTPUT_TYPE, DummyInverterModbusClient, DummyPSSModbusClient
+
+PSS_DEVICE_ADDRESS = 242
+
+
+class SimulatedPlant:
+    """One synthetic plant, polled on its own thread and event loop like the devices of one configured host."""
+
+    def __init__(self, plant_index: int, devices: list[Device], modbus_client: SimulatedModbusClient):
+        self.plant_index = plant_index
+        self.devices = devices
+        self.modbus_client = modbus_client
+        self.recorder = CycleRecorder()
+        self.lag = LoopLagMonitor()
+        self.mqtt_client: LoopbackMqttClient | None = None
+        self.scan_groups = 0
+        self.started = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop: asyncio.Future | None = None
+
+    def run(self) -> None:
+        """Thread entry point: poll the plant until :meth:`stop` is called."""
+        threading.current_thread().name = f"Plant{self.plant_index}Thread"
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._poll())
+        finally:
+            loop.close()
+
+    async def _poll(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stop = self._loop.create_future()
+        await self.modbus_client.connect()
+        mqtt_handler = MqttHandler(f"plant{self.plant_index}", self.modbus_client, self._loop, MqttHealthRegistry())
+        self.mqtt_client = LoopbackMqttClient(mqtt_handler, self._loop)
+        self.recorder.install()
+        tasks = [task for device in self.devices for task in schedule(device, self.modbus_client, self.mqtt_client, self.recorder)]
+        self.scan_groups = len(tasks)
+        gathered = asyncio.gather(*tasks, return_exceptions=True)
+        # Cancelled when the devices are taken offline
+        online = self._loop.create_future()
+        for device in self.devices:
+            device.online = online
+        lag = asyncio.create_task(self.lag.run())
+        self.started.set()
+        try:
+            await self._stop
+            for device in self.devices:
+                device.online = False
+            await gathered
+        finally:
+            lag.cancel()
+            await mqtt_handler.close()
+            self.modbus_client.close()
+
+    def stop(self) -> None:
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set_result, None)
+
+    def counters(self) -> tuple[int, int, int, int, int]:
+        """Return the Modbus requests, sensor reads, publishes, poll cycles and loop lag samples so far."""
+        publishes = self.mqtt_client.publishes if self.mqtt_client is not None else 0
+        return self.modbus_client.requests, self.modbus_client._read_count, publishes, len(self.recorder.cycles), len(self.lag.samples)
+
+
+async def _build_plant(plant_index: int, args: argparse.Namespace) -> SimulatedPlant:
+    """Construct the devices of one plant, as the plant and device probing at startup would, and its simulated Modbus host."""
+    protocol_version = max(Protocol)
+    device_type = HybridInverter(has_grid_code_interface=True, has_independent_phase_power_control_interface=True)
+    tz = timezone(timedelta(minutes=600))
+    config = active_config.modbus[plant_index]
+    config.inverters = list(range(1, args.inverters + 1))
+    config.dc_chargers = config.inverters[: args.dc_chargers]
+    config.ac_chargers = list(range(args.inverters + 1, args.inverters + args.ac_chargers + 1))
+    config.pss = list(range(PSS_DEVICE_ADDRESS, PSS_DEVICE_ADDRESS + args.pss))
+
+    def _client(device_address: int) -> DummyInverterModbusClient:
+        return DummyInverterModbusClient("SigenStor EC 12.0 TP", f"CMU{plant_index:03d}A{device_address:03d}BP")
+
+    plant = await PowerPlant.create(plant_index, device_type, FirmwareVersion(FIRMWARE_VERSION), protocol_version, tz, OUTPUT_TYPE, True, _client(config.inverters[0]))
+    devices: list[Device] = [plant]
+    inverters: dict[int, Inverter] = {}
+    for device_address in config.inverters:
+        inverters[device_address] = await Inverter.create(plant_index, device_address, device_type, protocol_version, tz, _client(device_address))
+        inverters[device_address].via_device = plant.unique_id
+        devices.append(inverters[device_address])
+    for device_address in config.dc_chargers:
+        charger = await DCCharger.create(plant_index, device_address, protocol_version)
+        charger.via_device = inverters[device_address].unique_id
+        devices.append(charger)
+    for device_address in config.ac_chargers:
+        charger = await ACCharger.create(plant_index, device_address, protocol_version, _client(device_address))
+        charger.via_device = plant.unique_id
+        devices.append(charger)
+    for device_address in config.pss:
+        pss = await PSS.create(plant_index, device_address, protocol_version, DummyPSSModbusClient("Sigen PSS 1.0", f"PSS{plant_index:03d}A{device_address:03d}BP"))
+        pss.via_device = plant.unique_id
+        devices.append(pss)
+    bind_cross_device_sensors(plant_index)
+
+    total_rated_active_power = 12 * args.inverters
+    for sensor in plant.sensors.values():
+        if isinstance(sensor, (ActivePowerFixedAdjustmentTargetValue, PhaseActivePowerFixedAdjustmentTargetValue)):
+            sensor.apply_min_max(-total_rated_active_power, total_rated_active_power)
+        elif isinstance(sensor, (ReactivePowerFixedAdjustmentTargetValue, PhaseReactivePowerFixedAdjustmentTargetValue)):
+            sensor.apply_min_max(-60 * total_rated_active_power, 60 * total_rated_active_power)
+
+    sensors: dict[str, Sensor] = {}
+    for device in devices:
+        for sensor in device.get_all_sensors().values():
+            sensors[sensor.unique_id] = sensor
+            for alarm in getattr(sensor, "alarms", []):
+                sensors[alarm.unique_id] = alarm
+    modbus_client = SimulatedModbusClient(register_values(sensors), latency=args.latency_ms / 1000.0, jitter=args.jitter_ms / 1000.0)
+    return SimulatedPlant(plant_index, devices, modbus_client)
+
+
+async def _simulate(plants: int, args: argparse.Namespace, state_path: Path) -> dict:
+    await state_store.initialise(state_path, active_config.persistence)
+    try:
+        simulated = [await _build_plant(plant_index, args) for plant_index in range(plants)]
+        threads = [threading.Thread(target=plant.run, daemon=True) for plant in simulated]
+        for thread in threads:
+            thread.start()
+        for plant in simulated:
+            await asyncio.to_thread(plant.started.wait)
+
+        await asyncio.sleep(args.warmup)
+        before = [plant.counters() for plant in simulated]
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        await asyncio.sleep(args.duration)
+        after = [plant.counters() for plant in simulated]
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+
+        for plant in simulated:
+            plant.stop()
+        for thread in threads:
+            await asyncio.to_thread(thread.join)
+    finally:
+        await state_store.flush()
+        state_store.shutdown()
+
+    requests, reads, publishes, ticks, _ = (sum(a[i] - b[i] for a, b in zip(after, before)) for i in range(5))
+    cycles = [c * 1000.0 for plant, b, a in zip(simulated, before, after) for c in plant.recorder.cycles[b[3] : a[3]]]
+    lags = [lag * 1000.0 for plant, b, a in zip(simulated, before, after) for lag in plant.lag.samples[b[4] : a[4]]]
+    return {
+        "plants": plants,
+        "devices": sum(len(plant.devices) for plant in simulated),
+        "scan_groups": sum(plant.scan_groups for plant in simulated),
+        "wall_s": round(wall, 3),
+        "ticks": ticks,
+        "modbus_requests_per_s": round(requests / wall, 2),
+        "sensor_reads_per_s": round(reads / wall, 2),
+        "publishes_per_s": round(publishes / wall, 2),
+        "cpu_utilisation": round(cpu / wall, 3),
+        "cpu_per_tick_ms": round(cpu * 1000.0 / ticks, 3) if ticks else None,
+        "cycle_p50_ms": round(percentile(cycles, 50), 3),
+        "cycle_p99_ms": round(percentile(cycles, 99), 3),
+        "loop_lag_p50_ms": round(percentile(lags, 50), 3),
+        "loop_lag_p99_ms": round(percentile(lags, 99), 3),
+        "loop_lag_max_ms": round(max(lags, default=0.0), 3),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def _measure(plants: int, args: argparse.Namespace) -> dict:
+    """Measure one point of the curve in this process."""
+    with tempfile.TemporaryDirectory() as directory, _swap_active_config(Config()):
+        active_config.persistence.mqtt_redundancy = False
+        while len(active_config.modbus) < plants:
+            active_config.modbus.append(active_config.modbus[0].model_copy(deep=True))
+        if args.scan_intervals is not None:
+            for config in active_config.modbus:
+                config.scan_interval.realtime, config.scan_interval.high, config.scan_interval.medium, config.scan_interval.low = args.scan_intervals
+        return asyncio.run(_simulate(plants, args, Path(directory)))
+
+
+def _measure_in_subprocess(plants: int, args: argparse.Namespace) -> dict:
+    command = [sys.executable, os.path.abspath(__file__), "--plants", str(plants), "--inverters", str(args.inverters), "--dc-chargers", str(args.dc_chargers), "--ac-chargers", str(args.ac_chargers), "--pss", str(args.pss)]
+    command += ["--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms), "--warmup", str(args.warmup), "--duration", str(args.duration)]
+    if args.scan_intervals is not None:
+        command += ["--scan-intervals", *(str(interval) for interval in args.scan_intervals)]
+    completed = subprocess.run(command, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout)["results"]["points"][0]
+
+
+def main(args: argparse.Namespace) -> None:
+    logging.disable(logging.WARNING)
+    points = []
+    for plants in args.plants:
+        point = _measure(plants, args) if len(args.plants) == 1 else _measure_in_subprocess(plants, args)
+        points.append(point)
+        if len(args.plants) > 1:
+            print(
+                f"{plants:>4} plants: {point['publishes_per_s']:9.1f} publishes/s, CPU {point['cpu_utilisation'] * 100:5.1f}%, "
+                f"loop lag p99 {point['loop_lag_p99_ms']:8.1f} ms, cycle p99 {point['cycle_p99_ms']:8.1f} ms, peak RSS {point['peak_rss_mb']:7.1f} MiB",
+                file=sys.stderr,
+            )
+    parameters = {key: value for key, value in vars(args).items() if key not in ("output", "compare")}
+    document = write_results(args.output, "scale", parameters, {"points": points})
+    if args.compare is not None:
+        for line in compare_results(json.loads(args.compare.read_text(encoding="utf-8")), document):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main(ARGS)
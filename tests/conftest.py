@@ -79,8 +79,10 @@ def reset_config():
     from sigenergy2mqtt.config import active_config
     from sigenergy2mqtt.config.config import Config, is_docker
     from sigenergy2mqtt.devices import DeviceRegistry
+    from sigenergy2mqtt.influxdb.spool import InfluxSpool
     from sigenergy2mqtt.modbus.client_factory import ModbusClientFactory
     from sigenergy2mqtt.modbus.lock_factory import ModbusLockFactory
+    from sigenergy2mqtt.mqtt import sensor_event_bus
 
     # Clear proxy attributes that might have been added by tests (e.g. active_config.home_assistant = ...)
     # which would overshadow the proxy's redirection to _config.
@@ -91,10 +93,14 @@ def reset_config():
     os.environ.update(_BASELINE_ENV)
     active_config._config = Config()
     asyncio.run(active_config.reload())
+    # Otherwise InfluxDB services would spool to the working directory (tests that need a spool enable it)
+    active_config.influxdb.spool_max_size = 0
 
     DeviceRegistry.clear()
     ModbusClientFactory.clear()
     ModbusLockFactory.clear()
+    sensor_event_bus.clear()
+    InfluxSpool.clear()
     is_docker.cache_clear()
 
     # Clear sensor registries
@@ -122,6 +128,8 @@ def reset_config():
     DeviceRegistry.clear()
     ModbusClientFactory.clear()
     ModbusLockFactory.clear()
+    sensor_event_bus.clear()
+    InfluxSpool.clear()
     is_docker.cache_clear()
 
     Sensor._used_unique_ids.clear()
@@ -460,12 +460,12 @@ async def test_copy_records_from_homeassistant_falls_back_to_v1(service, monkeyp
         get_count[0] += 1
         return FakeResponse(200, v1_result)
 
-    def fake_post(*args, **kwargs):
+    async def fake_post_write(body):
         post_count[0] += 1
-        return FakeResponse(204)
+        return 204, ""
 
     monkeypatch.setattr(service._session, "get", fake_get)
-    monkeypatch.setattr(service._session, "post", fake_post)
+    monkeypatch.setattr(service, "_post_write", fake_post_write)
 
     count = await service.copy_records_from_homeassistant("power", {"entity_id": "sensor.power"})
     await service.flush_buffer()
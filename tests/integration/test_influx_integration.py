@@ -1,3 +1,4 @@
+import gzip
 from unittest.mock import MagicMock
 
 import pytest
@@ -96,18 +97,13 @@ async def test_init_falls_back_to_v2_http_implicit(monkeypatch):
 async def testwrite_line_uses_configured_writer(monkeypatch):
     calls = {}
 
-    class FakeResponse:
-        def __init__(self, code):
-            self.status_code = code
-
-    def fake_post(self, url, headers=None, data=None, timeout=None, params=None, auth=None):
-        calls["url"] = url
-        calls["data"] = data
-        return FakeResponse(204)
-
-    monkeypatch.setattr(requests.Session, "post", fake_post)
+    async def fake_post_write(body):
+        calls["url"] = svc._write_url
+        calls["data"] = gzip.decompress(body)
+        return 204, ""
 
     svc = InfluxService(plant_index=0)
+    monkeypatch.setattr(svc, "_post_write", fake_post_write)
     # Manually configure writer
     svc._writer_type = "v2_http"
     svc._write_url = "http://localhost:8086/api/v2/write?bucket=test_db&precision=s"
@@ -116,7 +112,8 @@ async def testwrite_line_uses_configured_writer(monkeypatch):
 
     await svc.write_line("measurement,tag=1 value=42 1000000000")
     await svc.flush_buffer()
-    assert "url" in calls and "data" in calls
+    assert calls["url"] == svc._write_url
+    assert calls["data"] == b"measurement,tag=1 value=42 1000000000"
 
 
 # =============================================================================
@@ -487,12 +484,12 @@ async def testcopy_records_v1_success(monkeypatch):
         get_call_count[0] += 1
         return FakeResponse(200, query_result)
 
-    def fake_post(url, headers=None, params=None, data=None, timeout=None, auth=None):
+    async def fake_post_write(body):
         post_call_count[0] += 1
-        return FakeResponse(204)
+        return 204, ""
 
     monkeypatch.setattr(svc._session, "get", fake_get)
-    monkeypatch.setattr(svc._session, "post", fake_post)
+    monkeypatch.setattr(svc, "_post_write", fake_post_write)
 
     config = {"base": "http://localhost:8086", "db": "homeassistant", "auth": None}
     count = await svc.copy_records_v1(config, "power", {"entity_id": "sensor.power"}, before_timestamp=None)
@@ -583,12 +580,12 @@ async def testcopy_records_v1_multiple_series(monkeypatch):
     def fake_get(*args, **kwargs):
         return FakeResponse(200, query_result)
 
-    def fake_post(*args, **kwargs):
+    async def fake_post_write(body):
         post_count[0] += 1
-        return FakeResponse(204)
+        return 204, ""
 
     monkeypatch.setattr(svc._session, "get", fake_get)
-    monkeypatch.setattr(svc._session, "post", fake_post)
+    monkeypatch.setattr(svc, "_post_write", fake_post_write)
 
     config = {"base": "http://localhost:8086", "db": "homeassistant", "auth": None}
     count = await svc.copy_records_v1(config, "power", {"entity_id": "sensor.power"}, before_timestamp=None)
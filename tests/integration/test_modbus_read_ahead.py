@@ -72,7 +72,7 @@ async def test_read_ahead_caching(mock_modbus_server):
     assert client.connected
 
     # Ensure cache is empty initially
-    assert client._read_ahead_pdu == {}
+    assert client._register_images == {}
     assert client._cache_hits == 0
 
     # Perform Read Ahead
@@ -86,8 +86,9 @@ async def test_read_ahead_caching(mock_modbus_server):
     await client.read_ahead_registers(start_addr, count, device_id=1, input_type=InputType.INPUT)
 
     # Verify cache is populated
-    assert 1 in client._read_ahead_pdu
-    assert start_addr in client._read_ahead_pdu[1]
+    image = client.register_image(1, InputType.INPUT)
+    assert image is not None
+    assert image.is_valid(start_addr, count)
 
     # Verify NO cache hits yet (the pre-read itself doesn't count as a hit, or does it?)
     # The _read_registers logic only increments cache hits if use_pre_read=True is passed.
@@ -117,3 +118,26 @@ async def test_read_ahead_caching(mock_modbus_server):
     assert client._cache_hits == 2  # Should NOT increment
 
     client.close()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_pipelined_reads(mock_modbus_server):
+    port = mock_modbus_server
+    serial = ModbusClient("127.0.0.1", port=port)
+    pipelined = ModbusClient("127.0.0.1", port=port, pipeline_depth=4)
+    await serial.connect()
+    await pipelined.connect()
+    assert pipelined.connected
+
+    addresses = [31000, 31001, 31002, 31003, 31004, 31000, 31004, 31002]
+    expected = [(await serial.read_ahead_registers(a, count=1, device_id=1, input_type=InputType.INPUT), serial.register_image(1, InputType.INPUT).view(a, 1)[0]) for a in addresses]
+
+    # Issue concurrently: responses must be matched to their requests by transaction id
+    responses = await asyncio.gather(*[pipelined._read_registers(a, count=1, device_id=1, input_type=InputType.INPUT) for a in addresses])
+
+    assert [(0, r.registers[0]) for r in responses] == expected
+    assert pipelined.ctx.window.in_flight == 0
+    assert pipelined.ctx.window.peak > 1
+
+    serial.close()
+    pipelined.close()
@@ -0,0 +1,133 @@
+import asyncio
+import socket
+import time
+
+import pytest
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.pdu.register_message import ReadHoldingRegistersRequest, ReadHoldingRegistersResponse, ReadInputRegistersRequest, ReadInputRegistersResponse
+
+from sigenergy2mqtt.config import Config, _swap_active_config
+from sigenergy2mqtt.config.models.modbus import ModbusConfig
+from sigenergy2mqtt.main import main as main_mod
+from sigenergy2mqtt.modbus.capture import ModbusCapture, read_capture
+from sigenergy2mqtt.modbus.client import ModbusClient
+from tests.utils.modbus_test_server import run_async_server, run_replay_server, wait_for_server_start
+
+
+def get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def capture_file(tmp_path):
+    path = tmp_path / "site.capture"
+    capture = ModbusCapture(path)
+    capture.record(1.0, 0.2, ReadHoldingRegistersRequest(address=30000, count=2, dev_id=247), ReadHoldingRegistersResponse(registers=[1, 2], dev_id=247))
+    capture.record(2.0, 0.2, ReadHoldingRegistersRequest(address=30000, count=2, dev_id=247), ReadHoldingRegistersResponse(registers=[3, 4], dev_id=247))
+    capture.record(3.0, 0.01, ReadHoldingRegistersRequest(address=30010, count=1, dev_id=247), ExceptionResponse(0x03, 0x06, device_id=247))
+    capture.record(4.0, 0.01, ReadInputRegistersRequest(address=31000, count=1, dev_id=1), None)
+    capture.record(5.0, 0.01, ReadInputRegistersRequest(address=31001, count=3, dev_id=1), ReadInputRegistersResponse(registers=[7, 8, 9], dev_id=1))
+    capture.close()
+    return path
+
+
+async def _replay(capture_file, speed):
+    port = get_free_port()
+    server_task = asyncio.create_task(run_replay_server(str(capture_file), host="127.0.0.1", port=port, speed=speed))
+    if not await wait_for_server_start("127.0.0.1", port):
+        server_task.cancel()
+        raise RuntimeError("Replay server failed to start")
+    return port, server_task
+
+
+async def _stop(server_task):
+    server_task.cancel()
+    try:
+        await server_task
+    except asyncio.CancelledError:
+        pass
+
+
+async def test_replay_serves_captured_responses(capture_file, tmp_path):
+    port, server_task = await _replay(capture_file, speed=1.0)
+    recapture = tmp_path / "replayed.capture"
+    client = ModbusClient("127.0.0.1", port=port, retries=0, capture_file=str(recapture))
+    try:
+        await client.connect()
+
+        start = time.monotonic()
+        first = await client._read_registers(30000, count=2, device_id=247)
+        assert time.monotonic() - start >= 0.2
+        second = await client._read_registers(30000, count=2, device_id=247)
+        third = await client._read_registers(30000, count=2, device_id=247)
+        assert [first.registers, second.registers, third.registers] == [[1, 2], [3, 4], [1, 2]]
+
+        assert (await client._read_registers(30010, count=1, device_id=247)).exception_code == 0x06
+        assert (await client.read_input_registers(31000, count=1, device_id=1)).exception_code == 0x0B
+        # Not captured as such, but within a captured range
+        assert (await client.read_input_registers(31002, count=2, device_id=1)).registers == [8, 9]
+        # Outside every captured range
+        assert (await client._read_registers(30100, count=1, device_id=247)).exception_code == 0x02
+    finally:
+        client.close()
+        await _stop(server_task)
+
+    # The replay can itself be captured, and matches the original
+    assert [(r.function_code, r.address, r.count, r.exception_code, r.registers) for r in read_capture(recapture)][:5] == [
+        (0x03, 30000, 2, 0, [1, 2]),
+        (0x03, 30000, 2, 0, [3, 4]),
+        (0x03, 30000, 2, 0, [1, 2]),
+        (0x03, 30010, 1, 0x06, []),
+        (0x04, 31000, 1, 0x0B, []),
+    ]
+
+
+async def test_replay_is_time_scaled(capture_file):
+    port, server_task = await _replay(capture_file, speed=4.0)
+    client = ModbusClient("127.0.0.1", port=port, retries=0)
+    try:
+        await client.connect()
+        start = time.monotonic()
+        await client._read_registers(30000, count=2, device_id=247)
+        elapsed = time.monotonic() - start
+    finally:
+        client.close()
+        await _stop(server_task)
+
+    assert 0.05 <= elapsed < 0.2
+
+
+async def test_setup_devices_replays_captured_startup(tmp_path):
+    async def _setup(port, capture_file=None):
+        cfg = Config()
+        cfg.modbus = [ModbusConfig(host="127.0.0.1", port=port, retries=0, inverters=[1], capture_file=capture_file)]
+        with _swap_active_config(cfg):
+            main_mod.thread_config_registry.clear()
+            try:
+                configs, protocol_version = await main_mod.setup_devices(set())
+                return {device.unique_id for config in configs for device in config.devices}, protocol_version
+            finally:
+                main_mod.thread_config_registry.clear()
+
+    port = get_free_port()
+    with _swap_active_config(Config()):
+        server_task = asyncio.create_task(run_async_server(None, modbus_client=None, use_simplified_topics=True, host="127.0.0.1", port=port))
+        assert await wait_for_server_start("127.0.0.1", port, timeout=30.0)
+    capture = tmp_path / "startup.capture"
+    try:
+        captured = await _setup(port, str(capture))
+    finally:
+        await _stop(server_task)
+    assert captured[0] and captured[1] is not None
+    # The startup probing was captured, so replaying it creates the same devices
+    assert len(list(read_capture(capture))) > 0
+
+    port, server_task = await _replay(capture, speed=0)
+    try:
+        replayed = await _setup(port)
+    finally:
+        await _stop(server_task)
+
+    assert replayed == captured
@@ -60,6 +60,8 @@ async def test_persistence_integration_flow(temp_state_dir, mock_mqtt_client):
     persistence_config.mqtt_state_prefix = "sigenergy2mqtt/_state"
     persistence_config.disk_primary = True
     persistence_config.cache_warmup_timeout = 2.0
+    persistence_config.write_behind_interval = 0.0
+    persistence_config.write_behind_threshold = 50
 
     store = StateStore()
 
@@ -0,0 +1,98 @@
+"""Unit tests for ScanScheduler."""
+
+import asyncio
+import threading
+
+import pytest
+
+from sigenergy2mqtt.common import ScanScheduler
+
+
+@pytest.mark.asyncio
+async def test_one_scheduler_per_event_loop():
+    scheduler = ScanScheduler.get()
+    assert ScanScheduler.get() is scheduler
+
+    other: list[ScanScheduler] = []
+
+    def _in_thread():
+        async def _get():
+            other.append(ScanScheduler.get())
+
+        asyncio.run(_get())
+
+    thread = threading.Thread(target=_in_thread)
+    thread.start()
+    thread.join()
+    assert other and other[0] is not scheduler
+
+
+@pytest.mark.asyncio
+async def test_waiters_resolve_in_due_order_with_a_single_timer():
+    scheduler = ScanScheduler(asyncio.get_running_loop())
+    woken: list[str] = []
+
+    async def _wait(name: str, delay: float):
+        await scheduler.schedule(delay)
+        woken.append(name)
+
+    tasks = [asyncio.create_task(_wait(name, delay)) for name, delay in (("slow", 0.15), ("fast", 0.05), ("medium", 0.1))]
+    await asyncio.sleep(0)
+
+    assert len(scheduler) == 3
+    assert scheduler.armed_at == pytest.approx(asyncio.get_running_loop().time() + 0.05, abs=0.02)
+    await asyncio.gather(*tasks)
+    assert woken == ["fast", "medium", "slow"]
+    assert scheduler.armed_at is None
+
+
+@pytest.mark.asyncio
+async def test_earlier_waiter_rearms_timer():
+    scheduler = ScanScheduler(asyncio.get_running_loop())
+    late = scheduler.schedule(60)
+    armed = scheduler.armed_at
+
+    early = scheduler.schedule(0.01)
+
+    assert scheduler.armed_at < armed
+    await asyncio.wait_for(early, timeout=1)
+    assert not late.done()
+    assert scheduler.armed_at == pytest.approx(armed)
+    late.cancel()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_are_discarded():
+    scheduler = ScanScheduler(asyncio.get_running_loop())
+    cancelled = scheduler.schedule(0.01)
+    kept = scheduler.schedule(0.02)
+
+    cancelled.cancel()
+    await asyncio.wait_for(kept, timeout=1)
+
+    assert len(scheduler) == 0
+    assert scheduler.armed_at is None
+
+
+@pytest.mark.asyncio
+async def test_wake_resolves_early():
+    scheduler = ScanScheduler(asyncio.get_running_loop())
+    waiter = scheduler.schedule(60)
+
+    ScanScheduler.wake(waiter)
+
+    await asyncio.wait_for(waiter, timeout=1)
+    ScanScheduler.wake(waiter)  # Already resolved: ignored
+
+
+@pytest.mark.asyncio
+async def test_wake_from_another_thread():
+    scheduler = ScanScheduler(asyncio.get_running_loop())
+    waiter = scheduler.schedule(None)
+
+    thread = threading.Thread(target=ScanScheduler.wake, args=(waiter,))
+    thread.start()
+    thread.join()
+
+    await asyncio.wait_for(waiter, timeout=1)
+    assert scheduler.armed_at is None
@@ -88,6 +88,17 @@ class TestConfigAutoDiscovery:
             assert len(cfg.modbus) == 1
             assert cfg.modbus[0].host == "192.168.1.1"
 
+    def test_auto_discovery_force_probes_previous_device_ids_first(self, tmp_path, monkeypatch):
+        cache_file = tmp_path / "auto-discovery.yaml"
+        cache_file.write_text("- host: 192.168.1.100\n  port: 502\n  inverters: [1, 2]\n  ac-chargers: [3]\n  dc-chargers: [1]\n")
+
+        with patch("sigenergy2mqtt.config.config.auto_discovery_scan", return_value=[]) as mock_scan, _swap_active_config(Config()) as cfg:
+            monkeypatch.setenv(const.SIGENERGY2MQTT_MODBUS_AUTO_DISCOVERY, "force")
+            monkeypatch.setenv(const.SIGENERGY2MQTT_MODBUS_HOST, "192.168.1.1")
+            cfg.persistent_state_path = tmp_path
+            asyncio.run(cfg.reload())
+            assert mock_scan.call_args.kwargs["likely_device_ids"] == {"192.168.1.100": [1, 2, 3]}
+
     def test_auto_discovery_cached(self, tmp_path, monkeypatch):
         cache_file = tmp_path / "auto-discovery.yaml"
         cache_file.write_text("- host: 192.168.1.100\n  port: 502\n  inverters: [1]\n")
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from sigenergy2mqtt.common import ScanScheduler
+
+
+@pytest.fixture
+def scheduled_sleep(monkeypatch):
+    """Route SensorGroupPoller waits through a replacement ``sleep(delay)`` coroutine function.
+
+    The poller waits on futures from ``ScanScheduler.schedule`` rather than calling
+    ``asyncio.sleep``, so tests that fast-forward or interrupt the wait install their
+    fake sleep here. Waits without a due time are passed a delay of ``1``.
+    """
+
+    def _install(sleep):
+        def schedule(self, delay):
+            waiter = asyncio.get_running_loop().create_future()
+
+            def _done(task):
+                if waiter.done():
+                    return
+                if task.cancelled():
+                    waiter.cancel()
+                elif task.exception() is not None:
+                    waiter.set_exception(task.exception())
+                else:
+                    waiter.set_result(None)
+
+            asyncio.ensure_future(sleep(1 if delay is None else delay)).add_done_callback(_done)
+            return waiter
+
+        monkeypatch.setattr(ScanScheduler, "schedule", schedule)
+
+    return _install
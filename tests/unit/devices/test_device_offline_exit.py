@@ -5,6 +5,7 @@ import pytest
 
 from sigenergy2mqtt.common import Protocol
 from sigenergy2mqtt.config import Config, _swap_active_config
+from sigenergy2mqtt.config.models.modbus import ScanInterval
 from sigenergy2mqtt.devices import Device
 from sigenergy2mqtt.devices.base.poller import SensorGroupPoller
 from sigenergy2mqtt.sensors.base import ModbusSensorMixin, ReadableSensorMixin, Sensor
@@ -44,6 +45,7 @@ def mock_config():
     cfg.modbus = [MagicMock()]
     cfg.modbus[0].registers = MagicMock()
     cfg.modbus[0].disable_chunking = False
+    cfg.modbus[0].scan_interval = ScanInterval()
     cfg.home_assistant.device_name_prefix = ""
     cfg.home_assistant.enabled = True
     cfg.home_assistant.discovery_prefix = "homeassistant"
@@ -10,6 +10,7 @@ from pymodbus import ModbusException
 
 from sigenergy2mqtt.common import HybridInverter, InputType, Protocol
 from sigenergy2mqtt.config import Config, _swap_active_config
+from sigenergy2mqtt.config.models.modbus import ScanInterval
 from sigenergy2mqtt.devices import Device, DeviceRegistry, ModbusDevice
 from sigenergy2mqtt.devices.base.poller import SensorGroupPoller
 from sigenergy2mqtt.devices.base.scan_groups import create_sensor_scan_groups
@@ -223,7 +224,7 @@ def mock_config(tmp_path):
     mock_modbus = MagicMock()
     mock_modbus.registers = {}
     mock_modbus.disable_chunking = False
-    mock_modbus.scan_interval.high = 60
+    mock_modbus.scan_interval = ScanInterval(high=60)
     cfg.modbus = [mock_modbus]
     cfg.home_assistant.device_name_prefix = ""
     cfg.home_assistant.unique_id_prefix = "sigen"
@@ -442,7 +443,7 @@ async def test_publish_updates_exits_when_offline(device):
 
 
 @pytest.mark.asyncio
-async def test_publish_updates_initial_republish_of_existing_state(device):
+async def test_publish_updates_initial_republish_of_existing_state(device, scheduled_sleep):
     """if a sensor has a latest_raw_state it is republished on startup."""
     fut = asyncio.get_event_loop().create_future()
     device._online = fut
@@ -472,8 +473,8 @@ async def test_publish_updates_initial_republish_of_existing_state(device):
         device._online = False  # stop the loop after first sleep
 
     poller = SensorGroupPoller(device)
-    with patch("asyncio.sleep", fake_sleep):
-        await poller.run(None, MagicMock(), "grp", s)
+    scheduled_sleep(fake_sleep)
+    await poller.run(None, MagicMock(), "grp", s)
 
     # Initial republish should have been called with republish=True
     assert any(r is True for r in publish_calls)
@@ -481,7 +482,7 @@ async def test_publish_updates_initial_republish_of_existing_state(device):
 
 
 @pytest.mark.asyncio
-async def test_publish_updates_force_publish(device):
+async def test_publish_updates_force_publish(device, scheduled_sleep):
     """Line 630 area: force_publish causes a sensor to publish even if not yet due."""
     fut = asyncio.get_event_loop().create_future()
     device._online = fut
@@ -506,15 +507,44 @@ async def test_publish_updates_force_publish(device):
         device._online = False
 
     poller = SensorGroupPoller(device)
-    with patch("asyncio.sleep", fake_sleep):
-        await poller.run(None, MagicMock(), "grp_force", s)
+    scheduled_sleep(fake_sleep)
+    await poller.run(None, MagicMock(), "grp_force", s)
 
     assert published_event.is_set()
     fut.cancel()
 
 
 @pytest.mark.asyncio
-async def test_publish_updates_modbus_exception_reconnects(device):
+async def test_publish_updates_force_publish_wakes_idle_group(device):
+    """Setting force_publish while the group is waiting on the scheduler publishes without waiting for the scan interval."""
+    fut = asyncio.get_event_loop().create_future()
+    device._online = fut
+
+    s = DummyReadable("s_force_wake", scan_interval=600)
+    s.force_publish = True
+    published = asyncio.Queue()
+
+    async def recording_publish(*args, **kwargs):
+        published.put_nowait(True)
+        return True
+
+    s.publish = recording_publish
+
+    poller = SensorGroupPoller(device)
+    task = asyncio.create_task(poller.run(None, MagicMock(), "grp_force_wake", s))
+    await asyncio.wait_for(published.get(), timeout=1)
+    await asyncio.sleep(0.15)
+    assert s.sleeper_task is not None
+
+    s.force_publish = True
+
+    await asyncio.wait_for(published.get(), timeout=1)
+    device.online = False
+    await asyncio.wait_for(task, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_publish_updates_modbus_exception_reconnects(device, scheduled_sleep):
     """Lines 702-725: ModbusException triggers reconnection logic."""
     fut = asyncio.get_event_loop().create_future()
     device._online = fut
@@ -553,14 +583,14 @@ async def test_publish_updates_modbus_exception_reconnects(device):
     poller = SensorGroupPoller(device)
     with patch("sigenergy2mqtt.devices.base.poller.ModbusLockFactory") as mock_factory:
         mock_factory.get.return_value = lock_obj
-        with patch("asyncio.sleep", fake_sleep):
-            await poller.run(modbus_client, MagicMock(), "grp_modbus_err", s)
+        scheduled_sleep(fake_sleep)
+        await poller.run(modbus_client, MagicMock(), "grp_modbus_err", s)
 
     fut.cancel()
 
 
 @pytest.mark.asyncio
-async def test_publish_updates_generic_exception_logged(device):
+async def test_publish_updates_generic_exception_logged(device, scheduled_sleep):
     """Lines 720-725: generic exceptions are caught and logged."""
     fut = asyncio.get_event_loop().create_future()
     device._online = fut
@@ -578,8 +608,8 @@ async def test_publish_updates_generic_exception_logged(device):
 
     poller = SensorGroupPoller(device)
     with patch("sigenergy2mqtt.devices.base.poller.logger") as mock_log:
-        with patch("asyncio.sleep", fake_sleep):
-            await poller.run(None, MagicMock(), "grp_generic_err", s)
+        scheduled_sleep(fake_sleep)
+        await poller.run(None, MagicMock(), "grp_generic_err", s)
 
         mock_log.error.assert_called()
 
@@ -587,7 +617,7 @@ async def test_publish_updates_generic_exception_logged(device):
 
 
 @pytest.mark.asyncio
-async def test_publish_updates_rediscover_triggers_discovery(device):
+async def test_publish_updates_rediscover_triggers_discovery(device, scheduled_sleep):
     """publish_updates triggers publish_discovery when rediscover is set."""
     fut = asyncio.get_event_loop().create_future()
     device._online = fut
@@ -611,15 +641,15 @@ async def test_publish_updates_rediscover_triggers_discovery(device):
         device._online = False
 
     poller = SensorGroupPoller(device)
-    with patch("asyncio.sleep", fake_sleep):
-        await poller.run(None, MagicMock(), "grp_rediscover", s)
+    scheduled_sleep(fake_sleep)
+    await poller.run(None, MagicMock(), "grp_rediscover", s)
 
     assert discovery_called
     fut.cancel()
 
 
 @pytest.mark.asyncio
-async def test_publish_updates_sleep_interrupted_by_cancel(device):
+async def test_publish_updates_sleep_interrupted_by_cancel(device, scheduled_sleep):
     """Lines 764-784: CancelledError from sleep is handled gracefully."""
     fut = asyncio.get_event_loop().create_future()
     device._online = fut
@@ -637,8 +667,8 @@ async def test_publish_updates_sleep_interrupted_by_cancel(device):
         device._online = False
 
     poller = SensorGroupPoller(device)
-    with patch("asyncio.sleep", interruptible_sleep):
-        await poller.run(None, MagicMock(), "grp_cancel", s)
+    scheduled_sleep(interruptible_sleep)
+    await poller.run(None, MagicMock(), "grp_cancel", s)
 
     fut.cancel()
 
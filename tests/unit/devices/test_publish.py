@@ -11,6 +11,7 @@ from pymodbus.pdu import ExceptionResponse
 
 from sigenergy2mqtt.common import Protocol
 from sigenergy2mqtt.config import Config, _swap_active_config
+from sigenergy2mqtt.config.models.modbus import ScanInterval
 from sigenergy2mqtt.devices import Device
 from sigenergy2mqtt.devices.base.poller import SensorGroupPoller
 from sigenergy2mqtt.modbus.client import ModbusClient
@@ -22,7 +23,7 @@ class FakeLock:
     def __init__(self):
         self.waiters = 0
 
-    def lock(self, timeout=None):
+    def lock(self, timeout=None, **kwargs):
         class _CM:
             async def __aenter__(self):
                 return None
@@ -48,7 +49,7 @@ def mock_config():
     mock_modbus = MagicMock()
     mock_modbus.registers = {}
     mock_modbus.disable_chunking = False
-    mock_modbus.scan_interval.high = 60
+    mock_modbus.scan_interval = ScanInterval(high=60)
     cfg.modbus = [mock_modbus]
     cfg.home_assistant.device_name_prefix = ""
     cfg.home_assistant.unique_id_prefix = "sigen"
@@ -108,7 +109,7 @@ class DummyModbusSensor(ModbusSensorMixin, ReadableSensorMixin):
 
 
 @pytest.mark.asyncio
-async def test_publish_updates_runs_one_iteration(monkeypatch):
+async def test_publish_updates_runs_one_iteration(monkeypatch, scheduled_sleep):
     # --- 1. SET UP TIME MOCKING ---
     class MockClock:
         def __init__(self):
@@ -134,6 +135,7 @@ async def test_publish_updates_runs_one_iteration(monkeypatch):
         return await original_sleep(0, result)  # Yield briefly to keep event loop happy
 
     monkeypatch.setattr(asyncio, "sleep", mock_sleep)
+    scheduled_sleep(mock_sleep)
     # ------------------------------
 
     dev = Device("devpub", 0, "uidpub", "mf", "mdl", Protocol.V1_8)
@@ -208,7 +210,7 @@ async def test_publish_updates_read_ahead_error_code_switch(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_publish_updates_handles_modbus_exception_and_reconnect(monkeypatch):
+async def test_publish_updates_handles_modbus_exception_and_reconnect(monkeypatch, scheduled_sleep):
     """If ModbusException occurs the device attempts to reconnect via modbus.connect."""
 
     dev = Device("devpub3", 0, "uidpub3", "mf", "mdl", Protocol.V1_8)
@@ -251,6 +253,7 @@ async def test_publish_updates_handles_modbus_exception_and_reconnect(monkeypatc
         return None
 
     monkeypatch.setattr(asyncio, "sleep", _fast_sleep)
+    scheduled_sleep(_fast_sleep)
     monkeypatch.setattr("sigenergy2mqtt.modbus.lock_factory.ModbusLockFactory.get", lambda modbus: FakeLock())
 
     # ensure initial state has no latest_raw_state so loop enters read_ahead
@@ -271,7 +274,7 @@ async def test_publish_updates_handles_modbus_exception_and_reconnect(monkeypatc
 
 
 @pytest.mark.asyncio
-async def test_publish_updates_day_change_forces_daily_sensor(monkeypatch):
+async def test_publish_updates_day_change_forces_daily_sensor(monkeypatch, scheduled_sleep):
     """When tm_yday changes between iterations, sensors with EnergyDailyAccumulationSensor
     derived sensors are forced to publish immediately (covers device.py lines 1017-1025)."""
 
@@ -306,8 +309,7 @@ async def test_publish_updates_day_change_forces_daily_sensor(monkeypatch):
     monkeypatch.setattr(DummyModbusSensor, "publish", _tracking_publish)
 
     # --- Time control ---
-    # Start at a fixed time. localtime will first return day 100, then day 101.
-    call_count = 0
+    # Start at a fixed time. localtime returns day 100 until the clock has advanced past the first wait, then day 101.
     base_time = 1000.0
     current_time = [base_time]
 
@@ -315,11 +317,9 @@ async def test_publish_updates_day_change_forces_daily_sensor(monkeypatch):
         return current_time[0]
 
     def fake_localtime(secs=None):
-        nonlocal call_count
-        call_count += 1
         s = time.struct_time((2025, 4, 10, 23, 59, 59, 3, 100, -1))
         # After the first loop iteration completes, simulate day change
-        if call_count > 1:
+        if current_time[0] > base_time:
             s = time.struct_time((2025, 4, 11, 0, 0, 1, 4, 101, -1))
         return s
 
@@ -334,6 +334,7 @@ async def test_publish_updates_day_change_forces_daily_sensor(monkeypatch):
         await _original_sleep(0)
 
     monkeypatch.setattr(asyncio, "sleep", _fast_sleep)
+    scheduled_sleep(_fast_sleep)
 
     monkeypatch.setattr(ModbusLockFactory, "get", staticmethod(lambda modbus: FakeLock()))
 
@@ -398,7 +399,7 @@ async def test_poller_skips_unpublishable_sensors(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_poller_read_ahead_exception_codes(monkeypatch, caplog):
+async def test_poller_read_ahead_exception_codes(monkeypatch, caplog, scheduled_sleep):
     """Mock read_ahead_registers to return code 1, 3, 4, -1 and ensure appropriate warning logs are hit but read_ahead stays enabled."""
     import logging
 
@@ -460,6 +461,7 @@ async def test_poller_read_ahead_exception_codes(monkeypatch, caplog):
         return None
 
     monkeypatch.setattr(asyncio, "sleep", _mock_sleep_no_recursion)
+    scheduled_sleep(_mock_sleep_no_recursion)
 
     coro = poller.run(cast(ModbusClient, modbus), cast(MqttClient, object()), "grp", s1, s2)
     # The timeout here ensures it doesn't hang forever if the loop breaks
@@ -525,7 +527,7 @@ async def test_poller_reconnect_cancellation(monkeypatch, caplog):
 
 
 @pytest.mark.asyncio
-async def test_poller_run_sleep_cancelled(monkeypatch, caplog):
+async def test_poller_run_sleep_cancelled(monkeypatch, caplog, scheduled_sleep):
     """Raise asyncio.CancelledError from the sleep task in run and ensure it's caught."""
     import logging
 
@@ -558,7 +560,7 @@ async def test_poller_run_sleep_cancelled(monkeypatch, caplog):
         await original_sleep(0.1)
         return None
 
-    monkeypatch.setattr("sigenergy2mqtt.devices.base.poller.asyncio.sleep", _mock_sleep)
+    scheduled_sleep(_mock_sleep)
     monkeypatch.setattr("sigenergy2mqtt.modbus.lock_factory.ModbusLockFactory.get", lambda modbus: FakeLock())
 
     modbus = FakeModbus()
@@ -1,15 +1,17 @@
 import asyncio
 import time
 from typing import cast
-from unittest.mock import AsyncMock, MagicMock, call, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, call, patch
 
 import pytest
 from pymodbus import ModbusException
 
 from sigenergy2mqtt.common import InputType, Protocol
 from sigenergy2mqtt.config import Config, _swap_active_config
+from sigenergy2mqtt.config.models.modbus import ScanInterval
 from sigenergy2mqtt.devices import Device, DeviceRegistry
 from sigenergy2mqtt.devices.base.poller import SensorGroupPoller
+from sigenergy2mqtt.modbus import BusPriority
 from sigenergy2mqtt.sensors.base import ModbusSensorMixin, ReadableSensorMixin, Sensor
 
 # Capture original sleep
@@ -74,6 +76,7 @@ def mock_config():
     cfg.home_assistant.enabled = False
     cfg.modbus = [MagicMock()]
     cfg.modbus[0].disable_chunking = False
+    cfg.modbus[0].scan_interval = ScanInterval()
     with _swap_active_config(cfg):
         yield cfg
     DeviceRegistry._devices.clear()
@@ -86,7 +89,7 @@ async def fast_sleep(duration):
 
 
 @pytest.mark.asyncio
-async def test_modbus_exception_recovery(mock_config):
+async def test_modbus_exception_recovery(mock_config, scheduled_sleep):
     dev = Device("test", 0, "sigen_uid", "mf", "mdl", Protocol.V1_8)
     sensor1 = DummyModbusSensor("sigen_s1", address=100)
     sensor2 = DummyModbusSensor("sigen_s1b", address=101)  # Add second sensor for multiple-sensor path
@@ -102,7 +105,8 @@ async def test_modbus_exception_recovery(mock_config):
     mock_lock = MagicMock()
     mock_lock.lock.return_value = async_cm
 
-    with patch("sigenergy2mqtt.devices.base.poller.ModbusLockFactory.get", return_value=mock_lock), patch("sigenergy2mqtt.devices.base.poller.asyncio.sleep", side_effect=fast_sleep):
+    scheduled_sleep(fast_sleep)
+    with patch("sigenergy2mqtt.devices.base.poller.ModbusLockFactory.get", return_value=mock_lock):
         dev._online = True
         sensor1.force_publish = True
         sensor2.force_publish = True
@@ -127,12 +131,12 @@ async def test_modbus_exception_recovery(mock_config):
 
     # Check that lock was called both with and without timeout
     calls = mock_lock.lock.call_args_list
-    assert call() in calls  # Normal scan
-    assert call(timeout=None) in calls  # Reconnection
+    assert call(priority=BusPriority.LOW, deadline=ANY, shared=True) in calls  # Normal scan
+    assert call(timeout=None, priority=BusPriority.WRITE) in calls  # Reconnection
 
 
 @pytest.mark.asyncio
-async def test_reconnection_interruption_on_offline(mock_config):
+async def test_reconnection_interruption_on_offline(mock_config, scheduled_sleep):
     dev = Device("test", 0, "sigen_uid2", "mf", "mdl", Protocol.V1_8)
     sensor = DummyModbusSensor("sigen_s2", address=100)
     dev._add_sensor(cast(Sensor, sensor))
@@ -149,7 +153,8 @@ async def test_reconnection_interruption_on_offline(mock_config):
         dev._online = False
         await real_sleep(0)
 
-    with patch("sigenergy2mqtt.devices.base.poller.ModbusLockFactory.get", return_value=mock_lock), patch("sigenergy2mqtt.devices.base.poller.asyncio.sleep", side_effect=mock_sleep_offline):
+    scheduled_sleep(mock_sleep_offline)
+    with patch("sigenergy2mqtt.devices.base.poller.ModbusLockFactory.get", return_value=mock_lock):
         dev._online = True
         sensor.force_publish = True
 
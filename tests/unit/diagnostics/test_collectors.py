@@ -2,6 +2,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from sigenergy2mqtt.common import InputType
 from sigenergy2mqtt.config import active_config
 from sigenergy2mqtt.diagnostics.collectors import DiagnosticsCollectors
 
@@ -59,3 +60,33 @@ async def test_collect_pvoutput_metrics(monkeypatch):
     assert "PVOutput Upload Errors" in metrics
     assert "config" in metrics
     assert metrics["config"]["end_of_day"] == "@ status interval"
+
+
+def test_collect_scan_plan():
+    from sigenergy2mqtt.devices.base.scan_groups import ScanGroupPlan, ScanPlanRegistry
+
+    ScanPlanRegistry.clear()
+    ScanPlanRegistry.record(0, "Inverter", [ScanGroupPlan("001_30500", 1, InputType.INPUT, 30500, 10, 4, 5, 36.0)])
+    try:
+        plan = DiagnosticsCollectors._diagnostics_collect_scan_plan()
+    finally:
+        ScanPlanRegistry.clear()
+    assert plan["plant_0"]["scan_groups_count"] == 1
+    assert plan["plant_0"]["reads_per_hour"] == 720
+    assert plan["plant_0"]["predicted_bus_load_pct"] == 1.0
+    assert plan["plant_0"]["groups"]["Inverter [001_30500]"].startswith("30500-30509")
+    assert "config" in plan
+
+
+def test_collect_bus_schedule():
+    from sigenergy2mqtt.modbus import BusPriority, ModbusLockFactory
+
+    ModbusLockFactory.clear()
+    try:
+        ModbusLockFactory.get(MagicMock()).wait_stats[BusPriority.HIGH].record(0.25)
+        schedule = DiagnosticsCollectors._diagnostics_collect_bus_schedule()
+    finally:
+        ModbusLockFactory.clear()
+    assert schedule["lock_0"]["high"] == {"granted_count": 1, "expired_count": 0, "wait_mean_ms": 250.0, "wait_max_ms": 250.0}
+    assert schedule["lock_0"]["write"]["granted_count"] == 0
+    assert "config" in schedule
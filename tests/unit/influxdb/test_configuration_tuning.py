@@ -19,6 +19,11 @@ def test_influxdb_config_tuning_defaults():
     assert cfg.pool_maxsize == 100
     assert cfg.sync_chunk_size == 1000
     assert cfg.max_sync_workers == 4
+    assert cfg.spool_max_size == 64.0
+    assert cfg.spool_max_age == 168.0
+    assert cfg.spool_replay_rate == 1000
+    assert cfg.precision == "ms"
+    assert cfg.point_schema == "entity"
 
 
 def test_influxdb_config_tuning_parsing():
@@ -36,6 +41,11 @@ def test_influxdb_config_tuning_parsing():
         "pool-maxsize": "30",
         "sync-chunk-size": "500",
         "max-sync-workers": "8",
+        "spool-max-size": "0",
+        "spool-max-age": 24,
+        "spool-replay-rate": "250",
+        "precision": "us",
+        "point-schema": "device",
         "default-measurement": "energy",
         "load-hass-history": True,
     }
@@ -51,12 +61,17 @@ def test_influxdb_config_tuning_parsing():
     assert cfg.pool_maxsize == 30
     assert cfg.sync_chunk_size == 500
     assert cfg.max_sync_workers == 8
+    assert cfg.spool_max_size == 0.0
+    assert cfg.spool_max_age == 24.0
+    assert cfg.spool_replay_rate == 250
+    assert cfg.precision == "us"
+    assert cfg.point_schema == "device"
     assert cfg.default_measurement == "energy"
     assert cfg.load_hass_history is True
 
 
 @pytest.mark.asyncio
-async def test_service_uses_config_values(monkeypatch):
+async def test_service_uses_config_values():
     # Setup custom config
     active_config.influxdb.batch_size = 50
     active_config.influxdb.flush_interval = 2.0
@@ -92,19 +107,13 @@ async def test_service_uses_config_values(monkeypatch):
     await svc.query_v2("base", "org", "tok", "q")
     assert captured_args["retries"] == 5
 
-    # Verify write timeout logic
-    # Mock asyncio.to_thread to check timeout arg
-    captured_post = {}
-
-    async def fake_to_thread(func, *args, **kwargs):
-        captured_post["timeout"] = kwargs.get("timeout")
-        return MagicMock(status_code=204)
-
-    monkeypatch.setattr("asyncio.to_thread", fake_to_thread)
-
-    svc._writer_type = "v2_http"
-    svc._write_url = "http://localhost:8086/api/v2/write"
+    # Verify the write session uses the write timeout and pool size
     active_config.influxdb.write_timeout = 45.0
-
-    await svc.execute_write(b"data")
-    assert captured_post["timeout"] == 45.0
+    active_config.influxdb.pool_maxsize = 7
+
+    session = svc._get_write_session()
+    assert session.timeout.total == 45.0
+    assert session.connector.limit == 7
+    assert svc._get_write_session() is session
+    await svc.close_write_session()
+    assert session.closed
@@ -1,12 +1,14 @@
 import asyncio
 import logging
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
 import requests
 
 from sigenergy2mqtt.config import active_config
 from sigenergy2mqtt.influxdb.service import InfluxService
+from sigenergy2mqtt.mqtt import SensorEvent, sensor_event_bus
 
 
 class MockResponse:
@@ -71,6 +73,7 @@ def test_init_no_influx_config(logger):
     mock_config.max_retries = 3
     mock_config.pool_connections = 100
     mock_config.pool_maxsize = 100
+    mock_config.precision = "s"
     mock_config.batch_size = 100
     mock_config.flush_interval = 1.0
     mock_config.query_interval = 0.1
@@ -171,9 +174,10 @@ async def testwrite_line_http_fail(influx_config):
     # Manually configure writer
     svc._writer_type = "v2_http"
     svc._write_url = "http://localhost:8086/api/v2/write"
+    svc._max_retries = 0
 
     # Mock clean session post failure
-    with patch.object(svc._session, "post", side_effect=requests.RequestException("write error")), patch("sigenergy2mqtt.influxdb.base.logger.error") as mock_logger_error:
+    with patch.object(svc, "_post_write", side_effect=aiohttp.ClientError("write error")), patch("sigenergy2mqtt.influxdb.base.logger.error") as mock_logger_error:
         await svc.write_line("test line")
         await svc.flush_buffer()  # Force flush to trigger write
         # Log message contains exception detail and context
@@ -235,7 +239,20 @@ def test_subscribe_comprehensive(logger):
         mqtt_handler = MagicMock()
         svc.subscribe(None, mqtt_handler)
         assert "topic1" in svc._topic_cache
-        mqtt_handler.register.assert_called_with(None, "topic1", svc.handle_mqtt)
+        assert sensor_event_bus.is_subscribed("topic1")
+        mqtt_handler.register.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_handle_event_uses_read_time(logger):
+    svc = InfluxService(plant_index=0)
+    svc._topic_cache["topic1"] = {"uom": "W", "object_id": "obj1", "unique_id": "uid1"}
+
+    with patch.object(svc, "write_line") as mock_write:
+        res = await svc.handle_event(SensorEvent("topic1", 1.5, 1700000000.9, "uid1", "obj1"))
+
+    assert res is True
+    mock_write.assert_called_once_with("W,entity_id=obj1 value=1.5 1700000000900")
 
 
 @pytest.mark.asyncio
@@ -312,8 +329,7 @@ async def testwrite_line_v2_http_and_v1_http(logger, influx_config):
     # v2_http
     svc._writer_type = "v2_http"
     svc._write_url = "http://v2"
-    with patch.object(svc._session, "post") as mock_post:
-        mock_post.return_value = MockResponse(204)
+    with patch.object(svc, "_post_write", new_callable=AsyncMock, return_value=(204, "")) as mock_post:
         await svc.write_line("line2")
         await svc.flush_buffer()  # Force flush to trigger write
         mock_post.assert_called()
@@ -321,8 +337,7 @@ async def testwrite_line_v2_http_and_v1_http(logger, influx_config):
     # v1_http
     svc._writer_type = "v1_http"
     svc._write_url = "http://v1"
-    with patch.object(svc._session, "post") as mock_post:
-        mock_post.return_value = MockResponse(204)
+    with patch.object(svc, "_post_write", new_callable=AsyncMock, return_value=(204, "")) as mock_post:
         await svc.write_line("line1")
         await svc.flush_buffer()  # Force flush to trigger write
         mock_post.assert_called()
@@ -10,6 +10,7 @@ import requests
 from sigenergy2mqtt.config import active_config
 from sigenergy2mqtt.influxdb.hass_history_sync import HassHistorySync
 from sigenergy2mqtt.influxdb.service import InfluxService
+from sigenergy2mqtt.mqtt import sensor_event_bus
 
 
 @pytest.fixture
@@ -26,11 +27,13 @@ def service(logger):
     mock_config.max_retries = 3
     mock_config.pool_connections = 100
     mock_config.pool_maxsize = 100
+    mock_config.precision = "s"
     mock_config.batch_size = 100
     mock_config.flush_interval = 1.0
     mock_config.query_interval = 0.1
     mock_config.sync_chunk_size = 100
     mock_config.max_sync_workers = 5
+    mock_config.spool_max_size = 0
 
     with patch.object(active_config, "influxdb", mock_config):
         svc = InfluxService(plant_index=0)
@@ -325,6 +328,7 @@ class TestMiscEdgeCases:
         mock_config.max_retries = 3
         mock_config.pool_connections = 100
         mock_config.pool_maxsize = 100
+        mock_config.precision = "s"
         mock_config.batch_size = 100
         mock_config.flush_interval = 1.0
         mock_config.query_interval = 0.1
@@ -354,6 +358,7 @@ class TestHassHistorySyncCoverage:
         mock_config.max_retries = 3
         mock_config.pool_connections = 10
         mock_config.pool_maxsize = 10
+        mock_config.precision = "s"
         mock_config.batch_size = 100
         mock_config.flush_interval = 1.0
         mock_config.query_interval = 0.1
@@ -604,11 +609,33 @@ class TestInfluxServiceMissingCoverage:
         with patch.object(active_config.influxdb, "load_hass_history", False):
             caplog.set_level(logging.DEBUG)
             service.online = False
-            client = MagicMock()
             service._topic_cache["topic1"] = {}
-            await service._keep_running(None, client)
+            sensor_event_bus.subscribe("topic1", service.handle_event, asyncio.get_running_loop())
+            await service._keep_running(None, MagicMock())
             assert "Loading history from Home Assistant is disabled" in caplog.text
-            client.unsubscribe.assert_called_with("topic1")
+            assert not sensor_event_bus.is_subscribed("topic1")
+
+    @pytest.mark.asyncio
+    async def test_keep_running_spools_unwritten_lines(self, service, monkeypatch, tmp_path):
+        async def fake_init():
+            return True
+
+        monkeypatch.setattr(service, "async_init", fake_init)
+        monkeypatch.setattr(active_config, "persistent_state_path", tmp_path)
+        service._writer_type = "mock"
+        active_config.influxdb.spool_max_size = 1
+        active_config.influxdb.spool_max_age = 1
+        active_config.influxdb.spool_replay_rate = 100
+        active_config.influxdb.load_hass_history = False
+
+        service.online = False
+        service._write_buffer.append("m v=1 1")
+        await service._keep_running(None, MagicMock())
+
+        spool = service._spool
+        assert spool is not None and spool.path == (tmp_path / "influxdb-spool" / "plant0").resolve()
+        assert service._replay_task is None
+        assert spool.read(10).lines == [b"m v=1 1"]
 
     @pytest.mark.asyncio
     async def test_keep_running_sync_task_cancellation(self, service, monkeypatch, caplog):
@@ -1,6 +1,5 @@
 import asyncio
 import logging
-import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,6 +9,7 @@ from sigenergy2mqtt.config import active_config
 from sigenergy2mqtt.config.config import active_config
 from sigenergy2mqtt.influxdb.hass_history_sync import HassHistorySync
 from sigenergy2mqtt.influxdb.service import InfluxService
+from sigenergy2mqtt.influxdb.spool import InfluxSpool
 
 
 class MockResponse:
@@ -37,6 +37,7 @@ def service(logger):
     mock_config.max_retries = 3
     mock_config.pool_connections = 100
     mock_config.pool_maxsize = 100
+    mock_config.precision = "s"
     mock_config.batch_size = 100
     mock_config.flush_interval = 1.0
     mock_config.query_interval = 0.1
@@ -59,6 +60,7 @@ def hass_sync(logger):
     mock_config.max_retries = 3
     mock_config.pool_connections = 100
     mock_config.pool_maxsize = 100
+    mock_config.precision = "s"
     mock_config.batch_size = 100
     mock_config.flush_interval = 1.0
     mock_config.query_interval = 0.1
@@ -134,32 +136,37 @@ class TestInfluxBatching:
 
             await service.write_line("line1")
             await service.write_line("line2")
+            await asyncio.sleep(0.01)
             mock_exec.assert_not_called()
 
             await service.write_line("line3")
+            await asyncio.sleep(0.01)
             mock_exec.assert_called()
 
             # Verify batch content
             args, _ = mock_exec.call_args
             data = args[0]
             assert b"line1\nline2\nline3" == data
+            await service.stop_flusher()
 
     @pytest.mark.asyncio
     async def test_batch_flush_on_interval(self, service):
-        """Test validation that batch flushes when time interval is exceeded."""
+        """Test validation that batch flushes when time interval is exceeded, without further writes."""
         service._batch_size = 100
-        service._flush_interval = 0.5
-        service._last_flush = time.time() - 1.0  # Force interval expiry
+        service._flush_interval = 0.05
 
         with patch.object(service, "execute_write", new_callable=AsyncMock) as mock_exec:
             mock_exec.return_value = True
 
             await service.write_line("line1")
+            mock_exec.assert_not_called()
 
-            mock_exec.assert_called()
+            await asyncio.sleep(0.2)
+            mock_exec.assert_called_once()
 
             args, _ = mock_exec.call_args
             assert b"line1" == args[0]
+            await service.stop_flusher()
 
     @pytest.mark.asyncio
     async def test_manual_flush(self, service):
@@ -172,6 +179,251 @@ class TestInfluxBatching:
 
             await service.flush_buffer()
             mock_exec.assert_called()
+            await service.stop_flusher()
+
+    @pytest.mark.asyncio
+    async def test_write_line_does_not_wait_for_write_in_progress(self, service):
+        """Lines are accepted into the spare buffer while a batch is being written."""
+        release = asyncio.Event()
+        batches = []
+
+        async def slow_write(data):
+            batches.append(data)
+            await release.wait()
+            return True
+
+        with patch.object(service, "execute_write", side_effect=slow_write):
+            await service.write_line("line1")
+            flush = asyncio.create_task(service.flush_buffer())
+            await asyncio.sleep(0.01)
+            assert batches == [b"line1"]
+
+            await asyncio.wait_for(service.write_line("line2"), timeout=0.1)
+            assert service._write_buffer == ["line2"]
+            assert not flush.done()
+
+            release.set()
+            await flush
+            await service.flush_buffer()
+            assert batches == [b"line1", b"line2"]
+            await service.stop_flusher()
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_in_batch_size_slices(self, service):
+        """A buffer that has grown beyond the batch size is written in slices of at most that size."""
+        service._batch_size = 2
+        service._flush_interval = 1000
+        with patch.object(service, "execute_write", new_callable=AsyncMock, return_value=True) as mock_exec:
+            for i in range(3):
+                await service.write_line(f"line{i}")
+            service._write_buffer.extend(["line3", "line4"])  # Appended while the flusher was not scheduled
+            await service.flush_buffer()
+
+            assert [c.args[0] for c in mock_exec.await_args_list] == [b"line0\nline1", b"line2\nline3", b"line4"]
+            await service.stop_flusher()
+
+    @pytest.mark.asyncio
+    async def test_write_line_waits_above_high_water_mark(self, service):
+        """Writers wait for the buffer to be flushed once it holds several batches."""
+        service._batch_size = 2
+        release = asyncio.Event()
+        batches = []
+
+        async def slow_write(data):
+            batches.append(data)
+            await release.wait()
+            return True
+
+        with patch.object(service, "execute_write", side_effect=slow_write):
+            await service.write_line("line0")
+            flush = asyncio.create_task(service.flush_buffer())
+            await asyncio.sleep(0.01)
+            for i in range(1, 8):
+                await asyncio.wait_for(service.write_line(f"line{i}"), timeout=0.1)
+
+            blocked = asyncio.create_task(service.write_line("line8"))  # 8 lines buffered: 4 batches
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+
+            release.set()
+            await asyncio.wait_for(blocked, timeout=1)
+            await flush
+            assert len(service._write_buffer) < 2
+            assert batches[:5] == [b"line0", b"line1\nline2", b"line3\nline4", b"line5\nline6", b"line7\nline8"]
+            await service.stop_flusher()
+
+    @pytest.mark.asyncio
+    async def test_flush_records_batch_metrics(self, service):
+        """Each flushed batch records its size and how long its oldest line waited."""
+        with patch.object(service, "execute_write", new_callable=AsyncMock) as mock_exec, patch("sigenergy2mqtt.influxdb.base.Metrics.influxdb_flush", new_callable=AsyncMock) as mock_flush:
+            mock_exec.return_value = True
+
+            await service.write_line("line1")
+            await service.write_line("line2")
+            await asyncio.sleep(0.02)
+            await service.flush_buffer()
+            await service.flush_buffer()  # Empty buffer: nothing recorded
+
+            mock_flush.assert_awaited_once()
+            batch_size, delay = mock_flush.await_args.args
+            assert batch_size == 2
+            assert delay >= 0.02
+            await service.stop_flusher()
+
+    @pytest.mark.asyncio
+    async def test_stop_flusher(self, service):
+        """stop_flusher cancels the background task started by write_line."""
+        with patch.object(service, "execute_write", new_callable=AsyncMock):
+            await service.write_line("line1")
+            task = service._flusher_task
+            assert task is not None and not task.done()
+
+            await service.stop_flusher()
+
+            assert task.cancelled()
+            assert service._flusher_task is None
+
+
+class TestInfluxSpoolReplay:
+    @pytest.fixture
+    def spool(self, tmp_path):
+        return InfluxSpool(tmp_path, max_bytes=1 << 20, max_age=3600)
+
+    @staticmethod
+    def _influxdb(service, statuses):
+        """Patch execute_write to answer with each HTTP status in turn (None: no response), then 204."""
+        written = []
+
+        async def execute_write(data):
+            status = statuses.pop(0) if statuses else 204
+            service._last_write_status = status
+            if status == 204:
+                written.append(data)
+            return status == 204
+
+        return patch.object(service, "execute_write", side_effect=execute_write), written
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_spooled_and_replayed(self, service, spool):
+        service._batch_size = 2
+        service._flush_interval = 1000
+        patcher, written = self._influxdb(service, [None, None])
+        with patcher, patch("sigenergy2mqtt.influxdb.base._REPLAY_MIN_BACKOFF", 0.05):
+            service.start_replay(spool, rate=10000)
+            await service.write_line("m v=1 1")
+            await service.flush_buffer()  # Fails (no response): spooled
+            assert spool.pending_lines == 1
+
+            await asyncio.sleep(0.02)  # Replay fails once, then backs off
+            assert spool.pending_lines == 1
+            await service.write_line("m v=2 2")
+            await service.flush_buffer()  # Succeeds, and wakes replay
+            await asyncio.sleep(0.05)
+
+            assert written == [b"m v=2 2", b"m v=1 1"]
+            assert spool.pending_lines == 0
+            assert spool.replayed_lines == 1
+            await service.stop_replay()
+            await service.stop_flusher()
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_is_not_spooled(self, service, spool):
+        patcher, written = self._influxdb(service, [400])
+        with patcher:
+            service.start_replay(spool, rate=10000)
+            await service.write_line("bad")
+            await service.flush_buffer()
+
+            assert spool.pending_lines == 0
+            assert written == []
+            await service.stop_replay()
+            await service.stop_flusher()
+
+    @pytest.mark.asyncio
+    async def test_replay_is_rate_limited_in_order(self, service, spool):
+        service._batch_size = 2
+        for i in range(6):
+            spool.append(f"m v={i} {i}".encode())
+        patcher, written = self._influxdb(service, [])
+        with patcher:
+            service.start_replay(spool, rate=20)  # 2 lines every 0.1s
+            await asyncio.sleep(0.15)
+            assert len(written) == 2
+
+            await asyncio.sleep(0.2)
+            assert written == [b"m v=0 0\nm v=1 1", b"m v=2 2\nm v=3 3", b"m v=4 4\nm v=5 5"]
+            await service.stop_replay()
+
+    @pytest.mark.asyncio
+    async def test_replay_yields_to_waiting_live_batch(self, service, spool):
+        spool.append(b"m v=0 0")
+        service._flush_wakeup.set()  # A full live batch is waiting for the flusher
+        patcher, written = self._influxdb(service, [])
+        with patcher:
+            service.start_replay(spool, rate=10000)
+            await asyncio.sleep(0.05)
+            assert written == []
+
+            service._flush_wakeup.clear()
+            await asyncio.sleep(0.15)
+            assert written == [b"m v=0 0"]
+            await service.stop_replay()
+
+    @pytest.mark.asyncio
+    async def test_rejected_spooled_points_are_discarded(self, service, spool):
+        spool.append(b"bad")
+        spool.append(b"m v=1 1")
+        service._batch_size = 1
+        patcher, written = self._influxdb(service, [400])
+        with patcher:
+            service.start_replay(spool, rate=10000)
+            await asyncio.sleep(0.05)
+
+            assert written == [b"m v=1 1"]
+            assert (spool.replayed_lines, spool.dropped_lines) == (1, 1)
+            await service.stop_replay()
+
+    @pytest.mark.asyncio
+    async def test_interrupted_write_is_spooled_on_shutdown(self, service, spool):
+        service._spool = spool
+        writing = asyncio.Event()
+
+        async def execute_write(data):
+            writing.set()
+            await asyncio.Event().wait()  # No response before shutdown
+
+        with patch.object(service, "execute_write", side_effect=execute_write):
+            await service.write_line("m v=1 1")
+            service._flush_wakeup.set()
+            await asyncio.wait_for(writing.wait(), 1)
+            await service.write_line("m v=2 2")
+
+            await service.stop_flusher()
+            await service.spool_buffer()
+
+        assert spool.read(10).lines == [b"m v=1 1", b"m v=2 2"]
+
+    @pytest.mark.asyncio
+    async def test_spool_buffer_on_shutdown(self, service, spool):
+        service._spool = spool
+        await service.write_line("m v=1 1")
+        await service.write_line("m v=2 2")
+        await service.stop_flusher()
+
+        await service.spool_buffer()
+
+        assert service._write_buffer == []
+        assert spool.read(10).lines == [b"m v=1 1", b"m v=2 2"]
+
+    @pytest.mark.asyncio
+    async def test_without_spool_failed_batch_is_dropped(self, service):
+        patcher, _ = self._influxdb(service, [None])
+        with patcher:
+            await service.write_line("m v=1 1")
+            await service.flush_buffer()
+            await service.spool_buffer()
+            assert service._write_buffer == []
+            await service.stop_flusher()
 
 
 class TestInfluxChunking:
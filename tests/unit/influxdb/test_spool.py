@@ -0,0 +1,154 @@
+"""Unit tests for the InfluxDB failed-batch spool."""
+
+import os
+import time
+
+from sigenergy2mqtt.influxdb.spool import SEGMENT_SUFFIX, InfluxSpool
+
+
+def _segments(path):
+    return sorted(p.name for p in path.iterdir() if p.suffix == SEGMENT_SUFFIX)
+
+
+def test_points_are_replayed_in_order(tmp_path):
+    spool = InfluxSpool(tmp_path, max_bytes=1 << 20, max_age=3600)
+    spool.append(b"m v=1 1\nm v=2 2")
+    spool.append(b"m v=3 3\n")
+
+    first = spool.read(2)
+    assert first.lines == [b"m v=1 1", b"m v=2 2"]
+    assert spool.read(2) == first  # Not removed until committed
+    spool.commit(first)
+    spool.commit(first)  # Already committed
+    rest = spool.read(10)
+    assert rest.lines == [b"m v=3 3"]
+    spool.commit(rest)
+
+    assert spool.pending_lines == 0
+    assert spool.pending_bytes == 0
+    assert _segments(tmp_path) == []
+    assert spool.stats()["replayed_points"] == 3
+
+
+def test_segments_roll_and_are_removed_once_replayed(tmp_path):
+    spool = InfluxSpool(tmp_path, max_bytes=64 * 1024, max_age=3600)
+    line = b"m v=1 " + b"0" * 1000
+    for _ in range(10):
+        spool.append(line)
+
+    assert len(_segments(tmp_path)) == 2  # 4 KiB segments, closed once full
+
+    while chunk := spool.read(3):
+        spool.commit(chunk)
+
+    assert _segments(tmp_path) == []
+    assert spool.replayed_lines == 10
+
+
+def test_spool_survives_restart(tmp_path):
+    spool = InfluxSpool(tmp_path, max_bytes=1 << 20, max_age=3600)
+    spool.append(b"m v=1 1\nm v=2 2")
+    spool.commit(spool.read(1))
+    # The application stopped part-way through appending a further batch
+    with open(tmp_path / _segments(tmp_path)[0], "ab") as f:
+        f.write(b"m v=3")
+
+    reopened = InfluxSpool(tmp_path, max_bytes=1 << 20, max_age=3600)
+
+    # Replay progress is not persisted, and the partial line is discarded
+    assert reopened.pending_lines == 2
+    assert reopened.read(10).lines == [b"m v=1 1", b"m v=2 2"]
+    reopened.append(b"m v=4 4")
+    assert reopened.read(10).lines == [b"m v=1 1", b"m v=2 2", b"m v=4 4"]
+
+
+def test_oldest_segments_dropped_when_too_large(tmp_path):
+    spool = InfluxSpool(tmp_path, max_bytes=10_000, max_age=3600)
+    line = b"m v=1 " + b"0" * 1000
+    for _ in range(20):
+        spool.append(line)
+
+    assert spool.pending_bytes <= 10_000
+    assert spool.dropped_lines == 20 - spool.pending_lines
+    assert spool.dropped_lines > 0
+
+
+def test_old_segments_dropped(tmp_path):
+    spool = InfluxSpool(tmp_path, max_bytes=1 << 20, max_age=60)
+    spool.append(b"m v=1 1")
+    spool._segments[0].modified = time.time() - 120
+
+    assert spool.read(10) is None
+    assert spool.dropped_lines == 1
+    assert _segments(tmp_path) == []
+
+
+def test_commit_ignored_once_segment_dropped(tmp_path):
+    spool = InfluxSpool(tmp_path, max_bytes=10_000, max_age=3600)
+    spool.append(b"\n".join(b"m v=%d 1" % i for i in range(5)))
+    chunk = spool.read(2)
+    # While the chunk was being written, a failed live batch pushed the spool over its limit
+    for _ in range(10):
+        spool.append(b"m v=1 " + b"0" * 1000)
+    assert _segments(tmp_path)[0] != chunk.path.name
+
+    spool.commit(chunk)
+
+    assert spool.replayed_lines == 0
+    assert spool.dropped_lines + spool.pending_lines == 15  # No point skipped, or counted twice
+    oldest = spool.read(1)
+    assert oldest.start == 0
+    assert oldest.lines == [b"m v=1 " + b"0" * 1000]
+
+
+def test_points_replayed_at_current_precision(tmp_path):
+    InfluxSpool(tmp_path, max_bytes=1 << 20, max_age=3600, precision="s").append(b'm,t=a\\ b v=1,s="x y" 1700000000\nm v=2 1700000001')
+
+    spool = InfluxSpool(tmp_path, max_bytes=1 << 20, max_age=3600, precision="ms")
+    spool.append(b"m v=3 1700000002500")
+
+    assert _segments(tmp_path) == ["000000000000.s.lp", "000000000001.ms.lp"]
+    first = spool.read(10)
+    assert first.lines == [b'm,t=a\\ b v=1,s="x y" 1700000000000', b"m v=2 1700000001000"]
+    spool.commit(first)
+    assert spool.read(10).lines == [b"m v=3 1700000002500"]
+
+    spool.precision = "s"
+    assert spool.read(10).lines == [b"m v=3 1700000002"]
+
+
+def test_discarded_points_are_counted_as_dropped(tmp_path):
+    spool = InfluxSpool(tmp_path, max_bytes=1 << 20, max_age=3600)
+    spool.append(b"bad line")
+    spool.commit(spool.read(10), replayed=False)
+
+    assert (spool.replayed_lines, spool.dropped_lines, spool.pending_lines) == (0, 1, 0)
+
+
+def test_unwritable_spool_drops_batch(tmp_path):
+    (tmp_path / "file").write_text("")
+    spool = InfluxSpool(tmp_path / "file" / "spool", max_bytes=1 << 20, max_age=3600)
+
+    assert spool.append(b"m v=1 1") is False
+    assert spool.dropped_lines == 1
+    assert spool.pending_lines == 0
+
+
+def test_get_shares_instances_and_snapshot(tmp_path):
+    spool = InfluxSpool.get(tmp_path / "plant0", 1 << 20, 3600)
+    assert InfluxSpool.get(str(tmp_path / "." / "plant0"), 1 << 20, 3600) is spool
+    spool.append(b"m v=1 1")
+
+    snapshot = InfluxSpool.snapshot()
+    assert snapshot["plant0"]["pending_points"] == 1
+    assert snapshot["plant0"]["segments"] == 1
+    assert snapshot["plant0"]["spooled_points"] == 1
+
+
+def test_segment_files_are_durable(tmp_path):
+    spool = InfluxSpool(tmp_path, max_bytes=1 << 20, max_age=3600)
+    spool.append(b"m v=1 1")
+
+    segment = tmp_path / _segments(tmp_path)[0]
+    assert segment.read_bytes() == b"m v=1 1\n"
+    assert os.path.getsize(segment) == spool.pending_bytes
@@ -0,0 +1,236 @@
+"""Unit tests for InfluxDB line-protocol serialisation, point schemas and compressed writes."""
+
+import gzip
+
+import pytest
+from aiohttp import web
+
+from sigenergy2mqtt.config import active_config
+from sigenergy2mqtt.influxdb.service import InfluxService
+from sigenergy2mqtt.mqtt import SensorEvent
+
+
+def _service(precision: str = "ms") -> InfluxService:
+    active_config.influxdb.precision = precision
+    svc = InfluxService(plant_index=0)
+    svc._online = True
+    return svc
+
+
+@pytest.mark.parametrize(
+    "precision, expected",
+    [
+        ("s", "1700000000"),
+        ("ms", "1700000000123"),
+        ("us", "1700000000123457"),
+        ("ns", "1700000000123456768"),
+    ],
+)
+def test_fractional_timestamp_converted_to_precision(precision, expected):
+    line = _service(precision).to_line_protocol("m", {}, {"v": 1.0}, 1700000000.1234567)
+    assert line == f"m v=1.0 {expected}"
+
+
+@pytest.mark.parametrize("precision, expected", [("s", "1700000000"), ("ms", "1700000000000"), ("ns", "1700000000000000000")])
+def test_integer_timestamp_converted_exactly(precision, expected):
+    assert _service(precision).to_line_protocol("m", {}, {"v": 1}, 1700000000).endswith(f" {expected}")
+
+
+def test_second_precision_truncates():
+    assert _service("s").to_line_protocol("m", {}, {"v": 1}, 1700000000.9).endswith(" 1700000000")
+
+
+def _cache(svc: InfluxService, object_id: str, uom: str, device_id: str) -> str:
+    topic = f"sigenergy2mqtt/{object_id}/state"
+    svc._topic_cache[topic] = {"uom": uom, "object_id": object_id, "unique_id": object_id, "device_id": device_id, "debug_logging": False}
+    return topic
+
+
+async def _written(svc: InfluxService, states: list[tuple[str, object, float]]) -> list[str]:
+    written: list[bytes] = []
+
+    async def execute_write(data: bytes) -> bool:
+        written.append(data)
+        return True
+
+    svc.execute_write = execute_write
+    for topic, value, timestamp in states:
+        assert await svc.handle_event(SensorEvent(topic, value, timestamp, "uid", "obj"))
+    await svc.flush_buffer()
+    await svc.stop_flusher()
+    return b"\n".join(written).decode().split("\n")
+
+
+@pytest.mark.asyncio
+async def test_entity_schema_writes_point_per_state():
+    svc = _service()
+    a = _cache(svc, "inverter_phase_a_voltage", "V", "inverter")
+    b = _cache(svc, "inverter_phase_b_voltage", "V", "inverter")
+
+    lines = await _written(svc, [(a, 230.1, 1700000000.5), (b, 229.8, 1700000000.5)])
+
+    assert lines == [
+        "V,entity_id=inverter_phase_a_voltage value=230.1 1700000000500",
+        "V,entity_id=inverter_phase_b_voltage value=229.8 1700000000500",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_device_schema_groups_states_by_device_unit_and_timestamp():
+    active_config.influxdb.point_schema = "device"
+    svc = _service()
+    a = _cache(svc, "inverter_phase_a_voltage", "V", "inverter")
+    b = _cache(svc, "inverter_phase_b_voltage", "V", "inverter")
+    power = _cache(svc, "inverter_active_power", "kW", "inverter")
+    state = _cache(svc, "inverter_running_state", "", "inverter")
+    plant = _cache(svc, "plant_voltage", "V", "plant")
+
+    lines = await _written(
+        svc,
+        [
+            (a, 230.1, 1700000000.5),
+            (power, 4.2, 1700000000.5),
+            (b, 229.8, 1700000000.5),
+            (state, "Running", 1700000000.5),
+            (plant, 231.0, 1700000000.5),
+            (a, 230.3, 1700000001.5),
+        ],
+    )
+
+    assert lines == [
+        "V,device_id=inverter inverter_phase_a_voltage=230.1,inverter_phase_b_voltage=229.8 1700000000500",
+        "kW,device_id=inverter inverter_active_power=4.2 1700000000500",
+        'state,device_id=inverter inverter_running_state_str="Running" 1700000000500',
+        "V,device_id=plant plant_voltage=231.0 1700000000500",
+        "V,device_id=inverter inverter_phase_a_voltage=230.3 1700000001500",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_device_schema_matches_timestamps_at_precision():
+    active_config.influxdb.point_schema = "device"
+    svc = _service("s")
+    a = _cache(svc, "inverter_phase_a_voltage", "V", "inverter")
+    b = _cache(svc, "inverter_phase_b_voltage", "V", "inverter")
+
+    lines = await _written(svc, [(a, 230.1, 1700000000.2), (b, 229.8, 1700000000.7), (a, 230.3, 1700000000.9)])
+
+    assert lines == ["V,device_id=inverter inverter_phase_a_voltage=230.3,inverter_phase_b_voltage=229.8 1700000000"]
+
+
+@pytest.mark.asyncio
+async def test_grouped_points_count_towards_batch_size():
+    active_config.influxdb.point_schema = "device"
+    active_config.influxdb.batch_size = 2
+    svc = _service()
+    a = _cache(svc, "inverter_phase_a_voltage", "V", "inverter")
+    power = _cache(svc, "inverter_active_power", "kW", "inverter")
+
+    await svc.handle_event(SensorEvent(a, 230.1, 1700000000.5, "uid", "obj"))
+    await svc.handle_event(SensorEvent(a, 230.2, 1700000000.5, "uid", "obj"))
+    assert not svc._flush_wakeup.is_set()
+    await svc.handle_event(SensorEvent(power, 4.2, 1700000000.5, "uid", "obj"))
+    assert svc._flush_wakeup.is_set()
+    await svc.stop_flusher()
+
+
+async def _start_server(responses: list[int]) -> tuple[web.AppRunner, str, list[dict]]:
+    """Start a stand-in InfluxDB on a free local port that answers writes with *responses* in turn."""
+    received = []
+
+    async def write(request: web.Request) -> web.Response:
+        received.append({"path": request.path, "query": dict(request.query), "headers": dict(request.headers), "body": await request.read()})
+        return web.Response(status=responses.pop(0) if len(responses) > 1 else responses[0], text="")
+
+    app = web.Application()
+    app.router.add_post("/write", write)
+    app.router.add_post("/api/v2/write", write)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}", received
+
+
+@pytest.mark.asyncio
+async def test_v2_write_is_gzip_compressed():
+    runner, base, received = await _start_server([204])
+    svc = _service("ms")
+    svc._writer_type = "v2_http"
+    svc._write_url = f"{base}/api/v2/write?bucket=b&precision=ms"
+    svc._write_headers = {"Authorization": "Token tok"}
+    try:
+        assert await svc.execute_write(b"m v=1 1700000000000\nm v=2 1700000001000") is True
+    finally:
+        await svc.close_write_session()
+        await runner.cleanup()
+
+    assert len(received) == 1
+    request = received[0]
+    assert request["query"] == {"bucket": "b", "precision": "ms"}
+    assert request["headers"]["Content-Encoding"] == "gzip"
+    assert request["headers"]["Authorization"] == "Token tok"
+    # aiohttp decompresses the request body for the handler
+    assert request["body"] == b"m v=1 1700000000000\nm v=2 1700000001000"
+    assert int(request["headers"]["Content-Length"]) == len(gzip.compress(request["body"], compresslevel=5, mtime=0))
+    assert svc._last_write_status == 204
+
+
+@pytest.mark.asyncio
+async def test_v1_write_passes_database_precision_and_auth():
+    runner, base, received = await _start_server([204])
+    active_config.influxdb.database = "energy"
+    svc = _service("us")
+    svc._writer_type = "v1_http"
+    svc._write_url = f"{base}/write"
+    svc._write_auth = ("user", "secret")
+    try:
+        assert await svc.execute_write(b"m v=1 1") is True
+    finally:
+        await svc.close_write_session()
+        await runner.cleanup()
+
+    request = received[0]
+    assert request["query"] == {"db": "energy", "precision": "u"}
+    assert request["headers"]["Authorization"] == "Basic dXNlcjpzZWNyZXQ="
+    assert request["headers"]["Content-Encoding"] == "gzip"
+    assert request["body"] == b"m v=1 1"
+
+
+@pytest.mark.asyncio
+async def test_transient_status_is_retried(monkeypatch):
+    monkeypatch.setattr("sigenergy2mqtt.influxdb.base.asyncio.wait_for", _no_backoff)
+    runner, base, received = await _start_server([503, 204])
+    svc = _service()
+    svc._writer_type = "v2_http"
+    svc._write_url = f"{base}/api/v2/write?bucket=b&precision=ms"
+    try:
+        assert await svc.execute_write(b"m v=1 1") is True
+    finally:
+        await svc.close_write_session()
+        await runner.cleanup()
+
+    assert len(received) == 2
+
+
+@pytest.mark.asyncio
+async def test_rejected_batch_is_not_retried(monkeypatch):
+    monkeypatch.setattr("sigenergy2mqtt.influxdb.base.asyncio.wait_for", _no_backoff)
+    runner, base, received = await _start_server([400])
+    svc = _service()
+    svc._writer_type = "v2_http"
+    svc._write_url = f"{base}/api/v2/write?bucket=b&precision=ms"
+    try:
+        assert await svc.execute_write(b"bad") is False
+    finally:
+        await svc.close_write_session()
+        await runner.cleanup()
+
+    assert len(received) == 1
+    assert svc._last_write_status == 400
+
+
+async def _no_backoff(awaitable, timeout):
+    awaitable.close()
+    raise TimeoutError
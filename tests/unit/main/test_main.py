@@ -503,6 +503,36 @@ class TestFactories:
             assert inv is not None
             assert plant is not None
 
+    @pytest.mark.asyncio
+    async def test_make_plant_and_inverter_same_sn_on_concurrent_hosts(self):
+        """Test that an inverter reachable through two hosts probed concurrently is only created once."""
+        states = {"InverterSerialNumber": "SN1", "InverterModel": "MDL1", "PACKBCUCount": 0, "SystemTimeZone": 600, "InverterFirmwareVersion": "V122R001C00SPC112B701P", "OutputType": 1}
+        seen = set()
+
+        async def get_state(sensor, *args, **kwargs):
+            await asyncio.sleep(0)  # Every read lets the other host's probe run
+            return states.get(type(sensor).__name__)
+
+        with (
+            patch("sigenergy2mqtt.main.main.get_state", side_effect=get_state),
+            patch("sigenergy2mqtt.main.main.probe_protocol", AsyncMock(return_value=Protocol.V2_8)),
+            patch("sigenergy2mqtt.main.main.probe_optional_interface", AsyncMock(return_value=False)),
+            patch("sigenergy2mqtt.devices.PowerPlant.create", AsyncMock(return_value=MagicMock(protocol_version=Protocol.V2_8, unique_id="p1"))),
+            patch("sigenergy2mqtt.devices.Inverter.create", AsyncMock(return_value=MagicMock())),
+        ):
+            results = await asyncio.gather(*(main_mod.make_plant_and_inverter(i, AsyncMock(), 1, None, seen) for i in range(2)))
+
+        assert [inv is not None for inv, _ in results] == [True, False]
+        assert seen == {"SN1"}
+
+    @pytest.mark.asyncio
+    async def test_make_plant_and_inverter_failure_releases_sn(self):
+        """Test that the serial number is released when the inverter cannot be created."""
+        seen = set()
+        with patch("sigenergy2mqtt.main.main.get_state", side_effect=["SN123", None]), pytest.raises(ValueError):
+            await main_mod.make_plant_and_inverter(0, AsyncMock(), 1, None, seen)
+        assert seen == set()
+
     @pytest.mark.asyncio
     async def test_make_plant_and_inverter_spc113_forces_ems_mode_check_false(self, clean_config):
         """Test ems_mode_check forced to False for firmware SPC113+."""
@@ -910,6 +940,49 @@ async def test_validate_publishable_sensors_ignores_non_inverter_device_attribut
     read_registers.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_validate_publishable_sensors_bisects_contiguous_ranges(clean_config, monkeypatch):
+    sensors = [make_validation_sensor(f"bisect_{i}", 30100 + i) for i in range(16)] + [make_validation_sensor("bisect_apart", 30200)]
+    device = make_validation_device(sensors[0], "sigen_validation_bisect_device")
+    device.get_all_sensors.return_value = {s.unique_id: s for s in sensors}
+    illegal = 30105
+    monkeypatch.setattr(main_mod.state_store, "load", AsyncMock(return_value=None))
+    save = AsyncMock()
+    monkeypatch.setattr(main_mod.state_store, "save", save)
+    monkeypatch.setattr(main_mod, "_current_modbus_config_hash", lambda: "modbus-a")
+
+    async def read(client, address, count, device_id, input_type):
+        return IllegalAddressResponse() if address <= illegal < address + count else MagicMock(isError=MagicMock(return_value=False))
+
+    read_registers = AsyncMock(side_effect=read)
+    monkeypatch.setattr(main_mod, "read_registers", read_registers)
+
+    await main_mod.validate_publishable_sensors(AsyncMock(), device, {1: "V100R001C00SPC112B107G"})
+
+    assert [s.address for s in sensors if not s.publishable] == [illegal]
+    # One read of each range, then two reads per halving of the range holding the illegal address
+    assert read_registers.await_count == 1 + 1 + 2 * 4
+    assert read_registers.await_args_list[0].args[1:3] == (30100, 16)
+    assert json.loads(save.await_args.args[2])["illegal_sensor_unique_ids"] == ["sigen_validation_bisect_5"]
+
+
+@pytest.mark.asyncio
+async def test_validate_publishable_sensors_reads_each_sensor_when_chunking_disabled(clean_config, monkeypatch):
+    sensors = [make_validation_sensor(f"unchunked_{i}", 30300 + i) for i in range(3)]
+    device = make_validation_device(sensors[0], "sigen_validation_unchunked_device")
+    device.get_all_sensors.return_value = {s.unique_id: s for s in sensors}
+    device.plant_index = 0
+    clean_config.modbus[0].disable_chunking = True
+    monkeypatch.setattr(main_mod.state_store, "load", AsyncMock(return_value=None))
+    monkeypatch.setattr(main_mod.state_store, "save", AsyncMock())
+    read_registers = AsyncMock(return_value=None)
+    monkeypatch.setattr(main_mod, "read_registers", read_registers)
+
+    await main_mod.validate_publishable_sensors(AsyncMock(), device)
+
+    assert [call.args[1:3] for call in read_registers.await_args_list] == [(30300, 1), (30301, 1), (30302, 1)]
+
+
 @pytest.mark.asyncio
 async def test_setup_services_comprehensive(clean_config):
     """Test setup_services with various enabled/disabled parts."""
@@ -1148,6 +1221,8 @@ async def test_async_main_restarts_when_requested(clean_config, monkeypatch):
 
     clear_mock = MagicMock()
     monkeypatch.setattr(main_mod.thread_config_registry, "clear", clear_mock)
+    plan_clear_mock = MagicMock()
+    monkeypatch.setattr(main_mod.ScanPlanRegistry, "clear", plan_clear_mock)
 
     monkeypatch.setattr(main_mod, "ModbusClient", lambda *a, **h: AsyncMock(__aenter__=AsyncMock(return_value=AsyncMock(connected=True))))
     mock_plant = MagicMock(protocol_version=Protocol.V1_8, device_address=247, name="Plant")
@@ -1160,6 +1235,7 @@ async def test_async_main_restarts_when_requested(clean_config, monkeypatch):
 
     assert start_mock.await_count == 2
     assert clear_mock.call_count == 2
+    assert plan_clear_mock.call_count == 2
     assert active_config.home_assistant.enabled is False
 
 
@@ -181,6 +181,108 @@ async def test_setup_devices_active_power_bounds_missing(caplog):
             assert "Failed to acquire RatedActivePower" in caplog.text
 
 
+# ---------------------------------------------------------------------------
+# setup_devices concurrent probing of hosts
+# ---------------------------------------------------------------------------
+
+def _mock_host(host, ac_chargers=()):
+    device = MagicMock()
+    device.host = host
+    device.port = 502
+    device.registers.read_only = True
+    device.registers.read_write = True
+    device.registers.write_only = False
+    device.inverters = [1]
+    device.ac_chargers = list(ac_chargers)
+    device.dc_chargers = []
+    device.pss = []
+    device.pid = []
+    return device
+
+
+@pytest.mark.asyncio
+async def test_setup_devices_probes_hosts_concurrently_in_config_order():
+    hosts = [_mock_host("slow", ac_chargers=[2]), _mock_host("fast", ac_chargers=[3])]
+    created = []
+    in_flight = 0
+    max_in_flight = 0
+    configs = {}
+    sequences = {}
+
+    def create(host, *args, **kwargs):
+        created.append(host)
+        return configs.setdefault(host, MagicMock(devices=[]))
+
+    async def make_plant_and_inverter(plant_index, modbus, device_address, plant, seen):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05 if hosts[plant_index].host == "slow" else 0)
+        in_flight -= 1
+        mock_plant = MagicMock()
+        mock_plant.protocol_version = Protocol.V2_8 if plant_index == 0 else Protocol.V2_4
+        mock_plant.sensors = {}
+        return None, mock_plant
+
+    async def setup_ac_chargers(plant_index, device, plant, modbus, config, protocol_version, sequence_start, total_count, firmware):
+        sequences[device.host] = (sequence_start, total_count, protocol_version)
+        return sequence_start + len(device.ac_chargers)
+
+    with patch("sigenergy2mqtt.config.active_config.modbus", hosts), \
+         patch("sigenergy2mqtt.main.main.thread_config_registry.get_all", side_effect=lambda: [configs[h] for h in created]), \
+         patch("sigenergy2mqtt.main.main.ModbusClient", autospec=True) as mock_mc, \
+         patch("sigenergy2mqtt.main.main.ThreadConfig.create", side_effect=create), \
+         patch("sigenergy2mqtt.main.main.make_plant_and_inverter", side_effect=make_plant_and_inverter), \
+         patch("sigenergy2mqtt.main.main.validate_publishable_sensors", new_callable=AsyncMock), \
+         patch("sigenergy2mqtt.main.main.bind_cross_device_sensors"), \
+         patch("sigenergy2mqtt.main.main._setup_ac_chargers", side_effect=setup_ac_chargers):
+        mock_client = AsyncMock()
+        mock_client.connected = True
+        mock_mc.return_value = mock_client
+        mock_client.__aenter__.return_value = mock_client
+
+        result, protocol_version = await main_mod.setup_devices(set())
+
+    assert max_in_flight == 2
+    assert created == ["slow", "fast"]
+    assert result == [configs["slow"], configs["fast"]]
+    assert protocol_version == Protocol.V2_8
+    # Sequence numbers follow the configuration, and each host is checked against its own plant protocol
+    assert sequences == {"slow": (0, 2, Protocol.V2_8), "fast": (1, 2, Protocol.V2_4)}
+
+
+@pytest.mark.asyncio
+async def test_setup_devices_connection_failure_cancels_other_hosts():
+    hosts = [_mock_host("down"), _mock_host("up")]
+    cancelled = False
+
+    async def make_plant_and_inverter(*args):
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    clients = {}
+
+    def client(host, **kwargs):
+        mock_client = AsyncMock()
+        mock_client.connected = host == "up"
+        mock_client.__aenter__.return_value = mock_client
+        clients[host] = mock_client
+        return mock_client
+
+    with patch("sigenergy2mqtt.config.active_config.modbus", hosts), \
+         patch("sigenergy2mqtt.main.main.ModbusClient", side_effect=client), \
+         patch("sigenergy2mqtt.main.main.ThreadConfig.create", return_value=MagicMock(devices=[])), \
+         patch("sigenergy2mqtt.main.main.make_plant_and_inverter", side_effect=make_plant_and_inverter):
+        with pytest.raises(SystemExit):
+            await main_mod.setup_devices(set())
+
+    assert cancelled
+
+
 # ---------------------------------------------------------------------------
 # _setup_dc_chargers missing associated inverter test (lines 731-732)
 # ---------------------------------------------------------------------------
@@ -24,6 +24,8 @@ class DummyMQTTClient:
 
 
 class DummyMQTTHandler:
+    loop = None
+
     async def wait_for(self, timeout, name, method, mqtt_client, **kwargs):
         # call the device method synchronously (it may be sync in tests)
         try:
@@ -126,7 +128,7 @@ async def test_read_and_publish_device_sensors_with_modbus_and_tasks(monkeypatch
             def close(self):
                 self.closed = True
 
-        async def fake_get_client(host, port, timeout, retries):
+        async def fake_get_client(host, port, timeout, retries, pipeline_depth=1, capture_file=None):
             return MockModbus()
 
         monkeypatch.setattr(threading_mod.ModbusClientFactory, "get_client", fake_get_client)
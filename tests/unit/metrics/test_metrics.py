@@ -1,3 +1,4 @@
+import asyncio
 import threading
 from unittest.mock import patch
 
@@ -190,6 +191,115 @@ class TestMetricsRead:
             assert "modbus read metrics collection" in mock_warning.call_args[0][0]
 
 
+class TestMetricsDecodedRead:
+    """Tests for Metrics.modbus_decoded_read()."""
+
+    @pytest.fixture(autouse=True)
+    def reset_metrics(self):
+        """Reset decoded read metrics before and after each test."""
+        fields = ["sigenergy2mqtt_modbus_decoded_reads", "sigenergy2mqtt_modbus_unchanged_reads", "sigenergy2mqtt_modbus_unchanged_percentage"]
+        for name in fields:
+            setattr(Metrics, name, Metrics._defaults[name])
+        yield
+        for name in fields:
+            setattr(Metrics, name, Metrics._defaults[name])
+
+    @pytest.mark.asyncio
+    async def test_modbus_decoded_read_tracks_unchanged_percentage(self):
+        """Verify the fraction of short-circuited reads."""
+        for unchanged in (True, False, True, True):
+            await Metrics.modbus_decoded_read(unchanged=unchanged)
+        await Metrics.drain()
+
+        assert Metrics.sigenergy2mqtt_modbus_decoded_reads == 4
+        assert Metrics.sigenergy2mqtt_modbus_unchanged_reads == 3
+        assert Metrics.sigenergy2mqtt_modbus_unchanged_percentage == 75.0
+
+
+class TestMetricsPipeline:
+    """Tests for Metrics.modbus_pipeline()."""
+
+    @pytest.fixture(autouse=True)
+    def reset_metrics(self):
+        """Reset pipelining metrics before and after each test."""
+        fields = [name for name in Metrics._defaults if name.startswith(("sigenergy2mqtt_modbus_in_flight", "sigenergy2mqtt_modbus_pipelined", "sigenergy2mqtt_modbus_queue_delay"))]
+        for name in fields:
+            setattr(Metrics, name, Metrics._defaults[name])
+        yield
+        for name in fields:
+            setattr(Metrics, name, Metrics._defaults[name])
+
+    @pytest.mark.asyncio
+    async def test_modbus_pipeline_tracks_depth_and_delay(self):
+        """Verify in-flight depth and queue delay aggregation."""
+        await Metrics.modbus_pipeline(in_flight=3, seconds=0.01)  # 10ms
+        await Metrics.drain()
+        await Metrics.modbus_pipeline(in_flight=1, seconds=0.03)  # 30ms
+        await Metrics.drain()
+
+        assert Metrics.sigenergy2mqtt_modbus_in_flight == 1
+        assert Metrics.sigenergy2mqtt_modbus_in_flight_max == 3
+        assert Metrics.sigenergy2mqtt_modbus_pipelined == 2
+        assert Metrics.sigenergy2mqtt_modbus_queue_delay_max == pytest.approx(30.0)
+        assert Metrics.sigenergy2mqtt_modbus_queue_delay_mean == pytest.approx(20.0)
+
+
+class TestMetricsInfluxDBFlush:
+    """Tests for Metrics.influxdb_flush()."""
+
+    @pytest.fixture(autouse=True)
+    def reset_metrics(self):
+        """Reset flush metrics before and after each test."""
+        fields = [name for name in Metrics._defaults if name.startswith(("sigenergy2mqtt_influxdb_flush", "sigenergy2mqtt_influxdb_batch_size"))]
+
+        def reset():
+            for name in fields:
+                setattr(Metrics, name, Metrics._defaults[name])
+            with Metrics._lock:
+                for counts in Metrics._buckets.values():
+                    counts[:] = [0] * len(counts)
+
+        reset()
+        yield
+        reset()
+
+    @pytest.mark.asyncio
+    async def test_influxdb_flush_tracks_batch_size_and_delay(self):
+        """Verify batch size and flush delay aggregation."""
+        await Metrics.influxdb_flush(batch_size=100, seconds=0.5)  # 500ms
+        await Metrics.drain()
+        await Metrics.influxdb_flush(batch_size=20, seconds=1.5)  # 1500ms
+        await Metrics.drain()
+
+        assert Metrics.sigenergy2mqtt_influxdb_flushes == 2
+        assert Metrics.sigenergy2mqtt_influxdb_flushed_points == 120
+        assert Metrics.sigenergy2mqtt_influxdb_batch_size_max == 100
+        assert Metrics.sigenergy2mqtt_influxdb_batch_size_mean == pytest.approx(60.0)
+        assert Metrics.sigenergy2mqtt_influxdb_flush_delay_max == pytest.approx(1500.0)
+        assert Metrics.sigenergy2mqtt_influxdb_flush_delay_mean == pytest.approx(1000.0)
+        assert (Metrics.sigenergy2mqtt_influxdb_batch_size_p50, Metrics.sigenergy2mqtt_influxdb_batch_size_p99) == (20, 100)
+        # The 99th percentile is in the bucket up to 2000ms, but no flush waited longer than 1500ms
+        assert (Metrics.sigenergy2mqtt_influxdb_flush_delay_p50, Metrics.sigenergy2mqtt_influxdb_flush_delay_p99) == (500, pytest.approx(1500.0))
+
+    @pytest.mark.asyncio
+    async def test_influxdb_flush_percentiles(self):
+        """Verify the batch size and flush delay percentiles from threads folded together."""
+
+        async def record(count, batch_size, seconds):
+            for _ in range(count):
+                await Metrics.influxdb_flush(batch_size=batch_size, seconds=seconds)
+
+        thread = threading.Thread(target=lambda: asyncio.run(record(49, 4, 0.04)))
+        thread.start()
+        thread.join()
+        await record(49, 300, 0.3)
+        await record(2, 5000, 30.0)
+        await Metrics.drain()
+
+        assert (Metrics.sigenergy2mqtt_influxdb_batch_size_p50, Metrics.sigenergy2mqtt_influxdb_batch_size_p99) == (500, 5000)
+        assert (Metrics.sigenergy2mqtt_influxdb_flush_delay_p50, Metrics.sigenergy2mqtt_influxdb_flush_delay_p99) == (500, pytest.approx(30000.0))
+
+
 class TestMetricsReadError:
     """Tests for Metrics.modbus_read_error()."""
 
@@ -217,18 +327,14 @@ class TestMetricsReadError:
         assert Metrics.sigenergy2mqtt_modbus_read_errors == 2
 
     @pytest.mark.asyncio
-    async def test_modbus_read_error_exception_handling(self):
-        """Test exception handling."""
+    async def test_modbus_read_error_does_not_take_lock(self):
+        """Test recording into the thread's shard never touches the lock."""
+        Metrics._shard()  # Registered on first use
         with patch.object(Metrics, "_lock") as mock_lock:
-            mock_lock.acquire.side_effect = RuntimeError("Test exception")
-
-            with patch("sigenergy2mqtt.metrics.metrics.logger.warning") as mock_warning:
-                await Metrics.modbus_read_error()
-                await Metrics.drain()
-                assert mock_warning.called
-                assert "modbus read error metrics collection" in mock_warning.call_args[0][0]
-                # Ensure Mock object was used (since it failed it shouldn't have released usually but here we just check it was called)
-                mock_lock.acquire.assert_called()
+            await Metrics.modbus_read_error()
+            assert not mock_lock.mock_calls
+        await Metrics.drain()
+        assert Metrics.sigenergy2mqtt_modbus_read_errors == 1
 
 
 class TestMetricsWrite:
@@ -329,17 +435,14 @@ class TestMetricsWriteError:
         assert Metrics.sigenergy2mqtt_modbus_write_errors == 2
 
     @pytest.mark.asyncio
-    async def test_modbus_write_error_exception_handling(self):
-        """Test exception handling."""
-        with patch.object(Metrics, "_lock") as mock_lock:
-            mock_lock.acquire.side_effect = RuntimeError("Test exception")
-
-            with patch("sigenergy2mqtt.metrics.metrics.logger.warning") as mock_warning:
-                await Metrics.modbus_write_error()
-                await Metrics.drain()
-                assert mock_warning.called
-                assert "modbus write error metrics collection" in mock_warning.call_args[0][0]
-                mock_lock.acquire.assert_called()
+    async def test_modbus_write_error_while_lock_held(self):
+        """Test errors are recorded while a reader holds the lock, and folded once it is released."""
+        Metrics._shard()  # Registered on first use
+        async with Metrics.lock():
+            await Metrics.modbus_write_error()
+            assert Metrics.sigenergy2mqtt_modbus_write_errors == 0
+        await Metrics.drain()
+        assert Metrics.sigenergy2mqtt_modbus_write_errors == 1
 
 
 class TestMetricsEnabledGate:
@@ -424,3 +527,30 @@ class TestMetricsMqttPublish:
         await Metrics.drain()
 
         assert Metrics.sigenergy2mqtt_mqtt_publish_failures == 2
+
+
+class TestMetricsStateStoreSaveRequests:
+    """Tests for Metrics.state_store_save_request()."""
+
+    @pytest.fixture(autouse=True)
+    def reset_metrics(self):
+        original_requests = Metrics.sigenergy2mqtt_state_store_save_requests
+        original_saves = Metrics.sigenergy2mqtt_state_store_saves
+
+        Metrics.sigenergy2mqtt_state_store_save_requests = 0
+        Metrics.sigenergy2mqtt_state_store_saves = 0
+
+        yield
+
+        Metrics.sigenergy2mqtt_state_store_save_requests = original_requests
+        Metrics.sigenergy2mqtt_state_store_saves = original_saves
+
+    @pytest.mark.asyncio
+    async def test_requests_counted_separately_from_saves(self):
+        for _ in range(3):
+            await Metrics.state_store_save_request()
+        await Metrics.state_store_save(seconds=0.001)
+        await Metrics.drain()
+
+        assert Metrics.sigenergy2mqtt_state_store_save_requests == 3
+        assert Metrics.sigenergy2mqtt_state_store_saves == 1
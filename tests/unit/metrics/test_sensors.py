@@ -6,13 +6,17 @@ from sigenergy2mqtt.metrics.sensors import (
     MetricsSensor,
     ModbusActiveLocks,
     ModbusCacheHits,
+    ModbusInFlight,
     ModbusPhysicalReads,
+    ModbusQueueDelayMax,
+    ModbusQueueDelayMean,
     ModbusReadErrors,
     ModbusReadMax,
     ModbusReadMean,
     ModbusReadMin,
     ModbusReadsPerSecond,
     ModbusSkippedErrors,
+    ModbusUnchangedReads,
     ModbusWriteErrors,
     ModbusWriteMax,
     ModbusWriteMean,
@@ -25,6 +29,7 @@ from sigenergy2mqtt.metrics.sensors import (
     StateStoreSaveMax,
     StateStoreSaveMean,
     StateStoreSaveMin,
+    StateStoreSaveRequests,
     StateStoreSaves,
 )
 
@@ -205,6 +210,30 @@ class TestModbusActiveLocks:
             assert sensor.latest_raw_state == 5
 
 
+class TestModbusUnchangedReads:
+    @pytest.mark.asyncio
+    async def test_update_internal_state(self):
+        Metrics.sigenergy2mqtt_modbus_unchanged_percentage = 62.5
+        sensor = ModbusUnchangedReads()
+        await sensor._update_internal_state()
+        assert sensor.latest_raw_state == 62.5
+
+
+class TestModbusPipelineSensors:
+    @pytest.mark.asyncio
+    async def test_update_internal_state(self):
+        Metrics.sigenergy2mqtt_modbus_in_flight = 4
+        Metrics.sigenergy2mqtt_modbus_queue_delay_max = 12.5
+        Metrics.sigenergy2mqtt_modbus_queue_delay_mean = 2.5
+        in_flight, delay_max, delay_mean = ModbusInFlight(), ModbusQueueDelayMax(), ModbusQueueDelayMean()
+        await in_flight._update_internal_state()
+        await delay_max._update_internal_state()
+        await delay_mean._update_internal_state()
+        assert in_flight.latest_raw_state == 4
+        assert delay_max.latest_raw_state == 12.5
+        assert delay_mean.latest_raw_state == 2.5
+
+
 class TestStarted:
     @pytest.mark.asyncio
     async def test_update_internal_state(self):
@@ -249,6 +278,15 @@ class TestStateStoreSaves:
         assert sensor.latest_raw_state == 42
 
 
+class TestStateStoreSaveRequests:
+    @pytest.mark.asyncio
+    async def test_update_internal_state(self):
+        sensor = StateStoreSaveRequests()
+        Metrics.sigenergy2mqtt_state_store_save_requests = 50
+        await sensor._update_internal_state()
+        assert sensor.latest_raw_state == 50
+
+
 class TestStateStoreSaveErrors:
     @pytest.mark.asyncio
     async def test_update_internal_state(self):
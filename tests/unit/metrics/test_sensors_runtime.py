@@ -3,6 +3,14 @@ from unittest.mock import patch
 
 import pytest
 from sigenergy2mqtt.metrics.sensors import (
+    InfluxDBBatchSizeMax,
+    InfluxDBBatchSizeMean,
+    InfluxDBBatchSizeP50,
+    InfluxDBBatchSizeP99,
+    InfluxDBFlushDelayMax,
+    InfluxDBFlushDelayMean,
+    InfluxDBFlushDelayP50,
+    InfluxDBFlushDelayP99,
     InfluxDBQueries,
     InfluxDBQueryErrors,
     InfluxDBRetries,
@@ -83,6 +91,28 @@ class TestMetricsSensorsExtended:
         await sensor._update_internal_state()
         assert sensor.latest_raw_state == 25.0
 
+    @pytest.mark.asyncio
+    async def test_influxdb_batch_size(self):
+        Metrics.sigenergy2mqtt_influxdb_batch_size_max = 100
+        Metrics.sigenergy2mqtt_influxdb_batch_size_mean = 42.5
+        Metrics.sigenergy2mqtt_influxdb_batch_size_p50 = 50
+        Metrics.sigenergy2mqtt_influxdb_batch_size_p99 = 100
+        for sensor, expected in ((InfluxDBBatchSizeMax(), 100), (InfluxDBBatchSizeMean(), 42.5), (InfluxDBBatchSizeP50(), 50), (InfluxDBBatchSizeP99(), 100)):
+            await sensor._update_internal_state()
+            assert sensor.latest_raw_state == expected
+            assert sensor.publishable
+
+    @pytest.mark.asyncio
+    async def test_influxdb_flush_delay(self):
+        Metrics.sigenergy2mqtt_influxdb_flush_delay_max = 1500.0
+        Metrics.sigenergy2mqtt_influxdb_flush_delay_mean = 750.0
+        Metrics.sigenergy2mqtt_influxdb_flush_delay_p50 = 500.0
+        Metrics.sigenergy2mqtt_influxdb_flush_delay_p99 = 1500.0
+        for sensor, expected in ((InfluxDBFlushDelayMax(), 1500.0), (InfluxDBFlushDelayMean(), 750.0), (InfluxDBFlushDelayP50(), 500.0), (InfluxDBFlushDelayP99(), 1500.0)):
+            await sensor._update_internal_state()
+            assert sensor.latest_raw_state == expected
+            assert sensor["unit_of_measurement"] == "ms"
+
     @pytest.mark.asyncio
     async def test_influxdb_queries(self):
         sensor = InfluxDBQueries()
@@ -1,86 +1,122 @@
-from unittest.mock import MagicMock
+import threading
+
+import pytest
 
-from sigenergy2mqtt.metrics import metrics as metrics_mod
 from sigenergy2mqtt.metrics.metrics import Metrics
 
 
-def test_shutdown_waits_for_pending_updates(monkeypatch):
-    executor = MagicMock()
-    original_executor = Metrics._executor
-    original_pending = list(Metrics._pending_updates)
-    try:
-        Metrics._executor = executor
-        pending_future = MagicMock()
-        Metrics._pending_updates = [pending_future]
+@pytest.fixture
+def reads():
+    original = Metrics.sigenergy2mqtt_modbus_reads
+    Metrics.sigenergy2mqtt_modbus_reads = 0
+    yield
+    Metrics.sigenergy2mqtt_modbus_reads = original
 
-        monkeypatch.setattr(metrics_mod, "wait", lambda pending, timeout: (set(pending), set()))
 
-        Metrics.shutdown(timeout=1.5)
+def _record_in_thread(count: int) -> None:
+    def _record():
+        for _ in range(count):
+            Metrics.modbus_skipped_error()
 
-        executor.shutdown.assert_called_once_with(wait=True, cancel_futures=False)
-        assert Metrics._pending_updates == []
-    finally:
-        Metrics._executor = original_executor
-        Metrics._pending_updates = original_pending
+    thread = threading.Thread(target=_record)
+    thread.start()
+    thread.join()
 
 
-def test_shutdown_cancels_when_timeout(monkeypatch):
-    executor = MagicMock()
-    original_executor = Metrics._executor
-    original_pending = list(Metrics._pending_updates)
+def test_shutdown_folds_pending_updates():
+    original = Metrics.sigenergy2mqtt_modbus_skipped_errors
     try:
-        Metrics._executor = executor
-        pending_future = MagicMock()
-        Metrics._pending_updates = [pending_future]
+        Metrics.sigenergy2mqtt_modbus_skipped_errors = 0
+        _record_in_thread(3)
+
+        assert Metrics.sigenergy2mqtt_modbus_skipped_errors == 0
+        Metrics.shutdown(timeout=1.0)
+        assert Metrics.sigenergy2mqtt_modbus_skipped_errors == 3
+    finally:
+        Metrics.sigenergy2mqtt_modbus_skipped_errors = original
 
-        monkeypatch.setattr(metrics_mod, "wait", lambda pending, timeout: (set(), set(pending)))
 
+def test_shutdown_times_out_when_lock_held(caplog):
+    Metrics._lock.acquire()
+    try:
         Metrics.shutdown(timeout=0.01)
-
-        executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
-        assert Metrics._pending_updates == []
     finally:
-        Metrics._executor = original_executor
-        Metrics._pending_updates = original_pending
+        Metrics._lock.release()
+    assert "Metrics shutdown timed out" in caplog.text
 
 
-def test_shutdown_noop_without_executor():
-    original_executor = Metrics._executor
-    original_pending = list(Metrics._pending_updates)
+def test_finished_thread_shards_are_pruned():
+    original = Metrics.sigenergy2mqtt_modbus_skipped_errors
     try:
-        Metrics._executor = None
-        Metrics._pending_updates = []
-        Metrics.shutdown(timeout=1.0)
-        assert Metrics._executor is None
+        Metrics.aggregate()
+        shards = len(Metrics._shards)
+        _record_in_thread(2)
+        assert len(Metrics._shards) == shards + 1
+
+        Metrics.aggregate()
+        assert len(Metrics._shards) == shards
+        assert Metrics.sigenergy2mqtt_modbus_skipped_errors == original + 2
     finally:
-        Metrics._executor = original_executor
-        Metrics._pending_updates = original_pending
+        Metrics.sigenergy2mqtt_modbus_skipped_errors = original
+
 
+@pytest.mark.asyncio
+async def test_updates_from_many_threads_are_all_counted(reads):
+    def _record():
+        for _ in range(1000):
+            Metrics._shard().modbus_reads += 1
 
-def test_submit_initializes_executor_once(monkeypatch):
-    class StubExecutor:
-        instances = 0
+    threads = [threading.Thread(target=_record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    await Metrics.modbus_read(registers=1, seconds=0.01)
+    for thread in threads:
+        thread.join()
+    await Metrics.drain()
 
-        def __init__(self, *args, **kwargs):
-            StubExecutor.instances += 1
+    assert Metrics.sigenergy2mqtt_modbus_reads == 4001
+
+
+@pytest.mark.asyncio
+async def test_assignment_discards_pending_updates(reads):
+    await Metrics.modbus_read(registers=1, seconds=0.01)
+
+    Metrics.sigenergy2mqtt_modbus_reads = 10
+    await Metrics.drain()
+
+    assert Metrics.sigenergy2mqtt_modbus_reads == 10
+
+
+@pytest.mark.asyncio
+async def test_folding_does_not_write_to_shards():
+    original = Metrics.sigenergy2mqtt_modbus_read_max
+    try:
+        Metrics.sigenergy2mqtt_modbus_read_max = 0.0
+        await Metrics.modbus_read(registers=1, seconds=0.5)
+        shard = Metrics._shard()
+        slots = {name: getattr(shard, name) for name in shard.__slots__}
+
+        await Metrics.drain()
+        await Metrics.drain()
+
+        assert {name: getattr(shard, name) for name in shard.__slots__} == slots
+        assert Metrics.sigenergy2mqtt_modbus_read_max == 500.0
+    finally:
+        Metrics.sigenergy2mqtt_modbus_read_max = original
 
-        def submit(self, operation):
-            operation()
-            future = MagicMock()
-            future.add_done_callback = lambda callback: None
-            return future
 
-    original_executor = Metrics._executor
-    original_pending = list(Metrics._pending_updates)
+@pytest.mark.asyncio
+async def test_extremes_recorded_before_reset_are_not_applied_after_it():
+    original = Metrics.sigenergy2mqtt_modbus_read_max
     try:
-        Metrics._executor = None
-        Metrics._pending_updates = []
+        await Metrics.modbus_read(registers=1, seconds=0.5)
 
-        monkeypatch.setattr(metrics_mod, "ThreadPoolExecutor", StubExecutor)
-        Metrics._submit(lambda: None)
-        Metrics._submit(lambda: None)
+        Metrics.sigenergy2mqtt_modbus_read_max = 0.0
+        await Metrics.drain()
+        assert Metrics.sigenergy2mqtt_modbus_read_max == 0.0
 
-        assert StubExecutor.instances == 1
+        await Metrics.modbus_read(registers=1, seconds=0.2)
+        await Metrics.drain()
+        assert Metrics.sigenergy2mqtt_modbus_read_max == 200.0
     finally:
-        Metrics._executor = original_executor
-        Metrics._pending_updates = original_pending
+        Metrics.sigenergy2mqtt_modbus_read_max = original
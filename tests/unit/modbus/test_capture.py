@@ -0,0 +1,142 @@
+"""Unit tests for Modbus traffic capture."""
+
+from unittest.mock import patch
+
+import pytest
+from pymodbus.client.base import ModbusBaseClient
+from pymodbus.exceptions import ModbusIOException
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.pdu.register_message import ReadHoldingRegistersRequest, ReadHoldingRegistersResponse, ReadInputRegistersRequest, WriteMultipleRegistersRequest, WriteMultipleRegistersResponse
+
+from sigenergy2mqtt.modbus.capture import MAGIC, NO_RESPONSE, ModbusCapture, read_capture
+from sigenergy2mqtt.modbus.client import ModbusClient
+
+
+def test_records_round_trip(tmp_path):
+    capture = ModbusCapture(tmp_path / "site.capture")
+    capture.record(1000.0, 0.015, ReadHoldingRegistersRequest(address=30000, count=3, dev_id=247), ReadHoldingRegistersResponse(registers=[1, 2, 65535], dev_id=247))
+    capture.record(1001.0, 0.02, ReadInputRegistersRequest(address=31000, count=2, dev_id=1), ExceptionResponse(0x04, 0x02, device_id=1))
+    capture.record(1002.0, 1.0, ReadInputRegistersRequest(address=31002, count=1, dev_id=1), None)
+    capture.record(1003.0, 0.03, WriteMultipleRegistersRequest(address=40000, registers=[7, 8], dev_id=247), WriteMultipleRegistersResponse(address=40000, count=2, dev_id=247))
+    capture.close()
+
+    records = list(read_capture(tmp_path / "site.capture"))
+
+    assert [(r.timestamp, r.device_id, r.function_code, r.address, r.count, r.exception_code, r.registers) for r in records] == [
+        (1000.0, 247, 0x03, 30000, 3, 0, [1, 2, 65535]),
+        (1001.0, 1, 0x04, 31000, 2, 0x02, []),
+        (1002.0, 1, 0x04, 31002, 1, NO_RESPONSE, []),
+        (1003.0, 247, 0x10, 40000, 2, 0, []),
+    ]
+    assert records[0].latency == pytest.approx(0.015)
+
+
+def test_records_are_appended_across_runs(tmp_path):
+    path = tmp_path / "site.capture"
+    for timestamp in (1.0, 2.0):
+        capture = ModbusCapture(path)
+        capture.record(timestamp, 0.01, ReadHoldingRegistersRequest(address=30000, count=1, dev_id=247), ReadHoldingRegistersResponse(registers=[5], dev_id=247))
+        capture.close()
+
+    assert path.read_bytes().count(MAGIC) == 1
+    assert [r.timestamp for r in read_capture(path)] == [1.0, 2.0]
+
+
+def test_truncated_record_ends_capture(tmp_path):
+    path = tmp_path / "site.capture"
+    capture = ModbusCapture(path)
+    capture.record(1.0, 0.01, ReadHoldingRegistersRequest(address=30000, count=2, dev_id=247), ReadHoldingRegistersResponse(registers=[5, 6], dev_id=247))
+    capture.close()
+    path.write_bytes(path.read_bytes()[:-1])
+
+    assert list(read_capture(path)) == []
+
+
+def test_incomplete_record_is_truncated_before_appending(tmp_path):
+    path = tmp_path / "site.capture"
+    request = ReadHoldingRegistersRequest(address=30000, count=2, dev_id=247)
+    capture = ModbusCapture(path)
+    capture.record(1.0, 0.01, request, ReadHoldingRegistersResponse(registers=[5, 6], dev_id=247))
+    capture.record(2.0, 0.01, request, ReadHoldingRegistersResponse(registers=[7, 8], dev_id=247))
+    capture.close()
+    path.write_bytes(path.read_bytes()[:-3])  # Killed while writing the second record
+
+    capture = ModbusCapture(path)
+    capture.record(3.0, 0.01, request, ReadHoldingRegistersResponse(registers=[9, 10], dev_id=247))
+    capture.close()
+
+    assert [(r.timestamp, r.registers) for r in read_capture(path)] == [(1.0, [5, 6]), (3.0, [9, 10])]
+
+
+def test_appending_to_other_file_is_disabled(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a capture")
+    capture = ModbusCapture(path)
+
+    capture.record(1.0, 0.01, ReadHoldingRegistersRequest(address=30000, count=1, dev_id=247), None)
+
+    assert capture._failed
+    assert path.read_bytes() == b"not a capture"
+
+
+def test_close_all_writes_buffered_records(tmp_path):
+    path = tmp_path / "site.capture"
+    ModbusCapture.get(path).record(1.0, 0.01, ReadHoldingRegistersRequest(address=30000, count=1, dev_id=247), None)
+    assert path.stat().st_size == 0  # Still buffered
+
+    ModbusCapture.close_all()
+
+    assert [r.timestamp for r in read_capture(path)] == [1.0]
+
+
+def test_other_file_is_rejected(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a capture")
+
+    with pytest.raises(ValueError):
+        list(read_capture(path))
+
+
+def test_unwritable_capture_is_disabled(tmp_path):
+    (tmp_path / "file").write_text("")
+    capture = ModbusCapture(tmp_path / "file" / "site.capture")
+    request = ReadHoldingRegistersRequest(address=30000, count=1, dev_id=247)
+
+    capture.record(1.0, 0.01, request, None)
+    capture.record(2.0, 0.01, request, None)
+
+    assert capture._failed
+
+
+def test_clients_with_same_path_share_capture(tmp_path):
+    assert ModbusCapture.get(tmp_path / "site.capture") is ModbusCapture.get(str(tmp_path / "." / "site.capture"))
+
+
+class TestModbusClientCapture:
+    async def test_transactions_are_recorded(self, tmp_path):
+        path = tmp_path / "client.capture"
+        client = ModbusClient("127.0.0.1", port=502, capture_file=str(path))
+        responses = [ReadHoldingRegistersResponse(registers=[10, 20], dev_id=247), ModbusIOException("timeout")]
+
+        async def execute(_self, no_response_expected, request):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        with patch.object(ModbusBaseClient, "execute", lambda self, no_response_expected, request: execute(self, no_response_expected, request)):
+            rr = await client.read_holding_registers(30000, count=2, device_id=247)
+            with pytest.raises(ModbusIOException):
+                await client.execute(False, ReadInputRegistersRequest(address=31000, count=1, dev_id=1))
+        client.close()
+
+        assert rr.registers == [10, 20]
+        assert [(r.function_code, r.device_id, r.address, r.count, r.exception_code, r.registers) for r in read_capture(path)] == [
+            (0x03, 247, 30000, 2, 0, [10, 20]),
+            (0x04, 1, 31000, 1, NO_RESPONSE, []),
+        ]
+
+    async def test_capture_is_off_by_default(self):
+        client = ModbusClient("127.0.0.1", port=502)
+        assert client._capture is None
+
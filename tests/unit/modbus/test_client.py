@@ -8,7 +8,7 @@ from pymodbus.pdu import ExceptionResponse, ModbusPDU
 
 from sigenergy2mqtt.common import InputType
 from sigenergy2mqtt.modbus.client import ModbusClient, ModbusClientHealth
-from sigenergy2mqtt.modbus.read_ahead import ReadAhead
+from sigenergy2mqtt.modbus.read_ahead import RegisterImage
 
 
 class TestModbusClient:
@@ -19,7 +19,7 @@ class TestModbusClient:
         """Create a ModbusClient instance for testing."""
         with patch.object(ModbusClient, "__init__", lambda self, *args, **kwargs: None):
             client = ModbusClient.__new__(ModbusClient)
-            client._read_ahead_pdu = {}
+            client._register_images = {}
             client._trace = False
             client._read_count = 0
             client._cache_hits = 0
@@ -83,9 +83,9 @@ class TestModbusClient:
     async def test_read_registers_cache_hit(self, client, mock_pdu):
         """Test _read_registers with cache hit."""
         # Set up cache
-        read_ahead = MagicMock(spec=ReadAhead)
+        read_ahead = MagicMock(spec=RegisterImage)
         read_ahead.get_registers.return_value = mock_pdu
-        client._read_ahead_pdu = {1: {100: read_ahead}}
+        client._register_images = {(1, InputType.HOLDING): read_ahead}
 
         with patch("sigenergy2mqtt.metrics.Metrics") as mock_metrics:
             mock_metrics.modbus_cache_hits = AsyncMock()
@@ -101,9 +101,9 @@ class TestModbusClient:
     async def test_read_registers_cache_miss_index_error(self, client, mock_pdu):
         """Test _read_registers when pre-read raises IndexError."""
         # Set up cache that will raise IndexError
-        read_ahead = MagicMock(spec=ReadAhead)
+        read_ahead = MagicMock(spec=RegisterImage)
         read_ahead.get_registers.side_effect = IndexError("Out of range")
-        client._read_ahead_pdu = {1: {100: read_ahead}}
+        client._register_images = {(1, InputType.HOLDING): read_ahead}
 
         with patch("sigenergy2mqtt.metrics.Metrics") as mock_metrics:
             mock_metrics.modbus_cache_hits = AsyncMock()
@@ -194,6 +194,30 @@ class TestModbusClient:
 
                 mock_metrics.modbus_read_error.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_read_registers_cache_keyed_by_input_type(self, client, mock_pdu):
+        """Test cached input registers are not served for a holding register read at the same address."""
+        image = RegisterImage(1, InputType.INPUT)
+        image.fill(100, [42])
+        client._register_images = {(1, InputType.INPUT): image}
+
+        with patch("sigenergy2mqtt.metrics.Metrics") as mock_metrics:
+            mock_metrics.modbus_cache_hits = AsyncMock()
+            mock_metrics.modbus_read = AsyncMock()
+
+            with patch("pymodbus.client.AsyncModbusTcpClient.read_holding_registers", new_callable=AsyncMock) as mock_read:
+                mock_read.return_value = mock_pdu
+
+                result = await client._read_registers(address=100, count=1, device_id=1, input_type=InputType.HOLDING, use_pre_read=True)
+
+                mock_read.assert_awaited_once()
+                assert result is mock_pdu
+                assert client._cache_hits == 0
+
+            result = await client._read_registers(address=100, count=1, device_id=1, input_type=InputType.INPUT, use_pre_read=True)
+            assert list(result.registers) == [42]
+            assert client._cache_hits == 1
+
     @pytest.mark.asyncio
     async def test_read_registers_unknown_input_type(self, client):
         """Test _read_registers with unknown input type."""
@@ -203,20 +227,24 @@ class TestModbusClient:
 
     def test_bypass_read_ahead(self, client, mock_pdu):
         """Test bypass_read_ahead clears cache for specified registers."""
-        read_ahead = MagicMock(spec=ReadAhead)
-        client._read_ahead_pdu = {1: {100: read_ahead, 101: read_ahead, 102: read_ahead, 103: read_ahead}}
+        holding = RegisterImage(1, InputType.HOLDING)
+        holding.fill(100, [1, 2, 3, 4])
+        other_device = RegisterImage(2, InputType.HOLDING)
+        other_device.fill(100, [1, 2, 3, 4])
+        client._register_images = {(1, InputType.HOLDING): holding, (2, InputType.HOLDING): other_device}
 
         client.bypass_read_ahead(address=101, count=2, device_id=1)
 
-        # Registers 101 and 102 should be set to None
-        assert client._read_ahead_pdu[1][100] is read_ahead
-        assert client._read_ahead_pdu[1][101] is None
-        assert client._read_ahead_pdu[1][102] is None
-        assert client._read_ahead_pdu[1][103] is read_ahead
+        # Registers 101 and 102 should be invalidated for device 1 only
+        assert holding.is_valid(100)
+        assert not holding.is_valid(101)
+        assert not holding.is_valid(102)
+        assert holding.is_valid(103)
+        assert other_device.is_valid(100, 4)
 
     def test_bypass_read_ahead_no_existing_cache(self, client):
         """Test bypass_read_ahead when device_id not in cache."""
-        client._read_ahead_pdu = {}
+        client._register_images = {}
 
         # Should not raise
         client.bypass_read_ahead(address=100, count=5, device_id=1)
@@ -237,10 +265,10 @@ class TestModbusClient:
                 mock_metrics.modbus_cache_fill.assert_awaited_once()
 
                 # Cache should be populated
-                assert 1 in client._read_ahead_pdu
-                for addr in range(100, 105):
-                    assert addr in client._read_ahead_pdu[1]
-                    assert isinstance(client._read_ahead_pdu[1][addr], ReadAhead)
+                image = client.register_image(1, InputType.INPUT)
+                assert isinstance(image, RegisterImage)
+                assert image.is_valid(100, 5)
+                assert client.register_image(1, InputType.HOLDING) is None
 
     @pytest.mark.asyncio
     async def test_read_ahead_registers_error_clears_cache(self, client, mock_error_pdu):
@@ -253,10 +281,11 @@ class TestModbusClient:
 
                 await client.read_ahead_registers(address=100, count=5, device_id=1, input_type=InputType.INPUT)
 
-                # Cache should be set to None for all addresses
-                assert 1 in client._read_ahead_pdu
+                # Cache should be invalid for all addresses
+                image = client.register_image(1, InputType.INPUT)
+                assert image is not None
                 for addr in range(100, 105):
-                    assert client._read_ahead_pdu[1][addr] is None
+                    assert not image.is_valid(addr)
 
     @pytest.mark.asyncio
     async def test_read_holding_registers_delegates(self, client, mock_pdu):
@@ -281,8 +310,11 @@ class TestModbusClient:
     @pytest.mark.asyncio
     async def test_read_registers_cache_preread_none(self, client, mock_pdu):
         """Test _read_registers when pre-read entry is None (bypassed)."""
-        # Set up cache with None entry (bypassed)
-        client._read_ahead_pdu = {1: {100: None}}
+        # Set up cache with an invalidated entry (bypassed)
+        image = RegisterImage(1, InputType.HOLDING)
+        image.fill(100, [1])
+        image.invalidate(100)
+        client._register_images = {(1, InputType.HOLDING): image}
 
         with patch("sigenergy2mqtt.metrics.Metrics") as mock_metrics:
             mock_metrics.modbus_cache_hits = AsyncMock()
@@ -0,0 +1,104 @@
+"""Unit tests for the BlockDecoder class."""
+
+import random
+from array import array
+
+import pytest
+from pymodbus.client.mixin import ModbusClientMixin
+
+from sigenergy2mqtt.modbus import BlockDecoder, ModbusDataType
+
+
+def _convert(registers, data_type):
+    return ModbusClientMixin.convert_from_registers(list(registers), data_type)
+
+
+class TestBlockDecoder:
+    """Test cases for BlockDecoder class."""
+
+    @pytest.mark.parametrize(
+        "data_type,count",
+        [
+            (ModbusDataType.INT16, 1),
+            (ModbusDataType.UINT16, 1),
+            (ModbusDataType.INT32, 2),
+            (ModbusDataType.UINT32, 2),
+            (ModbusDataType.INT64, 4),
+            (ModbusDataType.UINT64, 4),
+            (ModbusDataType.FLOAT32, 2),
+            (ModbusDataType.FLOAT64, 4),
+            (ModbusDataType.UINT16, 3),
+            (ModbusDataType.INT32, 4),
+            (ModbusDataType.BITS, 2),
+        ],
+    )
+    def test_matches_convert_from_registers(self, data_type, count):
+        """Test each data type decodes exactly as convert_from_registers does."""
+        rng = random.Random(count)
+        decoder = BlockDecoder(100, count + 2, [(101, count, data_type)])
+
+        for _ in range(50):
+            registers = [rng.randrange(0x10000) for _ in range(count + 2)]
+            expected = _convert(registers[1 : 1 + count], data_type)
+            actual = decoder.decode(registers)[0]
+            if data_type in (ModbusDataType.FLOAT32, ModbusDataType.FLOAT64) and expected != expected:
+                assert actual != actual  # NaN
+            else:
+                assert actual == expected
+
+    def test_strings_strip_trailing_nulls(self):
+        """Test string fields are decoded like convert_from_registers."""
+        registers = list(_encode("SigenStor\0\0\0"))
+        decoder = BlockDecoder(0, len(registers), [(0, len(registers), ModbusDataType.STRING)])
+
+        assert decoder.decode(registers) == [_convert(registers, ModbusDataType.STRING)] == ["SigenStor"]
+
+    def test_invalid_utf8_string_is_not_decoded(self):
+        """Test a string that is not valid UTF-8 is left undecoded."""
+        decoder = BlockDecoder(0, 1, [(0, 1, ModbusDataType.STRING)])
+
+        assert decoder.decode([0xFFFE]) == [None]
+
+    def test_fields_in_compiled_order_with_gaps_and_overlaps(self):
+        """Test fields are returned in compiled order across unused and shared registers."""
+        fields = [
+            (30005, 2, ModbusDataType.INT32),
+            (30000, 1, ModbusDataType.UINT16),
+            (30005, 1, ModbusDataType.UINT16),
+            (30009, 1, ModbusDataType.INT16),
+        ]
+        registers = [7, 0xAAAA, 0xBBBB, 0xCCCC, 0xDDDD, 0xFFFF, 0xFFFE, 0, 0, 0x8000]
+        decoder = BlockDecoder(30000, len(registers), fields)
+
+        assert decoder.decode(registers) == [_convert(registers[a - 30000 : a - 30000 + c], t) for a, c, t in fields] == [-2, 7, 0xFFFF, -32768]
+
+    def test_fields_outside_block_are_not_decoded(self):
+        """Test fields that do not lie within the block decode to None."""
+        decoder = BlockDecoder(10, 2, [(9, 1, ModbusDataType.UINT16), (11, 2, ModbusDataType.UINT32), (10, 1, ModbusDataType.UINT16)])
+
+        assert decoder.decode([1, 2]) == [None, None, 1]
+
+    def test_illegal_size_is_not_decoded(self):
+        """Test a field convert_from_registers would reject is left undecoded."""
+        decoder = BlockDecoder(0, 4, [(0, 3, ModbusDataType.INT32), (3, 1, ModbusDataType.UINT16)])
+
+        assert decoder.decode([1, 2, 3, 4]) == [None, 4]
+
+    def test_decodes_register_image_view(self):
+        """Test the decoder accepts a memoryview of an array, as served by RegisterImage."""
+        registers = array("H", [0x0001, 0x0002])
+        decoder = BlockDecoder(0, 2, [(0, 2, ModbusDataType.UINT32)])
+
+        assert decoder.decode(memoryview(registers)) == [0x00010002]
+
+    def test_register_count_must_match(self):
+        """Test decoding a block of the wrong size raises ValueError."""
+        decoder = BlockDecoder(0, 2, [(0, 1, ModbusDataType.UINT16)])
+
+        with pytest.raises(ValueError):
+            decoder.decode([1])
+
+
+def _encode(text: str) -> list[int]:
+    data = text.encode("utf-8")
+    return [int.from_bytes(data[i : i + 2], "big") for i in range(0, len(data), 2)]
@@ -0,0 +1,210 @@
+"""Unit tests for pipelined Modbus transactions."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+from pymodbus.framer import FramerSocket
+from pymodbus.pdu import DecodePDU, ExceptionResponse
+from pymodbus.pdu.register_message import ReadHoldingRegistersRequest, ReadHoldingRegistersResponse
+from pymodbus.transport import CommParams, CommType
+
+from sigenergy2mqtt.modbus.client import ModbusClient
+from sigenergy2mqtt.modbus.pipeline import AdaptiveWindow, PipelinedTransactionManager
+
+
+class TestAdaptiveWindow:
+    """Test cases for the AIMD in-flight window."""
+
+    def test_starts_at_one(self):
+        """Test the window starts unpipelined."""
+        window = AdaptiveWindow(8)
+
+        assert window.size == 1
+        assert window.in_flight == 0
+
+    def test_additive_increase_capped_at_limit(self):
+        """Test successes grow the window by about one slot per window of responses."""
+        window = AdaptiveWindow(4)
+
+        window.succeeded()
+        assert window.size == 2
+        for _ in range(3):
+            window.succeeded()
+        assert window.size == 3
+        for _ in range(20):
+            window.succeeded()
+        assert window.size == 4
+
+    def test_multiplicative_decrease(self):
+        """Test congestion halves the window but never below one."""
+        window = AdaptiveWindow(8)
+        for _ in range(100):
+            window.succeeded()
+        assert window.size == 8
+
+        window.congested()
+        assert window.size == 4
+        for _ in range(5):
+            window.congested()
+        assert window.size == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_queues_when_full(self):
+        """Test acquisition waits for a free slot and reports the time spent queued."""
+        window = AdaptiveWindow(2)
+        assert await window.acquire() == pytest.approx(0.0, abs=0.01)
+
+        waiter = asyncio.create_task(window.acquire())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        window.release()
+        queued = await asyncio.wait_for(waiter, timeout=1)
+        assert queued >= 0.04
+        assert window.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_growth_admits_waiters(self):
+        """Test growing the window wakes queued transactions."""
+        window = AdaptiveWindow(2)
+        await window.acquire()
+        waiter = asyncio.create_task(window.acquire())
+        await asyncio.sleep(0)
+
+        window.succeeded()
+        await asyncio.wait_for(waiter, timeout=1)
+
+        assert window.in_flight == 2
+        assert window.peak == 2
+
+
+def _response_frame(framer: FramerSocket, transaction_id: int, registers: list[int], dev_id: int = 1) -> bytes:
+    pdu = ReadHoldingRegistersResponse(registers=registers, dev_id=dev_id, transaction_id=transaction_id)
+    return framer.buildFrame(pdu)
+
+
+class TestPipelinedTransactionManager:
+    """Test cases for transaction id matching on a pipelined connection."""
+
+    @pytest.fixture
+    async def manager(self):
+        """Create a connected manager whose outbound frames are captured."""
+        params = CommParams(comm_type=CommType.TCP, host="127.0.0.1", port=502, timeout_connect=0.2)
+        manager = PipelinedTransactionManager(params, FramerSocket(DecodePDU(False)), 0, False, None, None, None, depth=4)
+        manager.transport = MagicMock()
+        manager.sent = []
+        manager.low_level_send = lambda data, addr=None: manager.sent.append(data)
+        for _ in range(10):
+            manager.window.succeeded()
+        return manager
+
+    @staticmethod
+    def _request(address: int) -> ReadHoldingRegistersRequest:
+        return ReadHoldingRegistersRequest(address=address, count=1, dev_id=1)
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_responses_are_matched(self, manager):
+        """Test responses arriving in reverse order resolve the right requests."""
+        framer = FramerSocket(DecodePDU(True))
+        tasks = [asyncio.create_task(manager.execute(False, self._request(a))) for a in (100, 200, 300)]
+        await asyncio.sleep(0.01)
+
+        assert len(manager.sent) == 3
+        assert manager.window.in_flight == 3
+        tids = [int.from_bytes(frame[:2], "big") for frame in manager.sent]
+        manager.data_received(b"".join(_response_frame(framer, tid, [tid * 10]) for tid in reversed(tids)))
+
+        responses = await asyncio.gather(*tasks)
+        assert [r.registers for r in responses] == [[tid * 10] for tid in tids]
+        assert manager.window.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_partial_frames_are_buffered(self, manager):
+        """Test a response split across reads is reassembled."""
+        framer = FramerSocket(DecodePDU(True))
+        task = asyncio.create_task(manager.execute(False, self._request(100)))
+        await asyncio.sleep(0.01)
+        frame = _response_frame(framer, int.from_bytes(manager.sent[0][:2], "big"), [42])
+
+        manager.data_received(frame[:5])
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        manager.data_received(frame[5:])
+
+        assert (await task).registers == [42]
+
+    @pytest.mark.asyncio
+    async def test_unknown_transaction_id_is_ignored(self, manager):
+        """Test a response for an unknown transaction does not resolve a pending request."""
+        framer = FramerSocket(DecodePDU(True))
+        task = asyncio.create_task(manager.execute(False, self._request(100)))
+        await asyncio.sleep(0.01)
+        tid = int.from_bytes(manager.sent[0][:2], "big")
+
+        manager.data_received(_response_frame(framer, tid + 1000, [1]))
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        manager.data_received(_response_frame(framer, tid, [2]))
+
+        assert (await task).registers == [2]
+
+    @pytest.mark.asyncio
+    async def test_timeout_shrinks_window(self, manager):
+        """Test a timeout halves the window and raises once retries are exhausted."""
+        size = manager.window.size
+
+        with pytest.raises(ModbusIOException):
+            await manager.execute(False, self._request(100))
+
+        assert manager.window.size == size // 2
+        assert manager.window.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_busy_response_shrinks_window(self, manager):
+        """Test a SERVER DEVICE BUSY exception response halves the window."""
+        framer = FramerSocket(DecodePDU(True))
+        size = manager.window.size
+        task = asyncio.create_task(manager.execute(False, self._request(100)))
+        await asyncio.sleep(0.01)
+        busy = ExceptionResponse(function_code=0x03, exception_code=0x06, device_id=1, transaction=int.from_bytes(manager.sent[0][:2], "big"))
+
+        manager.data_received(framer.buildFrame(busy))
+
+        assert (await task).exception_code == 0x06
+        assert manager.window.size == size // 2
+
+    @pytest.mark.asyncio
+    async def test_disconnect_fails_pending(self, manager):
+        """Test losing the connection fails in-flight transactions immediately."""
+        task = asyncio.create_task(manager.execute(False, self._request(100)))
+        await asyncio.sleep(0.01)
+
+        manager.callback_disconnected(None)
+
+        with pytest.raises(ConnectionException):
+            await task
+        assert manager.window.in_flight == 0
+
+
+class TestModbusClientPipelining:
+    """Test cases for enabling pipelining on ModbusClient."""
+
+    @pytest.mark.asyncio
+    async def test_default_client_is_not_pipelined(self):
+        """Test the stock pymodbus transaction manager is kept by default."""
+        client = ModbusClient("127.0.0.1", port=502)
+
+        assert client.pipeline_depth == 1
+        assert not isinstance(client.ctx, PipelinedTransactionManager)
+
+    @pytest.mark.asyncio
+    async def test_pipeline_depth_installs_pipelined_manager(self):
+        """Test a pipeline depth above one installs the pipelined transaction manager."""
+        client = ModbusClient("127.0.0.1", port=502, timeout=2.0, retries=5, pipeline_depth=4)
+
+        assert isinstance(client.ctx, PipelinedTransactionManager)
+        assert client.ctx.window.limit == 4
+        assert client.ctx.retries == 5
+        assert client.ctx.comm_params.timeout_connect == 2.0
@@ -1,185 +1,163 @@
-"""Unit tests for ReadAhead class edge cases."""
+"""Unit tests for RegisterImage class edge cases."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 from pymodbus.pdu import ExceptionResponse, ModbusPDU
+from pymodbus.pdu.register_message import ReadHoldingRegistersResponse, ReadInputRegistersResponse
 
 from sigenergy2mqtt.common import InputType
-from sigenergy2mqtt.modbus.read_ahead import ReadAhead
+from sigenergy2mqtt.modbus.read_ahead import RegisterImage
 
 
-class TestReadAhead:
-    """Test cases for ReadAhead class."""
+class TestRegisterImage:
+    """Test cases for RegisterImage class."""
 
     @pytest.fixture
-    def mock_pdu(self):
-        """Create a mock ModbusPDU with registers."""
-        pdu = MagicMock(spec=ModbusPDU)
-        pdu.isError.return_value = False
-        pdu.registers = [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000]
-        pdu.exception_code = 0
-        pdu.address = 1000
-        pdu.count = 10
-        return pdu
-
-    @pytest.fixture
-    def read_ahead(self, mock_pdu):
-        """Create a ReadAhead instance for testing."""
-        return ReadAhead(address=1000, count=10, device_id=1, input_type=InputType.INPUT, pdu=mock_pdu)
-
-    def test_last_address_property(self, read_ahead):
-        """Test last_address property calculation."""
-        # address=1000, count=10, so last_address = 1000 + 10 - 1 = 1009
-        assert read_ahead.last_address == 1009
-
-    def test_last_address_single_register(self):
-        """Test last_address with single register."""
-        pdu = MagicMock(spec=ModbusPDU)
-        pdu.registers = [100]
-        ra = ReadAhead(address=500, count=1, device_id=1, input_type=InputType.HOLDING, pdu=pdu)
-
-        assert ra.last_address == 500
-
-    def test_get_registers_success(self, read_ahead, mock_pdu):
+    def image(self):
+        """Create a RegisterImage filled with ten registers at 1000-1009."""
+        image = RegisterImage(device_id=1, input_type=InputType.INPUT)
+        image.fill(1000, [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000], timestamp=12345.0)
+        return image
+
+    def test_empty_image(self):
+        """Test a new image has no addressable registers."""
+        image = RegisterImage(device_id=5, input_type=InputType.HOLDING)
+
+        assert len(image) == 0
+        assert image.device_id == 5
+        assert image.input_type == InputType.HOLDING
+        assert not image.is_valid(0)
+        with pytest.raises(IndexError):
+            image.get_registers(address=0, count=1)
+
+    def test_address_properties(self, image):
+        """Test first_address and last_address after a fill."""
+        assert image.first_address == 1000
+        assert image.last_address == 1009
+        assert len(image) == 10
+
+    def test_get_registers_success(self, image):
         """Test successful get_registers within range."""
-        with patch("sigenergy2mqtt.modbus.read_ahead.copy") as mock_copy:
-            # Create a real deepcopy for the test
-            copied_pdu = MagicMock(spec=ModbusPDU)
-            mock_copy.deepcopy.return_value = copied_pdu
+        result = image.get_registers(address=1002, count=3)
 
-            result = read_ahead.get_registers(address=1002, count=3)
+        assert isinstance(result, ReadInputRegistersResponse)
+        assert result.address == 1002
+        assert result.count == 3
+        assert result.dev_id == 1
+        assert list(result.registers) == [300, 400, 500]
+        assert not result.isError()
 
-            # Verify the copied PDU was modified
-            assert copied_pdu.address == 1002
-            assert copied_pdu.count == 3
-            assert copied_pdu.registers == [300, 400, 500]
+    def test_get_registers_holding_response_type(self):
+        """Test holding register images return holding register responses."""
+        image = RegisterImage(device_id=1, input_type=InputType.HOLDING)
+        image.fill(40000, [1, 2])
 
-    def test_get_registers_first_register(self, read_ahead, mock_pdu):
-        """Test get_registers for first register in range."""
-        with patch("sigenergy2mqtt.modbus.read_ahead.copy") as mock_copy:
-            copied_pdu = MagicMock(spec=ModbusPDU)
-            mock_copy.deepcopy.return_value = copied_pdu
+        assert isinstance(image.get_registers(address=40000, count=2), ReadHoldingRegistersResponse)
 
-            result = read_ahead.get_registers(address=1000, count=1)
+    def test_get_registers_is_zero_copy_view(self, image):
+        """Test get_registers hands back a view into the image rather than a copy."""
+        result = image.get_registers(address=1000, count=2)
 
-            assert copied_pdu.registers == [100]
+        assert isinstance(result.registers, memoryview)
+        image.fill(1000, [1, 2])
+        assert list(result.registers) == [1, 2]
 
-    def test_get_registers_last_register(self, read_ahead, mock_pdu):
-        """Test get_registers for last register in range."""
-        with patch("sigenergy2mqtt.modbus.read_ahead.copy") as mock_copy:
-            copied_pdu = MagicMock(spec=ModbusPDU)
-            mock_copy.deepcopy.return_value = copied_pdu
-
-            result = read_ahead.get_registers(address=1009, count=1)
-
-            assert copied_pdu.registers == [1000]
-
-    def test_get_registers_full_range(self, read_ahead, mock_pdu):
+    def test_get_registers_full_range(self, image):
         """Test get_registers for entire range."""
-        with patch("sigenergy2mqtt.modbus.read_ahead.copy") as mock_copy:
-            copied_pdu = MagicMock(spec=ModbusPDU)
-            mock_copy.deepcopy.return_value = copied_pdu
-
-            result = read_ahead.get_registers(address=1000, count=10)
+        assert list(image.get_registers(address=1000, count=10).registers) == [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000]
 
-            assert copied_pdu.registers == [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000]
+    def test_get_registers_boundaries(self, image):
+        """Test get_registers for the first and last registers and exactly at the boundary."""
+        assert list(image.get_registers(address=1000, count=1).registers) == [100]
+        assert list(image.get_registers(address=1009, count=1).registers) == [1000]
+        assert list(image.get_registers(address=1007, count=3).registers) == [800, 900, 1000]
 
-    def test_get_registers_address_below_range(self, read_ahead):
+    def test_get_registers_address_below_range(self, image):
         """Test get_registers raises IndexError when address is below range."""
         with pytest.raises(IndexError) as exc_info:
-            read_ahead.get_registers(address=999, count=1)
+            image.get_registers(address=999, count=1)
 
         assert "address=999" in str(exc_info.value)
-        assert "self.address=1000" in str(exc_info.value)
 
-    def test_get_registers_address_plus_count_exceeds_range(self, read_ahead):
+    def test_get_registers_address_plus_count_exceeds_range(self, image):
         """Test get_registers raises IndexError when address+count exceeds range."""
         with pytest.raises(IndexError) as exc_info:
-            read_ahead.get_registers(address=1008, count=5)
+            image.get_registers(address=1008, count=5)
 
-        # 1008 + 5 - 1 = 1012 > 1009
         assert "count=5" in str(exc_info.value)
-        assert "last_address" in str(exc_info.value)
-
-    def test_get_registers_exactly_at_boundary(self, read_ahead, mock_pdu):
-        """Test get_registers exactly at the boundary (should succeed)."""
-        with patch("sigenergy2mqtt.modbus.read_ahead.copy") as mock_copy:
-            copied_pdu = MagicMock(spec=ModbusPDU)
-            mock_copy.deepcopy.return_value = copied_pdu
-
-            # Address 1007, count 3: last address = 1007 + 3 - 1 = 1009 (exactly at boundary)
-            result = read_ahead.get_registers(address=1007, count=3)
-
-            assert copied_pdu.registers == [800, 900, 1000]
-
-    def test_get_registers_pdu_is_exception_response(self):
-        """Test get_registers raises IndexError when PDU is ExceptionResponse."""
-        exception_pdu = ExceptionResponse(function_code=0x03, exception_code=0x02, device_id=1)
 
-        ra = ReadAhead(address=1000, count=10, device_id=1, input_type=InputType.HOLDING, pdu=exception_pdu)
-
-        with pytest.raises(IndexError) as exc_info:
-            ra.get_registers(address=1000, count=1)
-
-        assert "exception_code" in str(exc_info.value)
-
-    def test_get_registers_pdu_is_error(self):
-        """Test get_registers raises IndexError when PDU.isError() returns True."""
-        error_pdu = MagicMock(spec=ModbusPDU)
-        error_pdu.isError.return_value = True
-        error_pdu.exception_code = 5
-        error_pdu.registers = [100, 200]
-
-        ra = ReadAhead(address=1000, count=2, device_id=1, input_type=InputType.INPUT, pdu=error_pdu)
-
-        with pytest.raises(IndexError) as exc_info:
-            ra.get_registers(address=1000, count=1)
-
-        assert "exception_code" in str(exc_info.value)
-
-    def test_get_registers_count_mismatch(self):
-        """Test get_registers raises IndexError when register count doesn't match."""
+    def test_fill_grows_image_and_preserves_existing(self, image):
+        """Test filling outside the current span grows the image without losing data."""
+        held = image.get_registers(address=1000, count=2)
+
+        image.fill(990, [1, 2])
+        image.fill(1020, [3])
+
+        assert image.first_address == 990
+        assert image.last_address == 1020
+        assert list(image.get_registers(address=1000, count=2).registers) == [100, 200]
+        assert list(image.get_registers(address=990, count=2).registers) == [1, 2]
+        assert list(image.get_registers(address=1020, count=1).registers) == [3]
+        # Gaps between fills are never served
+        assert not image.is_valid(992)
+        assert not image.is_valid(1010, 10)
+        # Views taken before growth remain readable
+        assert list(held.registers) == [100, 200]
+
+    def test_invalidate(self, image):
+        """Test invalidate blocks only the requested range."""
+        image.invalidate(1002, 2)
+
+        assert image.is_valid(1000, 2)
+        assert not image.is_valid(1002)
+        assert not image.is_valid(1003)
+        assert image.is_valid(1004, 6)
+        with pytest.raises(IndexError):
+            image.get_registers(address=1001, count=2)
+
+    def test_invalidate_outside_span_is_ignored(self, image):
+        """Test invalidating registers the image does not cover is harmless."""
+        image.invalidate(500, 10)
+        image.invalidate(995, 7)
+
+        assert not image.is_valid(1000)
+        assert image.is_valid(1002, 8)
+
+    def test_filled_at(self, image):
+        """Test the fill timestamp is tracked per register."""
+        image.fill(1005, [1], timestamp=99999.0)
+
+        assert image.filled_at(1000) == 12345.0
+        assert image.filled_at(1005) == 99999.0
+        assert image.filled_at(2000) is None
+        image.invalidate(1000)
+        assert image.filled_at(1000) is None
+
+    def test_update_success(self):
+        """Test update fills the image from a successful response."""
         pdu = MagicMock(spec=ModbusPDU)
         pdu.isError.return_value = False
-        # Only 3 registers but claiming count of 5
-        pdu.registers = [100, 200, 300]
+        pdu.registers = [7, 8, 9]
+        image = RegisterImage(device_id=1, input_type=InputType.INPUT)
 
-        ra = ReadAhead(address=1000, count=5, device_id=1, input_type=InputType.INPUT, pdu=pdu)
+        image.update(100, 3, pdu)
 
-        # Try to get 5 registers but only 3 exist
-        with pytest.raises(IndexError) as exc_info:
-            ra.get_registers(address=1000, count=5)
-
-        assert "Requested" in str(exc_info.value)
-        assert "count=5" in str(exc_info.value)
-
-    def test_read_ahead_dataclass_fields(self):
-        """Test that ReadAhead has correct dataclass fields."""
-        pdu = MagicMock(spec=ModbusPDU)
-
-        ra = ReadAhead(address=2000, count=20, device_id=5, input_type=InputType.HOLDING, pdu=pdu)
+        assert list(image.get_registers(address=100, count=3).registers) == [7, 8, 9]
 
-        assert ra.address == 2000
-        assert ra.count == 20
-        assert ra.device_id == 5
-        assert ra.input_type == InputType.HOLDING
-        assert ra.pdu is pdu
+    def test_update_exception_response_invalidates(self, image):
+        """Test update invalidates the range when the PDU is an ExceptionResponse."""
+        image.update(1000, 5, ExceptionResponse(function_code=0x04, exception_code=0x02, device_id=1))
 
-    def test_get_registers_preserves_original_pdu(self, read_ahead, mock_pdu):
-        """Test that get_registers doesn't modify the original PDU."""
-        original_address = mock_pdu.address
-        original_count = mock_pdu.count
-        original_registers = mock_pdu.registers.copy()
+        assert not image.is_valid(1000)
+        assert image.is_valid(1005, 5)
 
-        # Use real copy.deepcopy
-        with patch("sigenergy2mqtt.modbus.read_ahead.copy.deepcopy") as mock_deepcopy:
-            copied_pdu = MagicMock()
-            mock_deepcopy.return_value = copied_pdu
+    def test_update_count_mismatch_invalidates(self, image):
+        """Test update invalidates the range when the register count doesn't match."""
+        pdu = MagicMock(spec=ModbusPDU)
+        pdu.isError.return_value = False
+        pdu.registers = [1, 2, 3]
 
-            read_ahead.get_registers(address=1005, count=2)
+        image.update(1000, 5, pdu)
 
-        # Original values should be unchanged
-        assert mock_pdu.address == original_address
-        assert mock_pdu.count == original_count
-        assert mock_pdu.registers == original_registers
+        assert not image.is_valid(1000)
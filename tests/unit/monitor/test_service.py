@@ -12,6 +12,7 @@ from sigenergy2mqtt.config import active_config
 from sigenergy2mqtt.influxdb.base import InfluxBase
 from sigenergy2mqtt.modbus import ModbusClientFactory
 from sigenergy2mqtt.monitor.service import MonitorService
+from sigenergy2mqtt.mqtt import SensorEvent, sensor_event_bus
 from sigenergy2mqtt.pvoutput.service import Service as PvOutputService
 from sigenergy2mqtt.sensors.base import ReadableSensorMixin
 
@@ -41,6 +42,7 @@ class DummyDevice:
 class FakeMqttHandler:
     def __init__(self):
         self.registered = []
+        self.loop = None
 
     def register(self, mqtt_client, topic, handler=None):
         self.registered.append((mqtt_client, topic, handler))
@@ -68,7 +70,8 @@ def test_subscribe_registers_topics():
 
     svc.subscribe(None, handler)
 
-    assert (None, "topic/1", svc.on_topic_update) in handler.registered
+    assert sensor_event_bus.is_subscribed("topic/1")
+    assert handler.registered == []
     assert "topic/1" in svc._topics
     ms = svc._topics["topic/1"]
     assert isinstance(ms, MonitoredSensor)
@@ -86,7 +89,7 @@ def test_subscribe_registers_topics_even_when_repeated_negative(monkeypatch):
 
     svc.subscribe(None, handler)
 
-    assert (None, "topic/1", svc.on_topic_update) in handler.registered
+    assert sensor_event_bus.is_subscribed("topic/1")
     assert "topic/1" in svc._topics
 
 
@@ -150,6 +153,19 @@ async def test_on_topic_update_known_and_unknown():
     assert res2 is False
 
 
+@pytest.mark.asyncio
+async def test_on_sensor_event_uses_publish_time():
+    svc = MonitorService([])
+    ms = MonitoredSensor("Dev", "S", "S", 5, "")
+    svc._topics["topic/known"] = ms
+
+    res = await svc.on_sensor_event(SensorEvent("topic/known", 12.5, 1000.0, "uid", "obj"))
+
+    assert res is True
+    assert ms.last_seen == 1000.0
+    assert ms.last_state == 12.5
+
+
 @pytest.mark.asyncio
 async def test_monitor_marks_overdue_and_stops(monkeypatch):
     monkeypatch.setattr(active_config, "log_level", logging.DEBUG)
@@ -270,12 +286,12 @@ async def test_influxdb_write_failure_marks_health_unhealthy(monkeypatch):
     service._writer_type = "v1_http"
     service._write_url = "https://example.test/write"
     service._write_auth = None
+    service._max_retries = 0
 
-    class FakeResponse:
-        status_code = 500
-        text = "failed"
+    async def failed_post(body):
+        return 500, "failed"
 
-    monkeypatch.setattr(service._session, "post", lambda *args, **kwargs: FakeResponse())
+    monkeypatch.setattr(service, "_post_write", failed_post)
 
     result = await service.execute_write(b"state value=1")
 
@@ -301,15 +317,22 @@ async def test_multi_plant_influxdb_health_isolation(monkeypatch):
     plant0_service._write_url = "https://example.test/write"
     plant1_service._writer_type = "v1_http"
     plant1_service._write_url = "https://example.test/write"
+    plant0_service._max_retries = 0
+
+    async def failed_post(body):
+        return 500, "error"
+
+    async def successful_post(body):
+        return 204, ""
 
     # Plant 0 fails write
-    monkeypatch.setattr(plant0_service._session, "post", lambda *args, **kwargs: MagicMock(status_code=500, text="error"))
+    monkeypatch.setattr(plant0_service, "_post_write", failed_post)
     res0 = await plant0_service.execute_write(b"state value=1")
     assert res0 is False
     assert service_health_registry.get_health("influxdb_0") is False
 
     # Plant 1 succeeds write
-    monkeypatch.setattr(plant1_service._session, "post", lambda *args, **kwargs: MagicMock(status_code=204))
+    monkeypatch.setattr(plant1_service, "_post_write", successful_post)
     res1 = await plant1_service.execute_write(b"state value=1")
     assert res1 is True
     assert service_health_registry.get_health("influxdb_1") is True
@@ -444,6 +467,5 @@ def test_monitor_service_respects_monitorable():
     svc.subscribe(None, handler)
 
     # Only s1 (monitorable=True) should be registered, s2 should be ignored
-    registered_topics = [t[1] for t in handler.registered]
-    assert "topic/1" in registered_topics
-    assert "topic/2" not in registered_topics
+    assert sensor_event_bus.is_subscribed("topic/1")
+    assert not sensor_event_bus.is_subscribed("topic/2")
@@ -146,6 +146,7 @@ class TestScanHostInterruption:
             mock_client.connect = AsyncMock()
             mock_client.connected = True
             mock_client.close = MagicMock()
+            mock_client.read_input_registers = AsyncMock(return_value=MagicMock(isError=lambda: False))
 
             with patch("sigenergy2mqtt.config.auto_discovery.probe_register", side_effect=mock_probe):
                 with pytest.raises(KeyboardInterrupt):
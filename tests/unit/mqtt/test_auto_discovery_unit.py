@@ -174,6 +174,7 @@ async def test_scan_host_full_discovery():
         mock_client.connect = AsyncMock()
         mock_client.connected = True
         mock_client.close = MagicMock()
+        mock_client.read_input_registers = AsyncMock(return_value=MagicMock(isError=lambda: False))
 
         async def mock_probe(m, address, count=1, device_id=247):
             if address == 30051:
@@ -198,6 +199,75 @@ async def test_scan_host_full_discovery():
     assert 3 in device["ac-chargers"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "response,responds",
+    [
+        (MagicMock(isError=lambda: False), True),
+        (MagicMock(isError=lambda: True, exception_code=0x02), True),
+        (MagicMock(isError=lambda: True, exception_code=0x0B), False),
+        (ModbusException("No response"), False),
+    ],
+)
+async def test_device_id_responds(response, responds):
+    modbus = AsyncMock()
+    modbus.connected = True
+    if isinstance(response, Exception):
+        modbus.read_input_registers.side_effect = response
+    else:
+        modbus.read_input_registers.return_value = response
+
+    assert await auto_discovery.device_id_responds(modbus, 5) is responds
+    modbus.read_input_registers.assert_awaited_once_with(address=auto_discovery.REG_INVERTER_RUNNING_STATE, count=1, device_id=5)
+
+
+@pytest.mark.asyncio
+async def test_scan_host_identifies_only_responding_device_ids():
+    results = []
+    auto_discovery.serial_numbers = []
+    responding = {1, 7, 12}
+    probed: list[int] = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_responds(m, device_id, max_reconnect_attempts=3):
+        nonlocal in_flight, max_in_flight
+        probed.append(device_id)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return device_id in responding
+
+    identified: list[int] = []
+
+    async def mock_identify(m, device_id, device, max_reconnect_attempts=3, exclude_devices=None):
+        identified.append(device_id)
+        device.inverters.append(device_id)
+
+    with patch("sigenergy2mqtt.config.auto_discovery.AsyncModbusTcpClient") as mock_client_cls:
+        mock_client = mock_client_cls.return_value
+        mock_client.connect = AsyncMock()
+        mock_client.connected = True
+        mock_client.close = MagicMock()
+
+        with (
+            patch("sigenergy2mqtt.config.auto_discovery.probe_register", AsyncMock(return_value=True)),
+            patch("sigenergy2mqtt.config.auto_discovery.device_id_responds", side_effect=mock_responds),
+            patch("sigenergy2mqtt.config.auto_discovery._probe_device_id", side_effect=mock_identify),
+        ):
+            await auto_discovery.scan_host("1.2.3.4", 502, results, max_device_id=20, device_id_concurrency=4, likely_device_ids=[12, 30])
+
+    assert probed[:2] == [1, 12]
+    assert sorted(probed) == list(range(1, 21))
+    assert max_in_flight == 4
+    assert identified == [1, 7, 12]
+    assert results[0]["inverters"] == [1, 7, 12]
+    # One connection for the plant check and identification, plus three more for the first pass, all closed
+    assert mock_client_cls.call_count == 4
+    assert mock_client.close.call_count == 4
+
+
 @pytest.mark.asyncio
 async def test_scan_host_ignored_serials():
     results = []
@@ -523,6 +593,7 @@ async def test_scan_host_cancelled_error_in_chunk():
         mock_client.connect = AsyncMock()
         mock_client.connected = True
         mock_client.close = MagicMock()
+        mock_client.read_input_registers = AsyncMock(return_value=MagicMock(isError=lambda: False))
 
         with patch("sigenergy2mqtt.config.auto_discovery.probe_register", return_value=True):
             with patch("sigenergy2mqtt.config.auto_discovery._probe_device_id", side_effect=asyncio.CancelledError):
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+
+from sigenergy2mqtt.mqtt.events import SensorEvent, SensorEventBus
+
+
+async def _settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_publish_delivers_typed_event():
+    bus = SensorEventBus()
+    received = []
+    bus.subscribe("a/state", received.append, asyncio.get_running_loop())
+
+    assert bus.publish("a/state", 1.5, "uid", "obj") is True
+    assert bus.publish("b/state", 2, "uid2", "obj2") is False
+    await _settle()
+
+    assert len(received) == 1
+    event = received[0]
+    assert isinstance(event, SensorEvent)
+    assert (event.topic, event.value, event.payload, event.unique_id, event.object_id) == ("a/state", 1.5, "1.5", "uid", "obj")
+    assert event.timestamp > 0
+
+
+async def test_coroutine_handlers_are_awaited_in_order():
+    bus = SensorEventBus()
+    received = []
+
+    async def handler(event):
+        received.append(event.value)
+
+    bus.subscribe("a/state", handler, asyncio.get_running_loop())
+    for value in range(5):
+        bus.publish("a/state", value, "uid", "obj")
+    await _settle()
+
+    assert received == [0, 1, 2, 3, 4]
+
+
+async def test_events_are_delivered_on_subscriber_loop():
+    bus = SensorEventBus()
+    loop = asyncio.get_running_loop()
+    delivered = asyncio.Event()
+    threads = []
+
+    def handler(event):
+        threads.append(threading.current_thread())
+        delivered.set()
+
+    bus.subscribe("a/state", handler, loop)
+    publisher = threading.Thread(target=bus.publish, args=("a/state", 1, "uid", "obj"))
+    publisher.start()
+    publisher.join()
+    await asyncio.wait_for(delivered.wait(), 1)
+
+    assert threads == [threading.current_thread()]
+
+
+async def test_failing_handler_does_not_stop_delivery(caplog):
+    bus = SensorEventBus()
+    received = []
+
+    def failing(event):
+        raise ValueError("boom")
+
+    bus.subscribe("a/state", failing, asyncio.get_running_loop())
+    bus.subscribe("a/state", received.append, asyncio.get_running_loop())
+    bus.publish("a/state", 1, "uid", "obj")
+    await _settle()
+
+    assert [e.value for e in received] == [1]
+    assert "boom" in caplog.text
+
+
+async def test_unsubscribe():
+    bus = SensorEventBus()
+    loop = asyncio.get_running_loop()
+    first, second = [], []
+    bus.subscribe("a/state", first.append, loop)
+    bus.subscribe("a/state", second.append, loop)
+    bus.subscribe("b/state", second.append, loop)
+
+    bus.unsubscribe("a/state", first.append)
+    bus.publish("a/state", 1, "uid", "obj")
+    await _settle()
+    assert (first, [e.value for e in second]) == ([], [1])
+
+    bus.unsubscribe_all(loop)
+    assert not bus.is_subscribed("a/state")
+    assert not bus.is_subscribed("b/state")
+    assert bus.publish("b/state", 2, "uid", "obj") is False
+
+
+async def test_publish_uses_read_time():
+    bus = SensorEventBus()
+    received = []
+    bus.subscribe("a/state", received.append, asyncio.get_running_loop())
+
+    bus.publish("a/state", 1, "uid", "obj", timestamp=1700000000.25)
+    await _settle()
+
+    assert received[0].timestamp == 1700000000.25
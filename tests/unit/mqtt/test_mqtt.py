@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import paho.mqtt.client as mqtt
 import pytest
+from paho.mqtt.enums import MQTTErrorCode
 
 from sigenergy2mqtt.config import Config, _swap_active_config, active_config
 from sigenergy2mqtt.mqtt import mqtt_setup
@@ -490,6 +491,143 @@ class TestMqttHandler:
         assert "did not return a valid MQTTMessageInfo" in caplog.text
 
 
+
+def _publish_info(mid: int, rc: MQTTErrorCode = MQTTErrorCode.MQTT_ERR_SUCCESS) -> MagicMock:
+    info = MagicMock(spec=mqtt.MQTTMessageInfo)
+    info.mid = mid
+    info.rc = rc
+    return info
+
+
+class TestMqttHandlerPublish:
+    """Tests for the MqttHandler non-blocking publish pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_publish_resolves_on_acknowledgement(self):
+        """Verify publish returns at once and the future resolves when the broker acknowledges it."""
+        handler = MqttHandler("test_client", None, asyncio.get_running_loop())
+        mock_client = MagicMock()
+        mock_client.publish.return_value = _publish_info(7)
+
+        future = handler.publish(mock_client, "test/topic", "42", qos=1, retain=True)
+
+        mock_client.publish.assert_called_once_with("test/topic", "42", qos=1, retain=True)
+        mock_client.publish.return_value.wait_for_publish.assert_not_called()
+        assert not future.done()
+        assert 7 in handler._pending_mids
+        assert len(handler._pending_publishes) == 1
+
+        handler.on_response(7, "publish", mock_client)
+
+        assert future.result(timeout=0) is True
+        assert 7 not in handler._pending_mids
+        assert not handler._pending_publishes
+
+    @pytest.mark.asyncio
+    async def test_publish_already_acknowledged(self):
+        """Verify a publish acknowledged before it is registered resolves immediately."""
+        handler = MqttHandler("test_client", None, asyncio.get_running_loop())
+        handler._seen_mids.add(7)
+        mock_client = MagicMock()
+        mock_client.publish.return_value = _publish_info(7)
+
+        future = handler.publish(mock_client, "test/topic", "42")
+
+        assert future.result(timeout=0) is True
+        assert 7 not in handler._seen_mids
+        assert 7 not in handler._pending_mids
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "qos,rc,pending",
+        [
+            (0, MQTTErrorCode.MQTT_ERR_NO_CONN, False),
+            (1, MQTTErrorCode.MQTT_ERR_NO_CONN, True),
+            (1, MQTTErrorCode.MQTT_ERR_QUEUE_SIZE, False),
+        ],
+    )
+    async def test_publish_not_queued(self, qos, rc, pending):
+        """Verify publishes paho will never send are failed, but QoS>0 publishes queued while disconnected are kept."""
+        handler = MqttHandler("test_client", None, asyncio.get_running_loop())
+        mock_client = MagicMock()
+        mock_client.publish.return_value = _publish_info(7, rc)
+
+        future = handler.publish(mock_client, "test/topic", "42", qos=qos)
+
+        assert future.done() is not pending
+        if not pending:
+            assert future.result() is False
+            assert not handler._pending_publishes
+
+    @pytest.mark.asyncio
+    async def test_publish_backpressure(self, caplog):
+        """Verify publishes are rejected while the backlog is full and accepted again once it drains."""
+        handler = MqttHandler("test_client", None, asyncio.get_running_loop(), max_pending_publishes=2)
+        mock_client = MagicMock()
+        mock_client.publish.side_effect = [_publish_info(1), _publish_info(2), _publish_info(3)]
+        caplog.set_level(logging.INFO, logger="paho.mqtt")
+
+        first = handler.publish(mock_client, "test/topic", "1", qos=1)
+        handler.publish(mock_client, "test/topic", "2", qos=1)
+        rejected = [handler.publish(mock_client, "test/topic", "3", qos=1) for _ in range(3)]
+
+        assert all(future.result(timeout=0) is False for future in rejected)
+        assert mock_client.publish.call_count == 2
+        assert caplog.text.count("rejecting publishes") == 1
+
+        handler.on_response(1, "publish", mock_client)
+
+        assert first.result(timeout=0) is True
+        assert "backlog cleared" in caplog.text
+        accepted = handler.publish(mock_client, "test/topic", "3", qos=1)
+        assert not accepted.done()
+        assert mock_client.publish.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_publish_expires_without_acknowledgement(self):
+        """Verify a publish that is never acknowledged resolves False when it expires."""
+        handler = MqttHandler("test_client", None, asyncio.get_running_loop(), max_pending_publishes=1)
+        mock_client = MagicMock()
+        mock_client.publish.side_effect = [_publish_info(1), _publish_info(2)]
+
+        stale = handler.publish(mock_client, "test/topic", "1", qos=1)
+        handler._pending_mids[1] = handler._pending_mids[1]._replace(now=time.time() - 120)
+
+        fresh = handler.publish(mock_client, "test/topic", "2", qos=1)
+
+        assert stale.result(timeout=0) is False
+        assert not fresh.done()
+        assert list(handler._pending_mids) == [2]
+
+    @pytest.mark.asyncio
+    async def test_publish_on_complete_scheduled_on_loop(self):
+        """Verify on_complete receives the outcome and awaitables it returns run on the loop."""
+        handler = MqttHandler("test_client", None, asyncio.get_running_loop())
+        mock_client = MagicMock()
+        mock_client.publish.return_value = _publish_info(7)
+        outcomes: list[bool] = []
+
+        async def on_complete(published: bool) -> None:
+            outcomes.append(published)
+
+        handler.publish(mock_client, "test/topic", "42", on_complete=on_complete)
+        await asyncio.to_thread(handler.on_response, 7, "publish", mock_client)
+        await handler.close()
+
+        assert outcomes == [True]
+
+    @pytest.mark.asyncio
+    async def test_publish_invalid_topic_raises(self):
+        """Verify paho exceptions propagate and do not hold a pipeline slot."""
+        handler = MqttHandler("test_client", None, asyncio.get_running_loop())
+        mock_client = MagicMock()
+        mock_client.publish.side_effect = ValueError("Invalid topic.")
+
+        with pytest.raises(ValueError):
+            handler.publish(mock_client, "test/#", "42")
+        assert not handler._pending_publishes
+
+
 class TestMqttCallbacks:
     """Tests for MQTT callback functions."""
 
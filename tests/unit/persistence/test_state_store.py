@@ -36,6 +36,8 @@ def mock_persistence_config():
     config.cache_warmup_timeout = 1.0
     config.disk_primary = True
     config.sync_timeout = 5.0
+    config.write_behind_interval = 0.0
+    config.write_behind_threshold = 50
     return config
 
 
@@ -323,3 +325,296 @@ async def test_invalid_envelope_handling(temp_state_dir, mock_persistence_config
 
     loaded = await store.load("test", "key")
     assert loaded == "{invalid json"
+
+
+@pytest.fixture
+def write_behind_config(mock_persistence_config):
+    mock_persistence_config.mqtt_redundancy = False
+    mock_persistence_config.write_behind_interval = 60.0
+    mock_persistence_config.write_behind_threshold = 3
+    return mock_persistence_config
+
+
+def _on_disk(state_dir, category, key):
+    path = state_dir / category / key
+    return json.loads(path.read_text(encoding="utf-8"))["v"] if path.is_file() else None
+
+
+@pytest.mark.asyncio
+async def test_write_behind_coalesces_to_latest_value(temp_state_dir, write_behind_config):
+    from unittest.mock import patch
+
+    store = StateStore()
+    await store.initialise(temp_state_dir, write_behind_config)
+
+    with patch.object(store, "_save_sync_impl", wraps=store._save_sync_impl) as writes:
+        for value in ("1.0", "2.0", "3.0"):
+            await store.save("sensor", "total", value)
+
+        assert _on_disk(temp_state_dir, "sensor", "total") is None
+        assert await store.load("sensor", "total") == "3.0"
+        assert await store.load("sensor", "total", validator=lambda v: v != "3.0") is None
+
+        await store.flush()
+        assert writes.call_count == 1
+    assert _on_disk(temp_state_dir, "sensor", "total") == "3.0"
+    assert store._flush_handle is None
+    store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_threshold_and_flush_write_immediately(temp_state_dir, write_behind_config):
+    store = StateStore()
+    await store.initialise(temp_state_dir, write_behind_config)
+
+    await store.save("sensor", "a", "1")
+    await store.save("sensor", "b", "2")
+    assert _on_disk(temp_state_dir, "sensor", "a") is None
+    await store.save("sensor", "c", "3")  # Threshold reached
+    assert [_on_disk(temp_state_dir, "sensor", k) for k in "abc"] == ["1", "2", "3"]
+
+    await store.save("sensor", "a", "4")
+    await store.save("sensor", "d", "5", flush=True)
+    assert _on_disk(temp_state_dir, "sensor", "a") == "4"
+    assert _on_disk(temp_state_dir, "sensor", "d") == "5"
+    store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flushes_after_interval(temp_state_dir, write_behind_config):
+    import asyncio
+
+    write_behind_config.write_behind_interval = 0.05
+    store = StateStore()
+    await store.initialise(temp_state_dir, write_behind_config)
+
+    await store.save("sensor", "total", "1.5")
+    assert store._flush_handle is not None
+    for _ in range(100):
+        await asyncio.sleep(0.02)
+        if _on_disk(temp_state_dir, "sensor", "total") is not None:
+            break
+
+    assert _on_disk(temp_state_dir, "sensor", "total") == "1.5"
+    assert store._flush_handle is None
+    store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_timer_survives_saving_loop(temp_state_dir, write_behind_config):
+    import asyncio
+    import threading
+
+    write_behind_config.write_behind_interval = 0.05
+    store = StateStore()
+    await store.initialise(temp_state_dir, write_behind_config)
+
+    # Saved from a device thread whose event loop is closed before the flush is due
+    thread = threading.Thread(target=asyncio.run, args=(store.save("sensor", "a", "1"),))
+    thread.start()
+    thread.join()
+    await store.save("sensor", "b", "2")
+    for _ in range(100):
+        await asyncio.sleep(0.02)
+        if _on_disk(temp_state_dir, "sensor", "b") is not None:
+            break
+
+    assert [_on_disk(temp_state_dir, "sensor", k) for k in "ab"] == ["1", "2"]
+    assert store._flush_handle is None
+    store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flushes_at_midnight(temp_state_dir, write_behind_config):
+    from datetime import datetime
+    from unittest.mock import patch
+
+    store = StateStore()
+    await store.initialise(temp_state_dir, write_behind_config)
+    loop = store._loop
+
+    with patch("sigenergy2mqtt.persistence.state_store.datetime") as mock_datetime:
+        mock_datetime.now.return_value = datetime(2026, 8, 9, 23, 59, 50)
+        mock_datetime.combine = datetime.combine
+        mock_datetime.min = datetime.min
+        await store.save("sensor", "total", "1.5")
+
+    assert store._flush_handle.when() - loop.time() == pytest.approx(10.0, abs=0.5)
+    store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_shutdown_writes_pending(temp_state_dir, write_behind_config):
+    store = StateStore()
+    await store.initialise(temp_state_dir, write_behind_config)
+
+    await store.save("sensor", "total", "7.0")
+    store.shutdown()
+
+    assert _on_disk(temp_state_dir, "sensor", "total") == "7.0"
+
+
+@pytest.mark.asyncio
+async def test_write_behind_delete_discards_pending(temp_state_dir, write_behind_config):
+    store = StateStore()
+    await store.initialise(temp_state_dir, write_behind_config)
+
+    await store.save("sensor", "total", "7.0")
+    await store.delete("sensor", "total")
+    assert await store.load("sensor", "total") is None
+    store.shutdown()
+
+    assert _on_disk(temp_state_dir, "sensor", "total") is None
+
+
+@pytest.fixture
+def sqlite_config(mock_persistence_config):
+    mock_persistence_config.mqtt_redundancy = False
+    mock_persistence_config.disk_backend = "sqlite"
+    return mock_persistence_config
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_round_trip(temp_state_dir, sqlite_config):
+    store = StateStore()
+    await store.initialise(temp_state_dir, sqlite_config)
+
+    await store.save("sensor", "total", "1.5")
+    await store.save("config", "total", "other")
+    await store.save("sensor", "gone", "x")
+    await store.delete("sensor", "gone")
+    store.shutdown()
+
+    assert not any(path.is_dir() for path in temp_state_dir.iterdir())
+    assert (temp_state_dir / "state.db").is_file()
+
+    store = StateStore()
+    await store.initialise(temp_state_dir, sqlite_config)
+    assert await store.load("sensor", "total") == "1.5"
+    assert await store.load("config", "total") == "other"
+    assert await store.load("sensor", "gone") is None
+    assert sorted(store._disk.all_keys()) == [("config", "total"), ("sensor", "total")]
+    store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_migrates_files(temp_state_dir, sqlite_config):
+    (temp_state_dir / "sensor").mkdir(parents=True)
+    (temp_state_dir / "sensor" / "total").write_text(json.dumps({"v": "1.5", "ts": 1000, "ver": "1.0.0"}), encoding="utf-8")
+    (temp_state_dir / "pvoutput").mkdir()
+    (temp_state_dir / "pvoutput" / "raw").write_text("42", encoding="utf-8")
+    (temp_state_dir / "orphaned_key").write_text("789", encoding="utf-8")
+
+    store = StateStore()
+    await store.initialise(temp_state_dir, sqlite_config)
+
+    assert not (temp_state_dir / "sensor").exists()
+    assert not (temp_state_dir / "pvoutput").exists()
+    assert await store.load("sensor", "total", stale_after=timedelta(days=1)) is None  # Original timestamp kept
+    assert await store.load("sensor", "total") == "1.5"
+    assert await store.load("pvoutput", "raw") == "42"
+
+    # Legacy root files are migrated when loaded
+    assert await store.load("sensor", "orphaned_key") == "789"
+    assert not (temp_state_dir / "orphaned_key").exists()
+    store.shutdown()
+
+    store = StateStore()
+    await store.initialise(temp_state_dir, sqlite_config)
+    assert await store.load("sensor", "orphaned_key") == "789"
+    store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_migration_keeps_newer_state(temp_state_dir, sqlite_config):
+    store = StateStore()
+    await store.initialise(temp_state_dir, sqlite_config)
+    await store.save("sensor", "newer_file", "stale")
+    await store.save("sensor", "older_file", "current")
+    store.shutdown()
+
+    # Saved to files after switching back to the per-file layout
+    now = int(time.time())
+    (temp_state_dir / "sensor").mkdir()
+    (temp_state_dir / "sensor" / "newer_file").write_text(json.dumps({"v": "updated", "ts": now + 60, "ver": "1.0.0"}), encoding="utf-8")
+    (temp_state_dir / "sensor" / "older_file").write_text(json.dumps({"v": "outdated", "ts": now - 60, "ver": "1.0.0"}), encoding="utf-8")
+
+    store = StateStore()
+    await store.initialise(temp_state_dir, sqlite_config)
+
+    assert await store.load("sensor", "newer_file") == "updated"
+    assert await store.load("sensor", "older_file") == "current"
+    assert not (temp_state_dir / "sensor").exists()
+    store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_flush_is_one_transaction(temp_state_dir, sqlite_config):
+    from unittest.mock import patch
+
+    sqlite_config.write_behind_interval = 60.0
+    store = StateStore()
+    await store.initialise(temp_state_dir, sqlite_config)
+
+    with patch.object(store._disk, "save_many", wraps=store._disk.save_many) as commits, patch.object(store._disk, "save") as single:
+        for key in ("a", "b", "c"):
+            await store.save("sensor", key, key.upper())
+        await store.flush()
+
+    commits.assert_called_once_with({("sensor", "a"): "A", ("sensor", "b"): "B", ("sensor", "c"): "C"})
+    single.assert_not_called()
+    assert [await store.load("sensor", key) for key in "abc"] == ["A", "B", "C"]
+    store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_clean(temp_state_dir, sqlite_config):
+    store = StateStore()
+    await store.initialise(temp_state_dir, sqlite_config)
+
+    await store.save("sensor", "a", "1")
+    await store.save("pvoutput", "b", "2")
+    await store.clean()
+
+    assert store._disk.all_keys() == []
+    assert await store.load("sensor", "a") is None
+    assert (temp_state_dir / "state.db").is_file()
+    store.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["files", "sqlite"])
+async def test_preload_answers_loads_from_memory(temp_state_dir, sqlite_config, backend):
+    from unittest.mock import patch
+
+    sqlite_config.disk_backend = backend
+    store = StateStore()
+    await store.initialise(temp_state_dir, sqlite_config)
+    await store.save("sensor", "total", "1.5")
+    await store.save("pvoutput", "topic", "{}")
+    await store.save("config", "cache", "x")
+    store.shutdown()
+    (temp_state_dir / "orphaned_key").write_text("789", encoding="utf-8")
+
+    store = StateStore()
+    await store.initialise(temp_state_dir, sqlite_config)
+    await store.preload("sensor", "pvoutput")
+
+    with patch.object(store._disk, "load", wraps=store._disk.load) as reads:
+        assert store.load_sync("sensor", "total") == "1.5"
+        assert store.load_sync("pvoutput", "topic") == "{}"
+        assert store.load_sync("sensor", "missing") is None
+        await store.save("sensor", "missing", "2.5")
+        assert store.load_sync("sensor", "missing") == "2.5"
+        await store.delete("sensor", "total")
+        assert store.load_sync("sensor", "total") is None
+        assert reads.call_count == 0
+
+        # Categories that were not preloaded, and keys that may be in legacy root files, are read from disk
+        assert store.load_sync("config", "cache") == "x"
+        assert store.load_sync("sensor", "orphaned_key") == "789"
+        assert reads.call_count == 2
+        assert store.load_sync("sensor", "orphaned_key") == "789"
+        assert reads.call_count == 2
+    store.shutdown()
+    assert store._preloaded == {}
@@ -18,6 +18,8 @@ def mock_persistence_config():
     config.cache_warmup_timeout = 0.01  # Very short for timeout test
     config.disk_primary = True
     config.sync_timeout = 5.0
+    config.write_behind_interval = 0.0
+    config.write_behind_threshold = 50
     return config
 
 
@@ -20,6 +20,8 @@ def mock_persistence_config():
     config.cache_warmup_timeout = 1.0
     config.disk_primary = True
     config.sync_timeout = 0.1
+    config.write_behind_interval = 0.0
+    config.write_behind_threshold = 50
     return config
 
 
@@ -7,6 +7,7 @@ import pytest
 
 from sigenergy2mqtt.config import OutputField, StatusField, active_config
 from sigenergy2mqtt.config.settings import PvOutputConfig
+from sigenergy2mqtt.mqtt import SensorEvent, sensor_event_bus
 from sigenergy2mqtt.pvoutput.service import Service
 from sigenergy2mqtt.pvoutput.service_topics import Calculation, ServiceTopics, TimePeriodServiceTopics
 from sigenergy2mqtt.pvoutput.topic import Topic
@@ -255,3 +256,28 @@ class TestPVOutputServiceTopics:
         mqtt_handler = MagicMock()
         st.subscribe(MagicMock(), mqtt_handler)
         mqtt_handler.register.assert_not_called()
+
+    def test_subscribe_uses_sensor_events_for_local_topics(self):
+        st = make_service_topics()
+        st.register(Topic("local/raw", gain=1.0))
+        st.register(Topic("external/state", gain=1.0))
+        sensor = MagicMock(publishable=True, publish_raw=True, state_topic="local/state", raw_state_topic="local/raw")
+        device = MagicMock()
+        device.get_all_sensors.return_value = {"s1": sensor}
+        mqtt_client = MagicMock()
+        mqtt_handler = MagicMock()
+
+        with patch("sigenergy2mqtt.pvoutput.service_topics.DeviceRegistry.all", return_value=[device]):
+            st.subscribe(mqtt_client, mqtt_handler)
+
+        assert sensor_event_bus.is_subscribed("local/raw")
+        assert not sensor_event_bus.is_subscribed("external/state")
+        mqtt_handler.register.assert_called_once_with(mqtt_client, "external/state", st.handle_update)
+
+    @pytest.mark.asyncio
+    async def test_handle_event_updates_state(self):
+        st = make_service_topics()
+        st.register(Topic("local/raw", gain=1.0))
+
+        assert await st.handle_event(SensorEvent("local/raw", 1234, time.time(), "uid", "obj")) is True
+        assert st["local/raw"].state == 1234.0
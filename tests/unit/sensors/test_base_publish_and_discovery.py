@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+from paho.mqtt.enums import MQTTErrorCode
 from pymodbus import ModbusException
 
 from sigenergy2mqtt.common import DeviceClass, Protocol, StateClass, UnitOfPower
 from sigenergy2mqtt.config import Config, _swap_active_config
+from sigenergy2mqtt.mqtt import MqttHandler, sensor_event_bus
 from sigenergy2mqtt.sensors.base import (
     Sensor,
 )
@@ -114,6 +117,26 @@ class TestPublishMethod:
         # Both state and raw should be published
         assert mqtt.publish.call_count >= 2
 
+    @pytest.mark.asyncio
+    async def test_publish_delivers_sensor_events(self):
+        """States are delivered to in-process subscribers of the state and raw state topics."""
+        s = self._sensor_with_topics("pub_events")
+        s._publish_raw = True
+        received = []
+        loop = asyncio.get_running_loop()
+        sensor_event_bus.subscribe("test/state", received.append, loop)
+        sensor_event_bus.subscribe("test/raw", received.append, loop)
+
+        async def _update(**kw):
+            s._states.append((time.time(), 100.0))
+            return True
+
+        with patch.object(s, "_update_internal_state", side_effect=_update):
+            await s.publish(_mqtt_mock(), None)
+        await asyncio.sleep(0)
+
+        assert [(e.topic, e.unique_id, e.object_id) for e in received] == [("test/state", s.unique_id, s["object_id"]), ("test/raw", s.unique_id, s["object_id"])]
+
     @pytest.mark.asyncio
     async def test_publish_exception_increments_failures(self):
         """Cover failure counting in exception handler."""
@@ -245,6 +268,30 @@ class TestPublishMethod:
         # After hitting max_failures with retry_interval set, _next_retry should be set
         assert s._next_retry is not None
 
+    @pytest.mark.asyncio
+    async def test_publish_through_handler_does_not_wait(self):
+        """With an MqttHandler, publish returns without waiting and metrics are recorded on acknowledgement."""
+        s = self._sensor_with_topics("pub_pipeline")
+        handler = MqttHandler("test_client", None, asyncio.get_running_loop())
+        mqtt = _mqtt_mock()
+        mqtt.user_data_get.return_value = handler
+        mqtt.publish.return_value.mid = 7
+        mqtt.publish.return_value.rc = MQTTErrorCode.MQTT_ERR_SUCCESS
+
+        async def _update(**kw):
+            s._states.append((time.time(), 42.0))
+            return True
+
+        with patch.object(s, "_update_internal_state", side_effect=_update), patch("sigenergy2mqtt.metrics.Metrics.mqtt_publish_attempt") as attempt:
+            published = await s.publish(mqtt, None)
+            assert published is True
+            mqtt.publish.return_value.wait_for_publish.assert_not_called()
+            attempt.assert_not_called()
+
+            handler.on_response(7, "publish", mqtt)
+            await handler.close()
+        attempt.assert_awaited_once_with(physical_publish=True)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 4. publish_attributes() branches
@@ -8,6 +8,7 @@ from pymodbus.client import AsyncModbusTcpClient as ModbusClient
 from sigenergy2mqtt.common import DeviceClass, InputType, Protocol, StateClass, UnitOfPower
 from sigenergy2mqtt.config import Config, _swap_active_config
 from sigenergy2mqtt.modbus import ModbusDataType
+from sigenergy2mqtt.modbus.read_ahead import RegisterImage
 from sigenergy2mqtt.sensors.base import EnergyDailyAccumulationSensor, EnergyLifetimeAccumulationSensor, NumericSensor, ReadOnlySensor, SelectSensor, Sensor, TimestampSensor
 
 
@@ -292,6 +293,167 @@ class TestReadOnlySensor:
             assert result is True
             assert sensor.latest_raw_state == 123
 
+    @pytest.mark.asyncio
+    async def test_update_internal_state_consumes_pre_decoded_value(self):
+        with patch.dict(Sensor._used_unique_ids, clear=True), patch.dict(Sensor._used_object_ids, clear=True):
+            sensor = ReadOnlySensor(
+                name="Test RO",
+                object_id="sigen_test_ro",
+                input_type=InputType.HOLDING,
+                plant_index=0,
+                device_address=1,
+                address=30001,
+                count=1,
+                data_type=ModbusClient.DATATYPE.UINT16,
+                scan_interval=10,
+                unit=UnitOfPower.WATT,
+                device_class=DeviceClass.POWER,
+                state_class=StateClass.MEASUREMENT,
+                icon="mdi:power",
+                gain=1.0,
+                precision=2,
+                protocol_version=Protocol.V2_4,
+            )
+            mock_modbus = AsyncMock()
+            mock_modbus.convert_from_registers = MagicMock(return_value=123)
+
+            sensor.pre_decode(456)
+            result = await sensor._update_internal_state(modbus_client=mock_modbus)
+
+            assert result is True
+            assert sensor.latest_raw_state == 456
+            mock_modbus.record_read_ahead_hit.assert_awaited_once()
+            mock_modbus.read_holding_registers.assert_not_called()
+            mock_modbus.convert_from_registers.assert_not_called()
+
+            # Consumed: the next read goes to the registers again
+            mock_rr = MagicMock()
+            mock_rr.isError.return_value = False
+            mock_rr.registers = [123]
+            mock_modbus.read_holding_registers.return_value = mock_rr
+            await sensor._update_internal_state(modbus_client=mock_modbus)
+
+            assert sensor.latest_raw_state == 123
+
+            sensor.pre_decode(789)
+            sensor.discard_pre_decoded()
+            await sensor._update_internal_state(modbus_client=mock_modbus)
+
+            assert sensor.latest_raw_state == 123
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("interval,republished", [(0, True), (-1, False), (3600, False)])
+    async def test_unchanged_registers_short_circuit_read(self, mock_config_all, interval, republished):
+        mock_config_all.repeated_state_publish_interval = interval
+        with patch.dict(Sensor._used_unique_ids, clear=True), patch.dict(Sensor._used_object_ids, clear=True):
+            sensor = ReadOnlySensor(
+                name="Test RO",
+                object_id="sigen_test_ro",
+                input_type=InputType.HOLDING,
+                plant_index=0,
+                device_address=1,
+                address=30001,
+                count=1,
+                data_type=ModbusClient.DATATYPE.UINT16,
+                scan_interval=10,
+                unit=UnitOfPower.WATT,
+                device_class=DeviceClass.POWER,
+                state_class=StateClass.MEASUREMENT,
+                icon="mdi:power",
+                gain=1.0,
+                precision=2,
+                protocol_version=Protocol.V2_4,
+            )
+            mock_modbus = AsyncMock()
+            assert not sensor.pre_decode_unchanged(b"\x01\xc8")
+
+            sensor.pre_decode(456, b"\x01\xc8")
+            assert await sensor._update_internal_state(modbus_client=mock_modbus) is True
+            assert not sensor.pre_decode_unchanged(b"\x01\xc9")
+            assert sensor.pre_decode_unchanged(b"\x01\xc8")
+
+            with patch.object(sensor, "set_latest_state") as set_latest_state, patch.object(sensor.sanity_check, "is_sane") as is_sane:
+                result = await sensor._update_internal_state(modbus_client=mock_modbus)
+
+            set_latest_state.assert_not_called()
+            is_sane.assert_not_called()
+            assert result is republished
+            assert sensor.state_count == (2 if republished else 1)
+            assert sensor.latest_raw_state == 456
+
+    @pytest.mark.asyncio
+    async def test_registers_not_remembered_for_rejected_state(self):
+        with patch.dict(Sensor._used_unique_ids, clear=True), patch.dict(Sensor._used_object_ids, clear=True):
+            sensor = ReadOnlySensor(
+                name="Test RO",
+                object_id="sigen_test_ro",
+                input_type=InputType.HOLDING,
+                plant_index=0,
+                device_address=1,
+                address=30001,
+                count=1,
+                data_type=ModbusClient.DATATYPE.UINT16,
+                scan_interval=10,
+                unit=UnitOfPower.WATT,
+                device_class=DeviceClass.POWER,
+                state_class=StateClass.MEASUREMENT,
+                icon="mdi:power",
+                gain=1.0,
+                precision=2,
+                protocol_version=Protocol.V2_4,
+            )
+            mock_modbus = AsyncMock()
+            sensor.pre_decode(456, b"\x01\xc8")
+            await sensor._update_internal_state(modbus_client=mock_modbus)
+
+            with patch.object(sensor.sanity_check, "is_sane", return_value=False):
+                sensor.pre_decode(789, b"\x03\x15")
+                await sensor._update_internal_state(modbus_client=mock_modbus)
+
+            assert sensor.latest_raw_state == 456
+            assert not sensor.pre_decode_unchanged(b"\x03\x15")
+
+    @pytest.mark.asyncio
+    async def test_state_timestamp_is_read_time(self):
+        with patch.dict(Sensor._used_unique_ids, clear=True), patch.dict(Sensor._used_object_ids, clear=True):
+            sensor = ReadOnlySensor(
+                name="Test RO",
+                object_id="sigen_test_ro",
+                input_type=InputType.HOLDING,
+                plant_index=0,
+                device_address=1,
+                address=30001,
+                count=1,
+                data_type=ModbusClient.DATATYPE.UINT16,
+                scan_interval=10,
+                unit=UnitOfPower.WATT,
+                device_class=DeviceClass.POWER,
+                state_class=StateClass.MEASUREMENT,
+                icon="mdi:power",
+                gain=1.0,
+                precision=2,
+                protocol_version=Protocol.V2_4,
+            )
+            mock_modbus = AsyncMock()
+            sensor.pre_decode(456, read_at=1700000000.5)
+            await sensor._update_internal_state(modbus_client=mock_modbus)
+
+            assert sensor.latest_time == 1700000000.5
+
+            # A read served from the read-ahead cache took place when the cache was filled
+            image = RegisterImage(1, InputType.HOLDING)
+            image.fill(30001, [123], timestamp=1700000001.25)
+            mock_modbus.register_image = MagicMock(return_value=image)
+            mock_modbus.convert_from_registers = MagicMock(return_value=123)
+            mock_rr = MagicMock()
+            mock_rr.isError.return_value = False
+            mock_rr.registers = [123]
+            mock_modbus.read_holding_registers.return_value = mock_rr
+            await sensor._update_internal_state(modbus_client=mock_modbus)
+
+            assert sensor.latest_raw_state == 123
+            assert sensor.latest_time == 1700000001.25
+
 
 class TestTimestampSensor:
     @pytest.mark.asyncio
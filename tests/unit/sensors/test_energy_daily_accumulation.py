@@ -114,7 +114,7 @@ class TestEnergyDailyAccumulationSensor:
             mock_state_store.save = AsyncMock()
             await sensor._update_state_at_midnight(150.0)
             assert sensor._state_at_midnight == 150.0
-            mock_state_store.save.assert_called_with(Category.SENSOR, "sigen_test_source_uid.atmidnight", "150.0")
+            mock_state_store.save.assert_called_with(Category.SENSOR, "sigen_test_source_uid.atmidnight", "150.0", flush=True)
 
     @pytest.mark.asyncio
     async def test_notify(self, source_sensor):
@@ -204,7 +204,7 @@ class TestPowerFactor:
         # Mock parent set_state to not raise
         with patch.object(sensor.__class__.__bases__[0], "set_state") as mock_parent_set_state:
             sensor.set_state(0.95)
-            mock_parent_set_state.assert_called_once_with(0.95)
+            mock_parent_set_state.assert_called_once_with(0.95, None)
 
     @pytest.mark.asyncio
     async def test_power_factor_calculated_from_active_reactive(self, mock_config, caplog):
@@ -228,7 +228,7 @@ class TestPowerFactor:
             # Second call should succeed (calculation bypass)
             call_count = [0]
 
-            def side_effect(value):
+            def side_effect(value, timestamp=None):
                 call_count[0] += 1
                 if call_count[0] == 1:
                     raise SanityCheckException("Invalid value")
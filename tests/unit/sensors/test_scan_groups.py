@@ -1,5 +1,7 @@
 import asyncio
 import time
+from array import array
+from collections import deque
 from pathlib import Path
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -11,9 +13,14 @@ from sigenergy2mqtt.common import Constants, InputType, Protocol
 from sigenergy2mqtt.config import Config
 from sigenergy2mqtt.devices import Device, DeviceRegistry
 from sigenergy2mqtt.devices.base.poller import SensorGroupPoller
-from sigenergy2mqtt.devices.base.scan_groups import create_sensor_scan_groups
+from sigenergy2mqtt.devices.base.scan_groups import IllegalAddressRegistry, ReadableSensorGroup, ScanCostModel, ScanPlanRegistry, create_sensor_scan_groups, partition_scan_group
+from sigenergy2mqtt.modbus import BlockDecoder, ModbusDataType
 from sigenergy2mqtt.modbus.client import ModbusClient
-from sigenergy2mqtt.sensors.base import AlarmCombinedSensor, ModbusSensorMixin, ReadableSensorMixin, ReservedSensor, Sensor
+from sigenergy2mqtt.modbus.lock import ModbusLock
+from sigenergy2mqtt.modbus.pipeline import AdaptiveWindow, PipelinedTransactionManager
+from sigenergy2mqtt.modbus.read_ahead import RegisterImage
+from sigenergy2mqtt.sensors.base import AlarmCombinedSensor, ModbusSensorMixin, ReadableSensorMixin, ReadOnlySensor, ReservedSensor, Sensor
+from sigenergy2mqtt.sensors.base.readable import _UNCHANGED
 
 
 class DummyModbusSensor(ModbusSensorMixin, ReadableSensorMixin):
@@ -96,6 +103,22 @@ class DummyReservedSensor(ReservedSensor):
         object.__setattr__(self, "debug_logging", False)
 
 
+class DummyReadOnlySensor(ReadOnlySensor):
+    """ReadOnlySensor using the standard read path, without the full constructor."""
+
+    def __init__(self, unique_id: str, address: int, count: int, data_type: ModbusDataType):
+        self["unique_id"] = unique_id
+        object.__setattr__(self, "unique_id", unique_id)
+        object.__setattr__(self, "address", address)
+        object.__setattr__(self, "count", count)
+        object.__setattr__(self, "data_type", data_type)
+        object.__setattr__(self, "device_address", 1)
+        object.__setattr__(self, "scan_interval", 10)
+        object.__setattr__(self, "input_type", InputType.INPUT)
+        object.__setattr__(self, "_publishable", True)
+        object.__setattr__(self, "debug_logging", False)
+
+
 @pytest.fixture
 def mock_config():
     from sigenergy2mqtt.config import _swap_active_config
@@ -301,6 +324,351 @@ class TestCreateSensorScanGroups:
         assert s2 in groups["MyGroup"]
 
 
+class TestScanGroupPlanner:
+    """Tests for scan-interval-aware partitioning of scan groups."""
+
+    def test_cost_model(self):
+        """Hourly cost is the per-request cost multiplied by reads per hour."""
+        model = ScanCostModel(request_overhead=0.05, register_cost=0.001)
+        assert model.request_cost(10) == pytest.approx(0.06)
+        assert model.hourly_cost(10, 5) == pytest.approx(720 * 0.06)
+
+    def test_fast_sensor_split_from_slow_neighbours(self):
+        """A single realtime sensor inside a long run of slow sensors is read on its own."""
+        slow_before = [DummyModbusSensor(f"a{i}", address=100 + i * 10, count=10, scan_interval=600) for i in range(6)]
+        fast = DummyModbusSensor("fast", address=160, count=2, scan_interval=5)
+        slow_after = [DummyModbusSensor(f"b{i}", address=162 + i * 10, count=10, scan_interval=600) for i in range(6)]
+
+        runs = partition_scan_group([*slow_before, fast, *slow_after])
+
+        assert runs == [slow_before, [fast], slow_after]
+
+    def test_similar_intervals_stay_together(self):
+        """Contiguous sensors with similar intervals are cheaper to read together."""
+        sensors = [
+            DummyModbusSensor("s1", address=100, scan_interval=5),
+            DummyModbusSensor("s2", address=101, scan_interval=10),
+            DummyModbusSensor("s3", address=102, scan_interval=60),
+        ]
+
+        assert partition_scan_group(sensors) == [sensors]
+
+    def test_request_overhead_drives_partition(self):
+        """With no request overhead, every sensor is cheapest read on its own; with high overhead, never split."""
+        fast = DummyModbusSensor("fast", address=100, count=1, scan_interval=5)
+        slow = DummyModbusSensor("slow", address=101, count=50, scan_interval=600)
+
+        assert partition_scan_group([fast, slow], ScanCostModel(request_overhead=0.0, register_cost=0.001)) == [[fast], [slow]]
+        assert partition_scan_group([fast, slow], ScanCostModel(request_overhead=10.0, register_cost=0.001)) == [[fast, slow]]
+
+    def test_create_groups_partitions_and_records_plan(self, mock_config):
+        """create_sensor_scan_groups partitions auto groups and records the plan for diagnostics."""
+        ScanPlanRegistry.clear()
+        dev = Device("test", 0, "uid", "mf", "mdl", Protocol.V1_8)
+        slow = DummyModbusSensor("slow", address=100, count=100, scan_interval=600)
+        fast = DummyModbusSensor("fast", address=200, count=1, scan_interval=5)
+        dev._add_sensor(cast(Sensor, slow))
+        dev._add_sensor(cast(Sensor, fast))
+
+        groups = create_sensor_scan_groups(dev)
+
+        assert groups["001_00100"] == [slow]
+        assert groups["001_00200"] == [fast]
+        snapshot = ScanPlanRegistry.snapshot()
+        plant = snapshot["plant_0"]
+        assert plant["scan_groups_count"] == 2
+        assert plant["reads_per_hour"] == pytest.approx(6 + 720)
+        expected = ScanPlanRegistry.cost_model.hourly_cost(100, 600) + ScanPlanRegistry.cost_model.hourly_cost(1, 5)
+        assert plant["predicted_bus_time_per_hour_secs"] == pytest.approx(expected, abs=0.001)
+        assert plant["predicted_bus_load_pct"] == pytest.approx(expected / 36, abs=0.001)
+        assert set(plant["groups"]) == {"test [001_00100]", "test [001_00200]"}
+        assert "config" in snapshot
+        ScanPlanRegistry.clear()
+
+    def test_named_groups_not_partitioned(self, mock_config):
+        """Named groups are kept intact regardless of scan intervals."""
+        dev = Device("test", 0, "uid", "mf", "mdl", Protocol.V1_8)
+        slow = DummyModbusSensor("slow", address=100, count=100, scan_interval=600)
+        fast = DummyModbusSensor("fast", address=200, count=1, scan_interval=5)
+        dev._add_sensor(cast(Sensor, slow), group="Named")
+        dev._add_sensor(cast(Sensor, fast), group="Named")
+
+        groups = create_sensor_scan_groups(dev)
+
+        assert groups["Named"] == [slow, fast]
+
+
+class TestGapBridging:
+    """Tests for bridging small register gaps between scan group sensors."""
+
+    @pytest.fixture(autouse=True)
+    def clear_illegal_addresses(self):
+        IllegalAddressRegistry.clear()
+        yield
+        IllegalAddressRegistry.clear()
+
+    def test_small_gap_bridged(self, mock_config):
+        """Sensors separated by a gap no larger than max_bridged_gap share a group."""
+        mock_config.modbus[0].max_bridged_gap = 5
+        dev = Device("test", 0, "uid", "mf", "mdl", Protocol.V1_8)
+        s1 = DummyModbusSensor("s1", address=100, count=2)
+        s2 = DummyModbusSensor("s2", address=107, count=1)  # 5 register gap
+        s3 = DummyModbusSensor("s3", address=114, count=1)  # 6 register gap
+        for s in (s1, s2, s3):
+            dev._add_sensor(cast(Sensor, s))
+
+        groups = create_sensor_scan_groups(dev)
+
+        assert groups["001_00100"] == [s1, s2]
+        assert groups["001_00114"] == [s3]
+
+    def test_gap_not_bridged_by_default(self, mock_config):
+        """With the default max_bridged_gap of 0, any gap starts a new group."""
+        dev = Device("test", 0, "uid", "mf", "mdl", Protocol.V1_8)
+        s1 = DummyModbusSensor("s1", address=100)
+        s2 = DummyModbusSensor("s2", address=102)
+        dev._add_sensor(cast(Sensor, s1))
+        dev._add_sensor(cast(Sensor, s2))
+
+        groups = create_sensor_scan_groups(dev)
+
+        assert groups["001_00100"] == [s1]
+        assert groups["001_00102"] == [s2]
+
+    def test_gap_capped_at_break_even(self, mock_config):
+        """Gaps larger than the cost model's break-even gap are never bridged."""
+        mock_config.modbus[0].max_bridged_gap = 100
+        model = ScanCostModel(request_overhead=0.01, register_cost=0.001)
+        dev = Device("test", 0, "uid", "mf", "mdl", Protocol.V1_8)
+        s1 = DummyModbusSensor("s1", address=100)
+        s2 = DummyModbusSensor("s2", address=111)  # 10 register gap
+        s3 = DummyModbusSensor("s3", address=123)  # 11 register gap
+        for s in (s1, s2, s3):
+            dev._add_sensor(cast(Sensor, s))
+
+        groups = create_sensor_scan_groups(dev, model)
+
+        assert model.break_even_gap == 10
+        assert groups["001_00100"] == [s1, s2]
+        assert groups["001_00123"] == [s3]
+
+    def test_illegal_address_never_bridged(self, mock_config):
+        """A gap containing an address recorded as ILLEGAL DATA ADDRESS is not bridged."""
+        mock_config.modbus[0].max_bridged_gap = 10
+        IllegalAddressRegistry.record(0, 1, InputType.INPUT, 103)
+        dev = Device("test", 0, "uid", "mf", "mdl", Protocol.V1_8)
+        s1 = DummyModbusSensor("s1", address=100)
+        s2 = DummyModbusSensor("s2", address=105)
+        s3 = DummyModbusSensor("s3", address=110)
+        for s in (s1, s2, s3):
+            dev._add_sensor(cast(Sensor, s))
+
+        groups = create_sensor_scan_groups(dev)
+
+        assert groups["001_00100"] == [s1]
+        assert groups["001_00105"] == [s2, s3]
+        assert not IllegalAddressRegistry.overlaps(1, 1, InputType.INPUT, 100, 110)  # Other plants are unaffected
+
+    def test_split_at_gaps(self):
+        """split_at_gaps returns the contiguous runs of publishable Modbus sensors."""
+        s1 = DummyModbusSensor("s1", address=100, count=2)
+        s2 = DummyModbusSensor("s2", address=102, count=1)
+        s3 = DummyModbusSensor("s3", address=105, count=1)
+        unpublishable = DummyModbusSensor("s4", address=106, count=1)
+        object.__setattr__(unpublishable, "_publishable", False)
+        s5 = DummyModbusSensor("s5", address=107, count=1)
+
+        runs = ReadableSensorGroup(s3, s1, unpublishable, s5, s2).split_at_gaps()
+
+        assert runs == [[s1, s2], [s3], [s5]]
+        assert (runs[0].first_address, runs[0].register_count) == (100, 3)
+
+    @pytest.mark.asyncio
+    async def test_bridged_read_split_on_illegal_data_address(self, mock_config):
+        """A bridged pre-read rejected with 0x02 is split into its contiguous runs instead of being disabled."""
+        dev = Device("test", 0, "uid", "mf", "mdl", Protocol.V1_8)
+        sensors = [
+            DummyModbusSensor("s1", address=100, count=2, scan_interval=60),
+            DummyModbusSensor("s2", address=102, count=1, scan_interval=60),
+            DummyModbusSensor("s3", address=110, count=1, scan_interval=60),
+            DummyModbusSensor("s4", address=111, count=1, scan_interval=60),
+            DummyModbusSensor("s5", address=120, count=1, scan_interval=60),
+        ]
+        for s in sensors:
+            s.force_publish = True
+
+        reads: list[tuple[int, int]] = []
+
+        async def read_ahead_registers(first_address, count, device_id, input_type, trace=False):
+            reads.append((first_address, count))
+            return 2 if count == 21 else 0
+
+        modbus_client = MagicMock(spec=ModbusClient)
+        modbus_client.read_ahead_registers = AsyncMock(side_effect=read_ahead_registers)
+        async_cm = AsyncMock()
+        async_cm.__aenter__ = AsyncMock(return_value=None)
+        async_cm.__aexit__ = AsyncMock(return_value=False)
+        lock = MagicMock()
+        lock.lock = MagicMock(return_value=async_cm)
+        poller = SensorGroupPoller(dev)
+
+        read_ranges = await poller._publish_read_ahead(sensors, modbus_client, [ReadableSensorGroup(*sensors)], lock, "grp", False)
+
+        assert reads == [(100, 21)]
+        assert [(r.first_address, r.register_count) for r in read_ranges] == [(100, 3), (110, 2)]
+
+        read_ranges = await poller._publish_read_ahead(sensors[2:3], modbus_client, read_ranges, lock, "grp", False)
+
+        assert reads == [(100, 21), (110, 2)]
+        assert len(read_ranges) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("window_size, expected_peak", [(1, 1), (4, 4)])
+    async def test_read_aheads_of_groups_share_pipelined_bus(self, mock_config, window_size, expected_peak):
+        """The read-aheads of different scan groups are in flight together, up to the client's pipeline window."""
+        dev = Device("test", 0, "uid", "mf", "mdl", Protocol.V1_8)
+        groups = [[DummyModbusSensor(f"s{i}", address=100 + 100 * i, scan_interval=60)] for i in range(6)]
+        in_flight = peak = 0
+
+        async def read_ahead_registers(first_address, count, device_id, input_type, trace=False):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 0
+
+        modbus_client = MagicMock(spec=ModbusClient)
+        modbus_client.read_ahead_registers = AsyncMock(side_effect=read_ahead_registers)
+        modbus_client.ctx = MagicMock(spec=PipelinedTransactionManager)
+        modbus_client.ctx.window = AdaptiveWindow(4)
+        modbus_client.ctx.window._size = float(window_size)
+        lock = ModbusLock(modbus_client)
+        poller = SensorGroupPoller(dev)
+
+        await asyncio.gather(*[poller._publish_read_ahead(sensors, modbus_client, [ReadableSensorGroup(*sensors)], lock, f"grp{i}", False) for i, sensors in enumerate(groups)])
+
+        assert modbus_client.read_ahead_registers.await_count == 6
+        assert peak == expected_peak
+        assert not lock.locked()
+
+
+class TestBlockDecoding:
+    """Tests for decoding a pre-read block once for all the sensors of a read range."""
+
+    def test_decoder_covers_standard_read_only_sensors(self):
+        """Only sensors that consume pre-decoded values are decoded, and appending recompiles the decoder."""
+        s1 = DummyReadOnlySensor("s1", 100, 2, ModbusDataType.UINT32)
+        other = DummyModbusSensor("s2", address=102, count=1)
+        group = ReadableSensorGroup(s1, other)
+
+        decoder, decoded = group.decoder
+        assert decoded == [s1]
+        assert group.decoder[0] is decoder
+
+        s3 = DummyReadOnlySensor("s3", 103, 1, ModbusDataType.INT16)
+        group.append(s3)
+        assert group.decoder[0] is not decoder
+        assert group.decoder[1] == [s1, s3]
+
+    def test_pre_decode_hands_due_sensors_their_values(self):
+        """The poller decodes a successful pre-read once and hands values only to due sensors."""
+        s1 = DummyReadOnlySensor("s1", 100, 2, ModbusDataType.UINT32)
+        s2 = DummyReadOnlySensor("s2", 102, 1, ModbusDataType.INT16)
+        s3 = DummyReadOnlySensor("s3", 105, 1, ModbusDataType.UINT16)
+        group = ReadableSensorGroup(s1, s2, s3)
+        image = RegisterImage(1, InputType.INPUT)
+        image.fill(100, [1, 2, 0xFFFF, 0, 0, 9])
+        modbus_client = MagicMock(spec=ModbusClient)
+        modbus_client.register_image.return_value = image
+        poller = SensorGroupPoller(Device("test", 0, "uid", "mf", "mdl", Protocol.V1_8))
+
+        poller._pre_decode(group, modbus_client, {id(s1), id(s2)})
+
+        assert s1._pre_decoded == 0x00010002
+        assert s2._pre_decoded == -1
+        assert s3._pre_decoded is None
+
+    def test_pre_decode_skips_decoding_unchanged_registers(self):
+        """Sensors whose registers are unchanged are short-circuited, and an entirely unchanged block is not decoded."""
+        s1 = DummyReadOnlySensor("s1", 100, 1, ModbusDataType.UINT16)
+        s2 = DummyReadOnlySensor("s2", 101, 1, ModbusDataType.UINT16)
+        group = ReadableSensorGroup(s1, s2)
+        image = RegisterImage(1, InputType.INPUT)
+        image.fill(100, [7, 8])
+        modbus_client = MagicMock(spec=ModbusClient)
+        modbus_client.register_image.return_value = image
+        poller = SensorGroupPoller(Device("test", 0, "uid", "mf", "mdl", Protocol.V1_8))
+        for sensor, value in ((s1, 7), (s2, 5)):
+            object.__setattr__(sensor, "_states", deque([(time.time(), value)]))
+            object.__setattr__(sensor, "_latest_registers", (array("H", [value]).tobytes(), value))
+
+        poller._pre_decode(group, modbus_client, {id(s1), id(s2)})
+
+        assert s1._pre_decoded is _UNCHANGED
+        assert s2._pre_decoded == 8
+        assert s2._pre_decoded_registers == array("H", [8]).tobytes()
+
+        s2.discard_pre_decoded()
+        object.__setattr__(s2, "_latest_registers", (array("H", [8]).tobytes(), 8))
+        object.__setattr__(s2, "_states", deque([(time.time(), 8)]))
+        with patch.object(BlockDecoder, "decode") as decode:
+            poller._pre_decode(group, modbus_client, {id(s1), id(s2)})
+
+        decode.assert_not_called()
+        assert s1._pre_decoded is _UNCHANGED and s2._pre_decoded is _UNCHANGED
+
+    def test_pre_decode_skipped_when_block_not_cached(self):
+        """Nothing is pre-decoded when the image does not hold the whole block."""
+        s1 = DummyReadOnlySensor("s1", 100, 1, ModbusDataType.UINT16)
+        s2 = DummyReadOnlySensor("s2", 101, 1, ModbusDataType.UINT16)
+        group = ReadableSensorGroup(s1, s2)
+        image = RegisterImage(1, InputType.INPUT)
+        image.fill(100, [1])
+        modbus_client = MagicMock(spec=ModbusClient)
+        modbus_client.register_image.return_value = image
+        poller = SensorGroupPoller(Device("test", 0, "uid", "mf", "mdl", Protocol.V1_8))
+
+        poller._pre_decode(group, modbus_client, {id(s1), id(s2)})
+
+        assert s1._pre_decoded is None
+
+    @pytest.mark.asyncio
+    async def test_pre_read_reads_block_once(self):
+        """A pre-read fetches the whole span in one request and hands every sensor its value."""
+        s1 = DummyReadOnlySensor("s1", 100, 2, ModbusDataType.UINT32)
+        s2 = DummyReadOnlySensor("s2", 102, 1, ModbusDataType.INT16)
+        group = ReadableSensorGroup(s1, s2)
+        rr = MagicMock()
+        rr.isError.return_value = False
+        rr.registers = [1, 2, 0xFFFF]
+        modbus_client = MagicMock(spec=ModbusClient)
+        modbus_client.read_input_registers = AsyncMock(return_value=rr)
+
+        assert await group.pre_read(modbus_client) is True
+
+        modbus_client.read_input_registers.assert_awaited_once_with(100, count=3, device_id=1)
+        assert s1._pre_decoded == 0x00010002
+        assert s2._pre_decoded == -1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failure", ["error", "exception"])
+    async def test_pre_read_failure_hands_over_nothing(self, failure):
+        """When the block cannot be read, the sensors are left to read their own registers."""
+        s1 = DummyReadOnlySensor("s1", 100, 1, ModbusDataType.UINT16)
+        group = ReadableSensorGroup(s1)
+        modbus_client = MagicMock(spec=ModbusClient)
+        if failure == "error":
+            rr = MagicMock()
+            rr.isError.return_value = True
+            modbus_client.read_input_registers = AsyncMock(return_value=rr)
+        else:
+            modbus_client.read_input_registers = AsyncMock(side_effect=TimeoutError)
+
+        assert await group.pre_read(modbus_client) is False
+        assert s1._pre_decoded is None
+
+
 class TestPublishUpdates:
     """Tests for publish_updates per-sensor timing."""
 
@@ -62,7 +62,7 @@ def mock_lock_factory():
         mock_lock = MagicMock()
 
         @asynccontextmanager
-        async def mock_lock_cm(timeout=None):
+        async def mock_lock_cm(timeout=None, **kwargs):
             yield
 
         mock_lock.lock.side_effect = mock_lock_cm
@@ -129,7 +129,7 @@ class TestWritableSensorMixin:
                 mock_lock = MagicMock()
 
                 @asynccontextmanager
-                async def mock_lock_cm(timeout=None):
+                async def mock_lock_cm(timeout=None, **kwargs):
                     raise asyncio.TimeoutError()
                     yield
 
@@ -72,7 +72,7 @@ def mock_lock_factory():
         mock_lock = MagicMock()
 
         @asynccontextmanager
-        async def mock_lock_cm(timeout=None):
+        async def mock_lock_cm(timeout=None, **kwargs):
             yield
 
         mock_lock.lock.side_effect = mock_lock_cm
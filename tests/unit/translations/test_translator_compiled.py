@@ -0,0 +1,80 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from sigenergy2mqtt.i18n import Translator
+
+
+@pytest.fixture
+def translator(tmp_path):
+    (tmp_path / "en.yaml").write_text("cli:\n  greeting: Hello\n  farewell: Goodbye\n", encoding="utf-8")
+    (tmp_path / "de.yaml").write_text("greeting: Hallo\n", encoding="utf-8")
+    (tmp_path / "fr.yaml").write_text("cli:\n  greeting: Bonjour\n", encoding="utf-8")
+    t = Translator()
+    t._translations_dir = tmp_path
+    return t
+
+
+def _compiled(t: Translator, language: str):
+    return t._translations_dir / "__pycache__" / f"{language}.{sys.implementation.cache_tag}.marshal"
+
+
+def test_parsed_file_is_compiled_and_reused(translator):
+    assert translator._load_file("de") == {"greeting": "Hallo"}
+    assert _compiled(translator, "de").exists()
+
+    fresh = Translator()
+    fresh._translations_dir = translator._translations_dir
+    with patch.object(fresh._yaml, "load", side_effect=AssertionError("YAML parsed")):
+        assert fresh._load_file("de") == {"greeting": "Hallo"}
+
+
+def test_changed_file_is_recompiled(translator):
+    translator._load_file("de")
+    source = translator._translations_dir / "de.yaml"
+    source.write_text("greeting: Guten Tag\n", encoding="utf-8")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    fresh = Translator()
+    fresh._translations_dir = translator._translations_dir
+    assert fresh._load_file("de") == {"greeting": "Guten Tag"}
+
+
+def test_touched_file_with_same_content_is_not_reparsed(translator):
+    translator._load_file("de")
+    source = translator._translations_dir / "de.yaml"
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    fresh = Translator()
+    fresh._translations_dir = translator._translations_dir
+    with patch.object(fresh._yaml, "load", side_effect=AssertionError("YAML parsed")):
+        assert fresh._load_file("de") == {"greeting": "Hallo"}
+
+
+def test_corrupt_compiled_file_is_ignored(translator):
+    translator._load_file("de")
+    _compiled(translator, "de").write_bytes(b"not marshal data")
+
+    fresh = Translator()
+    fresh._translations_dir = translator._translations_dir
+    assert fresh._load_file("de") == {"greeting": "Hallo"}
+
+
+def test_unwritable_cache_falls_back_to_yaml(translator):
+    (translator._translations_dir / "__pycache__").write_text("not a directory")
+
+    assert translator._load_file("de") == {"greeting": "Hallo"}
+    assert translator._load_file("de") == {"greeting": "Hallo"}
+
+
+def test_only_active_and_fallback_languages_are_kept(translator):
+    translator.load("de")
+    translator.load("fr")
+
+    assert set(translator._cache) == {"fr", "en"}
+    assert translator.translate("cli.greeting") == ("Bonjour", "fr", True)
+    assert translator.translate("cli.farewell") == ("Goodbye", "en", False)
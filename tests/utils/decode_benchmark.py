@@ -0,0 +1,103 @@
+"""
+decode_benchmark.py - Micro-benchmark of per-tick register decoding CPU time.
+
+Compares the two ways a scan group's sensors can obtain their raw values once a
+read-ahead has filled the register image:
+
+* ``per-sensor``: each sensor fetches its registers from the image as a PDU,
+  calls ``convert_from_registers`` and then ``set_latest_state`` (the path
+  taken when a sensor is read without a pre-decoded value).
+* ``block``: each read range is decoded in one pass with its precompiled
+  :class:`~sigenergy2mqtt.modbus.BlockDecoder`, and each sensor is handed its
+  value for ``set_latest_state``.
+
+The sensor set is every read-only plant, inverter and PSS sensor from
+:func:`tests.utils.modbus_sensors.get_sensor_instances`, grouped into contiguous
+read ranges per device and register space.
+
+Usage::
+
+    python tests/utils/decode_benchmark.py [ticks]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from collections import defaultdict
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+    # Removed before the project imports, which parse the command line for configuration options
+    TICKS = int(sys.argv.pop(1)) if len(sys.argv) > 1 else 1000
+
+from sigenergy2mqtt.config import Config, _swap_active_config
+from sigenergy2mqtt.devices.base.scan_groups import ReadableSensorGroup
+from sigenergy2mqtt.modbus.client import ModbusClient
+from sigenergy2mqtt.modbus.read_ahead import RegisterImage
+from sigenergy2mqtt.sensors.base import ReadOnlySensor
+from sigenergy2mqtt.sensors.base.sanity_check import SanityCheckException
+from tests.utils.modbus_sensors import get_sensor_instances
+
+
+def _read_ranges() -> list[ReadableSensorGroup]:
+    sensors = asyncio.run(get_sensor_instances())
+    groups: dict[tuple, ReadableSensorGroup] = defaultdict(ReadableSensorGroup)
+    for sensor in sensors.values():
+        if isinstance(sensor, ReadOnlySensor) and sensor.publishable and sensor.__class__.__module__.rsplit(".", 1)[-1].startswith(("plant_", "inverter_", "pss_")):
+            groups[(sensor.device_address, sensor.input_type)].append(sensor)
+    return [run for group in groups.values() for run in group.split_at_gaps()]
+
+
+def _images(read_ranges: list[ReadableSensorGroup]) -> dict[int, RegisterImage]:
+    images: dict[tuple, RegisterImage] = {}
+    by_range: dict[int, RegisterImage] = {}
+    for read_range in read_ranges:
+        key = (read_range.device_address, read_range.input_type)
+        image = images.setdefault(key, RegisterImage(*key))
+        image.fill(read_range.first_address, [0] * read_range.register_count)
+        by_range[id(read_range)] = image
+    return by_range
+
+
+def _set_latest_state(sensor: ReadOnlySensor, value) -> None:
+    try:
+        sensor.set_latest_state(value)
+    except SanityCheckException:
+        pass  # The zero-filled registers are not sane for every sensor, but the cost is the same for both paths
+
+
+def per_sensor_tick(read_ranges: list[ReadableSensorGroup], images: dict[int, RegisterImage]) -> None:
+    for read_range in read_ranges:
+        image = images[id(read_range)]
+        for sensor in read_range.decoder[1]:
+            rr = image.get_registers(sensor.address, sensor.count)
+            _set_latest_state(sensor, ModbusClient.convert_from_registers(rr.registers, sensor.data_type))
+
+
+def block_tick(read_ranges: list[ReadableSensorGroup], images: dict[int, RegisterImage]) -> None:
+    for read_range in read_ranges:
+        decoder, decoded = read_range.decoder
+        values = decoder.decode(images[id(read_range)].view(read_range.first_address, read_range.register_count))
+        for sensor, value in zip(decoded, values):
+            if value is not None:
+                _set_latest_state(sensor, value)
+
+
+def main(ticks: int) -> None:
+    with _swap_active_config(Config()):
+        read_ranges = _read_ranges()
+        images = _images(read_ranges)
+        sensors = sum(len(r.decoder[1]) for r in read_ranges)
+        print(f"{sensors} sensors in {len(read_ranges)} read ranges, {ticks} ticks")
+        for name, tick in (("per-sensor", per_sensor_tick), ("block", block_tick)):
+            tick(read_ranges, images)  # Warm up (and compile the decoders)
+            start = time.process_time()
+            for _ in range(ticks):
+                tick(read_ranges, images)
+            elapsed = time.process_time() - start
+            print(f"{name:>10}: {elapsed / ticks * 1_000_000:9.1f} µs CPU/tick")
+
+
+if __name__ == "__main__":
+    main(TICKS)
@@ -0,0 +1,61 @@
+"""
+i18n_benchmark.py - Benchmark of loading the translations at startup.
+
+Copies the translation files to a temporary directory and times loading each
+language (and the English fallback) with a new
+:class:`~sigenergy2mqtt.i18n.Translator`:
+
+* ``cold``: the YAML files are parsed, as on the first start after
+  installation or an upgrade, and saved in compiled form.
+* ``warm``: the compiled files saved by the cold start are loaded instead.
+
+Usage::
+
+    python tests/utils/i18n_benchmark.py [runs]
+"""
+
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+    # Removed before the project imports, which parse the command line for configuration options
+    RUNS = int(sys.argv.pop(1)) if len(sys.argv) > 1 else 5
+
+from sigenergy2mqtt.i18n import Translator
+
+
+def _startup(translations: Path, language: str) -> float:
+    translator = Translator()
+    translator._translations_dir = translations
+    t0 = time.perf_counter()
+    translator.load(language)
+    return time.perf_counter() - t0
+
+
+def main(runs: int) -> None:
+    logging.disable(logging.WARNING)
+    source = Path(Translator()._translations_dir)
+    languages = sorted(path.stem for path in source.glob("*.yaml"))
+    size = sum(path.stat().st_size for path in source.glob("*.yaml"))
+    print(f"{len(languages)} languages ({size / 1024:.0f} KiB of YAML)")
+    for language in languages:
+        cold = []
+        warm = []
+        for _ in range(runs):
+            with tempfile.TemporaryDirectory() as directory:
+                translations = Path(directory)
+                for path in source.glob("*.yaml"):
+                    shutil.copy2(path, translations)
+                cold.append(_startup(translations, language))
+                warm.append(_startup(translations, language))
+        print(f"{language:>7}: {min(cold) * 1000:8.1f} ms cold, {min(warm) * 1000:6.1f} ms warm")
+
+
+if __name__ == "__main__":
+    main(RUNS)
@@ -0,0 +1,158 @@
+"""
+metrics_benchmark.py - Micro-benchmark of the cost of recording metrics.
+
+Records the metrics of a publish loop (a modbus read, a decoded read and an
+MQTT publish attempt per sensor) from several threads, each running its own
+event loop like the device threads, and compares:
+
+* ``executor``: a replica of the previous implementation, where every update
+  was submitted as a closure to a single worker thread that applied it while
+  holding the global metrics lock.
+* ``sharded``: :class:`~sigenergy2mqtt.metrics.Metrics`, where every thread
+  records into its own shard, which is folded once when the metrics are read.
+
+Usage::
+
+    python tests/utils/metrics_benchmark.py [updates-per-thread] [threads]
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+    # Removed before the project imports, which parse the command line for configuration options
+    UPDATES = int(sys.argv.pop(1)) if len(sys.argv) > 1 else 20000
+    THREADS = int(sys.argv.pop(1)) if len(sys.argv) > 1 else 4
+
+from sigenergy2mqtt.metrics import Metrics
+
+
+class ExecutorMetrics:
+    """The previous executor-and-lock update path, reduced to the metrics recorded by the publish loop."""
+
+    reads = 0
+    read_total = 0.0
+    read_max = 0.0
+    read_min = float("inf")
+    read_mean = 0.0
+    decoded_reads = 0
+    unchanged_reads = 0
+    unchanged_percentage = 0.0
+    publish_attempts = 0
+    physical_publishes = 0
+    physical_publish_percentage = 0.0
+
+    _lock = threading.Lock()
+    _executor: ThreadPoolExecutor | None = None
+    _executor_lock = threading.Lock()
+    _pending: list[Future] = []
+    _pending_lock = threading.Lock()
+
+    @classmethod
+    def _submit(cls, operation) -> None:
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metrics")
+            executor = cls._executor
+        future = executor.submit(operation)
+        with cls._pending_lock:
+            cls._pending.append(future)
+
+        def _cleanup(completed: Future) -> None:
+            with cls._pending_lock:
+                if completed in cls._pending:
+                    cls._pending.remove(completed)
+
+        future.add_done_callback(_cleanup)
+
+    @classmethod
+    def _update_with_lock(cls, operation) -> None:
+        if not cls._lock.acquire(timeout=1.0):
+            raise TimeoutError
+        try:
+            operation()
+        finally:
+            cls._lock.release()
+
+    @classmethod
+    async def modbus_read(cls, registers: int, seconds: float) -> None:
+        def _operation() -> None:
+            elapsed = seconds * 1000.0
+            cls.reads += 1
+            cls.read_total += elapsed
+            cls.read_max = max(cls.read_max, elapsed)
+            cls.read_min = min(cls.read_min, elapsed)
+            cls.read_mean = cls.read_total / cls.reads
+
+        cls._submit(lambda: cls._update_with_lock(_operation))
+
+    @classmethod
+    async def modbus_decoded_read(cls, unchanged: bool) -> None:
+        def _operation() -> None:
+            cls.decoded_reads += 1
+            if unchanged:
+                cls.unchanged_reads += 1
+            cls.unchanged_percentage = round(cls.unchanged_reads / cls.decoded_reads * 100.0, 2)
+
+        cls._submit(lambda: cls._update_with_lock(_operation))
+
+    @classmethod
+    async def mqtt_publish_attempt(cls, physical_publish: bool) -> None:
+        def _operation() -> None:
+            cls.publish_attempts += 1
+            if physical_publish:
+                cls.physical_publishes += 1
+            cls.physical_publish_percentage = round(cls.physical_publishes / cls.publish_attempts * 100.0, 2)
+
+        cls._submit(lambda: cls._update_with_lock(_operation))
+
+    @classmethod
+    def settle(cls) -> int:
+        with cls._pending_lock:
+            pending = list(cls._pending)
+        wait(pending)
+        cls._executor.shutdown(wait=True)
+        cls._executor = None
+        return cls.publish_attempts
+
+
+def _sharded_settle() -> int:
+    Metrics.aggregate()
+    return Metrics.sigenergy2mqtt_mqtt_publish_attempts
+
+
+async def _publish_loop(metrics, updates: int) -> None:
+    for i in range(updates):
+        await metrics.modbus_read(1, 0.005)
+        await metrics.modbus_decoded_read(i % 3 == 0)
+        await metrics.mqtt_publish_attempt(i % 3 != 0)
+
+
+def _run(metrics, settle, updates: int, threads: int) -> tuple[float, float, int]:
+    workers = [threading.Thread(target=asyncio.run, args=(_publish_loop(metrics, updates),)) for _ in range(threads)]
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    attempts = settle()
+    return time.perf_counter() - wall, time.process_time() - cpu, attempts
+
+
+def main(updates: int, threads: int) -> None:
+    calls = updates * threads * 3
+    print(f"{threads} threads x {updates} publish-loop iterations ({calls} metric updates)")
+    for name, metrics, settle in (("executor", ExecutorMetrics, ExecutorMetrics.settle), ("sharded", Metrics, _sharded_settle)):
+        wall, cpu, attempts = _run(metrics, settle, updates, threads)
+        assert attempts >= updates * threads, f"{name}: only {attempts} publish attempts recorded"
+        print(f"{name:>10}: {wall * 1_000_000 / calls:7.2f} µs/update wall, {cpu * 1_000_000 / calls:7.2f} µs/update CPU")
+
+
+if __name__ == "__main__":
+    main(UPDATES, THREADS)
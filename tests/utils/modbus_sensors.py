@@ -125,6 +125,10 @@ class DummyModbusClient(ModbusClientMixin):
         """Simulate an input register read by returning pre-populated data for ``address``."""
         return self.get_state(address, device_id)
 
+    def register_image(self, device_id: int, input_type) -> None:  # noqa: unused arguments required to match real implementation
+        """Reads are never served from a read-ahead cache, so there is no register image."""
+        return None
+
 
 class DummyInverterModbusClient(DummyModbusClient):
     def __init__(self, model_id: str, serial_number: str):
@@ -9,6 +9,11 @@ When an MQTT broker is configured, the server also subscribes to each sensor's
 state topic so that register values track live MQTT updates from a real
 installation, enabling mixed live/synthetic test scenarios.
 
+When ``MODBUS_TEST_SERVER_REPLAY_FILE`` names a capture recorded with the
+``modbus[].capture-file`` option, the server instead replays the captured
+responses (see :func:`run_replay_server`), with their original latency scaled
+by ``MODBUS_TEST_SERVER_REPLAY_SPEED``.
+
 Run directly for manual testing::
 
     python tests/modbus_test_server.py
@@ -48,6 +53,7 @@ from pymodbus.server import ModbusTcpServer
 from pymodbus.simulator import DataType, SimData, SimDevice
 
 from sigenergy2mqtt.common import Constants, DeviceClass, Protocol
+from sigenergy2mqtt.modbus.capture import NO_RESPONSE, CaptureRecord, read_capture
 from sigenergy2mqtt.modbus.client import ModbusClient
 from sigenergy2mqtt.sensors.ac_charger_read_only import ACChargerInputBreaker, ACChargerRatedCurrent
 from sigenergy2mqtt.sensors.inverter_read_only import InverterFirmwareVersion, OutputType, PhaseCurrent, PhaseVoltage, PowerFactor
@@ -819,6 +825,105 @@ class CustomDataBlock:
         self._set_value(sensor, value, source)
 
 
+class ReplayDataBlock:
+    """Modbus data store for a single device address that replays a capture.
+
+    Each request is answered with the next response captured for the same
+    function code, address and count (cycling when they are exhausted), after
+    the captured latency divided by the replay speed:
+
+    * Captured registers are written into the served register block, so that
+      later requests for overlapping ranges that were never captured as such
+      are served the most recent values.
+    * Captured exception responses are returned as the same exception.
+    * Captured requests that received no response are answered with
+      :attr:`ExcCodes.GATEWAY_NO_RESPONSE` after the captured latency, which at
+      the original speed is after the client has already given up.
+
+    Requests that were never captured are served from the register block
+    without delay, or rejected with :attr:`ExcCodes.ILLEGAL_ADDRESS` when they
+    fall outside every captured range.
+    """
+
+    def __init__(self, device_address: int, speed: float = 1.0):
+        """Initialise an empty replay block for *device_address*.
+
+        Args:
+            device_address: The Modbus slave/unit ID this block represents.
+            speed: Divisor applied to the captured latencies; ``0`` serves
+                every response immediately.
+        """
+        self.device_address = device_address
+        self.speed = speed
+        self._responses: dict[tuple[int, int, int], list[CaptureRecord]] = {}
+        self._next: dict[tuple[int, int, int], int] = {}
+        # Raw uint16 register values used to seed SimData during build_sim_device(),
+        # which are the first captured value of each register (or 0 for registers
+        # only ever captured in exception responses and writes).
+        self._initial_registers: dict[int, int] = {}
+        self._placeholders: set[int] = set()
+
+    def add_record(self, record: CaptureRecord) -> None:
+        """Add a captured transaction for this device."""
+        self._responses.setdefault((record.function_code, record.address, record.count), []).append(record)
+        for i in range(record.count):
+            address = record.address + i
+            if i < len(record.registers):
+                if address not in self._initial_registers or address in self._placeholders:
+                    self._initial_registers[address] = record.registers[i]
+                    self._placeholders.discard(address)
+            elif address not in self._initial_registers:
+                self._initial_registers[address] = 0
+                self._placeholders.add(address)
+
+    def _make_device_action(self) -> Any:
+        """Return the async ``action`` callable for the :class:`SimDevice` (see :meth:`CustomDataBlock._make_device_action`)."""
+        block = self
+
+        async def _action(
+            func_code: int,
+            start_address: int,
+            address: int,
+            count: int,
+            current_registers: list[int],
+            set_values: list[int] | list[bool] | None,
+        ) -> None | ExcCodes:
+            key = (func_code, address, count)
+            responses = block._responses.get(key)
+            if not responses:
+                return None
+            index = block._next.get(key, 0)
+            block._next[key] = (index + 1) % len(responses)
+            record = responses[index]
+            if block.speed > 0:
+                await asyncio.sleep(record.latency / block.speed)
+            if record.exception_code == NO_RESPONSE:
+                return ExcCodes.GATEWAY_NO_RESPONSE
+            if record.exception_code:
+                try:
+                    return ExcCodes(record.exception_code)
+                except ValueError:
+                    return ExcCodes.DEVICE_FAILURE
+            if set_values is None and record.registers:
+                offset = address - start_address
+                current_registers[offset : offset + len(record.registers)] = record.registers
+            return None
+
+        return _action
+
+    def build_sim_device(self) -> SimDevice:
+        """Build and return a :class:`SimDevice` covering every captured register range."""
+        sim_data_list: list[SimData] = []
+        addresses = sorted(self._initial_registers)
+        start = 0
+        for i in range(1, len(addresses) + 1):
+            if i == len(addresses) or addresses[i] != addresses[i - 1] + 1:
+                run = addresses[start:i]
+                sim_data_list.append(SimData(run[0], datatype=DataType.REGISTERS, values=[self._initial_registers[a] for a in run]))
+                start = i
+        return SimDevice(id=self.device_address, simdata=sim_data_list, action=self._make_device_action())
+
+
 async def simulate_firmware_version_upgrade(data_block: CustomDataBlock, wait_for_seconds: int) -> None:
     """Simulate inverter firmware version upgrade on *data_block*.
 
@@ -1107,6 +1212,58 @@ async def run_async_server(
         await asyncio.sleep(0.1)
 
 
+async def run_replay_server(
+    capture_file: str,
+    host: str = "0.0.0.0",
+    port: int = 502,
+    speed: float = 1.0,
+    log_level: int = logging.INFO,
+) -> None:
+    """Build and run a Modbus TCP server that replays a capture.
+
+    The capture is read in full and a :class:`ReplayDataBlock` is created per
+    captured device address, so the server answers the application as the
+    captured site did (see :class:`ReplayDataBlock` for the details).
+
+    Args:
+        capture_file: A file written by the ``modbus[].capture-file`` option.
+        host: TCP host address for the server to bind to.
+        port: TCP port for the server to listen on.
+        speed: Divisor applied to the captured latencies (``2.0`` responds
+            twice as fast as the captured site, ``0`` without delay).
+        log_level: Logging verbosity for this module's logger.
+    """
+    _logger.setLevel(log_level)
+
+    _logger.info(f"Reading capture {capture_file}...")
+    context: dict[int, ReplayDataBlock] = {}
+    first: float | None = None
+    last: float = 0.0
+    for record in read_capture(capture_file):
+        if record.device_id not in context:
+            context[record.device_id] = ReplayDataBlock(record.device_id, speed)
+        context[record.device_id].add_record(record)
+        first = record.timestamp if first is None else first
+        last = record.timestamp
+    _logger.info(f"Capture covers {last - (first or last):.0f} seconds:")
+    for device_address, block in sorted(context.items()):
+        requests = sum(len(responses) for responses in block._responses.values())
+        _logger.info(f"  Device {device_address:>3}: {requests} requests for {len(block._responses)} ranges ({len(block._initial_registers)} registers)")
+
+    sim_devices: list[SimDevice] = [block.build_sim_device() for block in context.values()]
+    if 0 not in context:
+        # See run_async_server()
+        sim_devices.append(SimDevice(id=0, simdata=[SimData(0, datatype=DataType.REGISTERS, values=[0])]))
+
+    _logger.info(f"Starting ASYNC Modbus TCP Replay Server (speed {speed}x)...")
+    try:
+        server = ModbusTcpServer(context=sim_devices, address=(host, port), framer=FramerType.SOCKET)
+        await server.serve_forever()
+    except asyncio.CancelledError as e:
+        _logger.debug(f"Modbus TCP Replay Server cancelled: {e}")
+        await asyncio.sleep(0.1)
+
+
 async def wait_for_server_start(host: str, port: int, timeout: float = 10.0) -> bool:
     """Poll until the TCP server at *host*:*port* accepts a connection.
 
@@ -1193,7 +1350,8 @@ async def async_helper() -> None:
     Reads configuration from environment variables and uses it to optionally
     configure an MQTT client and a live Modbus client for register
     pre-population. Falls back to a fully synthetic server (no MQTT, no live
-    Modbus source) when no data-source values are provided.
+    Modbus source) when no data-source values are provided, or runs
+    :func:`run_replay_server` instead when a capture file is provided.
 
     The MQTT client is always cleanly shut down in a ``finally`` block,
     regardless of how the server exits.
@@ -1242,6 +1400,15 @@ async def async_helper() -> None:
             return []
         return [int(r) for segment in value.split(",") if segment.strip() for r in (range(int(segment.split("-")[0]), int(segment.split("-")[1]) + 1) if "-" in segment.strip() else [segment.strip()])]
 
+    server_host = _env("MODBUS_TEST_SERVER_HOST") or "0.0.0.0"
+    server_port = _env_int("MODBUS_TEST_SERVER_PORT", 502)
+
+    replay_file = _env("MODBUS_TEST_SERVER_REPLAY_FILE")
+    if replay_file:
+        speed = float(_env("MODBUS_TEST_SERVER_REPLAY_SPEED") or 1.0)
+        await run_replay_server(replay_file, host=server_host, port=server_port, speed=speed, log_level=_env_log_level("MODBUS_TEST_SERVER_LOG_LEVEL", logging.INFO))
+        return
+
     mqtt_client = None
     modbus_client = None
 
@@ -1286,9 +1453,6 @@ async def async_helper() -> None:
     TestConfig.simulate_power_factor_errors = _env_bool("MODBUS_TEST_SERVER_SIMULATE_POWER_FACTOR_ERRORS", False)
     TestConfig.force_sensor_values = _env_json("MODBUS_TEST_SERVER_FORCE_SENSOR_VALUES_JSON")
 
-    server_host = _env("MODBUS_TEST_SERVER_HOST") or "0.0.0.0"
-    server_port = _env_int("MODBUS_TEST_SERVER_PORT", 502)
-
     try:
         await run_async_server(
             mqtt_client,
@@ -0,0 +1,103 @@
+"""
+state_store_benchmark.py - Benchmark of restoring persisted sensor state at startup.
+
+Constructs the full sensor set with
+:func:`tests.utils.modbus_sensors.get_sensor_instances` against a state store
+holding a persisted value for every accumulation sensor, and compares:
+
+* ``per-key``: each sensor reads its own state with ``load_sync`` as it is
+  constructed (the previous startup path).
+* ``preload``: the sensor and PVOutput categories are first read in bulk with
+  :meth:`~sigenergy2mqtt.persistence.StateStore.preload`, so that the sensors'
+  ``load_sync`` calls are answered from memory.
+
+Both disk backends are measured. The time reported is that of the preload plus
+the construction of the sensor set, and the time spent in ``load_sync``.
+
+Usage::
+
+    python tests/utils/state_store_benchmark.py [runs]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+    # Removed before the project imports, which parse the command line for configuration options
+    RUNS = int(sys.argv.pop(1)) if len(sys.argv) > 1 else 5
+
+from sigenergy2mqtt.config import Config, _swap_active_config, active_config
+from sigenergy2mqtt.persistence import Category, state_store
+from tests.utils.modbus_sensors import get_sensor_instances
+
+
+def _persistence_keys(sensors) -> list[str]:
+    keys = []
+    for sensor in sensors.values():
+        for attribute in ("_state_persistence_key", "_midnight_persistence_key"):
+            key = getattr(sensor, attribute, None)
+            if key is not None:
+                keys.append(key)
+    return keys
+
+
+async def _populate(state_path: Path) -> int:
+    """Construct the sensor set once and persist a value for each of its state keys."""
+    await state_store.initialise(state_path, active_config.persistence)
+    keys = _persistence_keys(await get_sensor_instances())
+    for key in keys:
+        await state_store.save(Category.SENSOR, key, "1234.5")
+    state_store.shutdown()
+    return len(keys)
+
+
+async def _startup(state_path: Path, preload: bool) -> tuple[float, float, int]:
+    await state_store.initialise(state_path, active_config.persistence)
+    load_sync = state_store.load_sync
+    loading = 0.0
+    loads = 0
+
+    def _timed_load_sync(*args, **kwargs):
+        nonlocal loading, loads
+        t0 = time.perf_counter()
+        try:
+            return load_sync(*args, **kwargs)
+        finally:
+            loading += time.perf_counter() - t0
+            loads += 1
+
+    state_store.load_sync = _timed_load_sync
+    try:
+        t0 = time.perf_counter()
+        if preload:
+            await state_store.preload(Category.SENSOR, Category.PVOUTPUT)
+        await get_sensor_instances()
+        elapsed = time.perf_counter() - t0
+    finally:
+        del state_store.load_sync
+        state_store.shutdown()
+    return elapsed, loading, loads
+
+
+def main(runs: int) -> None:
+    logging.disable(logging.WARNING)
+    for backend in ("files", "sqlite"):
+        with tempfile.TemporaryDirectory() as directory, _swap_active_config(Config()):
+            active_config.persistence.mqtt_redundancy = False
+            active_config.persistence.disk_backend = backend
+            state_path = Path(directory)
+            keys = asyncio.run(_populate(state_path))
+            for mode, preload in (("per-key", False), ("preload", True)):
+                results = [asyncio.run(_startup(state_path, preload)) for _ in range(runs)]
+                elapsed, loading, loads = min(results)
+                print(f"{backend:>6} {mode:>8}: {elapsed * 1000:8.1f} ms startup, {loading * 1000:7.1f} ms in {loads} load_sync calls ({keys} persisted keys)")
+
+
+if __name__ == "__main__":
+    main(RUNS)